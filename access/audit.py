@@ -14,7 +14,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from contextlib import contextmanager
+
+from sqlite_pool import SQLiteConnectionPool
 
 
 # ============================================================================
@@ -67,34 +68,29 @@ class AuditLogger:
         history = logger.get_access_history("tensor-001")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pool: Optional[SQLiteConnectionPool] = None):
         """
         Initialize audit logger.
 
         Args:
             db_path: Path to SQLite database
+            pool: Optional connection pool (e.g. shared with TensorDatabase)
         """
         self.db_path = Path(db_path)
+        self.pool = pool or SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's persistent connection."""
+        return self.pool.connection()
 
-    @contextmanager
     def _transaction(self):
         """Context manager for atomic transactions."""
-        conn = self._get_connection()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        return self.pool.transaction()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.pool.close()
 
     def _init_schema(self):
         """Initialize audit log table."""
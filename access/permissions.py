@@ -4,6 +4,7 @@ Permission enforcement for tensor access control.
 Provides:
 - TensorPermission: Data class for tensor access permissions
 - PermissionEnforcer: Enforces access control on tensor operations
+- PermissionCache: TTL/generation cache of permission lookups
 - PermissionDenied: Exception for access violations
 
 Phase 5: Access Control
@@ -11,11 +12,15 @@ Phase 5: Access Control
 
 import json
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set
-from contextlib import contextmanager
+from typing import Any, Dict, Hashable, List, Optional, Set
+
+from sqlite_pool import SQLiteConnectionPool
 
 
 # ============================================================================
@@ -79,6 +84,96 @@ class TensorPermission:
             raise ValueError(f"Invalid access_level: {self.access_level}")
 
 
+# ============================================================================
+# Permission Cache
+# ============================================================================
+
+_MISS = object()
+
+# Tensor IDs shared with a user, directly or through one of their groups
+_SHARED_WITH_USER_SQL = """
+    SELECT s.tensor_id FROM tensor_shares s
+    WHERE (s.principal_type = 'user' AND s.principal_id = ?)
+       OR (s.principal_type = 'group' AND s.principal_id IN (
+               SELECT group_id FROM user_groups WHERE user_id = ?))
+"""
+
+# Stay below SQLite's default host-parameter limit
+_MAX_IN_PARAMS = 500
+
+
+class PermissionCache:
+    """
+    Bounded LRU cache of permission lookups with per-entry TTL.
+
+    Every permission or group write bumps ``generation`` and clears the
+    cache. Readers capture the generation before querying and pass it to
+    put(), so a result computed before a concurrent write is discarded
+    instead of resurrecting stale access. The TTL bounds staleness for
+    writes made by other processes sharing the database.
+
+    Args:
+        ttl_seconds: Entry lifetime; 0 disables caching
+        max_entries: LRU capacity
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISS if absent or expired."""
+        if not self.enabled:
+            return _MISS
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return _MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """Store a value computed under ``generation``; ignored if stale."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry and start a new generation."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "generation": self.generation,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
 # ============================================================================
 # Permission Enforcer
 # ============================================================================
@@ -99,36 +194,40 @@ class PermissionEnforcer:
         enforcer.enforce("user-123", "tensor-456", "read")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        pool: Optional[SQLiteConnectionPool] = None,
+        cache_ttl: float = 5.0,
+        cache_size: int = 10_000,
+    ):
         """
         Initialize permission enforcer.
 
         Args:
             db_path: Path to SQLite database
+            pool: Optional connection pool (e.g. shared with TensorDatabase)
+            cache_ttl: Seconds a cached group/permission lookup stays valid
+                (0 disables caching)
+            cache_size: Maximum number of cached lookups
         """
         self.db_path = Path(db_path)
+        self.pool = pool or SQLiteConnectionPool(self.db_path)
         self._init_schema()
-        # User groups cache (user_id -> set of group_ids)
-        self._user_groups: dict = {}
+        # Read decisions, owners and user groups; cleared on every write
+        self.cache = PermissionCache(ttl_seconds=cache_ttl, max_entries=cache_size)
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's persistent connection."""
+        return self.pool.connection()
 
-    @contextmanager
     def _transaction(self):
         """Context manager for atomic transactions."""
-        conn = self._get_connection()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        return self.pool.transaction()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.pool.close()
 
     def _init_schema(self):
         """Initialize permission tables."""
@@ -173,6 +272,53 @@ class PermissionEnforcer:
                 ON user_groups(group_id)
             """)
 
+            # Share grants, one row per (tensor, user or group)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tensor_shares (
+                    tensor_id TEXT NOT NULL,
+                    principal_type TEXT NOT NULL CHECK (principal_type IN ('user', 'group')),
+                    principal_id TEXT NOT NULL,
+                    PRIMARY KEY (tensor_id, principal_type, principal_id)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tensor_shares_principal
+                ON tensor_shares(principal_type, principal_id)
+            """)
+
+            self._migrate_json_shares(conn)
+
+    def _migrate_json_shares(self, conn: sqlite3.Connection) -> None:
+        """Move legacy shared_*_json arrays into tensor_shares."""
+        rows = conn.execute("""
+            SELECT tensor_id, shared_with_json, shared_groups_json
+            FROM tensor_permissions
+            WHERE shared_with_json IS NOT NULL OR shared_groups_json IS NOT NULL
+        """).fetchall()
+        if not rows:
+            return
+
+        for row in rows:
+            shares = [("user", u) for u in json.loads(row["shared_with_json"] or "[]")]
+            shares += [("group", g) for g in json.loads(row["shared_groups_json"] or "[]")]
+            self._insert_shares(conn, row["tensor_id"], shares)
+        conn.execute("""
+            UPDATE tensor_permissions
+            SET shared_with_json = NULL, shared_groups_json = NULL
+            WHERE shared_with_json IS NOT NULL OR shared_groups_json IS NOT NULL
+        """)
+
+    @staticmethod
+    def _insert_shares(conn: sqlite3.Connection, tensor_id: str, shares: List[tuple]) -> None:
+        conn.executemany("""
+            INSERT OR IGNORE INTO tensor_shares (tensor_id, principal_type, principal_id)
+            VALUES (?, ?, ?)
+        """, [(tensor_id, kind, principal) for kind, principal in shares])
+
+    def invalidate_cache(self) -> None:
+        """Discard cached permission lookups (e.g. after external writes)."""
+        self.cache.invalidate()
+
     # =========================================================================
     # Permission CRUD
     # =========================================================================
@@ -187,28 +333,59 @@ class PermissionEnforcer:
         Returns:
             TensorPermission if found, None otherwise
         """
+        return self.get_permissions([tensor_id]).get(tensor_id)
+
+    def get_permissions(self, tensor_ids: List[str]) -> Dict[str, TensorPermission]:
+        """
+        Get permission records for many tensors.
+
+        Args:
+            tensor_ids: Tensor identifiers
+
+        Returns:
+            Dict of tensor_id -> TensorPermission for records that exist
+        """
+        permissions: Dict[str, TensorPermission] = {}
+        ids = list(dict.fromkeys(tensor_ids))
         with self._transaction() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM tensor_permissions WHERE tensor_id = ?",
-                (tensor_id,)
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-
-            return TensorPermission(
-                tensor_id=row["tensor_id"],
-                owner_id=row["owner_id"],
-                access_level=row["access_level"],
-                shared_with=json.loads(row["shared_with_json"] or "[]"),
-                shared_groups=json.loads(row["shared_groups_json"] or "[]"),
-                api_enabled=bool(row["api_enabled"]),
-                rate_limit=row["rate_limit"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                modified_at=datetime.fromisoformat(row["modified_at"]),
-                accessed_at=datetime.fromisoformat(row["accessed_at"]) if row["accessed_at"] else None,
-                access_count=row["access_count"],
-            )
+            for start in range(0, len(ids), _MAX_IN_PARAMS):
+                chunk = ids[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT * FROM tensor_permissions WHERE tensor_id IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for row in rows:
+                    permissions[row["tensor_id"]] = TensorPermission(
+                        tensor_id=row["tensor_id"],
+                        owner_id=row["owner_id"],
+                        access_level=row["access_level"],
+                        api_enabled=bool(row["api_enabled"]),
+                        rate_limit=row["rate_limit"],
+                        created_at=datetime.fromisoformat(row["created_at"]),
+                        modified_at=datetime.fromisoformat(row["modified_at"]),
+                        accessed_at=datetime.fromisoformat(row["accessed_at"]) if row["accessed_at"] else None,
+                        access_count=row["access_count"],
+                    )
+
+                if not rows:
+                    continue
+                share_rows = conn.execute(f"""
+                    SELECT tensor_id, principal_type, principal_id
+                    FROM tensor_shares
+                    WHERE tensor_id IN ({placeholders})
+                    ORDER BY rowid
+                """, chunk).fetchall()
+                for share in share_rows:
+                    perm = permissions.get(share["tensor_id"])
+                    if perm is None:
+                        continue
+                    if share["principal_type"] == "user":
+                        perm.shared_with.append(share["principal_id"])
+                    else:
+                        perm.shared_groups.append(share["principal_id"])
+
+        return permissions
 
     def set_permission(self, permission: TensorPermission) -> None:
         """
@@ -231,8 +408,8 @@ class PermissionEnforcer:
                 permission.tensor_id,
                 permission.owner_id,
                 permission.access_level,
-                json.dumps(permission.shared_with),
-                json.dumps(permission.shared_groups),
+                None,
+                None,
                 1 if permission.api_enabled else 0,
                 permission.rate_limit,
                 permission.created_at.isoformat() if permission.created_at else now,
@@ -240,6 +417,18 @@ class PermissionEnforcer:
                 permission.accessed_at.isoformat() if permission.accessed_at else None,
                 permission.access_count,
             ))
+            conn.execute(
+                "DELETE FROM tensor_shares WHERE tensor_id = ?",
+                (permission.tensor_id,)
+            )
+            self._insert_shares(
+                conn,
+                permission.tensor_id,
+                [("user", u) for u in permission.shared_with]
+                + [("group", g) for g in permission.shared_groups],
+            )
+
+        self.cache.invalidate()
 
     def delete_permission(self, tensor_id: str) -> bool:
         """
@@ -252,11 +441,15 @@ class PermissionEnforcer:
             True if deleted, False if not found
         """
         with self._transaction() as conn:
+            conn.execute("DELETE FROM tensor_shares WHERE tensor_id = ?", (tensor_id,))
             cursor = conn.execute(
                 "DELETE FROM tensor_permissions WHERE tensor_id = ?",
                 (tensor_id,)
             )
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+
+        self.cache.invalidate()
+        return deleted
 
     def create_default_permission(
         self,
@@ -298,32 +491,54 @@ class PermissionEnforcer:
         Returns:
             True if user has read access
         """
-        perm = self.get_permission(tensor_id)
+        return tensor_id in self.filter_readable(user_id, [tensor_id])
 
-        # No permission record = no access (unless we want default behavior)
-        if perm is None:
-            return False
-
-        # Owner always has access
-        if perm.owner_id == user_id:
-            return True
-
-        # Public tensors are readable by anyone
-        if perm.access_level == "public":
-            return True
+    def filter_readable(self, user_id: str, tensor_ids: List[str]) -> Set[str]:
+        """
+        Resolve read access for many tensors with one query.
 
-        # Check shared access
-        if perm.access_level == "shared":
-            # Direct user share
-            if user_id in perm.shared_with:
-                return True
+        Owner, public, direct-share and group-share rules are evaluated in
+        SQL, and cached decisions are reused, so a page of results costs at
+        most one query. Tensors without a permission record are not
+        readable.
 
-            # Group share
-            user_groups = self.get_user_groups(user_id)
-            if user_groups.intersection(set(perm.shared_groups)):
-                return True
+        Args:
+            user_id: User identifier
+            tensor_ids: Tensor identifiers to check
 
-        return False
+        Returns:
+            Set of tensor IDs the user can read
+        """
+        readable = set()
+        pending = []
+        for tensor_id in dict.fromkeys(tensor_ids):
+            cached = self.cache.get(("read", user_id, tensor_id))
+            if cached is _MISS:
+                pending.append(tensor_id)
+            elif cached:
+                readable.add(tensor_id)
+        if not pending:
+            return readable
+
+        generation = self.cache.generation
+        granted = set()
+        with self._transaction() as conn:
+            for start in range(0, len(pending), _MAX_IN_PARAMS):
+                chunk = pending[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"""
+                    SELECT p.tensor_id FROM tensor_permissions p
+                    WHERE p.tensor_id IN ({placeholders})
+                      AND (p.owner_id = ?
+                           OR p.access_level = 'public'
+                           OR (p.access_level = 'shared'
+                               AND p.tensor_id IN ({_SHARED_WITH_USER_SQL})))
+                """, [*chunk, user_id, user_id, user_id]).fetchall()
+                granted.update(row["tensor_id"] for row in rows)
+
+        for tensor_id in pending:
+            self.cache.put(("read", user_id, tensor_id), tensor_id in granted, generation)
+        return readable | granted
 
     def can_write(self, user_id: str, tensor_id: str) -> bool:
         """
@@ -338,12 +553,19 @@ class PermissionEnforcer:
         Returns:
             True if user has write access
         """
-        perm = self.get_permission(tensor_id)
-        if perm is None:
-            return False
+        owner_id = self.cache.get(("owner", tensor_id))
+        if owner_id is _MISS:
+            generation = self.cache.generation
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT owner_id FROM tensor_permissions WHERE tensor_id = ?",
+                    (tensor_id,)
+                ).fetchone()
+            owner_id = row["owner_id"] if row else None
+            self.cache.put(("owner", tensor_id), owner_id, generation)
 
         # Only owner can write
-        return perm.owner_id == user_id
+        return owner_id is not None and owner_id == user_id
 
     def can_delete(self, user_id: str, tensor_id: str) -> bool:
         """
@@ -575,9 +797,11 @@ class PermissionEnforcer:
             Set of group IDs
         """
         # Check cache first
-        if user_id in self._user_groups:
-            return self._user_groups[user_id]
+        cached = self.cache.get(("groups", user_id))
+        if cached is not _MISS:
+            return set(cached)
 
+        generation = self.cache.generation
         with self._transaction() as conn:
             cursor = conn.execute(
                 "SELECT group_id FROM user_groups WHERE user_id = ?",
@@ -586,7 +810,7 @@ class PermissionEnforcer:
             groups = {row["group_id"] for row in cursor.fetchall()}
 
         # Cache it
-        self._user_groups[user_id] = groups
+        self.cache.put(("groups", user_id), frozenset(groups), generation)
         return groups
 
     def add_user_to_group(self, user_id: str, group_id: str) -> None:
@@ -603,9 +827,8 @@ class PermissionEnforcer:
                 VALUES (?, ?)
             """, (user_id, group_id))
 
-        # Invalidate cache
-        if user_id in self._user_groups:
-            del self._user_groups[user_id]
+        # Group membership feeds cached read decisions too
+        self.cache.invalidate()
 
     def remove_user_from_group(self, user_id: str, group_id: str) -> None:
         """
@@ -621,9 +844,8 @@ class PermissionEnforcer:
                 (user_id, group_id)
             )
 
-        # Invalidate cache
-        if user_id in self._user_groups:
-            del self._user_groups[user_id]
+        # Group membership feeds cached read decisions too
+        self.cache.invalidate()
 
     def get_group_members(self, group_id: str) -> List[str]:
         """
@@ -683,34 +905,21 @@ class PermissionEnforcer:
         Returns:
             List of accessible tensor IDs
         """
-        accessible = []
-        user_groups = self.get_user_groups(user_id)
+        queries = ["SELECT tensor_id FROM tensor_permissions WHERE owner_id = ?"]
+        params = [user_id]
+        if include_public:
+            queries.append(
+                "SELECT tensor_id FROM tensor_permissions WHERE access_level = 'public'"
+            )
+        queries.append(f"""
+            SELECT tensor_id FROM tensor_permissions
+            WHERE access_level = 'shared' AND tensor_id IN ({_SHARED_WITH_USER_SQL})
+        """)
+        params += [user_id, user_id]
 
         with self._transaction() as conn:
-            cursor = conn.execute("SELECT * FROM tensor_permissions")
-            for row in cursor.fetchall():
-                # Owner access
-                if row["owner_id"] == user_id:
-                    accessible.append(row["tensor_id"])
-                    continue
-
-                # Public access
-                if include_public and row["access_level"] == "public":
-                    accessible.append(row["tensor_id"])
-                    continue
-
-                # Shared access
-                if row["access_level"] == "shared":
-                    shared_with = json.loads(row["shared_with_json"] or "[]")
-                    if user_id in shared_with:
-                        accessible.append(row["tensor_id"])
-                        continue
-
-                    shared_groups = json.loads(row["shared_groups_json"] or "[]")
-                    if user_groups.intersection(set(shared_groups)):
-                        accessible.append(row["tensor_id"])
-
-        return accessible
+            cursor = conn.execute(" UNION ".join(queries), params)
+            return [row["tensor_id"] for row in cursor.fetchall()]
 
     def list_owned_tensors(self, owner_id: str) -> List[str]:
         """
@@ -739,24 +948,10 @@ class PermissionEnforcer:
         Returns:
             List of shared tensor IDs
         """
-        shared = []
-        user_groups = self.get_user_groups(user_id)
-
         with self._transaction() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM tensor_permissions WHERE access_level = 'shared'"
-            )
-            for row in cursor.fetchall():
-                if row["owner_id"] == user_id:
-                    continue
-
-                shared_with = json.loads(row["shared_with_json"] or "[]")
-                if user_id in shared_with:
-                    shared.append(row["tensor_id"])
-                    continue
-
-                shared_groups = json.loads(row["shared_groups_json"] or "[]")
-                if user_groups.intersection(set(shared_groups)):
-                    shared.append(row["tensor_id"])
-
-        return shared
+            cursor = conn.execute(f"""
+                SELECT tensor_id FROM tensor_permissions
+                WHERE access_level = 'shared' AND owner_id != ?
+                  AND tensor_id IN ({_SHARED_WITH_USER_SQL})
+            """, (user_id, user_id, user_id))
+            return [row["tensor_id"] for row in cursor.fetchall()]
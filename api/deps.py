@@ -38,6 +38,14 @@ class Settings:
             "EMBEDDING_MODEL",
             "all-MiniLM-L6-v2"
         )
+        self.rag_index_backend: str = os.getenv(
+            "RAG_INDEX_BACKEND",
+            "exact"
+        ).lower()
+        self.rag_index_path: str = os.getenv(
+            "RAG_INDEX_PATH",
+            f"{self.db_path}.rag_index"
+        )
         self.api_title: str = os.getenv(
             "API_TITLE",
             "Timepoint-Daedalus Tensor API"
@@ -101,7 +109,7 @@ def get_enforcer() -> PermissionEnforcer:
     """
     global _enforcer
     if _enforcer is None:
-        _enforcer = PermissionEnforcer(_get_db_path())
+        _enforcer = PermissionEnforcer(_get_db_path(), pool=get_tensor_db().pool)
     return _enforcer
 
 
@@ -114,7 +122,7 @@ def get_audit_logger() -> AuditLogger:
     """
     global _logger
     if _logger is None:
-        _logger = AuditLogger(_get_db_path())
+        _logger = AuditLogger(_get_db_path(), pool=get_tensor_db().pool)
     return _logger
 
 
@@ -139,6 +147,8 @@ def get_tensor_rag() -> Optional["TensorRAG"]:
             _rag = TensorRAG(
                 tensor_db=db,
                 embedding_model=settings.embedding_model,
+                index_backend=settings.rag_index_backend,
+                index_path=settings.rag_index_path,
                 auto_build_index=True,
                 permission_enforcer=enforcer,
             )
@@ -160,6 +170,9 @@ def cleanup_dependencies() -> None:
     Call this on shutdown.
     """
     global _tensor_db, _enforcer, _logger, _rag
+    for resource in (_tensor_db, _enforcer, _logger):
+        if resource is not None:
+            resource.close()
     _tensor_db = None
     _enforcer = None
     _logger = None
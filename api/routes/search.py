@@ -78,11 +78,13 @@ async def semantic_search(
         user_id=user_id,  # Permission filtering in RAG
     )
 
+    # Double-check permissions in one bulk lookup (defense in depth)
+    readable = enforcer.filter_readable(user_id, [r.tensor_id for r in raw_results])
+
     # Build response
     results = []
     for result in raw_results:
-        # Double-check permission (defense in depth)
-        if not enforcer.can_read(user_id, result.tensor_id):
+        if result.tensor_id not in readable:
             continue
 
         # Build result item
@@ -141,8 +143,9 @@ async def compose_tensors(
         )
 
     # Verify access to all tensors
+    readable = enforcer.filter_readable(user_id, request.tensor_ids)
     for tensor_id in request.tensor_ids:
-        if not enforcer.can_read(user_id, tensor_id):
+        if tensor_id not in readable:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"No read access to tensor '{tensor_id}'"
@@ -210,14 +213,6 @@ async def find_similar(
             detail=f"No read access to tensor '{tensor_id}'"
         )
 
-    # Get source record
-    record = db.get_tensor(tensor_id)
-    if record is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Tensor '{tensor_id}' not found"
-        )
-
     # Get RAG instance
     rag = get_tensor_rag()
     if rag is None:
@@ -226,36 +221,35 @@ async def find_similar(
             detail="Semantic search is not available (RAG not configured)"
         )
 
-    # Use description for search
-    query = record.description or f"Entity: {record.entity_id}"
+    # Source must exist (cheap check; the vector itself comes from the index)
+    if tensor_id not in rag.index and db.get_tensor(tensor_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tensor '{tensor_id}' not found"
+        )
 
-    # Search for similar
-    raw_results = rag.search(
-        query=query,
-        n_results=n_results + 1,  # +1 to exclude self
+    # Search by the stored embedding (no model inference), self excluded
+    raw_results = rag.search_by_id(
+        tensor_id,
+        n_results=n_results,
         user_id=user_id,
     )
 
-    # Filter out the source tensor and build response
-    results = []
-    for result in raw_results:
-        if result.tensor_id == tensor_id:
-            continue
+    # Double-check permissions in one bulk lookup (defense in depth)
+    readable = enforcer.filter_readable(user_id, [r.tensor_id for r in raw_results])
 
-        if not enforcer.can_read(user_id, result.tensor_id):
-            continue
-
-        results.append(SearchResultItem(
+    results = [
+        SearchResultItem(
             tensor_id=result.tensor_id,
             score=result.score,
             entity_id=result.tensor_record.entity_id,
             description=result.tensor_record.description,
             category=result.tensor_record.category,
             maturity=result.tensor_record.maturity,
-        ))
-
-        if len(results) >= n_results:
-            break
+        )
+        for result in raw_results
+        if result.tensor_id in readable
+    ][:n_results]
 
     return SearchResponse(
         results=results,
@@ -102,7 +102,7 @@ async def list_tensors(
     Returns paginated list of tensors the user can read.
     """
     # Get all accessible tensor IDs
-    accessible_ids = enforcer.list_accessible_tensors(user_id, include_public=True)
+    accessible_ids = set(enforcer.list_accessible_tensors(user_id, include_public=True))
 
     # Get all tensor records
     all_records = db.list_tensors(entity_id=entity_id, world_id=world_id)
@@ -120,9 +120,10 @@ async def list_tensors(
     page_records = accessible_records[start:end]
 
     # Build response
+    permissions = enforcer.get_permissions([r.tensor_id for r in page_records])
     tensors = []
     for record in page_records:
-        perm = enforcer.get_permission(record.tensor_id)
+        perm = permissions.get(record.tensor_id)
         if perm:
             tensors.append(record_to_response(
                 record,
@@ -669,6 +669,10 @@ def run_temporal_training(cfg: DictConfig, store: GraphStore, llm_client: LLMCli
             knowledge_growth = len(population.knowledge_state) - (len(previous_knowledge) if previous_knowledge else 0)
             print(f"  ✓ {entity_id}: +{knowledge_growth} knowledge items")
 
+        # Record each entity's state as of this timepoint for point-in-time reads
+        timepoint_entities = [store.get_entity(entity_data["entity_id"]) for entity_data in entities_data]
+        store.save_entity_snapshots([e for e in timepoint_entities if e is not None], timepoint.timepoint_id)
+
         print()
 
     print(f"Temporal training complete!")
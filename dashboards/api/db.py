@@ -4,20 +4,33 @@ Database query functions for Timepoint Dashboard API
 Provides efficient querying with filtering, sorting, and pagination.
 """
 
+import sys
 import sqlite3
 import json
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
+# Add project root to path for the shared rollup maintenance code
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from metadata.analytics_rollups import AnalyticsRollups
+
 
 class TimepointDB:
-    """Database interface for querying Timepoint runs."""
+    """
+    Database interface for querying Timepoint runs.
+
+    Aggregate endpoints read the rollup tables MetadataManager maintains
+    (see metadata/analytics_rollups.py) rather than scanning raw rows.
+    """
 
     def __init__(self, db_path: str = "../../metadata/runs.db"):
         self.db_path = Path(__file__).parent / db_path
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
+        # Backfills once for databases written before rollups existed
+        AnalyticsRollups(self.db_path).ensure()
 
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
@@ -127,27 +140,41 @@ class TimepointDB:
         cursor.execute(results_query, params)
         rows = cursor.fetchall()
 
-        # Get mechanisms for each run
-        results = []
-        for row in rows:
-            run_dict = dict(row)
-
-            # Get mechanisms used
-            cursor.execute("""
-                SELECT DISTINCT mechanism, COUNT(*) as count
-                FROM mechanism_usage
-                WHERE run_id = ?
-                GROUP BY mechanism
-            """, (run_dict['run_id'],))
-
-            mechanisms_used = {m[0]: m[1] for m in cursor.fetchall()}
-            run_dict['mechanisms_used'] = mechanisms_used
-
-            results.append(run_dict)
+        results = [dict(row) for row in rows]
+        mechanisms_by_run = self._page_mechanisms(cursor, results)
+        for run_dict in results:
+            run_dict['mechanisms_used'] = mechanisms_by_run.get(run_dict['run_id'], {})
 
         conn.close()
         return results, total_count
 
+    def _page_mechanisms(self, cursor: sqlite3.Cursor, runs: List[Dict]) -> Dict[str, Dict[str, int]]:
+        """
+        Mechanism counts for a page of runs in at most two queries.
+
+        Finished runs read their rolled-up counts; runs still in progress
+        are counted from raw rows, which also covers databases whose live
+        runs were last rolled up before telemetry flushes refreshed them.
+        """
+        mechanisms_by_run: Dict[str, Dict[str, int]] = {}
+        sources = (
+            ("run_mechanism_counts", "count", [r['run_id'] for r in runs if r['status'] != 'running']),
+            ("mechanism_usage", "COUNT(*)", [r['run_id'] for r in runs if r['status'] == 'running']),
+        )
+        for table, count_expr, run_ids in sources:
+            if not run_ids:
+                continue
+            placeholders = ",".join("?" * len(run_ids))
+            cursor.execute(f"""
+                SELECT run_id, mechanism, {count_expr} AS count
+                FROM {table}
+                WHERE run_id IN ({placeholders})
+                GROUP BY run_id, mechanism
+            """, run_ids)
+            for run_id, mechanism, count in cursor.fetchall():
+                mechanisms_by_run.setdefault(run_id, {})[mechanism] = count
+        return mechanisms_by_run
+
     def get_run_details(self, run_id: str) -> Optional[Dict]:
         """Get full details for a specific run."""
         conn = self.get_connection()
@@ -220,9 +247,8 @@ class TimepointDB:
         cursor = conn.cursor()
 
         cursor.execute("""
-            SELECT mechanism, COUNT(*) as count
-            FROM mechanism_usage
-            GROUP BY mechanism
+            SELECT mechanism, count
+            FROM rollup_mechanism_totals
             ORDER BY mechanism
         """)
 
@@ -238,15 +264,16 @@ class TimepointDB:
         # Basic metrics
         cursor.execute("""
             SELECT
-                COUNT(*) as total_runs,
-                SUM(cost_usd) as total_cost,
-                AVG(cost_usd) as avg_cost,
-                SUM(entities_created) as total_entities,
-                SUM(timepoints_created) as total_timepoints,
-                AVG(duration_seconds) as avg_duration,
-                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed_runs,
-                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed_runs
-            FROM runs
+                total_runs,
+                total_cost,
+                CASE WHEN total_runs > 0 THEN total_cost / total_runs ELSE 0.0 END as avg_cost,
+                total_entities,
+                total_timepoints,
+                CASE WHEN duration_count > 0 THEN duration_sum / duration_count END as avg_duration,
+                completed_runs,
+                failed_runs
+            FROM rollup_totals
+            WHERE id = 1
         """)
         metrics = dict(cursor.fetchone())
 
@@ -258,9 +285,8 @@ class TimepointDB:
 
         # Template distribution
         cursor.execute("""
-            SELECT template_id, COUNT(*) as count
-            FROM runs
-            GROUP BY template_id
+            SELECT template_id, run_count as count
+            FROM rollup_templates
             ORDER BY count DESC
             LIMIT 10
         """)
@@ -268,13 +294,8 @@ class TimepointDB:
 
         # Cost over time (by day)
         cursor.execute("""
-            SELECT
-                DATE(started_at) as date,
-                SUM(cost_usd) as total_cost,
-                COUNT(*) as run_count
-            FROM runs
-            WHERE started_at IS NOT NULL
-            GROUP BY DATE(started_at)
+            SELECT date, total_cost, run_count
+            FROM rollup_daily_cost
             ORDER BY date DESC
             LIMIT 30
         """)
@@ -282,14 +303,8 @@ class TimepointDB:
 
         # Mechanism usage heatmap data
         cursor.execute("""
-            SELECT
-                m1.mechanism as mechanism1,
-                m2.mechanism as mechanism2,
-                COUNT(DISTINCT m1.run_id) as co_occurrence
-            FROM mechanism_usage m1
-            JOIN mechanism_usage m2 ON m1.run_id = m2.run_id
-            WHERE m1.mechanism < m2.mechanism
-            GROUP BY m1.mechanism, m2.mechanism
+            SELECT mechanism1, mechanism2, co_occurrence
+            FROM rollup_mechanism_pairs
             ORDER BY co_occurrence DESC
             LIMIT 50
         """)
@@ -297,9 +312,8 @@ class TimepointDB:
 
         # Causal mode distribution
         cursor.execute("""
-            SELECT causal_mode, COUNT(*) as count
-            FROM runs
-            GROUP BY causal_mode
+            SELECT causal_mode, run_count as count
+            FROM rollup_causal_modes
         """)
         metrics['causal_mode_distribution'] = [dict(row) for row in cursor.fetchall()]
 
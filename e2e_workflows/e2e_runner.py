@@ -15,7 +15,7 @@ No test theater - this is the real application.
 import os
 import tempfile
 import uuid
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 import json
@@ -25,7 +25,18 @@ from orchestrator import simulate_event
 from llm_v2 import LLMClient
 from storage import GraphStore
 from schemas import Entity, Timepoint, TemporalMode, ResolutionLevel
-from workflows import TemporalAgent, create_entity_training_workflow, synthesize_dialog
+from workflows import (
+    TemporalAgent,
+    create_entity_training_workflow,
+    synthesize_dialog,
+    merge_emotional_state_updates,
+)
+from workflows.dialog_synthesis import _sync_ttm_to_cognitive
+from workflows.knowledge_extraction import (
+    DialogExtractionRequest,
+    extract_knowledge_from_dialogs,
+    create_exposure_events_from_knowledge,
+)
 from query_interface import QueryInterface
 from oxen_integration import OxenClient
 from oxen_integration.data_formatters import EntityEvolutionFormatter
@@ -258,37 +269,10 @@ class FullE2EWorkflowRunner:
             True if persisted successfully, False otherwise
         """
         try:
-            from tensor_persistence import TensorRecord
-            from tensor_serialization import serialize_tensor
-            from schemas import TTMTensor
-            import json
-            import base64
-
-            # Extract tensor from entity
-            tensor_json = entity.tensor
-            if not tensor_json:
+            record = self._build_tensor_record(entity, world_id, run_id)
+            if record is None:
                 return False
 
-            tensor_data = json.loads(tensor_json)
-
-            # Reconstruct TTMTensor from serialized format
-            ttm_tensor = TTMTensor(
-                context_vector=base64.b64decode(tensor_data["context_vector"]),
-                biology_vector=base64.b64decode(tensor_data["biology_vector"]),
-                behavior_vector=base64.b64decode(tensor_data["behavior_vector"])
-            )
-
-            # Create TensorRecord
-            tensor_id = f"{entity.entity_id}_{world_id}_{run_id}"
-            record = TensorRecord(
-                tensor_id=tensor_id,
-                entity_id=entity.entity_id,
-                world_id=world_id,
-                tensor_blob=serialize_tensor(ttm_tensor),
-                maturity=getattr(entity, 'tensor_maturity', 0.0),
-                training_cycles=getattr(entity, 'tensor_training_cycles', 0)
-            )
-
             # Save to dedicated tensor database
             tensor_db = self._get_tensor_db()
             tensor_db.save_tensor(record)
@@ -299,6 +283,74 @@ class FullE2EWorkflowRunner:
             print(f"    ⚠️  Failed to persist tensor for {entity.entity_id}: {e}")
             return False
 
+    def _persist_tensors_to_db(
+        self,
+        entities: List[Entity],
+        world_id: str,
+        run_id: str
+    ) -> int:
+        """
+        Persist several entities' tensors with one save_tensors_batch call.
+
+        Entities whose tensor cannot be encoded are skipped (and reported);
+        the rest are written in a single transaction.
+
+        Returns:
+            Number of tensors persisted
+        """
+        records = []
+        for entity in entities:
+            try:
+                record = self._build_tensor_record(entity, world_id, run_id)
+            except Exception as e:
+                print(f"    ⚠️  Failed to persist tensor for {entity.entity_id}: {e}")
+                continue
+            if record is not None:
+                records.append(record)
+
+        if not records:
+            return 0
+
+        try:
+            self._get_tensor_db().save_tensors_batch(records)
+        except Exception as e:
+            print(f"    ⚠️  Failed to persist {len(records)} tensors: {e}")
+            return 0
+        return len(records)
+
+    def _build_tensor_record(self, entity: Entity, world_id: str, run_id: str):
+        """Build the TensorRecord for an entity's tensor, or None if it has none"""
+        from tensor_persistence import TensorRecord
+        from tensor_serialization import serialize_tensor
+        from schemas import TTMTensor
+        import json
+        import base64
+
+        # Extract tensor from entity
+        tensor_json = entity.tensor
+        if not tensor_json:
+            return None
+
+        tensor_data = json.loads(tensor_json)
+
+        # Reconstruct TTMTensor from serialized format
+        ttm_tensor = TTMTensor(
+            context_vector=base64.b64decode(tensor_data["context_vector"]),
+            biology_vector=base64.b64decode(tensor_data["biology_vector"]),
+            behavior_vector=base64.b64decode(tensor_data["behavior_vector"])
+        )
+
+        # Create TensorRecord
+        tensor_id = f"{entity.entity_id}_{world_id}_{run_id}"
+        return TensorRecord(
+            tensor_id=tensor_id,
+            entity_id=entity.entity_id,
+            world_id=world_id,
+            tensor_blob=serialize_tensor(ttm_tensor),
+            maturity=getattr(entity, 'tensor_maturity', 0.0),
+            training_cycles=getattr(entity, 'tensor_training_cycles', 0)
+        )
+
     def _persist_timepoint_for_convergence(self, timepoint: Timepoint, run_id: str) -> None:
         """
         Persist a timepoint to the shared database for convergence analysis.
@@ -505,32 +557,36 @@ class FullE2EWorkflowRunner:
         """
         try:
             shared_store = self._get_shared_store()
-
-            # Prefix entity_id with run_id for uniqueness across runs
-            unique_entity_id = f"{run_id}_{entity.entity_id}"
-
-            # Create fresh Entity copy to avoid session detachment issues
-            fresh_entity = Entity(
-                entity_id=unique_entity_id,
-                entity_type=entity.entity_type,
-                resolution_level=entity.resolution_level,
-                tensor=entity.tensor,
-                tensor_maturity=getattr(entity, 'tensor_maturity', 0.0),
-                tensor_training_cycles=getattr(entity, 'tensor_training_cycles', 0),
-                entity_metadata=dict(entity.entity_metadata) if entity.entity_metadata else {},
-                run_id=run_id  # Set run_id for convergence filtering
-            )
-
-            shared_store.save_entity(fresh_entity)
+            shared_store.save_entity(self._convergence_entity_copy(entity, run_id))
 
         except Exception as e:
             # Non-fatal - log but don't fail the run
             print(f"  ⚠️  Failed to persist entity for convergence: {e}")
 
+    def _convergence_entity_copy(self, entity: Entity, run_id: str) -> Entity:
+        """Fresh, run-prefixed copy of an entity for the shared convergence DB"""
+        # Prefix entity_id with run_id for uniqueness across runs
+        unique_entity_id = f"{run_id}_{entity.entity_id}"
+
+        # Create fresh Entity copy to avoid session detachment issues
+        return Entity(
+            entity_id=unique_entity_id,
+            entity_type=entity.entity_type,
+            resolution_level=entity.resolution_level,
+            tensor=entity.tensor,
+            tensor_maturity=getattr(entity, 'tensor_maturity', 0.0),
+            tensor_training_cycles=getattr(entity, 'tensor_training_cycles', 0),
+            entity_metadata=dict(entity.entity_metadata) if entity.entity_metadata else {},
+            run_id=run_id  # Set run_id for convergence filtering
+        )
+
     def _persist_all_entities_for_convergence(self, entities: List[Entity], run_id: str) -> int:
         """
         Persist all entities to the shared database for convergence analysis.
 
+        Uses a single bulk upsert; falls back to per-entity saves if the
+        bulk write fails so one bad row cannot drop the whole roster.
+
         Args:
             entities: List of entities to persist
             run_id: Current run identifier
@@ -538,13 +594,23 @@ class FullE2EWorkflowRunner:
         Returns:
             Number of entities persisted
         """
-        persisted = 0
-        for entity in entities:
-            try:
-                self._persist_entity_for_convergence(entity, run_id)
-                persisted += 1
-            except Exception as e:
-                print(f"  ⚠️  Failed to persist entity {entity.entity_id}: {e}")
+        if not entities:
+            return 0
+
+        try:
+            shared_store = self._get_shared_store()
+            persisted = shared_store.save_entities_bulk(
+                [self._convergence_entity_copy(entity, run_id) for entity in entities]
+            )
+        except Exception as e:
+            print(f"  ⚠️  Bulk entity persist failed ({e}), falling back to per-entity saves")
+            persisted = 0
+            for entity in entities:
+                try:
+                    self._persist_entity_for_convergence(entity, run_id)
+                    persisted += 1
+                except Exception as e:
+                    print(f"  ⚠️  Failed to persist entity {entity.entity_id}: {e}")
 
         if persisted > 0:
             print(f"  📊 Persisted {persisted} entities for convergence")
@@ -796,7 +862,9 @@ class FullE2EWorkflowRunner:
 
                 # Step 4.5: Synthesize dialogs (M11)
                 self._synthesize_dialogs(
-                    trained_entities, all_timepoints, scene_result, run_id
+                    trained_entities, all_timepoints, scene_result, run_id,
+                    max_workers=config.temporal.max_dialog_workers,
+                    extraction_batch_size=config.temporal.dialog_extraction_batch_size
                 )
 
                 # Step 4.6: Execute queries (M5)
@@ -2111,54 +2179,22 @@ RESPOND WITH ONLY THE EVENT DESCRIPTION, nothing else."""
                 print(f"     Entities: {layer_ids}")
 
                 # Step 4a: LLM-guided tensor population + optional prospection (Phase 11)
+                # Entities in one layer are independent, so they are processed
+                # concurrently; the layer barrier below is kept for ANDOS
                 config = scene_result.get("config", {})
-                for entity in layer_entities:
-                    first_timepoint = timepoints[0] if timepoints else None
-                    if not first_timepoint:
-                        continue
-
-                    # LLM-guided population (if needed)
-                    if entity.entity_metadata.get("needs_llm_population", False):
-                        try:
-                            from tensor_initialization import populate_tensor_llm_guided
-                            print(f"     🔧 LLM-guided population for {entity.entity_id}...")
-                            refined_tensor, maturity = populate_tensor_llm_guided(
-                                entity, first_timepoint, graph, llm
-                            )
-                            import json, base64
-                            entity.tensor = json.dumps({
-                                "context_vector": base64.b64encode(refined_tensor.context_vector).decode('utf-8'),
-                                "biology_vector": base64.b64encode(refined_tensor.biology_vector).decode('utf-8'),
-                                "behavior_vector": base64.b64encode(refined_tensor.behavior_vector).decode('utf-8')
-                            })
-                            entity.entity_metadata["needs_llm_population"] = False
-                            entity.tensor_maturity = maturity  # Update maturity from LLM population
-                            store.save_entity(entity)
-
-                            # Phase 1 Tensor Persistence: Update tensor in dedicated DB after population
-                            cfg = scene_result.get("config")
-                            w_id = cfg.world_id if cfg else "unknown"
-                            self._persist_tensor_to_db(entity, w_id, run_id)
-
-                            print(f"       ✓ Populated (maturity: {maturity:.3f})")
-                        except Exception as e:
-                            print(f"       ⚠️  Population failed: {e}")
-                    else:
-                        # Entity already populated or doesn't need population
-                        print(f"     ✓ {entity.entity_id}: Already populated, skipping LLM call")
+                first_timepoint = timepoints[0] if timepoints else None
+                if first_timepoint:
+                    populated, dirty = self._populate_layer(
+                        layer_entities, first_timepoint, graph, llm, store, config, run_id
+                    )
 
-                    # Optional prospection (M15) - triggered conditionally
-                    try:
-                        from prospection_triggers import trigger_prospection_for_entity, refine_tensor_from_prospection
-                        prospective_state = trigger_prospection_for_entity(
-                            entity, first_timepoint, llm, store, config
-                        )
-                        if prospective_state:
-                            # Optionally refine tensor from prospection
-                            refine_tensor_from_prospection(entity, prospective_state)
-                            store.save_entity(entity)
-                    except Exception as e:
-                        print(f"       ⚠️  Prospection failed: {e}")
+                    # One bulk entity upsert and one tensor batch per layer
+                    if dirty:
+                        store.save_entities_bulk(dirty)
+                    if populated:
+                        cfg = scene_result.get("config")
+                        w_id = cfg.world_id if cfg else "unknown"
+                        self._persist_tensors_to_db(populated, w_id, run_id)
 
                 # Train entities in this layer (using first timepoint as context)
                 first_timepoint = timepoints[0] if timepoints else None
@@ -2261,6 +2297,112 @@ RESPOND WITH ONLY THE EVENT DESCRIPTION, nothing else."""
 
             return all_entities
 
+    def _populate_layer(
+        self,
+        layer_entities: List[Entity],
+        first_timepoint: Timepoint,
+        graph,
+        llm: LLMClient,
+        store: GraphStore,
+        config,
+        run_id: str
+    ) -> Tuple[List[Entity], List[Entity]]:
+        """
+        Run LLM-guided population and prospection for one ANDOS layer.
+
+        Entities are fanned out over up to config.entities.max_population_workers
+        threads (LLM calls still go through the global RateLimiter); each
+        worker only mutates its own entity.
+
+        Returns:
+            (populated, dirty): entities whose tensor was populated, and every
+            entity that changed, both in layer order
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        entity_config = getattr(config, "entities", None)
+        max_workers = min(getattr(entity_config, "max_population_workers", 1), len(layer_entities))
+
+        def process(entity: Entity):
+            # Mechanism tracking reads the run_id from thread-local storage
+            set_current_run_id(run_id)
+            try:
+                return self._populate_entity(entity, first_timepoint, graph, llm, store, config)
+            finally:
+                clear_current_run_id()
+
+        if max_workers > 1:
+            print(f"     Populating {len(layer_entities)} entities with {max_workers} workers...")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(process, layer_entities))
+        else:
+            outcomes = [
+                self._populate_entity(entity, first_timepoint, graph, llm, store, config)
+                for entity in layer_entities
+            ]
+
+        populated = [e for e, (was_populated, _) in zip(layer_entities, outcomes) if was_populated]
+        dirty = [e for e, (_, changed) in zip(layer_entities, outcomes) if changed]
+        return populated, dirty
+
+    def _populate_entity(
+        self,
+        entity: Entity,
+        first_timepoint: Timepoint,
+        graph,
+        llm: LLMClient,
+        store: GraphStore,
+        config
+    ) -> Tuple[bool, bool]:
+        """
+        LLM-guided tensor population (if needed) plus optional prospection (M15).
+
+        Returns:
+            (populated, changed) flags for this entity
+        """
+        populated = False
+        changed = False
+
+        # LLM-guided population (if needed)
+        if entity.entity_metadata.get("needs_llm_population", False):
+            try:
+                from tensor_initialization import populate_tensor_llm_guided
+                print(f"     🔧 LLM-guided population for {entity.entity_id}...")
+                refined_tensor, maturity = populate_tensor_llm_guided(
+                    entity, first_timepoint, graph, llm
+                )
+                import json, base64
+                entity.tensor = json.dumps({
+                    "context_vector": base64.b64encode(refined_tensor.context_vector).decode('utf-8'),
+                    "biology_vector": base64.b64encode(refined_tensor.biology_vector).decode('utf-8'),
+                    "behavior_vector": base64.b64encode(refined_tensor.behavior_vector).decode('utf-8')
+                })
+                entity.entity_metadata["needs_llm_population"] = False
+                entity.tensor_maturity = maturity  # Update maturity from LLM population
+                populated = changed = True
+
+                print(f"       ✓ Populated {entity.entity_id} (maturity: {maturity:.3f})")
+            except Exception as e:
+                print(f"       ⚠️  Population failed for {entity.entity_id}: {e}")
+        else:
+            # Entity already populated or doesn't need population
+            print(f"     ✓ {entity.entity_id}: Already populated, skipping LLM call")
+
+        # Optional prospection (M15) - triggered conditionally
+        try:
+            from prospection_triggers import trigger_prospection_for_entity, refine_tensor_from_prospection
+            prospective_state = trigger_prospection_for_entity(
+                entity, first_timepoint, llm, store, config
+            )
+            if prospective_state:
+                # Optionally refine tensor from prospection
+                refine_tensor_from_prospection(entity, prospective_state)
+                changed = True
+        except Exception as e:
+            print(f"       ⚠️  Prospection failed for {entity.entity_id}: {e}")
+
+        return populated, changed
+
     def _run_parallel_tensor_training(
         self,
         entities: List[Entity],
@@ -2362,9 +2504,26 @@ RESPOND WITH ONLY THE EVENT DESCRIPTION, nothing else."""
         entities: List[Entity],
         timepoints: List[Timepoint],
         scene_result: Dict,
-        run_id: str
+        run_id: str,
+        max_workers: int = 1,
+        extraction_batch_size: int = 1
     ) -> None:
-        """Step 4.5: Synthesize dialogs (M11) - entities already trained via ANDOS"""
+        """
+        Step 4.5: Synthesize dialogs (M11) - entities already trained via ANDOS
+
+        With max_workers > 1 the per-timepoint dialogs run concurrently on
+        copies of their participants (LLM calls still pass through the global
+        RateLimiter); emotional-state updates are merged back in timepoint
+        order once every dialog has finished.
+
+        With extraction_batch_size > 1 M19 knowledge extraction is packed
+        into one call per batch of dialogs instead of one call per dialog.
+        Serial runs synthesize and extract in windows of that size, so later
+        dialogs lag earlier dialogs' knowledge by at most one window.
+
+        Each timepoint's participants are snapshotted in their state as of
+        that timepoint's dialog, so get_entity_at_timepoint can serve them.
+        """
         with self.logfire.span("step:dialog_synthesis"):
             print("\nStep 4.5: Synthesizing dialogs...")
 
@@ -2375,46 +2534,49 @@ RESPOND WITH ONLY THE EVENT DESCRIPTION, nothing else."""
             llm = scene_result["llm_client"]
             store = scene_result["store"]
 
-            # Synthesize dialogs for each timepoint
+            # Select a subset of entities for each dialog (2-4 entities) up front,
+            # in timepoint order, so sampling does not depend on worker scheduling
+            import random
+            num_participants = min(4, len(entities))
+            plans = [(timepoint, random.sample(entities, num_participants)) for timepoint in timepoints]
+
+            # Build timeline context (simplified) - convert timestamps to ISO strings for JSON serialization
+            timeline = [{"event_description": tp.event_description, "timestamp": tp.timestamp.isoformat() if hasattr(tp.timestamp, 'isoformat') else str(tp.timestamp)} for tp in timepoints]
+
+            batched = extraction_batch_size > 1
+            workers = min(max_workers, len(plans))
+            if workers > 1:
+                print(f"  Synthesizing {len(plans)} dialogs with {workers} workers...")
+                dialogs = self._synthesize_dialogs_concurrently(
+                    entities, plans, timeline, llm, store, run_id, workers,
+                    extract_knowledge=not batched
+                )
+                if batched:
+                    self._extract_dialog_knowledge(plans, dialogs, llm, store, extraction_batch_size)
+            else:
+                dialogs = []
+                window = extraction_batch_size if batched else len(plans)
+                for start in range(0, len(plans), max(1, window)):
+                    window_plans = plans[start:start + window]
+                    window_dialogs = []
+                    for timepoint, participants in window_plans:
+                        window_dialogs.append(self._synthesize_timepoint_dialog(
+                            timepoint, participants, timeline, llm, store, run_id,
+                            extract_knowledge=not batched
+                        ))
+                        # Participants are updated in place; record them before the next dialog
+                        store.save_entity_snapshots(participants, timepoint.timepoint_id, run_id=run_id)
+                    if batched:
+                        self._extract_dialog_knowledge(window_plans, window_dialogs, llm, store, extraction_batch_size)
+                    dialogs.extend(window_dialogs)
+
+            # Save dialogs to store in timepoint order
             dialogs_created = 0
-
-            for timepoint in timepoints:
-                try:
-                    # Select a subset of entities for dialog (2-4 entities)
-                    import random
-                    num_participants = min(4, len(entities))
-                    dialog_participants = random.sample(entities, num_participants)
-
-                    print(f"  Generating dialog for {timepoint.timepoint_id} with {num_participants} entities...")
-
-                    # Build timeline context (simplified) - convert timestamps to ISO strings for JSON serialization
-                    timeline = [{"event_description": tp.event_description, "timestamp": tp.timestamp.isoformat() if hasattr(tp.timestamp, 'isoformat') else str(tp.timestamp)} for tp in timepoints]
-
-                    # Synthesize dialog (this invokes M11)
-                    # Entities should now have tensors from ANDOS layer-by-layer training
-                    dialog = synthesize_dialog(
-                        dialog_participants,
-                        timepoint,
-                        timeline,
-                        llm,
-                        store,
-                        run_id=run_id  # January 2026: Pass run_id for dialog persistence
-                    )
-
-                    # Save dialog to store
+            for dialog in dialogs:
+                if dialog is not None:
                     store.save_dialog(dialog)
                     dialogs_created += 1
 
-                    print(f"  ✓ Created dialog with {len(dialog_participants)} participants")
-
-                except Exception as e:
-                    print(f"  ⚠️  Failed to synthesize dialog for {timepoint.timepoint_id}: {e}")
-                    # Print traceback for debugging datetime serialization issues
-                    if "datetime" in str(e).lower() or "json" in str(e).lower():
-                        import traceback
-                        traceback.print_exc()
-                    # Continue with other timepoints
-
             print(f"✓ Synthesized {dialogs_created} dialogs")
 
             self.logfire.info(
@@ -2423,6 +2585,173 @@ RESPOND WITH ONLY THE EVENT DESCRIPTION, nothing else."""
                 timepoints_processed=len(timepoints)
             )
 
+    def _synthesize_timepoint_dialog(
+        self,
+        timepoint: Timepoint,
+        participants: List[Entity],
+        timeline: List[Dict],
+        llm: LLMClient,
+        store: GraphStore,
+        run_id: str,
+        persist_entities: bool = True,
+        extract_knowledge: bool = True
+    ):
+        """Synthesize one timepoint's dialog; returns None (after logging) on failure"""
+        try:
+            print(f"  Generating dialog for {timepoint.timepoint_id} with {len(participants)} entities...")
+
+            # Synthesize dialog (this invokes M11)
+            # Entities should now have tensors from ANDOS layer-by-layer training
+            dialog = synthesize_dialog(
+                participants,
+                timepoint,
+                timeline,
+                llm,
+                store,
+                run_id=run_id,  # January 2026: Pass run_id for dialog persistence
+                persist_entities=persist_entities,
+                extract_knowledge=extract_knowledge
+            )
+
+            print(f"  ✓ Created dialog with {len(participants)} participants")
+            return dialog
+
+        except Exception as e:
+            print(f"  ⚠️  Failed to synthesize dialog for {timepoint.timepoint_id}: {e}")
+            # Print traceback for debugging datetime serialization issues
+            if "datetime" in str(e).lower() or "json" in str(e).lower():
+                import traceback
+                traceback.print_exc()
+            # Continue with other timepoints
+            return None
+
+    def _synthesize_dialogs_concurrently(
+        self,
+        entities: List[Entity],
+        plans: List[tuple],
+        timeline: List[Dict],
+        llm: LLMClient,
+        store: GraphStore,
+        run_id: str,
+        max_workers: int,
+        extract_knowledge: bool = True
+    ) -> List[Optional[Any]]:
+        """
+        Run each (timepoint, participants) plan on a worker thread.
+
+        Every dialog sees the same starting emotional state; each worker's
+        updates land on private entity copies and are folded into `entities`
+        afterwards with merge_emotional_state_updates, in timepoint order.
+        Each timepoint's participants are snapshotted as the baseline plus
+        the updates of every dialog up to and including that timepoint's.
+
+        Returns:
+            Dialogs (or None for failures) in plan order
+        """
+        import copy
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Apply the TTM→cognitive pre-sync once on the real entities so every
+        # copy starts from (and is diffed against) the same baseline
+        participant_ids = {e.entity_id for _, participants in plans for e in participants}
+        baselines = {}
+        for entity in entities:
+            if entity.entity_id not in participant_ids:
+                continue
+            _sync_ttm_to_cognitive(entity)
+            baselines[entity.entity_id] = copy.deepcopy(
+                entity.entity_metadata.get("cognitive_tensor", {})
+            )
+
+        def run_plan(timepoint: Timepoint, participants: List[Entity]):
+            # Mechanism tracking reads the run_id from thread-local storage
+            set_current_run_id(run_id)
+            try:
+                copies = [Entity(**copy.deepcopy(e.model_dump())) for e in participants]
+                dialog = self._synthesize_timepoint_dialog(
+                    timepoint, copies, timeline, llm, store, run_id, persist_entities=False,
+                    extract_knowledge=extract_knowledge
+                )
+                states = {
+                    c.entity_id: copy.deepcopy(c.entity_metadata.get("cognitive_tensor", {}))
+                    for c in copies
+                }
+                return dialog, states
+            finally:
+                clear_current_run_id()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_plan, tp, participants) for tp, participants in plans]
+            results = [future.result() for future in futures]
+
+        # Replay the updates one dialog at a time on copies to snapshot each
+        # timepoint's participants as serial synthesis would have left them
+        replay = {
+            entity.entity_id: Entity(**copy.deepcopy(entity.model_dump()))
+            for entity in entities if entity.entity_id in participant_ids
+        }
+        for (timepoint, participants), (dialog, states) in zip(plans, results):
+            if dialog is not None:
+                merge_emotional_state_updates(list(replay.values()), baselines, [states])
+            store.save_entity_snapshots(
+                [replay[e.entity_id] for e in participants], timepoint.timepoint_id, run_id=run_id
+            )
+
+        updates = [states for dialog, states in results if dialog is not None]
+        merged = merge_emotional_state_updates(entities, baselines, updates, store=store)
+        if merged:
+            print(f"  [M11] Merged emotional state for {merged} entities across {len(updates)} dialogs")
+
+        return [dialog for dialog, _ in results]
+
+    def _extract_dialog_knowledge(
+        self,
+        plans: List[tuple],
+        dialogs: List[Optional[Any]],
+        llm: LLMClient,
+        store: GraphStore,
+        batch_size: int
+    ) -> int:
+        """
+        Run batched M19 extraction over synthesized dialogs and record exposures.
+
+        Args:
+            plans: (timepoint, participants) per dialog
+            dialogs: Synthesized dialogs (None for failures), aligned with plans
+            llm: LLM client
+            store: Store receiving the exposure events
+            batch_size: Max dialogs per extraction call
+
+        Returns:
+            Number of exposure events created
+        """
+        requests = []
+        for (timepoint, participants), dialog in zip(plans, dialogs):
+            if dialog is None:
+                continue
+            requests.append(DialogExtractionRequest(
+                dialog_turns=json.loads(dialog.turns),
+                entities=participants,
+                timepoint=timepoint,
+                dialog_id=f"dialog_{timepoint.timepoint_id}"
+            ))
+        if not requests:
+            return 0
+
+        try:
+            results = extract_knowledge_from_dialogs(requests, llm, store, max_batch_size=batch_size)
+        except Exception as e:
+            print(f"  ⚠️  Batched knowledge extraction failed: {e}")
+            return 0
+
+        events_created = 0
+        for request, result in zip(requests, results):
+            events_created += create_exposure_events_from_knowledge(result, request.timepoint, store)
+        items = sum(len(result.items) for result in results)
+        print(f"  [M19→M3] Extracted {items} knowledge items from {len(requests)} dialogs, "
+              f"created {events_created} exposure events")
+        return events_created
+
     def _execute_queries(
         self,
         entities: List[Entity],
@@ -2441,8 +2770,8 @@ RESPOND WITH ONLY THE EVENT DESCRIPTION, nothing else."""
             llm = scene_result["llm_client"]
             store = scene_result["store"]
 
-            # Create query interface
-            query_interface = QueryInterface(store, llm)
+            # Create query interface (reuses the TensorRAG embedder if one was loaded)
+            query_interface = QueryInterface(store, llm, tensor_rag=self._tensor_rag)
 
             # Generate 3-5 queries to exercise M5 lazy resolution
             queries_executed = 0
@@ -342,6 +342,10 @@ class EntityConfig(BaseModel):
         ge=0, le=6, default=0,
         description="Animistic entity inclusion level (0=humans only, 6=all types)"
     )
+    max_population_workers: int = Field(
+        ge=1, le=16, default=4,
+        description="Max entities per ANDOS layer populated/prospected concurrently (1 = serial)"
+    )
 
     # SynthasAIzer controls (optional, backward compatible)
     envelope: Optional[EnvelopeConfig] = Field(
@@ -462,6 +466,14 @@ class TemporalConfig(BaseModel):
         ge=1, le=100, default=5,
         description="Number of complete paths to find and rank"
     )
+    beam_width: Optional[int] = Field(
+        ge=1, le=100, default=None,
+        description="Max frontier states carried into the next PORTAL/BRANCHING step (None = path_count * 2)"
+    )
+    beam_dedupe: bool = Field(
+        default=True,
+        description="Collapse near-identical frontier states (same time and normalized description)"
+    )
     preserve_all_paths: bool = Field(
         default=True,
         description="Keep ALL generated paths for exploration (not just top N). Enables divergence analysis."
@@ -546,6 +558,22 @@ class TemporalConfig(BaseModel):
         ge=1, le=6, default=3,
         description="Max parallel state processing in backward exploration"
     )
+    max_branch_workers: int = Field(
+        ge=1, le=6, default=3,
+        description="Max parallel frontier states expanded per forward step in BRANCHING mode (1 = serial)"
+    )
+    branch_expansion_timeout_seconds: int = Field(
+        ge=10, le=600, default=120,
+        description="Timeout for expanding one frontier state in BRANCHING mode; timed-out states are dropped"
+    )
+    max_dialog_workers: int = Field(
+        ge=1, le=16, default=4,
+        description="Max timepoints whose dialogs are synthesized concurrently in the E2E runner (1 = serial)"
+    )
+    dialog_extraction_batch_size: int = Field(
+        ge=1, le=8, default=4,
+        description="Max dialogs packed into one M19 knowledge extraction call in the E2E runner (1 = one call per dialog)"
+    )
     fast_simulation_model: Optional[str] = Field(
         default=None,
         description="Use cheaper/faster model for mini-sims (None = use default model)"
@@ -210,7 +210,8 @@ class WorldManager:
             Entity, Timeline, Timepoint, ExposureEvent, QueryHistory,
             Dialog, RelationshipTrajectory, ProspectiveState,
             EnvironmentEntity, AtmosphereEntity, CrowdEntity,
-            SystemPrompt, ValidationRule
+            SystemPrompt, ValidationRule, KnowledgeState,
+            DialogParticipant, EntitySnapshot
         )
 
         # Create engine
@@ -229,7 +230,8 @@ class WorldManager:
             "entity", "timeline", "timepoint", "exposureevent",
             "queryhistory", "dialog", "relationshiptrajectory",
             "prospectivestate", "environmententity", "atmosphereentity",
-            "crowdentity", "systemprompt", "validationrule"
+            "crowdentity", "systemprompt", "validationrule",
+            "knowledge_state", "dialog_participant", "entity_snapshot"
         ]
 
         with engine.begin() as conn:
@@ -335,7 +337,8 @@ class WorldManager:
             "entity", "timeline", "timepoint", "exposureevent",
             "queryhistory", "dialog", "relationshiptrajectory",
             "prospectivestate", "environmententity", "atmosphereentity",
-            "crowdentity", "systemprompt", "validationrule"
+            "crowdentity", "systemprompt", "validationrule",
+            "knowledge_state", "dialog_participant", "entity_snapshot"
         ]
 
         with engine.begin() as conn:
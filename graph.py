@@ -2,10 +2,12 @@
 # ============================================================================
 # graph.py - NetworkX graph operations and fixtures
 # ============================================================================
+import threading
 import warnings
+import weakref
 import networkx as nx
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Dict, Optional
 import numpy as np
 
 def create_test_graph(n_entities: int = 10, seed: int = 42) -> nx.Graph:
@@ -53,17 +55,114 @@ def create_timeline_graph(start_date: datetime, end_date: datetime, resolution:
     
     return G
 
+class GraphMetricsCache:
+    """
+    Memoized centrality metrics, computed once per graph version.
+
+    compute_ttm_metrics, ResolutionEngine and tensor population used to run
+    whole-graph centrality for every entity and then read one node's value.
+    This cache keeps each metric per graph object and recomputes it only when
+    the graph's fingerprint (node count, edge count, version counter) changes.
+    Code that mutates a graph without changing its size should call
+    bump_graph_version().
+
+    Betweenness on graphs larger than approximate_above nodes is estimated
+    from betweenness_k sampled sources with a fixed seed.
+    """
+
+    METRICS = ("eigenvector", "betweenness", "pagerank", "degree")
+
+    def __init__(self, betweenness_k: int = 200, approximate_above: Optional[int] = 1000,
+                 seed: int = 42):
+        self.betweenness_k = betweenness_k
+        self.approximate_above = approximate_above
+        self.seed = seed
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # graph -> (fingerprint, {metric: values}); entries die with the graph
+        self._entries = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def fingerprint(G: nx.Graph) -> tuple:
+        return (G.number_of_nodes(), G.number_of_edges(), G.graph.get("metrics_version", 0))
+
+    def get(self, G: nx.Graph, metric: str) -> Dict[str, float]:
+        """Return node -> value for one metric. Treat the result as read-only."""
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown graph metric: {metric}")
+
+        fingerprint = self.fingerprint(G)
+        with self._lock:
+            entry = self._entries.get(G)
+            if entry is None or entry[0] != fingerprint:
+                entry = (fingerprint, {})
+                self._entries[G] = entry
+            values = entry[1].get(metric)
+            if values is not None:
+                self.hits += 1
+                return values
+
+            # Computed under the lock so concurrent workers wait for one result
+            self.misses += 1
+            values = self._compute(G, metric)
+            entry[1][metric] = values
+            return values
+
+    def centralities(self, G: nx.Graph) -> Dict[str, Dict[str, float]]:
+        return {metric: self.get(G, metric) for metric in self.METRICS}
+
+    def invalidate(self, G: Optional[nx.Graph] = None):
+        with self._lock:
+            if G is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(G, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "graphs": len(self._entries)}
+
+    def _compute(self, G: nx.Graph, metric: str) -> Dict[str, float]:
+        if G.number_of_nodes() == 0:
+            return {}
+
+        # Suppress RuntimeWarning for small graphs
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', category=RuntimeWarning)
+            if metric == "eigenvector":
+                try:
+                    return nx.eigenvector_centrality(G, max_iter=1000)
+                except nx.PowerIterationFailedConvergence:
+                    return nx.eigenvector_centrality_numpy(G)
+            if metric == "betweenness":
+                n = G.number_of_nodes()
+                if self.approximate_above is not None and n > self.approximate_above:
+                    return nx.betweenness_centrality(G, k=min(self.betweenness_k, n), seed=self.seed)
+                return nx.betweenness_centrality(G)
+            if metric == "pagerank":
+                return nx.pagerank(G)
+            return dict(G.degree())
+
+
+_metrics_cache = GraphMetricsCache()
+
+
+def get_graph_metrics_cache() -> GraphMetricsCache:
+    """Process-wide metrics cache shared by tensors, resolution and training code."""
+    return _metrics_cache
+
+
+def bump_graph_version(G: nx.Graph):
+    """Invalidate cached metrics after a mutation that keeps node/edge counts."""
+    G.graph["metrics_version"] = G.graph.get("metrics_version", 0) + 1
+
+
 def compute_centralities(G: nx.Graph) -> Dict[str, Dict[str, float]]:
     """Compute all centrality metrics"""
-    # Suppress RuntimeWarning for small graphs
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore', category=RuntimeWarning)
-        return {
-            "eigenvector": nx.eigenvector_centrality(G),
-            "betweenness": nx.betweenness_centrality(G),
-            "pagerank": nx.pagerank(G),
-            "degree": dict(G.degree())
-        }
+    return {
+        metric: dict(values)
+        for metric, values in get_graph_metrics_cache().centralities(G).items()
+    }
 
 def export_graph_data(graph: nx.Graph, filename: str):
     """Export graph in multiple formats for visualization"""
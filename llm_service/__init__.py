@@ -9,6 +9,7 @@ This package provides a unified interface for LLM operations with:
 - Session management and context injection
 - Flexible parameterization and configuration
 - **Intelligent per-action model selection** (NEW)
+- Content-addressed response caching with record/replay
 
 Model Selection:
     The model_selector module provides intelligent model selection based on:
@@ -36,6 +37,7 @@ Model Selection:
 from llm_service.provider import LLMProvider, LLMResponse
 from llm_service.service import LLMService
 from llm_service.config import LLMServiceConfig
+from llm_service.response_cache import ResponseCache, CacheMode, CacheMissError
 from llm_service.model_selector import (
     ModelSelector,
     ModelCapability,
@@ -53,6 +55,10 @@ __all__ = [
     "LLMResponse",
     "LLMService",
     "LLMServiceConfig",
+    # Response caching
+    "ResponseCache",
+    "CacheMode",
+    "CacheMissError",
     # Model selection
     "ModelSelector",
     "ModelCapability",
@@ -54,7 +54,11 @@ class SecurityConfig:
 class PerformanceConfig:
     """Configuration for performance optimization"""
     caching_enabled: bool = True
-    cache_ttl: int = 300  # seconds
+    cache_ttl: int = 300  # seconds (in-memory tier)
+    cache_max_entries: int = 1000  # in-memory LRU bound
+    cache_path: Optional[str] = None  # SQLite file for the persistent tier
+    cache_mode: str = "read_write"  # read_write, record, replay
+    cache_sampled_calls: bool = False  # read_write mode: also cache temperature > 0 calls
     timeout_seconds: float = 30.0
 
 
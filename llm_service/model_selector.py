@@ -625,6 +625,9 @@ ACTION_REQUIREMENTS: Dict[ActionType, Dict[str, Any]] = {
         "required": {ModelCapability.STRUCTURED_JSON, ModelCapability.INSTRUCTION_FOLLOWING},
         "preferred": {ModelCapability.HIGH_QUALITY, ModelCapability.LARGE_CONTEXT, ModelCapability.DIALOG_GENERATION},
         "min_context_tokens": 16384,  # Need context for causal graph + dialog
+        "min_output_tokens": 1000,
+        "tokens_per_unit": 150,     # ~one knowledge item per dialog turn
+        "output_scaling_factor": "turn_count",  # Scale output by this context key
     },
 
     # Portal mode operations (M17)
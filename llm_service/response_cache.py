@@ -0,0 +1,326 @@
+"""
+Response Cache - Content-addressed caching of LLM responses
+
+Two tiers sit between LLMService and the provider:
+- In-memory LRU with TTL expiry (per process)
+- Optional on-disk SQLite tier that persists across runs
+
+Cache modes:
+- read_write: Serve hits, call the provider on misses and store the result
+- record: Always call the provider, store every successful response
+- replay: Serve only from cache; a miss raises CacheMissError (zero-cost reruns)
+"""
+
+from typing import Dict, Any, Optional, Type
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from enum import Enum
+from pathlib import Path
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from pydantic import BaseModel
+
+from llm_service.provider import LLMResponse
+
+
+class CacheMode(str, Enum):
+    """How the response cache interacts with the provider"""
+    READ_WRITE = "read_write"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class CacheMissError(Exception):
+    """Raised in replay mode when a call has no recorded response"""
+    pass
+
+
+@dataclass
+class CachedResponse:
+    """Serializable subset of an LLMResponse"""
+    content: str
+    model: str
+    tokens_used: Dict[str, int]
+    cost_usd: float
+    created_at: float
+
+    def to_response(self) -> LLMResponse:
+        """Rebuild an LLMResponse for a cache hit (no cost, no latency)"""
+        return LLMResponse(
+            content=self.content,
+            model=self.model,
+            tokens_used=dict(self.tokens_used),
+            cost_usd=0.0,
+            latency_ms=0.0,
+            success=True,
+            metadata={"cache_hit": True, "original_cost_usd": self.cost_usd},
+        )
+
+
+def schema_fingerprint(schema: Optional[Type[BaseModel]]) -> Optional[str]:
+    """Stable fingerprint of a response schema (changes when fields change)"""
+    if schema is None:
+        return None
+    schema_json = json.dumps(schema.model_json_schema(), sort_keys=True)
+    return f"{schema.__name__}:{hashlib.sha256(schema_json.encode()).hexdigest()[:16]}"
+
+
+def make_cache_key(
+    model: str,
+    system: str,
+    user: str,
+    temperature: float,
+    schema: Optional[Type[BaseModel]] = None,
+    **params: Any,
+) -> str:
+    """
+    Compute the content address of an LLM request.
+
+    Args:
+        model: Model identifier
+        system: System prompt (as sent to the provider)
+        user: User prompt (as sent to the provider)
+        temperature: Sampling temperature
+        schema: Optional response schema for structured calls
+        **params: Any other sampling parameters that affect the response
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "model": model,
+        "system": system,
+        "user": user,
+        "temperature": temperature,
+        "schema": schema_fingerprint(schema),
+        "params": params,
+    }
+    key_str = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier LLM response cache.
+
+    The memory tier is bounded by max_entries (LRU eviction) and ttl_seconds.
+    The disk tier is a persistent record of responses: entries live until
+    clear() is called, so a recorded run can be replayed deterministically.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: int = 300,
+        db_path: Optional[str] = None,
+        mode: CacheMode = CacheMode.READ_WRITE,
+    ):
+        """
+        Args:
+            max_entries: Maximum entries held in memory
+            ttl_seconds: Time-to-live for in-memory entries (0 disables expiry)
+            db_path: SQLite file for the on-disk tier (None disables it)
+            mode: CacheMode controlling read/write behavior
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.mode = CacheMode(mode)
+        self.db_path = db_path
+
+        self._memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Statistics
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.saved_cost_usd = 0.0
+
+        if db_path:
+            self._init_disk_tier(db_path)
+
+    def _init_disk_tier(self, db_path: str) -> None:
+        """Open (or create) the SQLite tier"""
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                cache_key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                model TEXT NOT NULL,
+                tokens_used TEXT NOT NULL,
+                cost_usd REAL NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    @property
+    def reads_enabled(self) -> bool:
+        return self.mode in (CacheMode.READ_WRITE, CacheMode.REPLAY)
+
+    @property
+    def writes_enabled(self) -> bool:
+        return self.mode in (CacheMode.READ_WRITE, CacheMode.RECORD)
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a response by cache key.
+
+        Returns:
+            LLMResponse for a hit, None for a miss (or when reads are disabled)
+
+        Raises:
+            CacheMissError: In replay mode when the key was never recorded
+        """
+        if not self.reads_enabled:
+            return None
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._is_expired(entry):
+                del self._memory[key]
+                entry = None
+
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+            else:
+                entry = self._disk_get(key)
+                if entry is not None:
+                    self.disk_hits += 1
+                    self._memory_put(key, entry)
+
+            if entry is None:
+                self.misses += 1
+                if self.mode == CacheMode.REPLAY:
+                    raise CacheMissError(f"No recorded response for cache key {key[:12]}")
+                return None
+
+            self.hits += 1
+            self.saved_cost_usd += entry.cost_usd
+            return entry.to_response()
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a successful response under its cache key"""
+        if not self.writes_enabled or not response.success:
+            return
+
+        entry = CachedResponse(
+            content=response.content,
+            model=response.model,
+            tokens_used=dict(response.tokens_used or {}),
+            cost_usd=response.cost_usd,
+            created_at=time.time(),
+        )
+        with self._lock:
+            self._memory_put(key, entry)
+            self._disk_put(key, entry)
+            self.writes += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_response_cache")
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the on-disk tier"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode.value,
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "disk_enabled": self._conn is not None,
+            "saved_cost_usd": self.saved_cost_usd,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _is_expired(self, entry: CachedResponse) -> bool:
+        if self.ttl_seconds <= 0 or self.mode == CacheMode.REPLAY:
+            return False
+        return time.time() - entry.created_at >= self.ttl_seconds
+
+    def _memory_put(self, key: str, entry: CachedResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_get(self, key: str) -> Optional[CachedResponse]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT content, model, tokens_used, cost_usd FROM llm_response_cache "
+            "WHERE cache_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        content, model, tokens_used, cost_usd = row
+        # Promoted entries get a fresh memory TTL
+        return CachedResponse(
+            content=content,
+            model=model,
+            tokens_used=json.loads(tokens_used),
+            cost_usd=cost_usd,
+            created_at=time.time(),
+        )
+
+    def _disk_put(self, key: str, entry: CachedResponse) -> None:
+        if self._conn is None:
+            return
+        record = asdict(entry)
+        self._conn.execute(
+            """
+            INSERT INTO llm_response_cache
+                (cache_key, content, model, tokens_used, cost_usd, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                content = excluded.content,
+                model = excluded.model,
+                tokens_used = excluded.tokens_used,
+                cost_usd = excluded.cost_usd,
+                created_at = excluded.created_at
+            """,
+            (
+                key,
+                record["content"],
+                record["model"],
+                json.dumps(record["tokens_used"]),
+                record["cost_usd"],
+                record["created_at"],
+            ),
+        )
+        self._conn.commit()
@@ -18,6 +18,7 @@ from llm_service.error_handler import ErrorHandler, RetryConfig
 from llm_service.call_logger import CallLogger
 from llm_service.security_filter import SecurityFilter
 from llm_service.model_selector import ModelSelector, ActionType, ModelCapability
+from llm_service.response_cache import ResponseCache, CacheMode, make_cache_key
 
 
 class LLMService:
@@ -32,6 +33,7 @@ class LLMService:
     - Security filtering (input/output)
     - Comprehensive logging
     - Session management
+    - Content-addressed response caching (memory LRU + optional SQLite tier)
     """
 
     def __init__(self, config: LLMServiceConfig):
@@ -71,6 +73,16 @@ class LLMService:
         # Initialize provider based on config
         self.provider = self._create_provider()
 
+        # Response cache sits between the service and the provider
+        self.response_cache: Optional[ResponseCache] = None
+        if config.performance.caching_enabled:
+            self.response_cache = ResponseCache(
+                max_entries=config.performance.cache_max_entries,
+                ttl_seconds=config.performance.cache_ttl,
+                db_path=config.performance.cache_path,
+                mode=CacheMode(config.performance.cache_mode),
+            )
+
         # Initialize model selector for intelligent model selection
         self.model_selector = ModelSelector(default_model=config.defaults.model)
 
@@ -88,6 +100,9 @@ class LLMService:
         model: Optional[str] = None,
         call_type: str = "generic",
         apply_security: bool = True,
+        response_schema: Optional[Type[BaseModel]] = None,
+        use_cache: bool = True,
+        defer_cache_write: bool = False,
         **kwargs
     ) -> LLMResponse:
         """
@@ -102,10 +117,20 @@ class LLMService:
             model: Model identifier (uses config default if None)
             call_type: Type of call for logging (e.g., 'populate_entity')
             apply_security: Whether to apply security filtering
+            response_schema: Schema the response will be parsed into (part of the cache key)
+            use_cache: Whether to consult the response cache for this call.
+                In read_write mode, temperature > 0 calls are only cached when
+                performance.cache_sampled_calls is set; record/replay always cache
+            defer_cache_write: Leave storing the response to the caller, which
+                finds the key in response.metadata["cache_key"] (structured_call
+                stores it only once the response parses)
             **kwargs: Additional provider-specific parameters
 
         Returns:
             LLMResponse with content and metadata
+
+        Raises:
+            CacheMissError: In replay mode when the call was never recorded
         """
         # Use config defaults for unspecified parameters
         temperature = temperature if temperature is not None else self.config.defaults.temperature
@@ -118,6 +143,46 @@ class LLMService:
             system = self.security_filter.bleach_input(system)
             user = self.security_filter.bleach_input(user)
 
+        # Serve identical requests from the response cache
+        cache_key = None
+        if use_cache and self.response_cache is not None and (
+            temperature == 0
+            or self.response_cache.mode != CacheMode.READ_WRITE
+            or self.config.performance.cache_sampled_calls
+        ):
+            cache_key = make_cache_key(
+                model=model,
+                system=system,
+                user=user,
+                temperature=temperature,
+                schema=response_schema,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                **kwargs
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.call_logger.log_call(
+                    call_type=call_type,
+                    model=model,
+                    parameters={
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                        "top_p": top_p,
+                        "cache_hit": True,
+                    },
+                    tokens_used=cached.tokens_used,
+                    cost_usd=0.0,
+                    latency_ms=0.0,
+                    success=True,
+                    retry_count=0,
+                    system_prompt=system,
+                    user_prompt=user,
+                    response_full=cached.content,
+                )
+                self.call_count += 1
+                return cached
+
         # Define API call function for retry wrapper
         def _make_call() -> LLMResponse:
             return self.provider.call(
@@ -158,6 +223,12 @@ class LLMService:
         if apply_security and self.config.security.output_sanitization and response.success:
             response.content = self.security_filter.sanitize_output(response.content)
 
+        if cache_key is not None:
+            if defer_cache_write:
+                response.metadata = {**(response.metadata or {}), "cache_key": cache_key}
+            else:
+                self.response_cache.put(cache_key, response)
+
         # Log the call
         self.call_logger.log_call(
             call_type=call_type,
@@ -228,6 +299,8 @@ class LLMService:
             model=model,
             call_type=call_type,
             apply_security=apply_security,
+            response_schema=schema,
+            defer_cache_write=True,
             **kwargs
         )
 
@@ -240,7 +313,7 @@ class LLMService:
 
         # Parse response into schema
         try:
-            return self.response_parser.parse_structured(
+            result = self.response_parser.parse_structured(
                 response.content,
                 schema,
                 allow_partial=allow_partial
@@ -252,6 +325,12 @@ class LLMService:
             # Failsoft mode: return null instance
             return self.response_parser._create_null_instance(schema)
 
+        # Only responses that parse are cached, so a bad one is not replayed
+        cache_key = (response.metadata or {}).get("cache_key")
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response)
+        return result
+
     def start_session(
         self,
         workflow: str = "unknown",
@@ -288,6 +367,10 @@ class LLMService:
             "logger_stats": self.call_logger.get_statistics(),
             "retry_stats": self.error_handler.get_retry_statistics(),
             "filter_stats": self.security_filter.get_filter_statistics(),
+            "cache_stats": (
+                self.response_cache.get_statistics()
+                if self.response_cache is not None else {"enabled": False}
+            ),
         }
 
     def _create_provider(self) -> LLMProvider:
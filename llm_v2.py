@@ -28,7 +28,7 @@ from llm_service import LLMService, LLMServiceConfig
 from llm_service.config import ServiceMode, DefaultParametersConfig, APIKeyConfig
 
 # Import schemas (canonical location - breaks circular dependency)
-from schemas import EntityPopulation, ValidationResult
+from schemas import EntityPopulation, ValidationResult, RelevanceScores
 
 
 class LLMClient:
@@ -419,6 +419,79 @@ Relevance score:"""
         legacy = LegacyClient(self.api_key, self.base_url)
         return legacy.score_relevance(query, knowledge_item, model)
 
+    def score_relevance_batch(
+        self,
+        query: str,
+        knowledge_items: List[str],
+        model: Optional[str] = None
+    ) -> List[float]:
+        """
+        Score many knowledge items against one query in a single call.
+
+        Args:
+            query: Query string
+            knowledge_items: Knowledge items to score
+            model: Model identifier
+
+        Returns:
+            Relevance scores (0.0-1.0), aligned with knowledge_items
+        """
+        if not knowledge_items:
+            return []
+        if self.use_centralized_service:
+            return self._score_relevance_batch_v2(query, knowledge_items, model)
+        else:
+            return [self._score_relevance_legacy(query, item, model) for item in knowledge_items]
+
+    def _score_relevance_batch_v2(
+        self,
+        query: str,
+        knowledge_items: List[str],
+        model: Optional[str] = None
+    ) -> List[float]:
+        """Implementation using centralized service"""
+        numbered = "\n".join(f'{i}. "{item}"' for i, item in enumerate(knowledge_items, 1))
+        user_prompt = f"""Rate how relevant each knowledge item is to the query on a scale of 0.0 to 1.0.
+
+Query: "{query}"
+
+Knowledge items:
+{numbered}
+
+Use this scale:
+- 1.0 = Perfectly relevant and directly answers the query
+- 0.5 = Somewhat relevant but not central to the query
+- 0.0 = Completely irrelevant to the query
+
+Return a JSON object with one field:
+- scores: array of exactly {len(knowledge_items)} numbers, in the same order as the items
+
+Return only valid JSON, no other text."""
+
+        try:
+            result = self.service.structured_call(
+                system="You are an expert at assessing relevance between queries and knowledge items.",
+                user=user_prompt,
+                schema=RelevanceScores,
+                temperature=0.1,
+                max_tokens=20 + 8 * len(knowledge_items),
+                model=model,
+                call_type="score_relevance_batch",
+            )
+        except Exception:
+            # Fallback to heuristic for every item if the batched call fails
+            result = None
+
+        # Items the response missed or mangled fall back to the heuristic
+        scores = []
+        returned = list(result.scores or []) if result is not None else []
+        for i, item in enumerate(knowledge_items):
+            try:
+                scores.append(max(0.0, min(1.0, float(returned[i]))))
+            except (IndexError, TypeError, ValueError):
+                scores.append(self._heuristic_relevance_score(query, item))
+        return scores
+
     def generate_structured(self, prompt: str, response_model: type, model: Optional[str] = None, **kwargs):
         """
         Generate structured output using Pydantic schema.
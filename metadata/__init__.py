@@ -17,6 +17,8 @@ from .run_tracker import (
     ALL_MECHANISMS
 )
 
+from .telemetry_writer import TelemetryWriter
+
 from .coverage_matrix import CoverageMatrix
 
 from .tracking import (
@@ -39,6 +41,7 @@ __all__ = [
     "ResolutionAssignment",
     "ValidationRecord",
     "ALL_MECHANISMS",
+    "TelemetryWriter",
     "CoverageMatrix",
     "track_mechanism",
     "track_resolution",
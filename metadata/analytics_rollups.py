@@ -0,0 +1,292 @@
+"""
+Analytics Rollups - Incrementally maintained aggregates over runs.db
+
+The dashboard used to compute its analytics from raw rows on every request
+(a self-join over mechanism_usage for co-occurrence, one GROUP BY per listed
+run). These tables hold the same aggregates and are updated per run:
+
+- run_mechanism_counts: mechanism -> call count for each run
+- rollup_totals: single-row run/cost/entity/duration totals
+- rollup_daily_cost: cost and run count per DATE(started_at)
+- rollup_templates / rollup_causal_modes: run counts per key
+- rollup_mechanism_totals: call counts per mechanism across runs
+- rollup_mechanism_pairs: runs in which both mechanisms appear
+
+Each run's last applied contribution is kept in rollup_run_state, so
+refresh_run() subtracts the old contribution and adds the new one. Calling
+it repeatedly for the same run (start, completion, re-save) is safe.
+"""
+
+import json
+import sqlite3
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+ROLLUP_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS rollup_run_state (
+        run_id TEXT PRIMARY KEY,
+        day TEXT,
+        template_id TEXT,
+        causal_mode TEXT,
+        status TEXT,
+        cost_usd REAL,
+        entities_created INTEGER,
+        timepoints_created INTEGER,
+        duration_seconds REAL,
+        mechanisms TEXT
+    );
+    CREATE TABLE IF NOT EXISTS run_mechanism_counts (
+        run_id TEXT NOT NULL,
+        mechanism TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (run_id, mechanism)
+    );
+    CREATE TABLE IF NOT EXISTS rollup_totals (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        total_runs INTEGER NOT NULL DEFAULT 0,
+        total_cost REAL NOT NULL DEFAULT 0,
+        total_entities INTEGER NOT NULL DEFAULT 0,
+        total_timepoints INTEGER NOT NULL DEFAULT 0,
+        duration_sum REAL NOT NULL DEFAULT 0,
+        duration_count INTEGER NOT NULL DEFAULT 0,
+        completed_runs INTEGER NOT NULL DEFAULT 0,
+        failed_runs INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS rollup_daily_cost (
+        date TEXT PRIMARY KEY,
+        total_cost REAL NOT NULL DEFAULT 0,
+        run_count INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS rollup_templates (
+        template_id TEXT PRIMARY KEY,
+        run_count INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS rollup_causal_modes (
+        causal_mode TEXT PRIMARY KEY,
+        run_count INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS rollup_mechanism_totals (
+        mechanism TEXT PRIMARY KEY,
+        count INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS rollup_mechanism_pairs (
+        mechanism1 TEXT NOT NULL,
+        mechanism2 TEXT NOT NULL,
+        co_occurrence INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (mechanism1, mechanism2)
+    );
+    CREATE INDEX IF NOT EXISTS idx_mechanism_usage_run ON mechanism_usage(run_id);
+    CREATE INDEX IF NOT EXISTS idx_rollup_pairs_count ON rollup_mechanism_pairs(co_occurrence);
+    INSERT OR IGNORE INTO rollup_totals (id) VALUES (1);
+"""
+
+# Keyed count tables: (table, key column, count column)
+_KEYED_COUNTS = {
+    "template_id": ("rollup_templates", "template_id", "run_count"),
+    "causal_mode": ("rollup_causal_modes", "causal_mode", "run_count"),
+}
+
+
+class AnalyticsRollups:
+    """
+    Maintains the rollup tables in a runs.db.
+
+    Args:
+        db_path: Path to the MetadataManager database
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = str(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def ensure(self) -> bool:
+        """
+        Create the rollup tables, backfilling them from raw rows the first
+        time they appear in an existing database.
+
+        Returns:
+            True if a backfill ran
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executescript(ROLLUP_SCHEMA)
+            pending = conn.execute("""
+                SELECT EXISTS (
+                    SELECT 1 FROM runs
+                    WHERE run_id NOT IN (SELECT run_id FROM rollup_run_state)
+                )
+            """).fetchone()[0]
+        finally:
+            conn.close()
+
+        if pending:
+            self.rebuild()
+        return bool(pending)
+
+    def rebuild(self) -> int:
+        """
+        Recompute every rollup from runs and mechanism_usage.
+
+        Returns:
+            Number of runs rolled up
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                for table in ("rollup_run_state", "run_mechanism_counts", "rollup_daily_cost",
+                              "rollup_templates", "rollup_causal_modes",
+                              "rollup_mechanism_totals", "rollup_mechanism_pairs"):
+                    conn.execute(f"DELETE FROM {table}")
+                conn.execute("DELETE FROM rollup_totals")
+                conn.execute("INSERT INTO rollup_totals (id) VALUES (1)")
+
+                run_ids = [row[0] for row in conn.execute("SELECT run_id FROM runs")]
+                for run_id in run_ids:
+                    self._refresh(conn, run_id)
+        finally:
+            conn.close()
+        return len(run_ids)
+
+    def refresh_run(self, run_id: str, conn: Optional[sqlite3.Connection] = None):
+        """
+        Bring the rollups up to date for one run.
+
+        Args:
+            run_id: Run whose contribution changed
+            conn: Optional open connection; the caller then owns the commit
+        """
+        if conn is not None:
+            self._refresh(conn, run_id)
+            return
+
+        conn = self._connect()
+        try:
+            with conn:
+                self._refresh(conn, run_id)
+        finally:
+            conn.close()
+
+    def _refresh(self, conn: sqlite3.Connection, run_id: str):
+        # Callers may pass a connection without a row factory
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        row = cursor.execute("""
+            SELECT run_id, DATE(started_at) AS day, template_id, causal_mode, status,
+                   cost_usd, entities_created, timepoints_created, duration_seconds
+            FROM runs WHERE run_id = ?
+        """, (run_id,)).fetchone()
+
+        previous = cursor.execute(
+            "SELECT * FROM rollup_run_state WHERE run_id = ?", (run_id,)
+        ).fetchone()
+
+        if previous is not None:
+            old = dict(previous)
+            old["mechanisms"] = json.loads(old["mechanisms"] or "{}")
+            self._apply(conn, old, -1)
+            conn.execute("DELETE FROM rollup_run_state WHERE run_id = ?", (run_id,))
+            conn.execute("DELETE FROM run_mechanism_counts WHERE run_id = ?", (run_id,))
+
+        if row is None:
+            return
+
+        state = dict(row)
+        state["mechanisms"] = {
+            m["mechanism"]: m["count"] for m in cursor.execute("""
+                SELECT mechanism, COUNT(*) AS count
+                FROM mechanism_usage WHERE run_id = ?
+                GROUP BY mechanism
+            """, (run_id,))
+        }
+        self._apply(conn, state, 1)
+
+        conn.executemany(
+            "INSERT INTO run_mechanism_counts (run_id, mechanism, count) VALUES (?, ?, ?)",
+            [(run_id, m, c) for m, c in state["mechanisms"].items()]
+        )
+        conn.execute("""
+            INSERT INTO rollup_run_state (
+                run_id, day, template_id, causal_mode, status, cost_usd,
+                entities_created, timepoints_created, duration_seconds, mechanisms
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            run_id, state["day"], state["template_id"], state["causal_mode"],
+            state["status"], state["cost_usd"], state["entities_created"],
+            state["timepoints_created"], state["duration_seconds"],
+            json.dumps(state["mechanisms"])
+        ))
+
+    def _apply(self, conn: sqlite3.Connection, state: Dict[str, Any], sign: int):
+        """Add (sign=1) or remove (sign=-1) one run's contribution."""
+        cost = state["cost_usd"] or 0.0
+        duration = state["duration_seconds"]
+
+        conn.execute("""
+            UPDATE rollup_totals SET
+                total_runs = total_runs + ?,
+                total_cost = total_cost + ?,
+                total_entities = total_entities + ?,
+                total_timepoints = total_timepoints + ?,
+                duration_sum = duration_sum + ?,
+                duration_count = duration_count + ?,
+                completed_runs = completed_runs + ?,
+                failed_runs = failed_runs + ?
+            WHERE id = 1
+        """, (
+            sign,
+            sign * cost,
+            sign * (state["entities_created"] or 0),
+            sign * (state["timepoints_created"] or 0),
+            sign * (duration or 0.0),
+            sign * (duration is not None),
+            sign * (state["status"] == "completed"),
+            sign * (state["status"] == "failed"),
+        ))
+
+        if state["day"] is not None:
+            self._bump(conn, "rollup_daily_cost", "date", state["day"],
+                       {"total_cost": sign * cost, "run_count": sign})
+
+        for field, (table, key, column) in _KEYED_COUNTS.items():
+            self._bump(conn, table, key, state[field], {column: sign})
+
+        mechanisms = state["mechanisms"]
+        for mechanism, count in mechanisms.items():
+            self._bump(conn, "rollup_mechanism_totals", "mechanism", mechanism,
+                       {"count": sign * count})
+        self._bump_pairs(conn, combinations(sorted(mechanisms), 2), sign)
+
+        if sign < 0:
+            # Drop keys no run contributes to any more
+            conn.execute("DELETE FROM rollup_daily_cost WHERE run_count <= 0")
+            conn.execute("DELETE FROM rollup_templates WHERE run_count <= 0")
+            conn.execute("DELETE FROM rollup_causal_modes WHERE run_count <= 0")
+            conn.execute("DELETE FROM rollup_mechanism_totals WHERE count <= 0")
+            conn.execute("DELETE FROM rollup_mechanism_pairs WHERE co_occurrence <= 0")
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, table: str, key: str, value: Any,
+              deltas: Dict[str, float]):
+        columns = ", ".join(deltas)
+        placeholders = ", ".join("?" for _ in deltas)
+        updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in deltas)
+        conn.execute(f"""
+            INSERT INTO {table} ({key}, {columns}) VALUES (?, {placeholders})
+            ON CONFLICT({key}) DO UPDATE SET {updates}
+        """, (value, *deltas.values()))
+
+    @staticmethod
+    def _bump_pairs(conn: sqlite3.Connection, pairs: Iterable, sign: int):
+        conn.executemany("""
+            INSERT INTO rollup_mechanism_pairs (mechanism1, mechanism2, co_occurrence)
+            VALUES (?, ?, ?)
+            ON CONFLICT(mechanism1, mechanism2)
+            DO UPDATE SET co_occurrence = co_occurrence + excluded.co_occurrence
+        """, [(m1, m2, sign) for m1, m2 in pairs])
@@ -16,6 +16,8 @@ from pathlib import Path
 import json
 import sqlite3
 from schemas import ResolutionLevel, TemporalMode
+from .telemetry_writer import TelemetryWriter, INSERT_SQL, acquire_writer, release_writer
+from .analytics_rollups import AnalyticsRollups
 
 # List of all 17 mechanisms
 ALL_MECHANISMS = [
@@ -23,6 +25,20 @@ ALL_MECHANISMS = [
     "M10", "M11", "M12", "M13", "M14", "M15", "M16", "M17"
 ]
 
+# runs columns read back into RunMetadata, named explicitly so migration
+# column order does not matter
+_RUN_COLUMNS = """
+    run_id, template_id, started_at, completed_at, causal_mode,
+    max_entities, max_timepoints, entities_created, timepoints_created,
+    training_examples, cost_usd, llm_calls, tokens_used, duration_seconds,
+    oxen_repo_url, oxen_dataset_url, status, error_message,
+    summary, summary_generated_at, narrative_exports, narrative_export_generated_at,
+    schema_version, fidelity_strategy_json, fidelity_distribution,
+    actual_tokens_used, token_budget_compliance, fidelity_efficiency_score,
+    tensor_resolution_stats, entities_resolved_from_cache,
+    entities_new_baseline, tensor_cache_hit_rate
+"""
+
 
 class MechanismUsage(BaseModel):
     """Record of a mechanism being invoked"""
@@ -152,12 +168,60 @@ class MetadataManager:
     Manages metadata tracking for all workflow runs.
 
     Stores metadata in SQLite for persistence and fast querying.
+
+    Mechanism, resolution and validation rows are buffered by a background
+    TelemetryWriter (unless buffered=False) and flushed before any read and
+    on complete_run. Managers on the same database share one writer.
     """
 
-    def __init__(self, db_path: str = "metadata/runs.db"):
+    def __init__(
+        self,
+        db_path: str = "metadata/runs.db",
+        buffered: bool = True,
+        batch_size: int = 256,
+        flush_interval: float = 0.5
+    ):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
+        self.rollups = AnalyticsRollups(self.db_path)
+        self.rollups.ensure()
+        self._writer: Optional[TelemetryWriter] = (
+            acquire_writer(self.db_path, batch_size=batch_size, flush_interval=flush_interval)
+            if buffered else None
+        )
+
+    def flush(self) -> int:
+        """Write any buffered telemetry rows now. Returns rows written."""
+        if self._writer is None:
+            return 0
+        return self._writer.flush()
+
+    def close(self):
+        """Drain buffered telemetry and release the shared background writer."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            release_writer(writer)
+
+    def get_telemetry_stats(self) -> Dict[str, Any]:
+        """Queue depth and write overhead of the telemetry writer."""
+        if self._writer is None:
+            return {"buffered": False}
+        return {"buffered": True, **self._writer.get_stats()}
+
+    def _write_telemetry(self, table: str, row: tuple):
+        """Queue a telemetry row, or write it immediately when unbuffered."""
+        if self._writer is not None and not self._writer.closed:
+            self._writer.enqueue(table, row)
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(INSERT_SQL[table], row)
+        if table == "mechanism_usage":
+            self.rollups.refresh_run(row[0], conn)
+        conn.commit()
+        conn.close()
 
     def _init_database(self):
         """Initialize SQLite database with necessary tables"""
@@ -350,6 +414,7 @@ class MetadataManager:
             max_entities,
             max_timepoints
         ))
+        self.rollups.refresh_run(run_id, conn)
 
         conn.commit()
         conn.close()
@@ -371,14 +436,7 @@ class MetadataManager:
             context=context or {}
         )
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO mechanism_usage (
-                run_id, mechanism, function_name, timestamp, context
-            ) VALUES (?, ?, ?, ?, ?)
-        """, (
+        self._write_telemetry("mechanism_usage", (
             run_id,
             mechanism,
             function_name,
@@ -386,9 +444,6 @@ class MetadataManager:
             json.dumps(usage.context)
         ))
 
-        conn.commit()
-        conn.close()
-
     def record_resolution(
         self,
         run_id: str,
@@ -404,14 +459,7 @@ class MetadataManager:
             timestamp=datetime.now()
         )
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO resolution_assignments (
-                run_id, entity_id, resolution, timepoint_id, timestamp
-            ) VALUES (?, ?, ?, ?, ?)
-        """, (
+        self._write_telemetry("resolution_assignments", (
             run_id,
             entity_id,
             resolution.value,
@@ -419,9 +467,6 @@ class MetadataManager:
             assignment.timestamp.isoformat()
         ))
 
-        conn.commit()
-        conn.close()
-
     def record_validation(
         self,
         run_id: str,
@@ -439,14 +484,7 @@ class MetadataManager:
             violations=violations or []
         )
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO validations (
-                run_id, validator_name, passed, timestamp, message, violations
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        self._write_telemetry("validations", (
             run_id,
             validator_name,
             passed,
@@ -455,9 +493,6 @@ class MetadataManager:
             json.dumps(violations or [])
         ))
 
-        conn.commit()
-        conn.close()
-
     def complete_run(
         self,
         run_id: str,
@@ -483,6 +518,9 @@ class MetadataManager:
         tensor_cache_hit_rate: Optional[float] = None
     ) -> RunMetadata:
         """Complete a run and finalize metadata"""
+        # Drain buffered telemetry so the finalized run sees every row
+        self.flush()
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -547,6 +585,7 @@ class MetadataManager:
             tensor_cache_hit_rate,
             run_id
         ))
+        self.rollups.refresh_run(run_id, conn)
 
         conn.commit()
         conn.close()
@@ -740,30 +779,21 @@ class MetadataManager:
                 metadata.entities_new_baseline,
                 metadata.tensor_cache_hit_rate
             ))
+        self.rollups.refresh_run(metadata.run_id, conn)
 
         conn.commit()
         conn.close()
 
     def get_run(self, run_id: str) -> RunMetadata:
         """Retrieve complete run metadata"""
+        self.flush()
+
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row  # Use Row factory for column-name access
         cursor = conn.cursor()
 
         # Get run with explicit column names to avoid migration ordering issues
-        cursor.execute("""
-            SELECT
-                run_id, template_id, started_at, completed_at, causal_mode,
-                max_entities, max_timepoints, entities_created, timepoints_created,
-                training_examples, cost_usd, llm_calls, tokens_used, duration_seconds,
-                oxen_repo_url, oxen_dataset_url, status, error_message,
-                summary, summary_generated_at, narrative_exports, narrative_export_generated_at,
-                schema_version, fidelity_strategy_json, fidelity_distribution,
-                actual_tokens_used, token_budget_compliance, fidelity_efficiency_score,
-                tensor_resolution_stats, entities_resolved_from_cache,
-                entities_new_baseline, tensor_cache_hit_rate
-            FROM runs WHERE run_id = ?
-        """, (run_id,))
+        cursor.execute(f"SELECT {_RUN_COLUMNS} FROM runs WHERE run_id = ?", (run_id,))
         row = cursor.fetchone()
         if not row:
             conn.close()
@@ -777,6 +807,10 @@ class MetadataManager:
 
         conn.close()
 
+        return self._row_to_metadata(row, mechanisms_used)
+
+    def _row_to_metadata(self, row: sqlite3.Row, mechanisms_used: Set[str]) -> RunMetadata:
+        """Build RunMetadata from a runs row selected with _RUN_COLUMNS"""
         # Parse narrative exports if present
         narrative_exports = None
         narrative_exports_raw = row['narrative_exports']
@@ -829,15 +863,29 @@ class MetadataManager:
 
     def get_all_runs(self, template_id: Optional[str] = None) -> List[RunMetadata]:
         """Get all runs, optionally filtered by template"""
+        self.flush()
+
         conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        if template_id:
-            cursor.execute("SELECT run_id FROM runs WHERE template_id = ?", (template_id,))
-        else:
-            cursor.execute("SELECT run_id FROM runs")
+        where_sql, params = ("WHERE template_id = ?", (template_id,)) if template_id else ("", ())
+
+        # Two queries total instead of two per run
+        cursor.execute(f"SELECT {_RUN_COLUMNS} FROM runs {where_sql}", params)
+        rows = cursor.fetchall()
+
+        cursor.execute(f"""
+            SELECT DISTINCT run_id, mechanism FROM mechanism_usage
+            WHERE run_id IN (SELECT run_id FROM runs {where_sql})
+        """, params)
+        mechanisms_by_run: Dict[str, Set[str]] = {}
+        for run_id, mechanism in cursor.fetchall():
+            mechanisms_by_run.setdefault(run_id, set()).add(mechanism)
 
-        run_ids = [row[0] for row in cursor.fetchall()]
         conn.close()
 
-        return [self.get_run(run_id) for run_id in run_ids]
+        return [
+            self._row_to_metadata(row, mechanisms_by_run.get(row['run_id'], set()))
+            for row in rows
+        ]
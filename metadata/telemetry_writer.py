@@ -0,0 +1,299 @@
+"""
+Telemetry Writer - Background batched writes for run tracking rows
+
+MetadataManager.record_mechanism / record_resolution / record_validation are
+called from hot paths (via @track_mechanism), so instead of opening a
+connection and committing per row they enqueue onto a TelemetryWriter. A
+daemon thread drains the queue and writes each batch with executemany in a
+single transaction once `batch_size` rows are pending or `flush_interval`
+seconds have passed. The same transaction refreshes the analytics rollups
+of every run whose mechanism rows it wrote, so global dashboard aggregates
+include runs that are still in progress or never completed.
+
+Readers call flush() first, so a manager always reads its own writes.
+
+Managers on the same database share one writer (and one thread) through
+acquire_writer()/release_writer(), so code that builds a MetadataManager per
+request or per script does not start a thread each time.
+"""
+
+import atexit
+import sqlite3
+import threading
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Tuple, Union
+
+from .analytics_rollups import AnalyticsRollups
+
+# Insert statements per telemetry table
+INSERT_SQL: Dict[str, str] = {
+    "mechanism_usage": """
+        INSERT INTO mechanism_usage (
+            run_id, mechanism, function_name, timestamp, context
+        ) VALUES (?, ?, ?, ?, ?)
+    """,
+    "resolution_assignments": """
+        INSERT INTO resolution_assignments (
+            run_id, entity_id, resolution, timepoint_id, timestamp
+        ) VALUES (?, ?, ?, ?, ?)
+    """,
+    "validations": """
+        INSERT INTO validations (
+            run_id, validator_name, passed, timestamp, message, violations
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """,
+}
+
+# Writers still open at interpreter exit are drained so no rows are lost
+_live_writers: "weakref.WeakSet[TelemetryWriter]" = weakref.WeakSet()
+
+
+# Shared writers by resolved db_path, with the number of managers holding each
+_shared_writers: Dict[str, Tuple["TelemetryWriter", int]] = {}
+_shared_lock = threading.Lock()
+
+
+@atexit.register
+def _drain_live_writers():
+    for writer in list(_live_writers):
+        writer.close()
+
+
+def acquire_writer(
+    db_path: Union[str, Path],
+    batch_size: int = 256,
+    flush_interval: float = 0.5
+) -> "TelemetryWriter":
+    """
+    Get the shared writer for `db_path`, starting it on first use.
+
+    batch_size and flush_interval only apply when the writer is created;
+    later callers share the existing writer as configured.
+    """
+    key = str(Path(db_path).resolve())
+    with _shared_lock:
+        writer, refs = _shared_writers.get(key, (None, 0))
+        if writer is None or writer.closed:
+            writer, refs = TelemetryWriter(db_path, batch_size, flush_interval), 0
+        _shared_writers[key] = (writer, refs + 1)
+        return writer
+
+
+def release_writer(writer: "TelemetryWriter") -> None:
+    """Flush `writer` and close it once its last holder has released it."""
+    key = str(Path(writer.db_path).resolve())
+    with _shared_lock:
+        shared, refs = _shared_writers.get(key, (None, 0))
+        last = shared is not writer or refs <= 1
+        if shared is writer:
+            if last:
+                del _shared_writers[key]
+            else:
+                _shared_writers[key] = (writer, refs - 1)
+    if last:
+        writer.close()
+    else:
+        writer.flush()
+
+
+class TelemetryWriter:
+    """
+    Queues telemetry rows in memory and writes them in batches on a
+    background thread.
+
+    Args:
+        db_path: SQLite database holding the telemetry tables
+        batch_size: Pending rows that trigger an immediate flush
+        flush_interval: Maximum seconds a row waits before being written
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        batch_size: int = 256,
+        flush_interval: float = 0.5
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._rollups = AnalyticsRollups(self.db_path)
+
+        self._pending: Deque[Tuple[str, tuple]] = deque()
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
+
+        # Metrics
+        self._enqueued = 0
+        self._enqueue_seconds = 0.0
+        self._rows_written = 0
+        self._flushes = 0
+        self._flush_seconds = 0.0
+        self._max_queue_depth = 0
+        self._errors = 0
+        self._rows_dropped = 0
+        self._last_error: str = ""
+
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-writer", daemon=True
+        )
+        self._thread.start()
+        _live_writers.add(self)
+
+    def enqueue(self, table: str, row: tuple) -> None:
+        """Queue one row for `table`; never touches the database."""
+        start = time.perf_counter()
+        if table not in INSERT_SQL:
+            raise ValueError(f"Unknown telemetry table: {table}")
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("TelemetryWriter is closed")
+            self._pending.append((table, row))
+            depth = len(self._pending)
+            if depth > self._max_queue_depth:
+                self._max_queue_depth = depth
+            if depth >= self.batch_size:
+                self._cond.notify()
+            self._enqueued += 1
+            self._enqueue_seconds += time.perf_counter() - start
+
+    @property
+    def queue_depth(self) -> int:
+        """Rows waiting to be written."""
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Synchronously write everything queued so far.
+
+        Returns:
+            Number of rows written by this call
+        """
+        return self._drain()
+
+    def close(self) -> None:
+        """Drain the queue and stop the background thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._drain()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Overhead and throughput counters for this writer."""
+        with self._cond:
+            enqueued = self._enqueued
+            return {
+                "queue_depth": len(self._pending),
+                "max_queue_depth": self._max_queue_depth,
+                "rows_enqueued": enqueued,
+                "rows_written": self._rows_written,
+                "flushes": self._flushes,
+                "mean_enqueue_us": (self._enqueue_seconds / enqueued * 1e6) if enqueued else 0.0,
+                "mean_flush_ms": (self._flush_seconds / self._flushes * 1e3) if self._flushes else 0.0,
+                "errors": self._errors,
+                "rows_dropped": self._rows_dropped,
+                "last_error": self._last_error,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and len(self._pending) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                if self._closed:
+                    return
+            self._drain()
+
+    def _drain(self) -> int:
+        # Serialize writers so flush() from a caller and the background
+        # thread never interleave batches
+        with self._write_lock:
+            with self._cond:
+                if not self._pending:
+                    return 0
+                batch = list(self._pending)
+                self._pending.clear()
+
+            grouped: Dict[str, List[tuple]] = {}
+            for table, row in batch:
+                grouped.setdefault(table, []).append(row)
+
+            start = time.perf_counter()
+            try:
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    with conn:
+                        for table, rows in grouped.items():
+                            conn.executemany(INSERT_SQL[table], rows)
+                        self._refresh_rollups(conn, grouped.get("mechanism_usage", ()))
+                finally:
+                    conn.close()
+                written = len(batch)
+            except sqlite3.Error as e:
+                with self._cond:
+                    self._errors += 1
+                    self._last_error = str(e)
+                # One bad row must not cost the whole batch; retry row by row
+                written = self._write_rows(batch)
+
+            with self._cond:
+                self._rows_written += written
+                self._flushes += 1
+                self._flush_seconds += time.perf_counter() - start
+            return written
+
+    def _refresh_rollups(self, conn: sqlite3.Connection, mechanism_rows: Iterable[tuple]) -> None:
+        """Re-roll each run that gained mechanism rows (run_id is column 0)."""
+        for run_id in {row[0] for row in mechanism_rows}:
+            self._rollups.refresh_run(run_id, conn)
+
+    def _write_rows(self, batch: List[Tuple[str, tuple]]) -> int:
+        """Insert rows one at a time, dropping only the ones that fail."""
+        written = 0
+        failed: List[str] = []
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                for table, row in batch:
+                    try:
+                        with conn:
+                            conn.execute(INSERT_SQL[table], row)
+                        written += 1
+                    except sqlite3.Error as e:
+                        failed.append(str(e))
+                try:
+                    with conn:
+                        self._refresh_rollups(
+                            conn, [row for table, row in batch if table == "mechanism_usage"]
+                        )
+                except sqlite3.Error as e:
+                    with self._cond:
+                        self._errors += 1
+                        self._last_error = str(e)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            failed.append(str(e))
+
+        dropped = len(batch) - written
+        if dropped:
+            # Telemetry must never break the simulation; count and drop
+            with self._cond:
+                self._rows_dropped += dropped
+                self._last_error = failed[-1]
+            print(f"Warning: Dropped {dropped} of {len(batch)} telemetry rows: {failed[-1]}")
+        return written
@@ -297,14 +297,14 @@ def refine_tensor_from_prospection(
     import json
     import base64
     import numpy as np
-    import msgspec
+    from tensor_serialization import decode_vector, encode_vector
 
     # Load current tensor
     if not entity.tensor:
         return
 
     tensor_dict = json.loads(entity.tensor)
-    context = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["context_vector"])))
+    context = decode_vector(base64.b64decode(tensor_dict["context_vector"]), copy=True)
 
     # Get expectations from prospective_state
     # ProspectiveState.expectations is a string field, so we need to parse it or use a default
@@ -332,7 +332,7 @@ def refine_tensor_from_prospection(
 
     # Update tensor
     entity.tensor = json.dumps({
-        "context_vector": base64.b64encode(msgspec.msgpack.encode(context.tolist())).decode('utf-8'),
+        "context_vector": base64.b64encode(encode_vector(context)).decode('utf-8'),
         "biology_vector": tensor_dict["biology_vector"],
         "behavior_vector": tensor_dict["behavior_vector"]
     })
@@ -54,10 +54,15 @@ class QueryIntent(BaseModel):
 class QueryInterface:
     """Natural language query interface with lazy resolution elevation"""
 
-    def __init__(self, store: GraphStore, llm_client: LLMClient):
+    def __init__(self, store: GraphStore, llm_client: LLMClient,
+                 tensor_rag: Optional[Any] = None, relevance_prefilter_k: int = 12):
         self.store = store
         self.llm_client = llm_client
         self.resolution_engine = ResolutionEngine(store, llm_client)
+        # Optional TensorRAG; its sentence-transformer embeds knowledge for the relevance prefilter
+        self.tensor_rag = tensor_rag
+        # Max knowledge items passed on to LLM relevance scoring per query
+        self.relevance_prefilter_k = relevance_prefilter_k
 
     def _get_query_cache_key(self, query: str, query_intent: QueryIntent) -> str:
         """Generate cache key for query based on content and intent"""
@@ -144,6 +149,7 @@ Return only valid JSON, no other text."""
                 query_intent = QueryIntent(**data)
             except (json.JSONDecodeError, ValueError) as e:
                 raise Exception(f"Failed to parse LLM response as JSON: {e}. Content: {content}")
+            self._canonicalize_entity_names(query_intent)
 
             self.llm_client.token_count += 500  # Estimate
             self.llm_client.cost += 0.005
@@ -155,7 +161,6 @@ Return only valid JSON, no other text."""
     def _parse_query_simple(self, query: str) -> QueryIntent:
         """Improved rule-based parsing fallback"""
         query_lower = query.lower()
-        entities = self._get_all_entity_names()
         timepoints = self.store.get_all_timepoints()
 
         # Improved entity detection - handle partial names and variations
@@ -175,10 +180,10 @@ Return only valid JSON, no other text."""
             "president": "george_washington",  # Context-dependent but common
         }
 
-        # Find all mentioned entities
+        # Find all mentioned entities, starting with names known to the store
         target_entity = None
         context_entities = []
-        found_entities = []
+        found_entities = self.store.get_entity_name_index().find_mentions(query)
 
         # Sort by length (longest first) to match full names before partials
         sorted_mappings = sorted(entity_mappings.items(), key=lambda x: len(x[0]), reverse=True)
@@ -330,8 +335,7 @@ Return only valid JSON, no other text."""
 
         # Phase 7.5: Detect entity gaps in query text BEFORE cache check
         # This ensures on-demand generation can trigger even with caching enabled
-        existing_entities = set(self._get_all_entity_names())
-        missing_entity = self.detect_entity_gap(query_text, existing_entities)
+        missing_entity = self.detect_entity_gap(query_text)
         has_missing_entity = missing_entity is not None
 
         # Phase 7.5: Skip cache for queries about missing entities (to allow on-demand generation)
@@ -392,8 +396,7 @@ Return only valid JSON, no other text."""
         if not entity:
             # Mechanism 9: On-Demand Entity Generation
             # Check if this might be a missing entity that should be generated
-            existing_entities = set(self._get_all_entity_names())
-            missing_entity = self.detect_entity_gap(query_text, existing_entities)
+            missing_entity = self.detect_entity_gap(query_text)
 
             # Phase 7.5: Generate ANY missing entity detected, not just target_entity
             if missing_entity:
@@ -767,11 +770,15 @@ Return only valid JSON, no other text."""
                 query_parts.append(query_intent.information_type)
             original_query = " ".join(query_parts)
 
-        # Score each knowledge item using LLM relevance scoring
-        scored_knowledge = []
-        for knowledge in knowledge_state:
-            relevance_score = self.llm_client.score_relevance(original_query, knowledge)
-            scored_knowledge.append((knowledge, relevance_score))
+        # Stage 1: local similarity prefilter bounds the LLM workload
+        candidates = self._prefilter_knowledge(original_query, knowledge_state)
+
+        # Stage 2: score all survivors in one batched LLM call
+        if hasattr(self.llm_client, "score_relevance_batch"):
+            scores = self.llm_client.score_relevance_batch(original_query, candidates)
+        else:
+            scores = [self.llm_client.score_relevance(original_query, k) for k in candidates]
+        scored_knowledge = list(zip(candidates, scores))
 
         # Sort by relevance score (highest first)
         scored_knowledge.sort(key=lambda x: x[1], reverse=True)
@@ -783,6 +790,37 @@ Return only valid JSON, no other text."""
         else:
             return [k for k, s in scored_knowledge if s > 0.3][:5]  # Only highly relevant items
 
+    def _prefilter_knowledge(self, query: str, knowledge_state: List[str]) -> List[str]:
+        """Keep the relevance_prefilter_k items most similar to the query, in original order"""
+        if len(knowledge_state) <= self.relevance_prefilter_k:
+            return knowledge_state
+
+        similarities = self._embedding_similarities(query, knowledge_state)
+        if similarities is None:
+            # No embedder available: rank by word overlap instead
+            query_words = set(query.lower().split())
+            similarities = np.array([
+                len(query_words & set(k.lower().split())) / max(1, len(query_words | set(k.lower().split())))
+                for k in knowledge_state
+            ])
+
+        keep = np.argsort(-similarities, kind="stable")[:self.relevance_prefilter_k]
+        return [knowledge_state[i] for i in sorted(keep)]
+
+    def _embedding_similarities(self, query: str, knowledge_state: List[str]) -> Optional[np.ndarray]:
+        """Cosine similarity of each knowledge item to the query, or None without an embedder"""
+        if self.tensor_rag is None:
+            return None
+        try:
+            vectors = self.tensor_rag.generate_embeddings([query] + list(knowledge_state))
+        except ImportError:
+            return None
+
+        norms = np.linalg.norm(vectors, axis=1)
+        norms[norms == 0] = 1.0
+        vectors = vectors / norms[:, None]
+        return vectors[1:] @ vectors[0]
+
     def _filter_knowledge_by_time(self, knowledge_state: List[str], query_intent: QueryIntent, entity_id: str) -> List[str]:
         """Filter knowledge items to only those available at the query timepoint"""
         if not knowledge_state:
@@ -797,33 +835,25 @@ Return only valid JSON, no other text."""
                 query_timepoint = timepoint_obj.timestamp
         else:
             # Use latest timepoint as default (what entity currently knows)
-            timepoints = self.store.get_all_timepoints()
-            if timepoints:
-                query_timepoint = max(tp.timestamp for tp in timepoints)
+            query_timepoint = self.store.get_latest_timepoint_timestamp()
 
         if not query_timepoint:
             # Fallback to all knowledge if no timepoint determined
             return knowledge_state
 
-        # Get exposure events to determine when knowledge was learned
-        exposure_events = self.store.get_exposure_events(entity_id)
-
-        # Create mapping of knowledge item to when it was learned
-        knowledge_timestamps = {}
-        for event in exposure_events:
-            knowledge_timestamps[event.information] = event.timestamp
-
-        # Filter knowledge to only items learned before or at query timepoint
-        filtered_knowledge = []
-        for knowledge_item in knowledge_state:
-            learned_at = knowledge_timestamps.get(knowledge_item)
-            if learned_at and learned_at <= query_timepoint:
-                filtered_knowledge.append(knowledge_item)
-            elif not learned_at:
-                # If no timestamp available, include it (legacy knowledge)
-                filtered_knowledge.append(knowledge_item)
+        # Two indexed range scans over knowledge_state instead of loading every exposure event
+        known_by_then = set(self.store.get_knowledge_as_of(entity_id, query_timepoint))
+        learned_later = {
+            row.information
+            for row in self.store.get_knowledge_states(entity_id, start=query_timepoint)
+        }
 
-        return filtered_knowledge
+        # Keep items learned at or before the query timepoint; items with no
+        # exposure event at all are kept as legacy knowledge
+        return [
+            knowledge_item for knowledge_item in knowledge_state
+            if knowledge_item in known_by_then or knowledge_item not in learned_later
+        ]
 
     def _synthesize_timepoint_response(self, query_intent: QueryIntent) -> str:
         """Generate response for timepoint-focused queries (e.g., 'Describe the cabinet meeting')"""
@@ -918,9 +948,9 @@ Return only valid JSON, no other text."""
         if dialogs:
             response_parts.append("\n**Direct Interactions:**")
             for dialog in dialogs[:2]:  # Limit to most recent
-                participants = json.loads(dialog.participants) if isinstance(dialog.participants, str) else dialog.participants
+                participants = json.loads(dialog["participants"]) if isinstance(dialog["participants"], str) else dialog["participants"]
                 participant_names = [p.replace('_', ' ').title() for p in participants]
-                response_parts.append(f"• Conversation between {', '.join(participant_names)} at {dialog.timepoint_id}")
+                response_parts.append(f"• Conversation between {', '.join(participant_names)} at {dialog['timepoint_id']}")
 
         # Add entity perspectives
         response_parts.append("\n**Entity Perspectives:**")
@@ -1229,10 +1259,19 @@ Return only valid JSON, no other text."""
         return entity_names
 
     @track_mechanism("M9", "on_demand_entity_gap_detection")
-    def detect_entity_gap(self, query: str, existing_entities: Set[str]) -> Optional[str]:
-        """Parse query for entity mentions and return first missing entity"""
+    def detect_entity_gap(self, query: str, existing_entities: Optional[Set[str]] = None) -> Optional[str]:
+        """
+        Parse query for entity mentions and return first missing entity.
+
+        Existence is checked against the store's entity name index unless an
+        explicit existing_entities set is given.
+        """
         entities_mentioned = self.extract_entity_names(query)
-        missing = entities_mentioned - existing_entities
+        if existing_entities is None:
+            name_index = self.store.get_entity_name_index()
+            missing = {name for name in entities_mentioned if name not in name_index}
+        else:
+            missing = entities_mentioned - existing_entities
         return missing.pop() if missing else None
 
     @track_mechanism("M9", "on_demand_entity_generation")
@@ -1379,13 +1418,17 @@ Return only valid JSON."""
         return "historical figure"
 
     def _get_all_entity_names(self) -> List[str]:
-        """Get list of all entity IDs from database"""
-        from sqlmodel import Session, select
-        from schemas import Entity
+        """Get list of all entity IDs from the store's entity name index"""
+        return self.store.get_entity_name_index().entity_ids()
 
-        with Session(self.store.engine) as session:
-            entities = session.exec(select(Entity)).all()
-            return [entity.entity_id for entity in entities]
+    def _canonicalize_entity_names(self, query_intent: QueryIntent) -> None:
+        """Map LLM-returned names ("Washington", "thomas jeferson") onto stored entity IDs"""
+        name_index = self.store.get_entity_name_index()
+        if query_intent.target_entity:
+            query_intent.target_entity = name_index.resolve(query_intent.target_entity) or query_intent.target_entity
+        query_intent.context_entities = list(dict.fromkeys(
+            name_index.resolve(name) or name for name in query_intent.context_entities
+        ))
 
     # ============================================================================
     # Phase 3: Multi-Entity Analysis Helper Methods
@@ -1433,9 +1476,9 @@ Return only valid JSON."""
             for c in contradictions
         ]
 
-    def _find_relevant_dialogs(self, entity_ids: List[str]) -> List[Dict]:
-        """Find dialogs involving the specified entities"""
-        dialogs = self.store.get_dialogs_for_entities(entity_ids)
+    def _find_relevant_dialogs(self, entity_ids: List[str], run_id: Optional[str] = None) -> List[Dict]:
+        """Find dialogs involving the specified entities (indexed participant lookup)"""
+        dialogs = self.store.get_dialogs_for_entities(entity_ids, run_id=run_id)
 
         # Convert to dict format for easier handling
         dialog_list = []
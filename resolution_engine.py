@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 import networkx as nx
 from schemas import Entity, Timepoint, ResolutionLevel, ExposureEvent
 from storage import GraphStore
+from graph import get_graph_metrics_cache
 from llm_v2 import LLMClient  # Use new centralized service
 
 
@@ -40,7 +41,7 @@ class ResolutionEngine:
         # 1. Graph centrality (0-1 points)
         centrality_score = 0.0
         if graph and entity.entity_id in graph:
-            centrality = nx.eigenvector_centrality_numpy(graph)
+            centrality = get_graph_metrics_cache().get(graph, "eigenvector")
             centrality_score = centrality.get(entity.entity_id, 0.0)
             resolution_score += centrality_score * 1.0  # Max 1.0 points
 
@@ -172,7 +173,7 @@ class ResolutionEngine:
         centrality = entity.eigenvector_centrality
         if graph and entity.entity_id in graph:
             try:
-                centrality = nx.eigenvector_centrality_numpy(graph)[entity.entity_id]
+                centrality = get_graph_metrics_cache().get(graph, "eigenvector")[entity.entity_id]
             except:
                 # Fallback to stored value if computation fails
                 centrality = entity.eigenvector_centrality
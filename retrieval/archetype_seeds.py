@@ -30,7 +30,7 @@ import base64
 
 from schemas import TTMTensor, Entity
 from tensor_persistence import TensorDatabase, TensorRecord
-from tensor_serialization import serialize_tensor
+from tensor_serialization import serialize_tensor, encode_vector
 
 
 @dataclass
@@ -527,16 +527,11 @@ def generate_archetype_tensor(
     tensor = create_baseline_tensor(entity)
 
     # Serialize and store on entity for population
+    context, biology, behavior = tensor.to_arrays()
     entity.tensor = json.dumps({
-        "context_vector": base64.b64encode(
-            __import__('msgspec').msgpack.encode(tensor.to_arrays()[0].tolist())
-        ).decode('utf-8'),
-        "biology_vector": base64.b64encode(
-            __import__('msgspec').msgpack.encode(tensor.to_arrays()[1].tolist())
-        ).decode('utf-8'),
-        "behavior_vector": base64.b64encode(
-            __import__('msgspec').msgpack.encode(tensor.to_arrays()[2].tolist())
-        ).decode('utf-8')
+        "context_vector": base64.b64encode(encode_vector(context)).decode('utf-8'),
+        "biology_vector": base64.b64encode(encode_vector(biology)).decode('utf-8'),
+        "behavior_vector": base64.b64encode(encode_vector(behavior)).decode('utf-8')
     })
     entity.tensor_maturity = 0.0
     entity.tensor_training_cycles = 0
@@ -4,15 +4,37 @@ Embedding index for semantic tensor search.
 Uses numpy-based cosine similarity for portability.
 Optional FAISS support for improved performance at scale.
 
+Storage is a preallocated float32 matrix that doubles in capacity as it
+fills, so adds are amortized O(1). Removed rows are tombstoned and
+compacted away once they make up half of the matrix.
+
+Backends:
+    exact  Brute-force dot product with argpartition top-k (default)
+    ivf    Pure numpy inverted-file index: spherical k-means partitions,
+           probing the n_probe closest lists per query (approximate)
+    faiss  FAISS IndexFlatIP if installed, else falls back to exact
+
 Phase 3: Retrieval System
 """
 
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Sequence
 from pathlib import Path
 
 
+BACKENDS = ("exact", "ivf", "faiss")
+
+_INITIAL_CAPACITY = 64
+# Below this many live rows IVF searches exactly; partitioning would not pay off
+_IVF_MIN_ROWS = 2048
+# Rows sampled when training IVF centroids
+_IVF_TRAIN_SAMPLE = 65536
+_IVF_TRAIN_ITERATIONS = 10
+# Rows scored per block when assigning rows to IVF lists
+_ASSIGN_BLOCK = 65536
+
+
 @dataclass
 class EmbeddingIndex:
     """
@@ -24,86 +46,182 @@ class EmbeddingIndex:
     Attributes:
         embedding_dim: Dimension of embeddings (default 384 for MiniLM)
         use_faiss: Whether to use FAISS backend if available
+            (shorthand for backend="faiss")
+        backend: "exact", "ivf" or "faiss"
+        n_lists: IVF partitions (defaults to sqrt of the row count)
+        n_probe: IVF partitions scanned per query; higher is slower
+            but raises recall
     """
     embedding_dim: int = 384
     use_faiss: bool = False
+    backend: str = "exact"
+    n_lists: Optional[int] = None
+    n_probe: int = 16
 
     # Internal storage
-    _ids: List[str] = field(default_factory=list)
-    _embeddings: Optional[np.ndarray] = None
+    _ids: List[Optional[str]] = field(default_factory=list)
+    _matrix: Optional[np.ndarray] = None
+    _alive: Optional[np.ndarray] = None
+    _count: int = 0
     _id_to_idx: Dict[str, int] = field(default_factory=dict)
     _faiss_index: Optional[object] = None
 
     def __post_init__(self):
         """Initialize the index."""
-        self._ids = []
-        self._embeddings = None
-        self._id_to_idx = {}
+        if self.use_faiss:
+            self.backend = "faiss"
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown index backend: {self.backend} (expected one of {BACKENDS})"
+            )
+
         self._faiss_index = None
+        self._faiss_available = False
+        self._reset_storage()
 
         # Try to use FAISS if requested
-        if self.use_faiss:
+        if self.backend == "faiss":
             try:
                 import faiss
                 self._faiss_index = faiss.IndexFlatIP(self.embedding_dim)
                 self._faiss_available = True
             except ImportError:
-                self._faiss_available = False
+                self.backend = "exact"
                 self.use_faiss = False
-        else:
-            self._faiss_available = False
+
+    def _reset_storage(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        """Drop all rows and IVF state."""
+        self._ids = []
+        self._id_to_idx = {}
+        self._matrix = np.zeros((capacity, self.embedding_dim), dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._count = 0
+        self._reset_ivf()
+
+    def _reset_ivf(self) -> None:
+        """Forget IVF partitions; they are retrained lazily on search."""
+        self._centroids: Optional[np.ndarray] = None
+        self._assign = np.full(len(self._matrix), -1, dtype=np.int32)
+        self._lists: List[List[int]] = []
+        self._list_arrays: Dict[int, np.ndarray] = {}
+        self._trained_rows = 0
 
     @property
     def size(self) -> int:
         """Number of embeddings in the index."""
-        return len(self._ids)
+        return len(self._id_to_idx)
+
+    def __contains__(self, tensor_id: str) -> bool:
+        return tensor_id in self._id_to_idx
+
+    @property
+    def ids(self) -> List[str]:
+        """IDs of all embeddings in the index."""
+        return list(self._id_to_idx)
+
+    @property
+    def _embeddings(self) -> Optional[np.ndarray]:
+        """Live embeddings in slot order (a copy when tombstones exist)."""
+        if not self._id_to_idx:
+            return None
+        rows = self._matrix[:self._count]
+        if self.size == self._count:
+            return rows
+        return rows[self._alive[:self._count]]
+
+    def _normalize(self, embeddings: np.ndarray) -> np.ndarray:
+        """Validate shape and L2-normalize rows (zero rows stay zero)."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim == 1:
+            embeddings = embeddings.reshape(1, -1)
+        if embeddings.shape[1] != self.embedding_dim:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.embedding_dim}, "
+                f"got {embeddings.shape[1]}"
+            )
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.where(norms > 0, norms, 1.0)
+
+    def _ensure_capacity(self, extra: int) -> None:
+        """Grow storage by doubling so that `extra` more rows fit."""
+        needed = self._count + extra
+        capacity = len(self._matrix)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+
+        matrix = np.zeros((capacity, self.embedding_dim), dtype=np.float32)
+        matrix[:self._count] = self._matrix[:self._count]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._count] = self._alive[:self._count]
+        assign = np.full(capacity, -1, dtype=np.int32)
+        assign[:self._count] = self._assign[:self._count]
+        self._matrix, self._alive, self._assign = matrix, alive, assign
+
+    def _tombstone(self, tensor_id: str) -> None:
+        idx = self._id_to_idx.pop(tensor_id)
+        self._alive[idx] = False
+        self._ids[idx] = None
 
     def add(self, tensor_id: str, embedding: np.ndarray) -> None:
         """
         Add an embedding to the index.
 
+        Adding an existing ID replaces its embedding.
+
         Args:
             tensor_id: Unique identifier for this tensor
             embedding: Embedding vector (must match embedding_dim)
         """
-        # Validate embedding
         embedding = np.asarray(embedding, dtype=np.float32)
         if embedding.shape[0] != self.embedding_dim:
             raise ValueError(
                 f"Embedding dimension mismatch: expected {self.embedding_dim}, "
                 f"got {embedding.shape[0]}"
             )
+        self.add_batch([tensor_id], embedding.reshape(1, -1))
 
-        # Normalize for cosine similarity
-        norm = np.linalg.norm(embedding)
-        if norm > 0:
-            embedding = embedding / norm
-
-        # Check if ID already exists
-        if tensor_id in self._id_to_idx:
-            # Update existing
-            idx = self._id_to_idx[tensor_id]
-            if self._embeddings is not None:
-                self._embeddings[idx] = embedding
-            if self._faiss_available and self._faiss_index is not None:
-                # FAISS doesn't support in-place update, rebuild needed
-                self._rebuild_faiss_index()
-            return
-
-        # Add new
-        idx = len(self._ids)
-        self._ids.append(tensor_id)
-        self._id_to_idx[tensor_id] = idx
+    def add_batch(self, tensor_ids: Sequence[str], embeddings: np.ndarray) -> None:
+        """
+        Add many embeddings at once.
 
-        # Add to embeddings array
-        if self._embeddings is None:
-            self._embeddings = embedding.reshape(1, -1)
-        else:
-            self._embeddings = np.vstack([self._embeddings, embedding])
+        Args:
+            tensor_ids: Identifiers, one per row
+            embeddings: (N, embedding_dim) array
+        """
+        embeddings = self._normalize(embeddings)
+        if len(tensor_ids) != len(embeddings):
+            raise ValueError("tensor_ids and embeddings must have the same length")
+
+        # Later duplicates win, matching repeated add() calls
+        latest = {tensor_id: i for i, tensor_id in enumerate(tensor_ids)}
+        if len(latest) != len(tensor_ids):
+            keep = sorted(latest.values())
+            tensor_ids = [tensor_ids[i] for i in keep]
+            embeddings = embeddings[keep]
+
+        # Updates tombstone the old row and append the new one
+        for tensor_id in tensor_ids:
+            if tensor_id in self._id_to_idx:
+                self._tombstone(tensor_id)
+
+        self._ensure_capacity(len(tensor_ids))
+        start, end = self._count, self._count + len(tensor_ids)
+        self._matrix[start:end] = embeddings
+        self._alive[start:end] = True
+        for offset, tensor_id in enumerate(tensor_ids):
+            self._ids.append(tensor_id)
+            self._id_to_idx[tensor_id] = start + offset
+        self._count = end
+
+        if self._centroids is not None:
+            self._assign_to_lists(np.arange(start, end))
 
-        # Add to FAISS if available
         if self._faiss_available and self._faiss_index is not None:
-            self._faiss_index.add(embedding.reshape(1, -1))
+            self._faiss_index.add(embeddings)
+
+        self._maybe_compact()
 
     def remove(self, tensor_id: str) -> bool:
         """
@@ -118,26 +236,46 @@ class EmbeddingIndex:
         if tensor_id not in self._id_to_idx:
             return False
 
-        idx = self._id_to_idx[tensor_id]
+        self._tombstone(tensor_id)
+        self._maybe_compact()
+        return True
+
+    def _maybe_compact(self) -> None:
+        """Drop tombstoned rows once they are half of the used slots."""
+        dead = self._count - self.size
+        if dead == 0 or dead * 2 < self._count or self._count < _INITIAL_CAPACITY:
+            return
+
+        keep = np.flatnonzero(self._alive[:self._count])
+        remap = np.full(self._count, -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
 
-        # Remove from arrays
-        self._ids.pop(idx)
-        del self._id_to_idx[tensor_id]
+        capacity = max(_INITIAL_CAPACITY, len(self._matrix))
+        matrix = np.zeros((capacity, self.embedding_dim), dtype=np.float32)
+        matrix[:len(keep)] = self._matrix[keep]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(keep)] = True
+        assign = np.full(capacity, -1, dtype=np.int32)
+        assign[:len(keep)] = self._assign[keep]
 
-        # Rebuild index mapping
+        self._matrix, self._alive, self._assign = matrix, alive, assign
+        self._ids = [self._ids[i] for i in keep]
         self._id_to_idx = {id_: i for i, id_ in enumerate(self._ids)}
+        self._count = len(keep)
 
-        # Remove from embeddings
-        if self._embeddings is not None and len(self._embeddings) > 0:
-            self._embeddings = np.delete(self._embeddings, idx, axis=0)
-            if len(self._embeddings) == 0:
-                self._embeddings = None
+        if self._centroids is not None:
+            self._lists = [
+                [int(remap[i]) for i in members if remap[i] >= 0]
+                for members in self._lists
+            ]
+            self._list_arrays = {}
 
-        # Rebuild FAISS index if needed
         if self._faiss_available:
             self._rebuild_faiss_index()
 
-        return True
+    # =========================================================================
+    # Search
+    # =========================================================================
 
     def search(
         self,
@@ -154,37 +292,202 @@ class EmbeddingIndex:
         Returns:
             List of (tensor_id, similarity_score) tuples, sorted by score descending
         """
-        if self._embeddings is None or len(self._embeddings) == 0:
+        if self.size == 0 or k <= 0:
             return []
 
         # Normalize query
-        query = np.asarray(query, dtype=np.float32)
-        norm = np.linalg.norm(query)
-        if norm > 0:
-            query = query / norm
+        query = self._normalize(query)[0]
 
         # Limit k to actual size
-        k = min(k, len(self._ids))
+        k = min(k, self.size)
 
         if self._faiss_available and self._faiss_index is not None:
-            # Use FAISS
-            scores, indices = self._faiss_index.search(query.reshape(1, -1), k)
+            # Over-fetch to skip tombstoned rows
+            fetch = min(self._count, k + self._count - self.size)
+            scores, indices = self._faiss_index.search(query.reshape(1, -1), fetch)
             results = [
                 (self._ids[idx], float(score))
                 for idx, score in zip(indices[0], scores[0])
-                if idx >= 0 and idx < len(self._ids)
+                if 0 <= idx < self._count and self._alive[idx]
             ]
+            return results[:k]
+
+        candidates = None
+        if self.backend == "ivf" and self.size >= _IVF_MIN_ROWS:
+            candidates = self._ivf_candidates(query)
+
+        if candidates is None:
+            # Exact: tombstones score -inf and k never exceeds the live count
+            slots = np.arange(self._count)
+            similarities = self._matrix[:self._count] @ query
+            similarities[~self._alive[:self._count]] = -np.inf
         else:
-            # Use numpy cosine similarity
-            similarities = np.dot(self._embeddings, query)
-            top_indices = np.argsort(similarities)[::-1][:k]
-            results = [
-                (self._ids[idx], float(similarities[idx]))
-                for idx in top_indices
+            slots = candidates
+            similarities = self._matrix[candidates] @ query
+
+        top = self._top_k(similarities, min(k, len(slots)))
+        return [(self._ids[slots[i]], float(similarities[i])) for i in top]
+
+    @staticmethod
+    def _top_k(similarities: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k largest values, sorted descending."""
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        if k < len(similarities):
+            top = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            top = np.arange(len(similarities))
+        return top[np.argsort(-similarities[top], kind="stable")]
+
+    def search_by_id(
+        self,
+        tensor_id: str,
+        k: int = 10
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Nearest neighbors of an indexed embedding, excluding itself.
+
+        Args:
+            tensor_id: ID whose stored embedding is the query
+            k: Number of results to return
+
+        Returns:
+            List of (tensor_id, similarity_score) tuples, or None if
+            tensor_id is not in the index
+        """
+        idx = self._id_to_idx.get(tensor_id)
+        if idx is None:
+            return None
+        results = self.search(self._matrix[idx], k=k + 1)
+        return [(id_, score) for id_, score in results if id_ != tensor_id][:k]
+
+    def search_many(
+        self,
+        queries: np.ndarray,
+        k: int = 10
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Search several query vectors at once.
+
+        Exact search scores all queries with one matrix product (in row
+        blocks to bound memory); FAISS searches the batch natively; IVF
+        probes per query since each query scans different lists.
+
+        Args:
+            queries: (Q, embedding_dim) array of query embeddings
+            k: Number of results per query
+
+        Returns:
+            One result list per query, as from search()
+        """
+        queries = self._normalize(queries)
+        if self.size == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        k = min(k, self.size)
+
+        if self._faiss_available and self._faiss_index is not None:
+            fetch = min(self._count, k + self._count - self.size)
+            scores, indices = self._faiss_index.search(queries, fetch)
+            return [
+                [
+                    (self._ids[idx], float(score))
+                    for idx, score in zip(row_indices, row_scores)
+                    if 0 <= idx < self._count and self._alive[idx]
+                ][:k]
+                for row_indices, row_scores in zip(indices, scores)
             ]
 
+        if self.backend == "ivf" and self.size >= _IVF_MIN_ROWS:
+            return [self.search(query, k=k) for query in queries]
+
+        rows = self._matrix[:self._count]
+        dead = ~self._alive[:self._count]
+        block = max(1, _ASSIGN_BLOCK * 64 // max(1, self._count))
+        results = []
+        for start in range(0, len(queries), block):
+            similarities = queries[start:start + block] @ rows.T
+            similarities[:, dead] = -np.inf
+            if k < self._count:
+                top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(self._count), similarities.shape)
+            top_scores = np.take_along_axis(similarities, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            results.extend(
+                [(self._ids[i], float(score)) for i, score in zip(row, row_scores)]
+                for row, row_scores in zip(top, top_scores)
+            )
         return results
 
+    # =========================================================================
+    # IVF backend
+    # =========================================================================
+
+    def _ivf_candidates(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Live slots in the n_probe lists closest to the query."""
+        if self._centroids is None or self.size >= 4 * self._trained_rows:
+            self._train_ivf()
+
+        n_probe = min(self.n_probe, len(self._centroids))
+        probe = self._top_k(self._centroids @ query, n_probe)
+
+        parts = [self._list_array(int(list_id)) for list_id in probe]
+        candidates = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+        candidates = candidates[self._alive[candidates]]
+        return candidates if len(candidates) else None
+
+    def _list_array(self, list_id: int) -> np.ndarray:
+        arr = self._list_arrays.get(list_id)
+        if arr is None:
+            arr = np.asarray(self._lists[list_id], dtype=np.int64)
+            self._list_arrays[list_id] = arr
+        return arr
+
+    def _train_ivf(self, seed: int = 0) -> None:
+        """Spherical k-means over a sample of live rows, then assign every row."""
+        live = np.flatnonzero(self._alive[:self._count])
+        n_lists = self.n_lists or max(1, int(np.sqrt(len(live))))
+        n_lists = min(n_lists, len(live))
+
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(live), max(_IVF_TRAIN_SAMPLE, 32 * n_lists))
+        sample = self._matrix[rng.choice(live, size=sample_size, replace=False)]
+
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(_IVF_TRAIN_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            present, starts = np.unique(labels[order], return_index=True)
+            sums = np.zeros_like(centroids)
+            sums[present] = np.add.reduceat(sample[order], starts, axis=0)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.where(norms > 0, norms, 1.0), centroids)
+
+        self._centroids = centroids.astype(np.float32)
+        self._assign[:] = -1
+        self._lists = [[] for _ in range(n_lists)]
+        self._list_arrays = {}
+        self._assign_to_lists(live)
+        self._trained_rows = len(live)
+
+    def _assign_to_lists(self, slots: np.ndarray) -> None:
+        """Append rows to their nearest IVF list."""
+        for start in range(0, len(slots), _ASSIGN_BLOCK):
+            block = slots[start:start + _ASSIGN_BLOCK]
+            labels = np.argmax(self._matrix[block] @ self._centroids.T, axis=1)
+            self._assign[block] = labels
+            for list_id in np.unique(labels):
+                self._lists[list_id].extend(block[labels == list_id].tolist())
+                self._list_arrays.pop(int(list_id), None)
+
+    # =========================================================================
+    # Accessors and persistence
+    # =========================================================================
+
     def get_embedding(self, tensor_id: str) -> Optional[np.ndarray]:
         """
         Get embedding for a tensor ID.
@@ -197,19 +500,18 @@ class EmbeddingIndex:
         """
         if tensor_id not in self._id_to_idx:
             return None
-        idx = self._id_to_idx[tensor_id]
-        return self._embeddings[idx] if self._embeddings is not None else None
+        return self._matrix[self._id_to_idx[tensor_id]].copy()
 
     def _rebuild_faiss_index(self):
-        """Rebuild the FAISS index from scratch."""
+        """Rebuild the FAISS index from scratch (positions match slots)."""
         if not self._faiss_available:
             return
 
         try:
             import faiss
             self._faiss_index = faiss.IndexFlatIP(self.embedding_dim)
-            if self._embeddings is not None and len(self._embeddings) > 0:
-                self._faiss_index.add(self._embeddings)
+            if self._count > 0:
+                self._faiss_index.add(self._matrix[:self._count])
         except ImportError:
             pass
 
@@ -221,12 +523,14 @@ class EmbeddingIndex:
             path: Path to save index (will create .npz file)
         """
         path = Path(path)
+        embeddings = self._embeddings
+        ids = [id_ for id_ in self._ids if id_ is not None]
 
         # Save as numpy archive
         np.savez(
             str(path) + ".npz",
-            ids=np.array(self._ids, dtype=object),
-            embeddings=self._embeddings if self._embeddings is not None else np.array([]),
+            ids=np.array(ids, dtype=object),
+            embeddings=embeddings if embeddings is not None else np.array([]),
             embedding_dim=np.array([self.embedding_dim]),
         )
 
@@ -242,26 +546,21 @@ class EmbeddingIndex:
 
         data = np.load(npz_path, allow_pickle=True)
 
-        self._ids = list(data["ids"])
-        self._id_to_idx = {id_: i for i, id_ in enumerate(self._ids)}
-
-        embeddings = data["embeddings"]
-        if len(embeddings) > 0:
-            self._embeddings = embeddings
-        else:
-            self._embeddings = None
-
         if "embedding_dim" in data:
             self.embedding_dim = int(data["embedding_dim"][0])
 
+        self._reset_storage()
+        ids = list(data["ids"])
+        embeddings = data["embeddings"]
+        if len(ids) > 0:
+            self.add_batch(ids, embeddings)
+
         # Rebuild FAISS if needed
         if self._faiss_available:
             self._rebuild_faiss_index()
 
     def clear(self) -> None:
         """Clear all embeddings from the index."""
-        self._ids = []
-        self._embeddings = None
-        self._id_to_idx = {}
+        self._reset_storage()
         if self._faiss_available:
             self._rebuild_faiss_index()
@@ -8,9 +8,10 @@ Phase 3: Retrieval System
 Phase 5: Optional permission filtering for access control
 """
 
+import json
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -54,7 +55,10 @@ class TensorRAG:
         embedding_model: str = "all-MiniLM-L6-v2",
         embedding_dim: int = 384,
         auto_build_index: bool = True,
-        permission_enforcer: Optional["PermissionEnforcer"] = None
+        permission_enforcer: Optional["PermissionEnforcer"] = None,
+        index_backend: str = "exact",
+        index_path: Optional[Union[str, Path]] = None,
+        embed_batch_size: int = 256
     ):
         """
         Initialize TensorRAG.
@@ -65,21 +69,32 @@ class TensorRAG:
             embedding_dim: Dimension of embeddings
             auto_build_index: Whether to build index from database on init
             permission_enforcer: Optional PermissionEnforcer for access control (Phase 5)
+            index_backend: EmbeddingIndex backend ("exact", "ivf" or "faiss")
+            index_path: Optional on-disk index snapshot. When set, startup
+                loads it and only embeds records updated since it was saved
+            embed_batch_size: Texts per sentence-transformers encode() call
         """
         self.tensor_db = tensor_db
         self.embedding_model_name = embedding_model
         self.embedding_dim = embedding_dim
         self.permission_enforcer = permission_enforcer
+        self.index_path = Path(index_path) if index_path is not None else None
+        self.embed_batch_size = embed_batch_size
+
+        # Highest tensor_records.change_seq already reflected in the index
+        self._watermark: Optional[int] = None
 
         # Lazy load embedding model
         self._embedder = None
 
         # Initialize components
-        self.index = EmbeddingIndex(embedding_dim=embedding_dim)
+        self.index = EmbeddingIndex(embedding_dim=embedding_dim, backend=index_backend)
         self.composer = TensorComposer()
 
-        # Build index from existing tensors
+        # Build index from existing tensors, resuming from a snapshot if any
         if auto_build_index:
+            if self.index_path is not None:
+                self._load_snapshot()
             self._build_index_from_database()
 
     @property
@@ -102,27 +117,108 @@ class TensorRAG:
         return self.index.size
 
     def _build_index_from_database(self) -> None:
-        """Build embedding index from all tensors in database."""
-        # Get all tensors
-        tensors = self.tensor_db.list_tensors()
+        """
+        Bring the index up to date with the database.
 
-        for record in tensors:
-            # Use cached embedding if available
-            if record.embedding_blob is not None:
-                embedding = np.frombuffer(record.embedding_blob, dtype=np.float32)
-            elif record.description:
-                # Generate embedding from description
-                embedding = self.generate_embedding(record.description)
-                # Cache it
-                record.embedding_blob = embedding.tobytes()
-                self.tensor_db.save_tensor(record)
+        Only records written since the watermark are read; cached embeddings
+        are reused and the rest are embedded in batches and cached in place
+        (without creating tensor versions). Saves the snapshot if anything
+        changed and index_path is set.
+        """
+        since = self._watermark
+        entries = self.tensor_db.list_index_entries(changed_after=since)
+
+        removed = 0
+        if since is not None:
+            # Deletes leave no row to carry a newer change_seq
+            live = set(self.tensor_db.list_tensor_ids())
+            for tensor_id in self.index.ids:
+                if tensor_id not in live:
+                    self.index.remove(tensor_id)
+                    removed += 1
+
+        ids: List[str] = []
+        vectors: List[np.ndarray] = []
+        to_embed: List[Dict] = []
+        for entry in entries:
+            blob = entry["embedding_blob"]
+            if blob is not None and len(blob) == self.embedding_dim * 4:
+                ids.append(entry["tensor_id"])
+                vectors.append(np.frombuffer(blob, dtype=np.float32))
             else:
-                # No description - skip or use entity_id
-                embedding = self.generate_embedding(
-                    f"{record.entity_id} {record.world_id or ''}"
-                )
+                to_embed.append(entry)
+
+        if to_embed:
+            embeddings = self.generate_embeddings([
+                # No description - fall back to entity and world IDs
+                entry["description"] or f"{entry['entity_id']} {entry['world_id'] or ''}"
+                for entry in to_embed
+            ])
+            # Only description-based embeddings are cached, as before
+            self.tensor_db.update_embeddings({
+                entry["tensor_id"]: embedding.tobytes()
+                for entry, embedding in zip(to_embed, embeddings)
+                if entry["description"]
+            })
+            ids.extend(entry["tensor_id"] for entry in to_embed)
+            vectors.extend(embeddings)
+
+        if ids:
+            self.index.add_batch(ids, np.vstack(vectors))
+        if entries:
+            self._watermark = entries[-1]["change_seq"]
+
+        if self.index_path is not None and (ids or removed or not self._snapshot_exists()):
+            self._save_snapshot()
+
+    def sync_index(self) -> None:
+        """Index records added or changed since the last build or sync."""
+        self._build_index_from_database()
+
+    def _snapshot_meta_path(self) -> Path:
+        return Path(str(self.index_path) + ".json")
+
+    def _snapshot_exists(self) -> bool:
+        return self._snapshot_meta_path().exists()
 
-            self.index.add(record.tensor_id, embedding)
+    def _save_snapshot(self) -> None:
+        """Write the index and its watermark next to each other."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.index.save(self.index_path)
+        self._snapshot_meta_path().write_text(json.dumps({
+            "change_seq": self._watermark,
+            "embedding_model": self.embedding_model_name,
+            "embedding_dim": self.embedding_dim,
+            "size": self.index.size,
+        }))
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load the on-disk snapshot if it matches this model and dimension.
+
+        Returns:
+            True if loaded; otherwise the next build starts from scratch
+        """
+        meta_path = self._snapshot_meta_path()
+        npz_path = Path(str(self.index_path) + ".npz")
+        if not meta_path.exists() or not npz_path.exists():
+            return False
+
+        try:
+            meta = json.loads(meta_path.read_text())
+            if (meta.get("embedding_model") != self.embedding_model_name
+                    or meta.get("embedding_dim") != self.embedding_dim
+                    or not isinstance(meta.get("change_seq"), int)):
+                # Other model, or an older timestamp-watermark snapshot
+                return False
+            self.index.load(self.index_path)
+        except (OSError, ValueError, KeyError):
+            # Corrupt or partial snapshot - rebuild from the database
+            self.index.clear()
+            return False
+
+        self._watermark = meta["change_seq"]
+        return True
 
     def generate_embedding(self, text: str) -> np.ndarray:
         """
@@ -137,6 +233,23 @@ class TensorRAG:
         embedding = self.embedder.encode(text, convert_to_numpy=True)
         return embedding.astype(np.float32)
 
+    def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for many texts in batched encode() calls.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            (len(texts), embedding_dim) float32 array
+        """
+        if not texts:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+        embeddings = self.embedder.encode(
+            texts, batch_size=self.embed_batch_size, convert_to_numpy=True
+        )
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+
     def search(
         self,
         query: str,
@@ -161,64 +274,177 @@ class TensorRAG:
             List of SearchResults sorted by score descending
         """
         if not query:
-            # Return all tensors if no query
-            tensors = self.tensor_db.list_tensors()
-            results = []
-            for record in tensors[:n_results * 3]:  # Get more for filtering
-                if record.maturity >= min_maturity:
-                    if categories is None or (record.category and any(c in record.category for c in categories)):
-                        # Apply permission filter if enabled
-                        if not self._check_read_permission(record.tensor_id, user_id):
-                            continue
-                        results.append(SearchResult(
-                            tensor_id=record.tensor_id,
-                            score=1.0,
-                            tensor_record=record
-                        ))
-                        if len(results) >= n_results:
-                            break
-            return results
+            # Return all tensors if no query (filters applied in SQL)
+            tensors = self.tensor_db.list_tensors(
+                min_maturity=min_maturity, categories=categories
+            )
+            readable = self._readable_ids([r.tensor_id for r in tensors], user_id)
+            return [
+                SearchResult(tensor_id=record.tensor_id, score=1.0, tensor_record=record)
+                for record in tensors
+                if readable is None or record.tensor_id in readable
+            ][:n_results]
 
         # Generate query embedding
         query_embedding = self.generate_embedding(query)
 
         # Search index (get more than needed for filtering)
-        search_k = n_results * 5 if user_id else n_results * 3
-        raw_results = self.index.search(query_embedding, k=search_k)
+        raw_results = self.index.search(
+            query_embedding, k=self._search_k(n_results, user_id)
+        )
+        return self._resolve_results(
+            [raw_results], n_results, min_maturity, categories, user_id
+        )[0]
+
+    def search_by_id(
+        self,
+        tensor_id: str,
+        n_results: int = 10,
+        min_maturity: float = 0.0,
+        categories: Optional[List[str]] = None,
+        user_id: Optional[str] = None
+    ) -> List[SearchResult]:
+        """
+        Find tensors similar to a stored tensor, excluding the tensor itself.
+
+        Uses the embedding already in the index, so no model inference runs
+        unless the tensor has not been indexed and has no cached embedding.
+
+        Args:
+            tensor_id: Source tensor
+            n_results: Maximum number of results
+            min_maturity: Minimum maturity threshold
+            categories: Optional list of categories to filter
+            user_id: Optional user ID for permission filtering
 
-        # Build results with filtering
-        results = []
-        for tensor_id, score in raw_results:
-            # Get full record
+        Returns:
+            List of SearchResults sorted by score descending (empty if the
+            source tensor does not exist)
+        """
+        search_k = self._search_k(n_results, user_id)
+        raw_results = self.index.search_by_id(tensor_id, k=search_k)
+
+        if raw_results is None:
+            # Not indexed yet (e.g. written by another process since startup)
             record = self.tensor_db.get_tensor(tensor_id)
             if record is None:
-                continue
+                return []
+            if record.embedding_blob is not None:
+                embedding = np.frombuffer(record.embedding_blob, dtype=np.float32)
+            else:
+                embedding = self.generate_embedding(
+                    record.description or f"{record.entity_id} {record.world_id or ''}"
+                )
+            raw_results = [
+                (id_, score) for id_, score in self.index.search(embedding, k=search_k + 1)
+                if id_ != tensor_id
+            ]
+
+        return self._resolve_results(
+            [raw_results], n_results, min_maturity, categories, user_id
+        )[0]
+
+    def search_many(
+        self,
+        queries: List[str],
+        n_results: int = 10,
+        min_maturity: float = 0.0,
+        categories: Optional[List[str]] = None,
+        user_id: Optional[str] = None
+    ) -> List[List[SearchResult]]:
+        """
+        Run several searches with one batched encode and one index pass.
+
+        Args:
+            queries: Natural language search queries
+            n_results: Maximum number of results per query
+            min_maturity: Minimum maturity threshold
+            categories: Optional list of categories to filter
+            user_id: Optional user ID for permission filtering
 
-            # Apply maturity filter
-            if record.maturity < min_maturity:
-                continue
+        Returns:
+            One list of SearchResults per query
+        """
+        if not queries:
+            return []
+
+        raw_lists = self.index.search_many(
+            self.generate_embeddings(queries), k=self._search_k(n_results, user_id)
+        )
+        return self._resolve_results(
+            raw_lists, n_results, min_maturity, categories, user_id
+        )
+
+    @staticmethod
+    def _search_k(n_results: int, user_id: Optional[str]) -> int:
+        """Candidates to pull from the index to survive filtering."""
+        return n_results * 5 if user_id else n_results * 3
+
+    def _resolve_results(
+        self,
+        raw_lists: List[List[Tuple[str, float]]],
+        n_results: int,
+        min_maturity: Optional[float],
+        categories: Optional[List[str]],
+        user_id: Optional[str]
+    ) -> List[List[SearchResult]]:
+        """
+        Hydrate and filter index hits for one or more queries.
 
-            # Apply category filter
-            if categories is not None:
-                if record.category is None:
+        All candidates are hydrated in one query; maturity and category
+        filters run in SQL, permissions in one bulk check.
+        """
+        candidate_ids = list(dict.fromkeys(
+            tensor_id for raw_results in raw_lists for tensor_id, _ in raw_results
+        ))
+        records = {
+            record.tensor_id: record
+            for record in self.tensor_db.get_tensors_batch(
+                candidate_ids,
+                min_maturity=min_maturity,
+                categories=categories,
+            )
+        }
+        readable = self._readable_ids(list(records), user_id)
+
+        # Build results in similarity order
+        resolved = []
+        for raw_results in raw_lists:
+            results = []
+            for tensor_id, score in raw_results:
+                record = records.get(tensor_id)
+                if record is None:
                     continue
-                if not any(c in record.category for c in categories):
+                if readable is not None and tensor_id not in readable:
                     continue
 
-            # Apply permission filter if enabled (Phase 5)
-            if not self._check_read_permission(tensor_id, user_id):
-                continue
+                results.append(SearchResult(
+                    tensor_id=tensor_id,
+                    score=max(0.0, min(1.0, score)),  # Clamp to [0, 1]
+                    tensor_record=record
+                ))
+
+                if len(results) >= n_results:
+                    break
+            resolved.append(results)
 
-            results.append(SearchResult(
-                tensor_id=tensor_id,
-                score=max(0.0, min(1.0, score)),  # Clamp to [0, 1]
-                tensor_record=record
-            ))
+        return resolved
+
+    def _readable_ids(
+        self,
+        tensor_ids: List[str],
+        user_id: Optional[str]
+    ) -> Optional[Set[str]]:
+        """
+        Bulk variant of _check_read_permission.
 
-            if len(results) >= n_results:
-                break
+        Returns:
+            Set of readable tensor IDs, or None if no filtering applies
+        """
+        if self.permission_enforcer is None or user_id is None:
+            return None
 
-        return results
+        return self.permission_enforcer.filter_readable(user_id, tensor_ids)
 
     def _check_read_permission(
         self,
@@ -437,4 +663,5 @@ class TensorRAG:
     def rebuild_index(self) -> None:
         """Rebuild the embedding index from database."""
         self.index.clear()
+        self._watermark = None
         self._build_index_from_database()
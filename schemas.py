@@ -1,5 +1,6 @@
 # schemas.py - SQLModel schemas serving as ORM, validation, and API spec
 from sqlmodel import SQLModel, Field, JSON, Column
+from sqlalchemy import Index
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -79,20 +80,22 @@ class TTMTensor(SQLModel):
     behavior_vector: bytes  # Serialized numpy array (personality, patterns, momentum)
 
     @classmethod
-    def from_arrays(cls, context: np.ndarray, biology: np.ndarray, behavior: np.ndarray):
-        import msgspec
+    def from_arrays(cls, context: np.ndarray, biology: np.ndarray, behavior: np.ndarray,
+                    dtype=np.float32):
+        from tensor_serialization import encode_vector
         return cls(
-            context_vector=msgspec.msgpack.encode(context.tolist()),
-            biology_vector=msgspec.msgpack.encode(biology.tolist()),
-            behavior_vector=msgspec.msgpack.encode(behavior.tolist())
+            context_vector=encode_vector(context, dtype),
+            biology_vector=encode_vector(biology, dtype),
+            behavior_vector=encode_vector(behavior, dtype)
         )
 
     def to_arrays(self):
-        import msgspec
+        """Decode vectors; native-layout vectors are read-only zero-copy views"""
+        from tensor_serialization import decode_vector
         return (
-            np.array(msgspec.msgpack.decode(self.context_vector)),
-            np.array(msgspec.msgpack.decode(self.biology_vector)),
-            np.array(msgspec.msgpack.decode(self.behavior_vector))
+            decode_vector(self.context_vector),
+            decode_vector(self.biology_vector),
+            decode_vector(self.behavior_vector)
         )
 
 
@@ -252,6 +255,54 @@ class ExposureEvent(SQLModel, table=True):
     timepoint_id: Optional[str] = Field(default=None, index=True)  # link to timepoint
     run_id: Optional[str] = Field(default=None, index=True)  # link to simulation run for convergence
 
+
+class KnowledgeState(SQLModel, table=True):
+    """
+    Bitemporal knowledge-at-time index, one row per exposure event.
+
+    valid_from is when the entity learned the information (simulation time);
+    recorded_at is when the row was written (transaction time). Maintained by
+    GraphStore.save_exposure_event(s) so "what did X know at T" is a range
+    scan over (entity_id, valid_from).
+    """
+    __tablename__ = "knowledge_state"
+    __table_args__ = (
+        Index("ix_knowledge_state_entity_valid_from", "entity_id", "valid_from"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    exposure_event_id: Optional[int] = Field(default=None, index=True)
+    entity_id: str
+    information: str
+    valid_from: datetime
+    source: Optional[str] = None
+    run_id: Optional[str] = Field(default=None)
+    recorded_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class EntitySnapshot(SQLModel, table=True):
+    """
+    Append-only entity state at a timepoint.
+
+    Rows form a per-entity chain ordered by sequence. Keyframes hold the full
+    flattened state; other rows hold a delta ({"set": {...}, "unset": [...]})
+    against the previous snapshot. Written by GraphStore.save_entity_snapshots.
+    """
+    __tablename__ = "entity_snapshot"
+    __table_args__ = (
+        Index("ix_entity_snapshot_entity_timepoint", "entity_id", "timepoint_id", unique=True),
+        Index("ix_entity_snapshot_entity_sequence", "entity_id", "sequence"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    entity_id: str
+    timepoint_id: str
+    sequence: int  # position in the entity's snapshot chain
+    is_keyframe: bool = Field(default=False)
+    state: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    run_id: Optional[str] = Field(default=None)
+    recorded_at: datetime = Field(default_factory=datetime.utcnow)
+
 # ============================================================================
 # Mechanism 5: Query Resolution - Query History Tracking
 # ============================================================================
@@ -404,6 +455,19 @@ class Dialog(SQLModel, table=True):
     run_id: Optional[str] = Field(default=None, index=True)  # Link to simulation run for convergence (January 2026)
 
 
+class DialogParticipant(SQLModel, table=True):
+    """Normalized dialog membership (one row per participant) for indexed lookups"""
+    __tablename__ = "dialog_participant"
+    __table_args__ = (
+        Index("ix_dialog_participant_entity_run", "entity_id", "run_id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    dialog_id: str = Field(index=True)
+    entity_id: str = Field(index=True)
+    run_id: Optional[str] = Field(default=None)
+
+
 # ============================================================================
 # Multi-Entity Synthesis (Mechanism 13)
 # ============================================================================
@@ -656,6 +720,11 @@ class ValidationResult(BaseModel):
     reasoning: str
 
 
+class RelevanceScores(BaseModel):
+    """Structured batch relevance scores from LLM, one per numbered knowledge item"""
+    scores: List[float] = []
+
+
 # ============================================================================
 # Entity Type Converters
 # ============================================================================
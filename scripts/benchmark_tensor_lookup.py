@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark per-lookup latency of TensorDatabase.get_tensor.
+
+Compares the old access pattern (open a connection, set WAL mode, query,
+close) with the pooled persistent connection TensorDatabase now uses.
+
+Usage:
+    python scripts/benchmark_tensor_lookup.py [--tensors N] [--lookups N]
+
+Options:
+    --tensors   Tensors stored in the benchmark database (default: 1000)
+    --lookups   Primary-key lookups timed per path (default: 5000)
+"""
+
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tensor_persistence import TensorDatabase, TensorRecord
+
+
+def lookup_per_connection(db_path: str, tensor_id: str):
+    """The pre-pool pattern: a fresh connection and WAL pragma per call."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    try:
+        return conn.execute(
+            "SELECT * FROM tensor_records WHERE tensor_id = ?", (tensor_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+
+
+def time_lookups(fn, ids) -> float:
+    """Return mean microseconds per call of fn over ids."""
+    start = time.perf_counter()
+    for tensor_id in ids:
+        fn(tensor_id)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tensor lookup latency")
+    parser.add_argument("--tensors", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "lookup.db")
+        db = TensorDatabase(db_path)
+        db.save_tensors_batch([
+            TensorRecord(tensor_id=f"t-{i}", entity_id=f"e-{i}", tensor_blob=bytes(96))
+            for i in range(args.tensors)
+        ])
+        ids = [f"t-{random.randrange(args.tensors)}" for _ in range(args.lookups)]
+
+        before = time_lookups(lambda tid: lookup_per_connection(db_path, tid), ids)
+        after = time_lookups(db.get_tensor, ids)
+        db.close()
+
+    print(f"get_tensor over {args.lookups} lookups ({args.tensors} tensors)")
+    print(f"  connection per call: {before:8.1f} us/lookup")
+    print(f"  pooled connection:   {after:8.1f} us/lookup")
+    print(f"  Speedup: {before / after:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
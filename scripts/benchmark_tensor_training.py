@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized tensor training engine against the asyncio path.
+
+Seeds a temporary TensorDatabase with random tensors, then trains the same
+set with ParallelTensorTrainer.train_batch (one tensor per worker step) and
+ParallelTensorTrainer.train_batch_vectorized (one matrix for the whole batch).
+
+Usage:
+    python scripts/benchmark_tensor_training.py [--tensors N] [--target 0.95]
+        [--workers 4] [--shard-size ROWS] [--processes P]
+
+Options:
+    --tensors       Number of tensors to train (default: 200)
+    --target        Target maturity (default: 0.95)
+    --workers       Asyncio workers for the legacy path (default: 4)
+    --shard-size    Rows per process shard for the vectorized path (default: off)
+    --processes     Process pool size when sharding (default: CPU count)
+    --skip-legacy   Only time the vectorized path (useful for large N)
+"""
+
+import sys
+import time
+import uuid
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from schemas import TTMTensor
+from tensor_persistence import TensorDatabase, TensorRecord
+from tensor_serialization import serialize_tensor
+from training.parallel_trainer import ParallelTensorTrainer
+
+
+def seed_database(db_path: str, count: int) -> list:
+    """Create a database with `count` untrained tensors; returns their IDs."""
+    db = TensorDatabase(db_path)
+    records = []
+    for i in range(count):
+        tensor = TTMTensor.from_arrays(
+            np.random.rand(8), np.random.rand(4), np.random.rand(8)
+        )
+        records.append(TensorRecord(
+            tensor_id=f"bench-{uuid.uuid4().hex[:12]}",
+            entity_id=f"entity-{i}",
+            world_id="benchmark",
+            tensor_blob=serialize_tensor(tensor),
+        ))
+    db.save_tensors_batch(records)
+    return [r.tensor_id for r in records]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tensor training paths")
+    parser.add_argument("--tensors", type=int, default=200)
+    parser.add_argument("--target", type=float, default=0.95)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--shard-size", type=int, default=None)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+
+        if not args.skip_legacy:
+            db_path = str(Path(tmp) / "legacy.db")
+            ids = seed_database(db_path, args.tensors)
+            trainer = ParallelTensorTrainer(TensorDatabase(db_path), max_workers=args.workers)
+            start = time.perf_counter()
+            results = asyncio.run(trainer.train_batch(ids, target_maturity=args.target))
+            timings["asyncio train_batch"] = time.perf_counter() - start
+            assert all(r.success for r in results.values())
+
+        db_path = str(Path(tmp) / "vectorized.db")
+        ids = seed_database(db_path, args.tensors)
+        trainer = ParallelTensorTrainer(TensorDatabase(db_path))
+        start = time.perf_counter()
+        results = trainer.train_batch_vectorized(
+            ids, target_maturity=args.target,
+            shard_size=args.shard_size, max_processes=args.processes
+        )
+        timings["train_batch_vectorized"] = time.perf_counter() - start
+        assert all(r.success for r in results.values())
+
+    print(f"Trained {args.tensors} tensors to maturity {args.target}")
+    for name, seconds in timings.items():
+        rate = args.tensors / seconds if seconds else float("inf")
+        print(f"  {name:<24} {seconds:8.3f}s  ({rate:,.0f} tensors/s)")
+    if len(timings) == 2:
+        legacy, vectorized = timings.values()
+        print(f"  Speedup: {legacy / vectorized:.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -154,8 +154,9 @@ def delete_all_exposure_events(store: GraphStore, dry_run: bool = True):
         if dry_run:
             print(f"\n[DRY RUN] Would delete {count} exposure events")
         else:
-            # Delete all
+            # Delete all, along with the knowledge_state rows derived from them
             session.exec(text("DELETE FROM exposureevent"))
+            session.exec(text("DELETE FROM knowledge_state"))
             session.commit()
             print(f"\nDeleted {count} exposure events")
 
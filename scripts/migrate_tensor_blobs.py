@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Rewrite legacy msgpack tensor blobs in the native binary layout.
+
+Converts every row of tensor_records and tensor_versions whose tensor_blob
+is still msgpack-encoded. Rows already in the native layout are skipped, so
+the script can be re-run safely. Legacy values are float64 and are written
+as float64 native vectors, so every value round-trips exactly; version
+numbers and timestamps are left untouched because only the encoding changes.
+
+Usage:
+    python scripts/migrate_tensor_blobs.py path/to/tensors.db [--dry-run] [--batch-size N]
+
+Options:
+    --dry-run       Count legacy rows without rewriting them
+    --batch-size    Rows converted per transaction (default: 500)
+"""
+
+import sys
+import argparse
+import sqlite3
+from pathlib import Path
+from typing import Dict
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tensor_serialization import convert_legacy_blob, is_native_blob
+
+TABLES = {
+    "tensor_records": "tensor_id",
+    "tensor_versions": "id",
+}
+
+
+def migrate_table(conn: sqlite3.Connection, table: str, key: str,
+                  dry_run: bool = False, batch_size: int = 500) -> Dict[str, int]:
+    """Convert legacy blobs in one table; returns scanned/converted/failed counts."""
+    stats = {"scanned": 0, "converted": 0, "failed": 0}
+    pending = []
+
+    def flush():
+        if pending and not dry_run:
+            with conn:
+                conn.executemany(
+                    f"UPDATE {table} SET tensor_blob = ? WHERE {key} = ?", pending
+                )
+        pending.clear()
+
+    rows = conn.execute(f"SELECT {key}, tensor_blob FROM {table}").fetchall()
+    for row_key, blob in rows:
+        stats["scanned"] += 1
+        if is_native_blob(blob):
+            continue
+        try:
+            pending.append((convert_legacy_blob(blob), row_key))
+        except Exception as e:
+            stats["failed"] += 1
+            print(f"  ⚠️  {table}[{row_key}]: {e}")
+            continue
+        stats["converted"] += 1
+        if len(pending) >= batch_size:
+            flush()
+    flush()
+
+    return stats
+
+
+def migrate_database(db_path: str, dry_run: bool = False, batch_size: int = 500) -> Dict[str, Dict[str, int]]:
+    """Convert legacy blobs in all tensor tables present in the database."""
+    results = {}
+    conn = sqlite3.connect(db_path)
+    try:
+        existing = {
+            name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        for table, key in TABLES.items():
+            if table in existing:
+                results[table] = migrate_table(conn, table, key, dry_run, batch_size)
+        if not dry_run:
+            conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate tensor blobs to the native binary layout")
+    parser.add_argument("db_path", help="Path to the TensorDatabase SQLite file")
+    parser.add_argument("--dry-run", action="store_true", help="Count legacy rows without rewriting")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per transaction")
+    args = parser.parse_args()
+
+    if not Path(args.db_path).exists():
+        print(f"❌ Database not found: {args.db_path}")
+        return 1
+
+    results = migrate_database(args.db_path, dry_run=args.dry_run, batch_size=args.batch_size)
+
+    verb = "Would convert" if args.dry_run else "Converted"
+    for table, stats in results.items():
+        print(f"{table}: {verb} {stats['converted']}/{stats['scanned']} rows"
+              f" ({stats['failed']} failed)")
+
+    return 1 if any(stats["failed"] for stats in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
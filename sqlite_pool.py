@@ -0,0 +1,193 @@
+"""
+Thread-local SQLite connection pool.
+
+Provides:
+- SQLiteConnectionPool: One persistent connection per thread per database
+- Tunable pragmas (journal_mode, synchronous, cache_size, mmap_size, busy_timeout)
+- Prepared-statement reuse via the sqlite3 per-connection statement cache
+- Nestable transactions (only the outermost block commits or rolls back)
+- Connections of exited threads are closed, so per-stage thread pools
+  do not leak file handles
+- Clean shutdown: close() closes every connection the pool opened
+
+Opening a connection and re-issuing PRAGMA journal_mode=WAL costs far more
+than a primary-key lookup, so stores that used to connect per call
+(TensorDatabase, JobQueue, PermissionEnforcer, AuditLogger) keep their
+connections here instead.
+
+Example:
+    >>> pool = SQLiteConnectionPool("tensors.db", synchronous="NORMAL")
+    >>> with pool.transaction() as conn:
+    ...     conn.execute("SELECT 1")
+    >>> pool.close()
+"""
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional, Set, Union
+
+
+class _ThreadSlot:
+    """Per-thread connection holder; freed with the thread's local storage."""
+    __slots__ = ("conn", "depth", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.depth = 0
+
+
+class SQLiteConnectionPool:
+    """
+    Hands out one persistent SQLite connection per thread.
+
+    Connections are created lazily with check_same_thread=False so that
+    close() can shut them down from any thread. A connection is closed when
+    its thread exits. Asyncio tasks running on one event loop share that
+    thread's connection; transactions never span an await, so they do not
+    interleave.
+
+    Attributes:
+        db_path: Path to the SQLite database file
+        journal_mode: PRAGMA journal_mode (None leaves the file's mode alone)
+        synchronous: PRAGMA synchronous (NORMAL is safe with WAL)
+        cache_size: PRAGMA cache_size (negative values are KiB)
+        mmap_size: PRAGMA mmap_size in bytes (0 disables memory mapping)
+        busy_timeout: PRAGMA busy_timeout in milliseconds
+        cached_statements: Prepared statements kept per connection
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        journal_mode: Optional[str] = "WAL",
+        synchronous: Optional[str] = "NORMAL",
+        cache_size: Optional[int] = -16000,
+        mmap_size: Optional[int] = 0,
+        busy_timeout: int = 5000,
+        cached_statements: int = 256,
+        row_factory: Optional[Callable] = sqlite3.Row,
+    ):
+        self.db_path = Path(db_path)
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size = cache_size
+        self.mmap_size = mmap_size
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self.row_factory = row_factory
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Set[sqlite3.Connection] = set()
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection and apply pragmas."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        conn.row_factory = self.row_factory
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+        if self.journal_mode:
+            conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        if self.synchronous:
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        if self.cache_size is not None:
+            conn.execute(f"PRAGMA cache_size={int(self.cache_size)}")
+        if self.mmap_size is not None:
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it on first use.
+
+        Raises:
+            sqlite3.ProgrammingError: If the pool has been closed
+        """
+        return self._slot().conn
+
+    def _slot(self) -> _ThreadSlot:
+        """Get this thread's slot, opening its connection on first use."""
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            with self._lock:
+                if self._closed:
+                    raise sqlite3.ProgrammingError(
+                        f"Connection pool for {self.db_path} is closed"
+                    )
+                conn = self._connect()
+                self._connections.add(conn)
+            slot = _ThreadSlot(conn)
+            # Only the thread-local holds the slot, so it is freed when the thread exits
+            weakref.finalize(slot, SQLiteConnectionPool._release, weakref.ref(self), conn)
+            self._local.slot = slot
+        return slot
+
+    @staticmethod
+    def _release(pool_ref: "weakref.ref", conn: sqlite3.Connection) -> None:
+        """Close the connection of a thread that has exited."""
+        pool = pool_ref()
+        if pool is not None:
+            pool._connections.discard(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """
+        Context manager for atomic transactions on this thread's connection.
+
+        Nested blocks join the enclosing transaction; only the outermost
+        block commits, or rolls back if an exception escapes.
+
+        Args:
+            immediate: Take the write lock when the outermost block begins
+                (BEGIN IMMEDIATE) rather than at its first write. Nested
+                blocks join the enclosing transaction as it is.
+        """
+        slot = self._slot()
+        conn = slot.conn
+        outermost = slot.depth == 0
+        if outermost and immediate and not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        slot.depth += 1
+        try:
+            yield conn
+            if outermost:
+                conn.commit()
+        except Exception:
+            if outermost:
+                conn.rollback()
+            raise
+        finally:
+            slot.depth -= 1
+
+    def close(self) -> None:
+        """Close every connection opened by this pool. Safe to call twice."""
+        with self._lock:
+            self._closed = True
+            connections, self._connections = self._connections, set()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def __enter__(self) -> "SQLiteConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
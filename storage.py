@@ -2,13 +2,458 @@
 # storage.py - Database and graph persistence
 # ============================================================================
 from sqlmodel import Session, create_engine, select, SQLModel
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterable
+from datetime import datetime
 from contextlib import contextmanager
+from collections import OrderedDict
 import networkx as nx
+import copy
 import json
-from functools import lru_cache
+import re
+import threading
 
-from schemas import Entity, Timeline, SystemPrompt, ExposureEvent, Timepoint, Dialog, RelationshipTrajectory, QueryHistory, ConvergenceSet
+from schemas import Entity, EntitySnapshot, ResolutionLevel, Timeline, SystemPrompt, ExposureEvent, KnowledgeState, Timepoint, Dialog, DialogParticipant, RelationshipTrajectory, QueryHistory, ConvergenceSet
+
+# SQLite caps bound parameters per statement (999 before 3.32, 32766 after)
+_SQLITE_MAX_VARIABLES = 999
+
+
+def _entity_upsert_rows(entities: list[Entity]) -> list[dict]:
+    """Column dicts for a bulk entity upsert, last occurrence of an entity_id wins"""
+    columns = [c.name for c in Entity.__table__.columns if c.name != "id"]
+    rows_by_id = {}
+    for entity in entities:
+        rows_by_id[entity.entity_id] = {name: getattr(entity, name) for name in columns}
+    return list(rows_by_id.values())
+
+
+class RowCache:
+    """
+    Bounded LRU read-through cache of ORM rows keyed by a natural ID.
+
+    Stores detached rows and hands out independent copies, so callers can
+    mutate what they get back without corrupting the cache. Writers must
+    call invalidate() for the keys they change.
+    """
+
+    def __init__(self, max_size: int = 500):
+        """
+        Args:
+            max_size: Maximum number of rows held (0 disables caching)
+        """
+        self.max_size = max_size
+        self._rows: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: str):
+        """Return a copy of the cached row, or None on a miss"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                self.misses += 1
+                return None
+            self._rows.move_to_end(key)
+            self.hits += 1
+        return _detached_copy(row)
+
+    def put(self, key: str, row) -> None:
+        """Cache a copy of a detached row"""
+        if not self.enabled or row is None:
+            return
+        snapshot = _detached_copy(row)
+        with self._lock:
+            self._rows[key] = snapshot
+            self._rows.move_to_end(key)
+            while len(self._rows) > self.max_size:
+                self._rows.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Drop rows that have been written"""
+        with self._lock:
+            for key in keys:
+                if self._rows.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+
+    def get_statistics(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._rows),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def _detached_copy(row):
+    """
+    Copy a detached ORM row without touching the database.
+
+    merge(load=False) builds the copy through the mapper (as a load would)
+    and keeps its identity, so the copy can be re-saved as an UPDATE. JSON
+    values are deep-copied so the copy shares no mutable state.
+    """
+    from sqlalchemy import inspect as sa_inspect
+    from sqlalchemy.orm.attributes import set_committed_value
+
+    with Session() as session:
+        duplicate = session.merge(row, load=False)
+        for attr in sa_inspect(type(row)).column_attrs:
+            value = getattr(duplicate, attr.key)
+            if isinstance(value, (dict, list)):
+                set_committed_value(duplicate, attr.key, copy.deepcopy(value))
+    return duplicate
+
+
+# Words never treated as a partial entity name on their own
+_NAME_STOPWORDS = frozenset({"the", "and", "for", "von", "van", "del", "der", "des"})
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase a name and collapse punctuation/underscores to single spaces"""
+    return " ".join(re.findall(r"[a-z0-9]+", name.lower()))
+
+
+def _trigrams(phrase: str) -> set[str]:
+    padded = f"  {phrase} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _entity_aliases(entity_id: str, metadata: Optional[dict]) -> tuple[str, ...]:
+    """Normalized names an entity can be referred to by: its ID, metadata name, and aliases"""
+    names = [entity_id]
+    metadata = metadata or {}
+    if isinstance(metadata.get("name"), str):
+        names.append(metadata["name"])
+    aliases = metadata.get("aliases") or []
+    if isinstance(aliases, str):
+        aliases = [aliases]
+    names.extend(alias for alias in aliases if isinstance(alias, str))
+    return tuple(dict.fromkeys(phrase for phrase in map(_normalize_name, names) if phrase))
+
+
+class EntityNameIndex:
+    """
+    In-memory entity name resolution index.
+
+    Maps normalized alias phrases, unambiguous name tokens (e.g. a surname),
+    and character trigrams to entity IDs, so resolving names in a query never
+    touches the database. The owning GraphStore loads it once and keeps it
+    current from its entity write paths.
+    """
+
+    # Minimum trigram Jaccard similarity for a fuzzy match
+    FUZZY_THRESHOLD = 0.5
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._aliases: dict[str, tuple[str, ...]] = {}
+        self._phrases: dict[str, set[str]] = {}
+        self._tokens: dict[str, set[str]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+        self._max_phrase_tokens = 1
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, rows: Iterable[tuple[str, Optional[dict]]]) -> None:
+        """Replace the index contents with (entity_id, entity_metadata) rows"""
+        with self._lock:
+            self._reset()
+            for entity_id, metadata in rows:
+                self._add(entity_id, _entity_aliases(entity_id, metadata))
+            self._loaded = True
+
+    def update(self, aliases_by_id: dict[str, tuple[str, ...]]) -> None:
+        """Re-index written entities (no-op until the index has been loaded)"""
+        with self._lock:
+            if not self._loaded:
+                return
+            for entity_id, aliases in aliases_by_id.items():
+                self._remove(entity_id)
+                self._add(entity_id, aliases)
+
+    def clear(self) -> None:
+        """Drop everything; the store reloads on next use"""
+        with self._lock:
+            self._reset()
+            self._loaded = False
+
+    def _reset(self) -> None:
+        self._aliases.clear()
+        self._phrases.clear()
+        self._tokens.clear()
+        self._trigrams.clear()
+        self._max_phrase_tokens = 1
+
+    def _add(self, entity_id: str, aliases: tuple[str, ...]) -> None:
+        self._aliases[entity_id] = aliases
+        for phrase in aliases:
+            self._index_term(self._phrases, phrase, entity_id)
+            tokens = phrase.split()
+            self._max_phrase_tokens = max(self._max_phrase_tokens, len(tokens))
+            # Partial names only come from purely alphabetic multi-word
+            # aliases, so "attendee_47" doesn't claim every "attendee"
+            if len(tokens) > 1 and all(token.isalpha() for token in tokens):
+                for token in tokens:
+                    if len(token) >= 3 and token not in _NAME_STOPWORDS:
+                        self._index_term(self._tokens, token, entity_id)
+
+    def _remove(self, entity_id: str) -> None:
+        for phrase in self._aliases.pop(entity_id, ()):
+            self._unindex_term(self._phrases, phrase, entity_id)
+            for token in phrase.split():
+                self._unindex_term(self._tokens, token, entity_id)
+
+    def _index_term(self, terms: dict[str, set[str]], term: str, entity_id: str) -> None:
+        if term not in self._phrases and term not in self._tokens:
+            for gram in _trigrams(term):
+                self._trigrams.setdefault(gram, set()).add(term)
+        terms.setdefault(term, set()).add(entity_id)
+
+    def _unindex_term(self, terms: dict[str, set[str]], term: str, entity_id: str) -> None:
+        owners = terms.get(term)
+        if owners is None:
+            return
+        owners.discard(entity_id)
+        if not owners:
+            del terms[term]
+            if term not in self._phrases and term not in self._tokens:
+                for gram in _trigrams(term):
+                    self._trigrams[gram].discard(term)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._aliases
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    def entity_ids(self) -> list[str]:
+        """All indexed entity IDs, in insertion order"""
+        with self._lock:
+            return list(self._aliases)
+
+    def _unique(self, owners: Optional[set[str]]) -> Optional[str]:
+        if owners and len(owners) == 1:
+            return next(iter(owners))
+        return None
+
+    def resolve(self, name: str, fuzzy: bool = True) -> Optional[str]:
+        """
+        Resolve a free-form name to an entity ID.
+
+        Tries, in order: exact entity ID, exact alias, unambiguous single
+        name token, then (for names without digits) the closest alias or
+        name token by trigram similarity.
+
+        Returns:
+            The entity ID, or None if nothing matches unambiguously
+        """
+        with self._lock:
+            if name in self._aliases:
+                return name
+            phrase = _normalize_name(name)
+            if not phrase:
+                return None
+            if phrase in self._phrases or phrase in self._tokens:
+                # Known name: either unambiguous or deliberately unresolved
+                return self._unique(self._phrases.get(phrase)) or self._unique(self._tokens.get(phrase))
+            # Numbered names are never fuzzy-matched: attendee_47 is not attendee_41
+            if not fuzzy or any(ch.isdigit() for ch in phrase):
+                return None
+
+            query_grams = _trigrams(phrase)
+            overlaps: dict[str, int] = {}
+            for gram in query_grams:
+                for candidate in self._trigrams.get(gram, ()):
+                    overlaps[candidate] = overlaps.get(candidate, 0) + 1
+            best_score, best_phrase = 0.0, None
+            for candidate, overlap in overlaps.items():
+                if any(ch.isdigit() for ch in candidate):
+                    continue
+                score = overlap / (len(query_grams) + len(_trigrams(candidate)) - overlap)
+                if score > best_score:
+                    best_score, best_phrase = score, candidate
+            if best_phrase is None or best_score < self.FUZZY_THRESHOLD:
+                return None
+            return self._unique(self._phrases.get(best_phrase)) or self._unique(self._tokens.get(best_phrase))
+
+    def find_mentions(self, text: str) -> list[str]:
+        """
+        Entity IDs mentioned in free text, in order of first mention.
+
+        Matches the longest alias phrase at each position, falling back to
+        unambiguous single name tokens.
+        """
+        tokens = _normalize_name(text).split()
+        found: dict[str, None] = {}
+        with self._lock:
+            i = 0
+            while i < len(tokens):
+                step = 1
+                for n in range(min(self._max_phrase_tokens, len(tokens) - i), 0, -1):
+                    phrase = " ".join(tokens[i:i + n])
+                    match = self._unique(self._phrases.get(phrase))
+                    if match is None and n == 1:
+                        match = self._unique(self._tokens.get(phrase))
+                    if match is not None:
+                        found.setdefault(match)
+                        step = n
+                        break
+                i += step
+        return list(found)
+
+
+def _parse_participants(participants) -> list[str]:
+    """Decode Dialog.participants (a JSON-encoded list, or a list) into entity_ids"""
+    if isinstance(participants, str):
+        try:
+            participants = json.loads(participants)
+        except json.JSONDecodeError:
+            return []
+    return [p for p in (participants or []) if isinstance(p, str)]
+
+
+def _dialog_participant_rows(dialog: Dialog) -> list[DialogParticipant]:
+    """Association rows for a dialog, one per distinct participant"""
+    return [
+        DialogParticipant(dialog_id=dialog.dialog_id, entity_id=entity_id, run_id=dialog.run_id)
+        for entity_id in dict.fromkeys(_parse_participants(dialog.participants))
+    ]
+
+
+# Flattened snapshot keys for entity_metadata entries, so deltas are per metadata key
+_SNAPSHOT_METADATA_PREFIX = "entity_metadata."
+_SNAPSHOT_DATETIME_COLUMNS = ("temporal_span_start", "temporal_span_end")
+
+
+def _entity_snapshot_state(entity: Entity) -> dict:
+    """Flatten an entity into a JSON-safe dict for the snapshot chain"""
+    state = {}
+    for column in Entity.__table__.columns:
+        if column.name in ("id", "entity_metadata"):
+            continue
+        value = getattr(entity, column.name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, ResolutionLevel):
+            value = value.value
+        state[column.name] = value
+    for key, value in (entity.entity_metadata or {}).items():
+        state[_SNAPSHOT_METADATA_PREFIX + key] = value
+    # Round-trip through JSON so the snapshot shares nothing with the entity
+    # and compares equal to what is read back from the JSON column
+    return json.loads(json.dumps(state, default=str))
+
+
+def _entity_from_snapshot_state(state: dict) -> Entity:
+    """Rebuild a detached Entity from a flattened snapshot state"""
+    columns, metadata = {}, {}
+    for key, value in state.items():
+        if key.startswith(_SNAPSHOT_METADATA_PREFIX):
+            metadata[key[len(_SNAPSHOT_METADATA_PREFIX):]] = value
+        else:
+            columns[key] = value
+    for name in _SNAPSHOT_DATETIME_COLUMNS:
+        if columns.get(name):
+            columns[name] = datetime.fromisoformat(columns[name])
+    if columns.get("resolution_level"):
+        columns["resolution_level"] = ResolutionLevel(columns["resolution_level"])
+    return Entity(**columns, entity_metadata=metadata)
+
+
+def _snapshot_delta(previous: dict, current: dict) -> dict:
+    """Keys that changed or disappeared between two flattened states"""
+    return {
+        "set": {key: value for key, value in current.items() if key not in previous or previous[key] != value},
+        "unset": [key for key in previous if key not in current],
+    }
+
+
+def _apply_snapshot_chain(rows: list[EntitySnapshot]) -> dict:
+    """Replay a keyframe and the deltas after it (rows in sequence order)"""
+    state = dict(rows[0].state)
+    for row in rows[1:]:
+        state.update(row.state.get("set", {}))
+        for key in row.state.get("unset", []):
+            state.pop(key, None)
+    return state
+
+
+def _add_exposure_events(session: Session, events: list[ExposureEvent]) -> None:
+    """Stage exposure events plus their knowledge_state index rows on a session"""
+    session.add_all(events)
+    # Flush to assign event IDs for the index rows
+    session.flush()
+    session.add_all([
+        KnowledgeState(
+            exposure_event_id=event.id,
+            entity_id=event.entity_id,
+            information=event.information,
+            valid_from=event.timestamp,
+            source=event.source,
+            run_id=event.run_id,
+        )
+        for event in events
+    ])
+
+
+def _bulk_upsert_entities(connection, entities: list[Entity]) -> int:
+    """
+    Upsert entities with INSERT ... ON CONFLICT(entity_id) DO UPDATE.
+
+    Every non-key column is overwritten from the incoming entity. Rows are
+    chunked only as far as the SQLite bound-parameter limit requires, so a
+    typical roster is written in a single statement.
+
+    Args:
+        connection: SQLAlchemy Connection or Session to execute on
+        entities: Entities to insert or update
+
+    Returns:
+        Number of rows written
+    """
+    rows = _entity_upsert_rows(entities)
+    if not rows:
+        return 0
+
+    dialect = (getattr(connection, "dialect", None) or connection.get_bind().dialect).name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+    table = Entity.__table__
+    columns_per_row = len(rows[0])
+    batch_size = max(1, _SQLITE_MAX_VARIABLES // columns_per_row) if dialect == "sqlite" else len(rows)
+
+    for start in range(0, len(rows), batch_size):
+        stmt = dialect_insert(table).values(rows[start:start + batch_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.entity_id],
+            set_={name: stmt.excluded[name] for name in rows[0] if name != "entity_id"},
+        )
+        connection.execute(stmt)
+    return len(rows)
 
 
 class TransactionContext:
@@ -28,11 +473,19 @@ class TransactionContext:
 
     def __init__(self, session: Session):
         self._session = session
+        # Rows written in this transaction; the store invalidates its
+        # caches for them once the transaction commits
+        self.saved_timepoint_ids: set[str] = set()
+        self.saved_entity_ids: set[str] = set()
+        # Entity aliases captured at save time, applied to the name index on commit
+        self.saved_entity_aliases: dict[str, tuple[str, ...]] = {}
 
     def save_entity(self, entity: Entity) -> Entity:
         """Save an entity within the transaction"""
         from sqlalchemy.orm.attributes import flag_modified
 
+        self.saved_entity_ids.add(entity.entity_id)
+        self.saved_entity_aliases[entity.entity_id] = _entity_aliases(entity.entity_id, entity.entity_metadata)
         existing = self._session.exec(
             select(Entity).where(Entity.entity_id == entity.entity_id)
         ).first()
@@ -56,24 +509,36 @@ class TransactionContext:
             flag_modified(entity, "entity_metadata")
             return entity
 
+    def save_entities_bulk(self, entities: list[Entity]) -> int:
+        """Upsert many entities within the transaction using one statement per batch"""
+        # Push pending ORM changes first so the upsert sees them
+        self._session.flush()
+        self.saved_entity_ids.update(entity.entity_id for entity in entities)
+        self.saved_entity_aliases.update(
+            (entity.entity_id, _entity_aliases(entity.entity_id, entity.entity_metadata))
+            for entity in entities
+        )
+        return _bulk_upsert_entities(self._session, entities)
+
     def save_timepoint(self, timepoint: Timepoint) -> Timepoint:
         """Save a timepoint within the transaction"""
         self._session.add(timepoint)
+        self.saved_timepoint_ids.add(timepoint.timepoint_id)
         return timepoint
 
     def save_exposure_event(self, event: ExposureEvent) -> ExposureEvent:
-        """Save an exposure event within the transaction"""
-        self._session.add(event)
+        """Save an exposure event (and its knowledge index row) within the transaction"""
+        _add_exposure_events(self._session, [event])
         return event
 
     def save_exposure_events(self, events: list[ExposureEvent]) -> None:
-        """Batch save exposure events within the transaction"""
-        for event in events:
-            self._session.add(event)
+        """Batch save exposure events (and their knowledge index rows) within the transaction"""
+        _add_exposure_events(self._session, events)
 
     def save_dialog(self, dialog: Dialog) -> Dialog:
-        """Save a dialog within the transaction"""
+        """Save a dialog (and its participant index rows) within the transaction"""
         self._session.add(dialog)
+        self._session.add_all(_dialog_participant_rows(dialog))
         return dialog
 
     def save_relationship_trajectory(self, trajectory: RelationshipTrajectory) -> RelationshipTrajectory:
@@ -96,11 +561,63 @@ class TransactionContext:
         self._session.add(prospective_state)
         return prospective_state
 
+# Recursive walks over Timepoint.causal_parent. The path column guards against
+# cycles in malformed chains; max_depth bounds pathological inputs.
+_ANCESTRY_CTE = """
+WITH RECURSIVE ancestry(timepoint_id, parent_id, depth, path) AS (
+    SELECT timepoint_id, causal_parent, 0, ',' || timepoint_id || ','
+    FROM timepoint WHERE timepoint_id = :timepoint_id
+    UNION ALL
+    SELECT t.timepoint_id, t.causal_parent, a.depth + 1, a.path || t.timepoint_id || ','
+    FROM timepoint t JOIN ancestry a ON t.timepoint_id = a.parent_id
+    WHERE a.depth < :max_depth AND instr(a.path, ',' || t.timepoint_id || ',') = 0
+)
+"""
+
+_DESCENDANT_CTE = """
+WITH RECURSIVE descendants(timepoint_id, depth, path) AS (
+    SELECT timepoint_id, 0, ',' || timepoint_id || ','
+    FROM timepoint WHERE timepoint_id = :timepoint_id
+    UNION ALL
+    SELECT t.timepoint_id, d.depth + 1, d.path || t.timepoint_id || ','
+    FROM timepoint t JOIN descendants d ON t.causal_parent = d.timepoint_id
+    WHERE d.depth < :max_depth AND instr(d.path, ',' || t.timepoint_id || ',') = 0
+)
+"""
+
+
 class GraphStore:
     """Unified storage for entities, timelines, and graphs"""
 
-    def __init__(self, db_url: str = "sqlite:///timepoint.db"):
+    # Deepest causal chain walked by the recursive ancestry queries
+    MAX_CAUSAL_DEPTH = 10000
+
+    def __init__(
+        self,
+        db_url: str = "sqlite:///timepoint.db",
+        ancestry_cache: bool = True,
+        cache_size: int = 500,
+        snapshot_keyframe_interval: int = 8,
+    ):
+        """
+        Args:
+            db_url: SQLAlchemy database URL
+            ancestry_cache: Cache causal ancestor lists in-process (invalidated on save_timepoint)
+            cache_size: Rows held by each of the timepoint and entity read-through caches
+                (0 disables them)
+            snapshot_keyframe_interval: Entity snapshots per full keyframe; a point-in-time
+                read replays at most this many rows
+        """
+        self.snapshot_keyframe_interval = max(1, snapshot_keyframe_interval)
+        self._ancestry_cache: Optional[dict[str, tuple[str, ...]]] = {} if ancestry_cache else None
+        self._timepoint_cache = RowCache(cache_size)
+        self._entity_cache = RowCache(cache_size)
+        self._name_index = EntityNameIndex()
         self.engine = create_engine(db_url)
+        # knowledge_state is backfilled only by the open that creates it;
+        # afterwards every exposure-event write maintains it
+        from sqlalchemy import inspect
+        backfill_knowledge = not inspect(self.engine).has_table(KnowledgeState.__tablename__)
         SQLModel.metadata.create_all(self.engine)
         # Enable WAL mode for better concurrent write performance
         # (allows multiple readers + one writer simultaneously)
@@ -109,6 +626,64 @@ class GraphStore:
             with self.engine.connect() as conn:
                 conn.execute(text("PRAGMA journal_mode=WAL"))
                 conn.commit()
+        self._backfill_dialog_participants()
+        if backfill_knowledge:
+            self._backfill_knowledge_states()
+
+    def _backfill_dialog_participants(self) -> int:
+        """
+        Migration: populate dialog_participant for dialogs saved before the table existed.
+
+        Only dialogs without any participant rows are decoded, so this is a
+        no-op on an up-to-date database.
+
+        Returns:
+            Number of participant rows inserted
+        """
+        with Session(self.engine) as session:
+            missing = session.exec(
+                select(Dialog)
+                .outerjoin(DialogParticipant, DialogParticipant.dialog_id == Dialog.dialog_id)
+                .where(DialogParticipant.id == None)  # noqa: E711 - SQL IS NULL
+            ).all()
+            rows = [row for dialog in missing for row in _dialog_participant_rows(dialog)]
+            if rows:
+                session.add_all(rows)
+                session.commit()
+            return len(rows)
+
+    def _backfill_knowledge_states(self) -> int:
+        """
+        Migration: index exposure events saved before knowledge_state existed.
+
+        GraphStore runs this once, when it creates the knowledge_state table.
+        It is a single INSERT ... SELECT over events without an index row, so
+        running it again is a no-op. Backfilled rows are stamped with the
+        migration time as recorded_at.
+
+        Returns:
+            Number of knowledge_state rows inserted
+        """
+        from sqlalchemy import insert, literal, select as sa_select, DateTime
+
+        events = ExposureEvent.__table__
+        index = KnowledgeState.__table__
+        missing = (
+            sa_select(
+                events.c.id, events.c.entity_id, events.c.information,
+                events.c.timestamp, events.c.source, events.c.run_id,
+                literal(datetime.utcnow(), DateTime()),
+            )
+            .select_from(events.outerjoin(index, index.c.exposure_event_id == events.c.id))
+            .where(index.c.id.is_(None))
+        )
+        with self.engine.begin() as conn:
+            result = conn.execute(insert(index).from_select(
+                ["exposure_event_id", "entity_id", "information",
+                 "valid_from", "source", "run_id", "recorded_at"],
+                missing,
+            ))
+            return result.rowcount or 0
 
     @contextmanager
     def transaction(self) -> Generator[TransactionContext, None, None]:
@@ -137,9 +712,55 @@ class GraphStore:
             except Exception:
                 session.rollback()
                 raise
+            if tx.saved_timepoint_ids:
+                self._invalidate_timepoints(tx.saved_timepoint_ids)
+            if tx.saved_entity_ids:
+                self._entity_cache.invalidate(tx.saved_entity_ids)
+                self._name_index.update(tx.saved_entity_aliases)
+
+    def get_cache_stats(self) -> dict:
+        """Hit-rate metrics for the store's read-through caches"""
+        return {
+            "timepoints": self._timepoint_cache.get_statistics(),
+            "entities": self._entity_cache.get_statistics(),
+            "ancestry_entries": len(self._ancestry_cache) if self._ancestry_cache is not None else 0,
+            "entity_names": len(self._name_index),
+        }
+
+    def clear_caches(self) -> None:
+        """Drop every cached row (use after writing through a raw Session)"""
+        self._timepoint_cache.clear()
+        self._entity_cache.clear()
+        self._name_index.clear()
+        if self._ancestry_cache is not None:
+            self._ancestry_cache.clear()
+
+    def get_entity_name_index(self) -> EntityNameIndex:
+        """
+        The store's entity name index, loaded on first use.
+
+        Loading reads only entity_id and entity_metadata; afterwards the
+        index is updated in place by save_entity, save_entities_bulk and
+        committed transactions, so lookups never hit the database.
+        """
+        if not self._name_index.loaded:
+            with Session(self.engine) as session:
+                rows = session.exec(select(Entity.entity_id, Entity.entity_metadata)).all()
+            self._name_index.load(rows)
+        return self._name_index
+
+    def _invalidate_timepoints(self, timepoint_ids) -> None:
+        """Drop cached state derived from the given timepoints after a write"""
+        self._timepoint_cache.invalidate(timepoint_ids)
+        if self._ancestry_cache is not None:
+            # A new or re-parented timepoint can change the ancestry of any
+            # descendant, so the ancestry cache is cleared wholesale
+            self._ancestry_cache.clear()
 
     def save_entity(self, entity: Entity) -> Entity:
         from sqlalchemy.orm.attributes import flag_modified
+        # Captured before commit expires the entity's attributes
+        aliases = {entity.entity_id: _entity_aliases(entity.entity_id, entity.entity_metadata)}
         with Session(self.engine) as session:
             # Check if entity already exists by entity_id (unique constraint)
             existing = session.exec(
@@ -162,6 +783,8 @@ class GraphStore:
                 flag_modified(existing, "entity_metadata")
                 session.add(existing)
                 session.commit()
+                self._entity_cache.invalidate([entity.entity_id])
+                self._name_index.update(aliases)
                 session.refresh(existing)
                 return existing
             else:
@@ -169,22 +792,47 @@ class GraphStore:
                 session.add(entity)
                 flag_modified(entity, "entity_metadata")
                 session.commit()
+                self._name_index.update(aliases)
                 session.refresh(entity)
                 return entity
 
+    def save_entities_bulk(self, entities: list[Entity]) -> int:
+        """
+        Insert or update many entities in one round trip.
+
+        Uses INSERT ... ON CONFLICT(entity_id) DO UPDATE instead of the
+        select/copy/commit/refresh cycle that save_entity does per entity.
+        Unlike save_entity, every column (including tensor_maturity and
+        tensor_training_cycles) is written, and the passed objects are not
+        refreshed from the database.
+
+        Args:
+            entities: Entities to persist
+
+        Returns:
+            Number of entities written
+        """
+        if not entities:
+            return 0
+        aliases = {entity.entity_id: _entity_aliases(entity.entity_id, entity.entity_metadata) for entity in entities}
+        with self.engine.begin() as conn:
+            written = _bulk_upsert_entities(conn, entities)
+        self._entity_cache.invalidate(entity.entity_id for entity in entities)
+        self._name_index.update(aliases)
+        return written
+
     def save_exposure_event(self, event: ExposureEvent) -> ExposureEvent:
-        """Save a single exposure event"""
+        """Save a single exposure event and index it in knowledge_state"""
         with Session(self.engine) as session:
-            session.add(event)
+            _add_exposure_events(session, [event])
             session.commit()
             session.refresh(event)
             return event
 
     def save_exposure_events(self, exposure_events: list[ExposureEvent]) -> None:
-        """Batch save exposure events"""
+        """Batch save exposure events and index them in knowledge_state"""
         with Session(self.engine) as session:
-            for event in exposure_events:
-                session.add(event)
+            _add_exposure_events(session, exposure_events)
             session.commit()
 
     def get_exposure_events(self, entity_id: str, limit: Optional[int] = None) -> list[ExposureEvent]:
@@ -213,14 +861,49 @@ class GraphStore:
             session.add(timepoint)
             session.commit()
             session.refresh(timepoint)
+            self._invalidate_timepoints([timepoint.timepoint_id])
             return timepoint
 
-    @lru_cache(maxsize=500)
     def get_timepoint(self, timepoint_id: str) -> Optional[Timepoint]:
-        """Get a timepoint by ID with LRU caching"""
+        """Get a timepoint by ID through the read-through timepoint cache"""
+        cached = self._timepoint_cache.get(timepoint_id)
+        if cached is not None:
+            return cached
         with Session(self.engine) as session:
             statement = select(Timepoint).where(Timepoint.timepoint_id == timepoint_id)
-            return session.exec(statement).first()
+            timepoint = session.exec(statement).first()
+        self._timepoint_cache.put(timepoint_id, timepoint)
+        return timepoint
+
+    def get_timepoints(self, timepoint_ids: list[str]) -> list[Timepoint]:
+        """
+        Bulk-fetch timepoints, querying only for IDs not already cached.
+
+        Args:
+            timepoint_ids: Timepoints to load
+
+        Returns:
+            Found timepoints in the order requested (missing IDs are skipped)
+        """
+        found = {}
+        missing = []
+        for timepoint_id in dict.fromkeys(timepoint_ids):
+            cached = self._timepoint_cache.get(timepoint_id)
+            if cached is not None:
+                found[timepoint_id] = cached
+            else:
+                missing.append(timepoint_id)
+
+        if missing:
+            with Session(self.engine) as session:
+                rows = session.exec(
+                    select(Timepoint).where(Timepoint.timepoint_id.in_(missing))
+                ).all()
+            for timepoint in rows:
+                self._timepoint_cache.put(timepoint.timepoint_id, timepoint)
+                found[timepoint.timepoint_id] = timepoint
+
+        return [found[tp_id] for tp_id in dict.fromkeys(timepoint_ids) if tp_id in found]
 
     def get_all_timepoints(self) -> list[Timepoint]:
         """Get all timepoints ordered by timestamp"""
@@ -246,23 +929,66 @@ class GraphStore:
 
     def get_entity_knowledge_at_timepoint(self, entity_id: str, timepoint_id: str) -> list[str]:
         """Get what an entity knew at a specific timepoint"""
+        timepoint = self.get_timepoint(timepoint_id)
+        if not timepoint:
+            return []
+        return self.get_knowledge_as_of(entity_id, timepoint.timestamp)
+
+    def get_knowledge_states(
+        self,
+        entity_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        run_id: Optional[str] = None,
+    ) -> list[KnowledgeState]:
+        """
+        Range query over an entity's knowledge index.
+
+        Args:
+            entity_id: Entity identifier
+            start: Only knowledge learned strictly after this time
+            end: Only knowledge learned at or before this time
+            run_id: Optional simulation run filter
+
+        Returns:
+            KnowledgeState rows ordered by valid_from
+        """
         with Session(self.engine) as session:
-            # Get the timepoint timestamp
-            timepoint = session.exec(
-                select(Timepoint).where(Timepoint.timepoint_id == timepoint_id)
-            ).first()
+            statement = select(KnowledgeState).where(KnowledgeState.entity_id == entity_id)
+            if start is not None:
+                statement = statement.where(KnowledgeState.valid_from > start)
+            if end is not None:
+                statement = statement.where(KnowledgeState.valid_from <= end)
+            if run_id is not None:
+                statement = statement.where(KnowledgeState.run_id == run_id)
+            statement = statement.order_by(KnowledgeState.valid_from, KnowledgeState.id)
+            return list(session.exec(statement).all())
 
-            if not timepoint:
-                return []
+    def get_knowledge_as_of(
+        self,
+        entity_id: str,
+        as_of: datetime,
+        run_id: Optional[str] = None,
+    ) -> list[str]:
+        """
+        What an entity knew at a point in time, as one indexed range query.
 
-            # Get all exposure events for this entity up to and including this timepoint
-            statement = select(ExposureEvent).where(
-                ExposureEvent.entity_id == entity_id,
-                ExposureEvent.timestamp <= timepoint.timestamp
-            ).order_by(ExposureEvent.timestamp)
+        Args:
+            entity_id: Entity identifier
+            as_of: Simulation time (inclusive)
+            run_id: Optional simulation run filter
+
+        Returns:
+            Distinct information items, in the order they were first learned
+        """
+        rows = self.get_knowledge_states(entity_id, end=as_of, run_id=run_id)
+        return list(dict.fromkeys(row.information for row in rows))
 
-            exposure_events = list(session.exec(statement).all())
-            return [event.information for event in exposure_events]
+    def get_latest_timepoint_timestamp(self) -> Optional[datetime]:
+        """Timestamp of the most recent timepoint, or None if there are none"""
+        from sqlalchemy import func
+        with Session(self.engine) as session:
+            return session.exec(select(func.max(Timepoint.timestamp))).one()
 
     def get_all_entities(self) -> list[Entity]:
         """Get all entities"""
@@ -277,6 +1003,8 @@ class GraphStore:
         with Session(self.engine) as session:
             # Delete in order to respect foreign keys
             session.exec(text("DELETE FROM queryhistory"))
+            session.exec(text("DELETE FROM knowledge_state"))
+            session.exec(text("DELETE FROM entity_snapshot"))
             session.exec(text("DELETE FROM exposureevent"))
             session.exec(text("DELETE FROM entity"))
             session.exec(text("DELETE FROM timepoint"))
@@ -284,6 +1012,7 @@ class GraphStore:
             session.exec(text("DELETE FROM systemprompt"))
             session.exec(text("DELETE FROM validationrule"))
             session.commit()
+        self.clear_caches()
 
     def get_entity(self, entity_id: str, timepoint: Optional[str] = None) -> Optional[Entity]:
         """
@@ -296,11 +1025,16 @@ class GraphStore:
         Returns:
             Entity if found, None otherwise
         """
-        with Session(self.engine) as session:
-            statement = select(Entity).where(Entity.entity_id == entity_id)
-            if timepoint:
-                statement = statement.where(Entity.timepoint == timepoint)
-            return session.exec(statement).first()
+        entity = self._entity_cache.get(entity_id)
+        if entity is None:
+            with Session(self.engine) as session:
+                entity = session.exec(select(Entity).where(Entity.entity_id == entity_id)).first()
+            self._entity_cache.put(entity_id, entity)
+
+        # entity_id is unique, so the timepoint filter is a match check
+        if entity is not None and timepoint and entity.timepoint != timepoint:
+            return None
+        return entity
     
     def save_graph(self, graph: nx.Graph, timepoint_id: str):
         """Serialize NetworkX graph to database"""
@@ -336,9 +1070,10 @@ class GraphStore:
     # ============================================================================
 
     def save_dialog(self, dialog: Dialog) -> Dialog:
-        """Save a dialog conversation"""
+        """Save a dialog conversation and index its participants"""
         with Session(self.engine) as session:
             session.add(dialog)
+            session.add_all(_dialog_participant_rows(dialog))
             session.commit()
             session.refresh(dialog)
             return dialog
@@ -355,19 +1090,30 @@ class GraphStore:
             statement = select(Dialog).where(Dialog.timepoint_id == timepoint_id)
             return list(session.exec(statement).all())
 
-    def get_dialogs_for_entities(self, entity_ids: list[str]) -> list[Dialog]:
-        """Get all dialogs involving any of the specified entities"""
-        with Session(self.engine) as session:
-            # Find dialogs where participants JSON contains any of the entity_ids
-            all_dialogs = session.exec(select(Dialog)).all()
-            matching_dialogs = []
+    def get_dialogs_for_entities(self, entity_ids: list[str], run_id: Optional[str] = None) -> list[Dialog]:
+        """
+        Get all dialogs involving any of the specified entities.
 
-            for dialog in all_dialogs:
-                participants = json.loads(dialog.participants)
-                if any(entity_id in participants for entity_id in entity_ids):
-                    matching_dialogs.append(dialog)
+        Uses the indexed dialog_participant table rather than decoding every
+        dialog's participants JSON.
 
-            return matching_dialogs
+        Args:
+            entity_ids: Entities of interest
+            run_id: Optional run to scope the lookup to
+
+        Returns:
+            Matching dialogs in insertion order
+        """
+        if not entity_ids:
+            return []
+        with Session(self.engine) as session:
+            dialog_ids = select(DialogParticipant.dialog_id).where(
+                DialogParticipant.entity_id.in_(entity_ids)
+            )
+            if run_id is not None:
+                dialog_ids = dialog_ids.where(DialogParticipant.run_id == run_id)
+            statement = select(Dialog).where(Dialog.dialog_id.in_(dialog_ids)).order_by(Dialog.id)
+            return list(session.exec(statement).all())
 
     def load_all_dialogs(self) -> list[Dialog]:
         """Load all dialogs from the database.
@@ -418,10 +1164,172 @@ class GraphStore:
     # Additional Helper Methods
     # ============================================================================
 
+    def save_entity_snapshots(
+        self,
+        entities: list[Entity],
+        timepoint_id: str,
+        run_id: Optional[str] = None,
+    ) -> int:
+        """
+        Append each entity's current state to its snapshot chain at a timepoint.
+
+        Every snapshot_keyframe_interval-th snapshot of an entity is a full
+        keyframe; the rest store only the keys that changed since the previous
+        snapshot. Snapshots are append-only: an entity already snapshotted at
+        this timepoint is left as is.
+
+        Args:
+            entities: Entities in their state as of the timepoint
+            timepoint_id: Timepoint the state belongs to
+            run_id: Optional simulation run identifier
+
+        Returns:
+            Number of snapshots written
+        """
+        states = {entity.entity_id: _entity_snapshot_state(entity) for entity in entities}
+        if not states:
+            return 0
+        with Session(self.engine) as session:
+            already = set(session.exec(
+                select(EntitySnapshot.entity_id).where(
+                    EntitySnapshot.timepoint_id == timepoint_id,
+                    EntitySnapshot.entity_id.in_(list(states)),
+                )
+            ).all())
+            pending = {entity_id: state for entity_id, state in states.items() if entity_id not in already}
+            heads = self._snapshot_heads(session, list(pending))
+
+            rows = []
+            for entity_id, state in pending.items():
+                head = heads.get(entity_id)
+                if head is None:
+                    sequence, keyframe = 0, True
+                else:
+                    head_sequence, head_state, deltas_since_keyframe = head
+                    sequence = head_sequence + 1
+                    keyframe = deltas_since_keyframe + 1 >= self.snapshot_keyframe_interval
+                rows.append(EntitySnapshot(
+                    entity_id=entity_id,
+                    timepoint_id=timepoint_id,
+                    sequence=sequence,
+                    is_keyframe=keyframe,
+                    state=state if keyframe else _snapshot_delta(head_state, state),
+                    run_id=run_id,
+                ))
+            session.add_all(rows)
+            session.commit()
+            return len(rows)
+
+    def _snapshot_heads(self, session: Session, entity_ids: list[str]) -> dict[str, tuple[int, dict, int]]:
+        """
+        Latest snapshot state per entity, replayed from its last keyframe.
+
+        Returns:
+            entity_id -> (sequence, state, deltas since the keyframe)
+        """
+        from sqlalchemy import and_, func
+
+        if not entity_ids:
+            return {}
+        keyframes = (
+            select(EntitySnapshot.entity_id, func.max(EntitySnapshot.sequence).label("keyframe_sequence"))
+            .where(EntitySnapshot.is_keyframe, EntitySnapshot.entity_id.in_(entity_ids))
+            .group_by(EntitySnapshot.entity_id)
+            .subquery()
+        )
+        rows = session.exec(
+            select(EntitySnapshot)
+            .join(keyframes, and_(
+                EntitySnapshot.entity_id == keyframes.c.entity_id,
+                EntitySnapshot.sequence >= keyframes.c.keyframe_sequence,
+            ))
+            .order_by(EntitySnapshot.entity_id, EntitySnapshot.sequence)
+        ).all()
+
+        chains: dict[str, list[EntitySnapshot]] = {}
+        for row in rows:
+            chains.setdefault(row.entity_id, []).append(row)
+        return {
+            entity_id: (chain[-1].sequence, _apply_snapshot_chain(chain), len(chain) - 1)
+            for entity_id, chain in chains.items()
+        }
+
+    def get_entity_snapshot(self, entity_id: str, timepoint_id: str) -> Optional[Entity]:
+        """
+        Entity state recorded at exactly this timepoint.
+
+        Reads the nearest keyframe at or before the snapshot plus the deltas
+        between them, so the cost is bounded by snapshot_keyframe_interval.
+
+        Returns:
+            A detached Entity (not meant to be saved back), or None if the
+            entity was not snapshotted at this timepoint
+        """
+        from sqlalchemy import func
+
+        with Session(self.engine) as session:
+            target = session.exec(
+                select(EntitySnapshot.sequence).where(
+                    EntitySnapshot.entity_id == entity_id,
+                    EntitySnapshot.timepoint_id == timepoint_id,
+                )
+            ).first()
+            if target is None:
+                return None
+            keyframe = (
+                select(func.max(EntitySnapshot.sequence))
+                .where(
+                    EntitySnapshot.entity_id == entity_id,
+                    EntitySnapshot.is_keyframe,
+                    EntitySnapshot.sequence <= target,
+                )
+                .scalar_subquery()
+            )
+            chain = list(session.exec(
+                select(EntitySnapshot)
+                .where(
+                    EntitySnapshot.entity_id == entity_id,
+                    EntitySnapshot.sequence >= keyframe,
+                    EntitySnapshot.sequence <= target,
+                )
+                .order_by(EntitySnapshot.sequence)
+            ).all())
+        return _entity_from_snapshot_state(_apply_snapshot_chain(chain))
+
     def get_entity_at_timepoint(self, entity_id: str, timepoint_id: str) -> Optional[Entity]:
-        """Get entity state at a specific timepoint"""
-        # For now, return current entity state (could be enhanced to track historical states)
-        return self.get_entity(entity_id)
+        """
+        Get entity state at a specific timepoint.
+
+        Uses the snapshot taken at the timepoint, else the latest snapshot
+        from an earlier timepoint. Entities that have never been snapshotted
+        fall back to their current row.
+
+        Returns:
+            Entity state as of the timepoint, or None if the entity's first
+            snapshot postdates it
+        """
+        snapshot = self.get_entity_snapshot(entity_id, timepoint_id)
+        if snapshot is not None:
+            return snapshot
+
+        timepoint = self.get_timepoint(timepoint_id)
+        with Session(self.engine) as session:
+            if timepoint is not None:
+                earlier = session.exec(
+                    select(EntitySnapshot.timepoint_id)
+                    .join(Timepoint, Timepoint.timepoint_id == EntitySnapshot.timepoint_id)
+                    .where(
+                        EntitySnapshot.entity_id == entity_id,
+                        Timepoint.timestamp <= timepoint.timestamp,
+                    )
+                    .order_by(Timepoint.timestamp.desc(), EntitySnapshot.sequence.desc())
+                ).first()
+                if earlier is not None:
+                    return self.get_entity_snapshot(entity_id, earlier)
+            has_snapshots = session.exec(
+                select(EntitySnapshot.id).where(EntitySnapshot.entity_id == entity_id)
+            ).first() is not None
+        return None if has_snapshots else self.get_entity(entity_id)
 
     def get_timepoints_in_range(self, start_time=None, end_time=None) -> list[Timepoint]:
         """Get timepoints within a time range"""
@@ -465,6 +1373,77 @@ class GraphStore:
                 select(Timeline).where(Timeline.parent_timeline_id == parent_timeline_id)
             ).all())
 
+    def get_causal_ancestor_ids(self, timepoint_id: str) -> list[str]:
+        """
+        Get all causal ancestors of a timepoint in a single recursive query.
+
+        Args:
+            timepoint_id: Timepoint whose causal_parent chain to walk
+
+        Returns:
+            Ancestor timepoint_ids in chronological order (oldest first),
+            excluding the timepoint itself
+        """
+        if self._ancestry_cache is not None and timepoint_id in self._ancestry_cache:
+            return list(self._ancestry_cache[timepoint_id])
+
+        from sqlalchemy import text
+        with Session(self.engine) as session:
+            rows = session.exec(
+                text(_ANCESTRY_CTE + "SELECT timepoint_id FROM ancestry WHERE depth > 0 ORDER BY depth DESC"),
+                params={"timepoint_id": timepoint_id, "max_depth": self.MAX_CAUSAL_DEPTH},
+            ).all()
+        ancestors = tuple(row[0] for row in rows)
+
+        if self._ancestry_cache is not None:
+            self._ancestry_cache[timepoint_id] = ancestors
+        return list(ancestors)
+
+    def get_causal_chain(self, timepoint_id: str) -> list[Timepoint]:
+        """
+        Get a timepoint and all of its causal ancestors in a single query.
+
+        Returns:
+            Timepoints oldest first, ending with the requested timepoint
+            (empty if it does not exist)
+        """
+        from sqlalchemy import text
+        statement = select(Timepoint).from_statement(
+            text(
+                _ANCESTRY_CTE
+                + "SELECT timepoint.* FROM timepoint "
+                "JOIN ancestry ON timepoint.timepoint_id = ancestry.timepoint_id "
+                "ORDER BY ancestry.depth DESC"
+            ).bindparams(timepoint_id=timepoint_id, max_depth=self.MAX_CAUSAL_DEPTH)
+        )
+        with Session(self.engine) as session:
+            return list(session.execute(statement).scalars().all())
+
+    def get_causal_descendant_ids(self, timepoint_id: str) -> list[str]:
+        """
+        Get every timepoint causally downstream of a timepoint in a single recursive query.
+
+        Returns:
+            Descendant timepoint_ids, nearest first, excluding the timepoint itself
+        """
+        from sqlalchemy import text
+        with Session(self.engine) as session:
+            rows = session.exec(
+                text(
+                    _DESCENDANT_CTE
+                    + "SELECT timepoint_id, MIN(depth) AS depth FROM descendants WHERE depth > 0 "
+                    "GROUP BY timepoint_id ORDER BY depth, timepoint_id"
+                ),
+                params={"timepoint_id": timepoint_id, "max_depth": self.MAX_CAUSAL_DEPTH},
+            ).all()
+        return [row[0] for row in rows]
+
+    def has_causal_path(self, from_timepoint_id: str, to_timepoint_id: str) -> bool:
+        """Check whether to_timepoint_id is (or descends from) from_timepoint_id"""
+        if from_timepoint_id == to_timepoint_id:
+            return True
+        return from_timepoint_id in self.get_causal_ancestor_ids(to_timepoint_id)
+
     def get_successor_timepoints(self, timepoint_id: str) -> list[Timepoint]:
         """Get all timepoints that have the given timepoint as their causal parent"""
         with Session(self.engine) as session:
@@ -473,21 +1452,13 @@ class GraphStore:
 
     def get_predecessor_timepoints(self, timepoint_id: str) -> list[Timepoint]:
         """Get the causal parent(s) of a given timepoint"""
-        with Session(self.engine) as session:
-            # Get the timepoint to find its causal parent
-            timepoint = session.exec(
-                select(Timepoint).where(Timepoint.timepoint_id == timepoint_id)
-            ).first()
-
-            if not timepoint or not timepoint.causal_parent:
-                return []
-
-            # Get the parent timepoint
-            parent = session.exec(
-                select(Timepoint).where(Timepoint.timepoint_id == timepoint.causal_parent)
-            ).first()
+        # Both lookups go through the timepoint cache
+        timepoint = self.get_timepoint(timepoint_id)
+        if not timepoint or not timepoint.causal_parent:
+            return []
 
-            return [parent] if parent else []
+        parent = self.get_timepoint(timepoint.causal_parent)
+        return [parent] if parent else []
 
     # ============================================================================
     # Query History Storage (Mechanism 5: Query Resolution)
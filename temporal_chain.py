@@ -102,31 +102,10 @@ def has_causal_path(from_timepoint_id: str, to_timepoint_id: str, store) -> bool
     """
     Check if there's a causal path from from_timepoint_id to to_timepoint_id.
     Returns True if to_timepoint can causally depend on information from from_timepoint.
-    """
-    if from_timepoint_id == to_timepoint_id:
-        return True
-
-    # Get the target timepoint
-    to_timepoint = store.get_timepoint(to_timepoint_id)
-    if not to_timepoint:
-        return False
-
-    # Walk backwards through causal parents
-    current = to_timepoint
-    visited = set()
-
-    while current and current.timepoint_id not in visited:
-        visited.add(current.timepoint_id)
 
-        if current.timepoint_id == from_timepoint_id:
-            return True
-
-        if current.causal_parent:
-            current = store.get_timepoint(current.causal_parent)
-        else:
-            break
-
-    return False
+    Resolved with a single recursive ancestry query (or the store's ancestry cache).
+    """
+    return store.has_causal_path(from_timepoint_id, to_timepoint_id)
 
 
 def get_causal_ancestors(timepoint_id: str, store) -> List[str]:
@@ -134,17 +113,7 @@ def get_causal_ancestors(timepoint_id: str, store) -> List[str]:
     Get all causal ancestors of a timepoint (timepoints that could influence it).
     Returns list of timepoint_ids in chronological order (oldest first).
     """
-    ancestors = []
-    current = store.get_timepoint(timepoint_id)
-
-    while current:
-        if current.causal_parent:
-            ancestors.insert(0, current.causal_parent)  # Insert at beginning for chronological order
-            current = store.get_timepoint(current.causal_parent)
-        else:
-            break
-
-    return ancestors
+    return store.get_causal_ancestor_ids(timepoint_id)
 
 
 def validate_temporal_reference(entity_id: str, knowledge_item: str, timepoint_id: str, store) -> Dict[str, Any]:
@@ -154,31 +123,62 @@ def validate_temporal_reference(entity_id: str, knowledge_item: str, timepoint_i
     Returns:
         {"valid": bool, "message": str, "learned_at": Optional[str]}
     """
-    # Find where this knowledge was first learned (simplified - in practice would track exposure events)
-    # For now, we'll check if the entity has this knowledge in any previous timepoint
+    return validate_temporal_references(entity_id, [knowledge_item], timepoint_id, store)[0]
 
-    timepoint = store.get_timepoint(timepoint_id)
-    if not timepoint:
-        return {"valid": False, "message": f"Timepoint {timepoint_id} not found", "learned_at": None}
 
-    # Get all causal ancestors
-    ancestors = get_causal_ancestors(timepoint_id, store)
+def validate_temporal_references(
+    entity_id: str, knowledge_items: List[str], timepoint_id: str, store
+) -> List[Dict[str, Any]]:
+    """
+    Validate many knowledge items for one entity against the same causal chain.
 
-    # Check if entity had this knowledge at any ancestor timepoint
-    for ancestor_id in ancestors + [timepoint_id]:  # Include current timepoint
-        ancestor_knowledge = store.get_entity_knowledge_at_timepoint(entity_id, ancestor_id)
-        if ancestor_knowledge and knowledge_item in ancestor_knowledge:
-            return {
+    Costs two queries regardless of chain depth or item count: one recursive
+    query for the causal chain and one for the entity's exposure events.
+
+    Returns:
+        One {"valid": bool, "message": str, "learned_at": Optional[str]} per item, in order
+    """
+    # Causal chain, oldest first, ending at the timepoint itself
+    chain = store.get_causal_chain(timepoint_id)
+    if not chain:
+        return [
+            {"valid": False, "message": f"Timepoint {timepoint_id} not found", "learned_at": None}
+            for _ in knowledge_items
+        ]
+
+    # Earliest moment the entity was exposed to each piece of knowledge
+    wanted = {item for item in knowledge_items if isinstance(item, str)}
+    first_exposure: Dict[str, datetime] = {}
+    for event in store.get_exposure_events(entity_id):
+        if event.information in wanted:
+            seen = first_exposure.get(event.information)
+            if seen is None or event.timestamp < seen:
+                first_exposure[event.information] = event.timestamp
+
+    results = []
+    for item in knowledge_items:
+        exposed_at = first_exposure.get(item) if isinstance(item, str) else None
+        # Knowledge is available from the first point in the chain at or after exposure
+        learned_at = None
+        if exposed_at is not None:
+            learned_at = next(
+                (tp.timepoint_id for tp in chain if exposed_at <= tp.timestamp), None
+            )
+
+        if learned_at:
+            results.append({
                 "valid": True,
-                "message": f"Knowledge '{knowledge_item}' available through causal chain",
-                "learned_at": ancestor_id
-            }
+                "message": f"Knowledge '{item}' available through causal chain",
+                "learned_at": learned_at
+            })
+        else:
+            results.append({
+                "valid": False,
+                "message": f"Knowledge '{item}' not available through causal chain - potential temporal inconsistency",
+                "learned_at": None
+            })
 
-    return {
-        "valid": False,
-        "message": f"Knowledge '{knowledge_item}' not available through causal chain - potential temporal inconsistency",
-        "learned_at": None
-    }
+    return results
 
 
 def validate_causal_chain_integrity(timepoints: List[Timepoint]) -> Dict[str, Any]:
@@ -29,12 +29,12 @@ import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 import json
 import base64
-import msgspec
 import time
 from datetime import datetime
 from pathlib import Path
 
 from schemas import TTMTensor, Entity, Timepoint, ResolutionLevel
+from tensor_serialization import decode_vector, encode_vector
 from metadata.tracking import track_mechanism
 
 
@@ -444,9 +444,9 @@ def populate_tensor_llm_guided(
 
     # Decode tensor
     tensor_dict = json.loads(tensor_json)
-    context = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["context_vector"])))
-    biology = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["biology_vector"])))
-    behavior = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["behavior_vector"])))
+    context = decode_vector(base64.b64decode(tensor_dict["context_vector"]), copy=True)
+    biology = decode_vector(base64.b64decode(tensor_dict["biology_vector"]), copy=True)
+    behavior = decode_vector(base64.b64decode(tensor_dict["behavior_vector"]), copy=True)
 
     # Loop 1: Metadata-based population
     context, biology, behavior = _population_loop_metadata(
@@ -558,12 +558,9 @@ def _population_loop_graph(
 
     # Get graph metrics
     try:
-        import networkx as nx
-        import warnings
-        # Suppress RuntimeWarning for small graphs
-        with warnings.catch_warnings():
-            warnings.filterwarnings('ignore', category=RuntimeWarning)
-            centrality = nx.eigenvector_centrality(graph).get(entity.entity_id, 0.0)
+        from graph import get_graph_metrics_cache
+        # Shared across every entity populated against this graph
+        centrality = get_graph_metrics_cache().get(graph, "eigenvector").get(entity.entity_id, 0.0)
         neighbors = list(graph.neighbors(entity.entity_id))
         degree = graph.degree(entity.entity_id)
     except:
@@ -773,9 +770,9 @@ def validate_tensor_maturity(entity: Entity, threshold: float = 0.95) -> Tuple[b
     tensor_json = entity.tensor
     try:
         tensor_dict = json.loads(tensor_json)
-        context = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["context_vector"])))
-        biology = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["biology_vector"])))
-        behavior = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["behavior_vector"])))
+        context = decode_vector(base64.b64decode(tensor_dict["context_vector"]), copy=True)
+        biology = decode_vector(base64.b64decode(tensor_dict["biology_vector"]), copy=True)
+        behavior = decode_vector(base64.b64decode(tensor_dict["behavior_vector"]), copy=True)
 
         # Check for zeros
         if np.any(context == 0) or np.any(biology == 0) or np.any(behavior == 0):
@@ -838,9 +835,9 @@ def train_tensor_to_maturity(
         # Load current tensor
         tensor_json = entity.tensor
         tensor_dict = json.loads(tensor_json)
-        context = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["context_vector"])))
-        biology = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["biology_vector"])))
-        behavior = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["behavior_vector"])))
+        context = decode_vector(base64.b64decode(tensor_dict["context_vector"]), copy=True)
+        biology = decode_vector(base64.b64decode(tensor_dict["biology_vector"]), copy=True)
+        behavior = decode_vector(base64.b64decode(tensor_dict["behavior_vector"]), copy=True)
 
         # Simulate training update (placeholder - would be LangGraph dialog simulation)
         # For now, just add small random noise to push maturity higher
@@ -856,9 +853,9 @@ def train_tensor_to_maturity(
         # Update tensor
         trained_tensor = TTMTensor.from_arrays(context, biology, behavior)
         entity.tensor = json.dumps({
-            "context_vector": base64.b64encode(msgspec.msgpack.encode(context.tolist())).decode('utf-8'),
-            "biology_vector": base64.b64encode(msgspec.msgpack.encode(biology.tolist())).decode('utf-8'),
-            "behavior_vector": base64.b64encode(msgspec.msgpack.encode(behavior.tolist())).decode('utf-8')
+            "context_vector": base64.b64encode(encode_vector(context)).decode('utf-8'),
+            "biology_vector": base64.b64encode(encode_vector(biology)).decode('utf-8'),
+            "behavior_vector": base64.b64encode(encode_vector(behavior)).decode('utf-8')
         })
         entity.tensor_training_cycles += 1
 
@@ -9,6 +9,7 @@ Provides:
 - Batch operations for efficiency
 - Maturity-based queries
 - Training history tracking
+- Persistent thread-local connections (see sqlite_pool)
 
 Schema:
 - tensor_records: Current tensor state (latest version)
@@ -19,8 +20,17 @@ import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlite_pool import SQLiteConnectionPool
+
+# Stay below SQLite's default host-parameter limit
+_MAX_IN_PARAMS = 500
+
+# Next tensor_records.change_seq. Evaluated inside the write statement, so it
+# is assigned under SQLite's write lock and increases in commit order; the
+# updated_at timestamp is taken before the transaction and does not.
+_NEXT_CHANGE_SEQ = "(SELECT COALESCE(MAX(change_seq), 0) + 1 FROM tensor_records)"
 
 
 @dataclass
@@ -100,36 +110,30 @@ class TensorDatabase:
         >>> history = db.get_version_history("tensor-001")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pool: Optional[SQLiteConnectionPool] = None):
         """
         Initialize tensor database.
 
         Args:
             db_path: Path to SQLite database file
+            pool: Optional connection pool for tuning pragmas; defaults to a
+                WAL-mode pool owned by this database
         """
         self.db_path = Path(db_path)
+        self.pool = pool or SQLiteConnectionPool(self.db_path)
         self._init_schema()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        # Enable WAL mode for better concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
-
-    @contextmanager
+        """Get this thread's persistent connection (rows as sqlite3.Row)."""
+        return self.pool.connection()
+
     def _transaction(self):
         """Context manager for atomic transactions."""
-        conn = self._get_connection()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        return self.pool.transaction()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.pool.close()
 
     def _init_schema(self):
         """Initialize database schema."""
@@ -179,6 +183,12 @@ class TensorDatabase:
                 conn.execute(
                     "ALTER TABLE tensor_records ADD COLUMN embedding_blob BLOB"
                 )
+            if "change_seq" not in columns:
+                conn.execute(
+                    "ALTER TABLE tensor_records ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0"
+                )
+                # Existing rows get distinct sequence numbers
+                conn.execute("UPDATE tensor_records SET change_seq = rowid")
 
             # Index for category lookups
             conn.execute("""
@@ -186,6 +196,13 @@ class TensorDatabase:
                 ON tensor_records(category)
             """)
 
+            # Index for incremental embedding index sync (watermark scans)
+            conn.execute("DROP INDEX IF EXISTS idx_tensor_updated")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tensor_change_seq
+                ON tensor_records(change_seq)
+            """)
+
             # Version history table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS tensor_versions (
@@ -231,6 +248,50 @@ class TensorDatabase:
             )
             return [row["name"] for row in cursor.fetchall()]
 
+    @staticmethod
+    def _record_from_row(row: sqlite3.Row) -> TensorRecord:
+        """Build a TensorRecord from a full tensor_records row."""
+        return TensorRecord(
+            tensor_id=row["tensor_id"],
+            entity_id=row["entity_id"],
+            world_id=row["world_id"],
+            tensor_blob=row["tensor_blob"],
+            maturity=row["maturity"],
+            training_cycles=row["training_cycles"],
+            version=row["version"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            description=row["description"],
+            category=row["category"],
+            embedding_blob=row["embedding_blob"],
+        )
+
+    @staticmethod
+    def _filter_clauses(
+        min_maturity: Optional[float],
+        categories: Optional[List[str]],
+    ) -> Tuple[str, List]:
+        """
+        Build SQL for maturity and category filters.
+
+        Categories match as case-sensitive substrings of the stored category
+        path, so "detective" matches "profession/detective". Records without
+        a category never match a category filter.
+        """
+        sql = ""
+        params: List = []
+        if min_maturity is not None:
+            sql += " AND maturity >= ?"
+            params.append(min_maturity)
+        if categories is not None:
+            if not categories:
+                return " AND 0", []
+            sql += " AND (" + " OR ".join(
+                "instr(category, ?) > 0" for _ in categories
+            ) + ")"
+            params.extend(categories)
+        return sql, params
+
     # =========================================================================
     # CRUD Operations
     # =========================================================================
@@ -258,7 +319,7 @@ class TensorDatabase:
             if existing:
                 # Update existing - increment version
                 new_version = existing["version"] + 1
-                conn.execute("""
+                conn.execute(f"""
                     UPDATE tensor_records
                     SET entity_id = ?,
                         world_id = ?,
@@ -269,7 +330,8 @@ class TensorDatabase:
                         updated_at = ?,
                         description = ?,
                         category = ?,
-                        embedding_blob = ?
+                        embedding_blob = ?,
+                        change_seq = {_NEXT_CHANGE_SEQ}
                     WHERE tensor_id = ?
                 """, (
                     record.entity_id,
@@ -288,12 +350,12 @@ class TensorDatabase:
             else:
                 # Insert new
                 record.version = 1
-                conn.execute("""
+                conn.execute(f"""
                     INSERT INTO tensor_records
                     (tensor_id, entity_id, world_id, tensor_blob, maturity,
                      training_cycles, version, created_at, updated_at,
-                     description, category, embedding_blob)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     description, category, embedding_blob, change_seq)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {_NEXT_CHANGE_SEQ})
                 """, (
                     record.tensor_id,
                     record.entity_id,
@@ -342,20 +404,7 @@ class TensorDatabase:
             if row is None:
                 return None
 
-            return TensorRecord(
-                tensor_id=row["tensor_id"],
-                entity_id=row["entity_id"],
-                world_id=row["world_id"],
-                tensor_blob=row["tensor_blob"],
-                maturity=row["maturity"],
-                training_cycles=row["training_cycles"],
-                version=row["version"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-                description=row["description"] if "description" in row.keys() else None,
-                category=row["category"] if "category" in row.keys() else None,
-                embedding_blob=row["embedding_blob"] if "embedding_blob" in row.keys() else None,
-            )
+            return self._record_from_row(row)
 
     def delete_tensor(self, tensor_id: str) -> bool:
         """
@@ -383,6 +432,8 @@ class TensorDatabase:
         self,
         entity_id: Optional[str] = None,
         world_id: Optional[str] = None,
+        min_maturity: Optional[float] = None,
+        categories: Optional[List[str]] = None,
     ) -> List[TensorRecord]:
         """
         List tensors with optional filtering.
@@ -390,6 +441,8 @@ class TensorDatabase:
         Args:
             entity_id: Filter by entity
             world_id: Filter by world
+            min_maturity: Minimum maturity (inclusive)
+            categories: Keep tensors whose category contains any of these
 
         Returns:
             List of matching TensorRecords
@@ -405,22 +458,13 @@ class TensorDatabase:
             query += " AND world_id = ?"
             params.append(world_id)
 
+        filter_sql, filter_params = self._filter_clauses(min_maturity, categories)
+        query += filter_sql
+        params.extend(filter_params)
+
         with self._transaction() as conn:
             cursor = conn.execute(query, params)
-            return [
-                TensorRecord(
-                    tensor_id=row["tensor_id"],
-                    entity_id=row["entity_id"],
-                    world_id=row["world_id"],
-                    tensor_blob=row["tensor_blob"],
-                    maturity=row["maturity"],
-                    training_cycles=row["training_cycles"],
-                    version=row["version"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                )
-                for row in cursor.fetchall()
-            ]
+            return [self._record_from_row(row) for row in cursor.fetchall()]
 
     # =========================================================================
     # Maturity Queries
@@ -453,20 +497,7 @@ class TensorDatabase:
 
         with self._transaction() as conn:
             cursor = conn.execute(query, params)
-            return [
-                TensorRecord(
-                    tensor_id=row["tensor_id"],
-                    entity_id=row["entity_id"],
-                    world_id=row["world_id"],
-                    tensor_blob=row["tensor_blob"],
-                    maturity=row["maturity"],
-                    training_cycles=row["training_cycles"],
-                    version=row["version"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                )
-                for row in cursor.fetchall()
-            ]
+            return [self._record_from_row(row) for row in cursor.fetchall()]
 
     # =========================================================================
     # Version History
@@ -584,11 +615,11 @@ class TensorDatabase:
 
                 if existing:
                     new_version = existing["version"] + 1
-                    conn.execute("""
+                    conn.execute(f"""
                         UPDATE tensor_records
                         SET entity_id = ?, world_id = ?, tensor_blob = ?,
                             maturity = ?, training_cycles = ?, version = ?,
-                            updated_at = ?
+                            updated_at = ?, change_seq = {_NEXT_CHANGE_SEQ}
                         WHERE tensor_id = ?
                     """, (
                         record.entity_id, record.world_id, record.tensor_blob,
@@ -598,11 +629,11 @@ class TensorDatabase:
                     record.version = new_version
                 else:
                     record.version = 1
-                    conn.execute("""
+                    conn.execute(f"""
                         INSERT INTO tensor_records
                         (tensor_id, entity_id, world_id, tensor_blob, maturity,
-                         training_cycles, version, created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                         training_cycles, version, created_at, updated_at, change_seq)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, {_NEXT_CHANGE_SEQ})
                     """, (
                         record.tensor_id, record.entity_id, record.world_id,
                         record.tensor_blob, record.maturity, record.training_cycles,
@@ -620,12 +651,19 @@ class TensorDatabase:
                     record.maturity, record.training_cycles, now,
                 ))
 
-    def get_tensors_batch(self, tensor_ids: List[str]) -> List[TensorRecord]:
+    def get_tensors_batch(
+        self,
+        tensor_ids: List[str],
+        min_maturity: Optional[float] = None,
+        categories: Optional[List[str]] = None,
+    ) -> List[TensorRecord]:
         """
-        Get multiple tensors by IDs.
+        Get multiple tensors by IDs, one query per chunk of IDs.
 
         Args:
             tensor_ids: List of tensor identifiers
+            min_maturity: Minimum maturity (inclusive)
+            categories: Keep tensors whose category contains any of these
 
         Returns:
             List of found TensorRecords (may be fewer than requested)
@@ -633,25 +671,83 @@ class TensorDatabase:
         if not tensor_ids:
             return []
 
-        placeholders = ",".join("?" * len(tensor_ids))
-        query = f"SELECT * FROM tensor_records WHERE tensor_id IN ({placeholders})"
+        ids = list(dict.fromkeys(tensor_ids))
+        filter_sql, filter_params = self._filter_clauses(min_maturity, categories)
 
+        records = []
         with self._transaction() as conn:
-            cursor = conn.execute(query, tensor_ids)
-            return [
-                TensorRecord(
-                    tensor_id=row["tensor_id"],
-                    entity_id=row["entity_id"],
-                    world_id=row["world_id"],
-                    tensor_blob=row["tensor_blob"],
-                    maturity=row["maturity"],
-                    training_cycles=row["training_cycles"],
-                    version=row["version"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
+            for start in range(0, len(ids), _MAX_IN_PARAMS):
+                chunk = ids[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT * FROM tensor_records WHERE tensor_id IN ({placeholders})" + filter_sql,
+                    chunk + filter_params,
                 )
-                for row in cursor.fetchall()
-            ]
+                records.extend(self._record_from_row(row) for row in cursor.fetchall())
+        return records
+
+    # =========================================================================
+    # Embedding Cache
+    # =========================================================================
+
+    def list_index_entries(
+        self,
+        changed_after: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List the fields needed to index tensors, without tensor blobs.
+
+        Args:
+            changed_after: Only rows with change_seq > this value. Sequence
+                numbers follow commit order, so no committed write is skipped
+
+        Returns:
+            Dicts with tensor_id, entity_id, world_id, description,
+            embedding_blob and change_seq, oldest change first
+        """
+        query = """
+            SELECT tensor_id, entity_id, world_id, description,
+                   embedding_blob, change_seq
+            FROM tensor_records
+        """
+        params: List = []
+        if changed_after is not None:
+            query += " WHERE change_seq > ?"
+            params.append(changed_after)
+        query += " ORDER BY change_seq"
+
+        with self._transaction() as conn:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+    def list_tensor_ids(self) -> List[str]:
+        """List every stored tensor ID."""
+        with self._transaction() as conn:
+            return [row["tensor_id"] for row in conn.execute(
+                "SELECT tensor_id FROM tensor_records"
+            ).fetchall()]
+
+    def update_embeddings(self, embeddings: Dict[str, bytes]) -> int:
+        """
+        Cache embeddings in place.
+
+        Unlike save_tensor this writes only the embedding_blob column: no
+        version row is created and updated_at and change_seq are left alone.
+
+        Args:
+            embeddings: tensor_id -> serialized float32 embedding
+
+        Returns:
+            Number of records updated
+        """
+        if not embeddings:
+            return 0
+
+        with self._transaction() as conn:
+            cursor = conn.executemany(
+                "UPDATE tensor_records SET embedding_blob = ? WHERE tensor_id = ?",
+                [(blob, tensor_id) for tensor_id, blob in embeddings.items()]
+            )
+            return cursor.rowcount
 
     # =========================================================================
     # Optimistic Locking
@@ -689,11 +785,11 @@ class TensorDatabase:
                 if expected_version != 0:
                     return False
                 record.version = 1
-                conn.execute("""
+                conn.execute(f"""
                     INSERT INTO tensor_records
                     (tensor_id, entity_id, world_id, tensor_blob, maturity,
-                     training_cycles, version, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     training_cycles, version, created_at, updated_at, change_seq)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, {_NEXT_CHANGE_SEQ})
                 """, (
                     record.tensor_id, record.entity_id, record.world_id,
                     record.tensor_blob, record.maturity, record.training_cycles,
@@ -706,11 +802,11 @@ class TensorDatabase:
                     return False
 
                 new_version = current_version + 1
-                conn.execute("""
+                conn.execute(f"""
                     UPDATE tensor_records
                     SET entity_id = ?, world_id = ?, tensor_blob = ?,
                         maturity = ?, training_cycles = ?, version = ?,
-                        updated_at = ?
+                        updated_at = ?, change_seq = {_NEXT_CHANGE_SEQ}
                     WHERE tensor_id = ? AND version = ?
                 """, (
                     record.entity_id, record.world_id, record.tensor_blob,
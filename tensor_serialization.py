@@ -2,14 +2,23 @@
 Tensor serialization utilities for TTMTensor persistence.
 
 Provides functions for:
-- Binary serialization (msgpack) for efficient storage
+- Binary serialization for efficient storage
 - Dict conversion for JSON compatibility
 - Roundtrip-safe encoding/decoding
 
-Uses msgspec.msgpack for fast, compact binary encoding.
+Vectors are stored in a versioned native layout: a small fixed header
+followed by contiguous little-endian float32 (default) or float64 values,
+so decoding is a zero-copy ``np.frombuffer``. Blobs written by older
+versions as msgpack lists are still decoded transparently.
+
+Layouts:
+    vector  = "TTMV" | version u8 | dtype u8 | count u16 | values
+    tensor  = "TTMT" | version u8 | dtype u8 | pad u16 |
+              context u16 | biology u16 | behavior u16 | pad u16 | values
 """
 import base64
-from typing import Dict, Any
+import struct
+from typing import Dict, Any, Tuple
 
 import msgspec
 import numpy as np
@@ -17,11 +26,95 @@ import numpy as np
 from schemas import TTMTensor
 
 
+FORMAT_VERSION = 1
+DEFAULT_DTYPE = np.dtype("<f4")
+
+_VECTOR_MAGIC = b"TTMV"
+_TENSOR_MAGIC = b"TTMT"
+_VECTOR_HEADER = struct.Struct("<4sBBH")
+_TENSOR_HEADER = struct.Struct("<4sBBxxHHHxx")
+
+# Header dtype codes; the header size keeps float64 payloads 8-byte aligned
+_DTYPE_CODES = {1: np.dtype("<f4"), 2: np.dtype("<f8")}
+_CODES_BY_DTYPE = {dtype: code for code, dtype in _DTYPE_CODES.items()}
+
+
+def _dtype_code(dtype) -> int:
+    try:
+        return _CODES_BY_DTYPE[np.dtype(dtype).newbyteorder("<")]
+    except KeyError:
+        raise ValueError(f"Unsupported tensor dtype: {dtype}") from None
+
+
+def _header_dtype(code: int) -> np.dtype:
+    try:
+        return _DTYPE_CODES[code]
+    except KeyError:
+        raise ValueError(f"Unknown tensor dtype code: {code}") from None
+
+
+def is_native_blob(blob: bytes) -> bool:
+    """Return True if blob uses the native vector or tensor layout (not legacy msgpack)."""
+    return bytes(blob[:4]) in (_VECTOR_MAGIC, _TENSOR_MAGIC)
+
+
+def encode_vector(values, dtype=DEFAULT_DTYPE) -> bytes:
+    """
+    Encode a 1-D vector in the native layout.
+
+    Args:
+        values: Array-like of floats
+        dtype: np.float32 (default) or np.float64
+
+    Returns:
+        bytes: Header plus contiguous little-endian values
+    """
+    code = _dtype_code(dtype)
+    arr = np.ascontiguousarray(values, dtype=_DTYPE_CODES[code]).reshape(-1)
+    return _VECTOR_HEADER.pack(_VECTOR_MAGIC, FORMAT_VERSION, code, arr.size) + arr.tobytes()
+
+
+def decode_vector(blob: bytes, copy: bool = False) -> np.ndarray:
+    """
+    Decode a vector written by encode_vector() or a legacy msgpack list.
+
+    Native blobs are returned as a read-only view over ``blob`` unless
+    ``copy`` is set. Legacy blobs always produce a new float64 array.
+
+    Raises:
+        ValueError: If the header is malformed or truncated
+    """
+    if bytes(blob[:4]) != _VECTOR_MAGIC:
+        return np.array(msgspec.msgpack.decode(blob), dtype=np.float64)
+
+    _, version, code, count = _VECTOR_HEADER.unpack_from(blob)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported tensor vector format version: {version}")
+    dtype = _header_dtype(code)
+    if len(blob) != _VECTOR_HEADER.size + count * dtype.itemsize:
+        raise ValueError("Tensor vector blob length does not match header")
+
+    arr = np.frombuffer(blob, dtype=dtype, count=count, offset=_VECTOR_HEADER.size)
+    return arr.copy() if copy else arr
+
+
+def _is_native_vector(blob) -> bool:
+    return isinstance(blob, (bytes, bytearray, memoryview)) and bytes(blob[:4]) == _VECTOR_MAGIC
+
+
+def _vector_parts(blob: bytes) -> Tuple[int, int, bytes]:
+    """Return (dtype code, count, raw payload) for a native vector blob."""
+    _, _, code, count = _VECTOR_HEADER.unpack_from(blob)
+    return code, count, bytes(blob[_VECTOR_HEADER.size:])
+
+
 def serialize_tensor(tensor: TTMTensor) -> bytes:
     """
     Serialize a TTMTensor to compact binary format.
 
-    Uses msgspec.msgpack for efficient encoding of the three vectors.
+    The three vectors are written back to back after a single tensor header.
+    Vectors already in the native layout are copied byte-for-byte without
+    being decoded; mixed dtypes are widened to float64.
     The result is a single bytes object suitable for database BLOB storage.
 
     Args:
@@ -35,23 +128,38 @@ def serialize_tensor(tensor: TTMTensor) -> bytes:
         >>> blob = serialize_tensor(tensor)
         >>> recovered = deserialize_tensor(blob)
     """
-    # Extract arrays from tensor
-    context, biology, behavior = tensor.to_arrays()
-
-    # Pack all three vectors into a single structure
-    data = {
-        "context": context.tolist(),
-        "biology": biology.tolist(),
-        "behavior": behavior.tolist(),
-    }
-
-    return msgspec.msgpack.encode(data)
+    vectors = tuple(
+        getattr(tensor, name, None)
+        for name in ("context_vector", "biology_vector", "behavior_vector")
+    )
+    if not all(_is_native_vector(v) for v in vectors):
+        # Legacy msgpack vectors go through to_arrays() and are re-encoded,
+        # at float64 like the values they were written with
+        vectors = tuple(encode_vector(arr, np.float64) for arr in tensor.to_arrays())
+    parts = [_vector_parts(v) for v in vectors]
+
+    codes = {code for code, _, _ in parts}
+    if len(codes) > 1:
+        wide = _dtype_code(np.float64)
+        parts = [
+            (wide, count, np.frombuffer(payload, dtype=_DTYPE_CODES[code]).astype("<f8").tobytes())
+            for code, count, payload in parts
+        ]
+        codes = {wide}
+
+    header = _TENSOR_HEADER.pack(
+        _TENSOR_MAGIC, FORMAT_VERSION, codes.pop(), *(count for _, count, _ in parts)
+    )
+    return header + b"".join(payload for _, _, payload in parts)
 
 
 def deserialize_tensor(blob: bytes) -> TTMTensor:
     """
     Deserialize bytes back to TTMTensor.
 
+    Accepts both the native layout and legacy msgpack blobs; legacy values
+    are kept at float64 so re-saving them loses no precision.
+
     Args:
         blob: Binary data from serialize_tensor()
 
@@ -59,16 +167,53 @@ def deserialize_tensor(blob: bytes) -> TTMTensor:
         TTMTensor: Reconstructed tensor
 
     Raises:
-        msgspec.DecodeError: If blob is malformed
+        msgspec.DecodeError: If a legacy blob is malformed
         ValueError: If data structure is invalid
     """
-    data = msgspec.msgpack.decode(blob)
+    if bytes(blob[:4]) != _TENSOR_MAGIC:
+        data = msgspec.msgpack.decode(blob)
+        return TTMTensor.from_arrays(
+            np.array(data["context"], dtype=np.float64),
+            np.array(data["biology"], dtype=np.float64),
+            np.array(data["behavior"], dtype=np.float64),
+            dtype=np.float64,
+        )
+
+    _, version, code, *counts = _TENSOR_HEADER.unpack_from(blob)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported tensor format version: {version}")
+    itemsize = _header_dtype(code).itemsize
+    if len(blob) != _TENSOR_HEADER.size + sum(counts) * itemsize:
+        raise ValueError("Tensor blob length does not match header")
+
+    vectors = []
+    offset = _TENSOR_HEADER.size
+    for count in counts:
+        end = offset + count * itemsize
+        vectors.append(
+            _VECTOR_HEADER.pack(_VECTOR_MAGIC, FORMAT_VERSION, code, count) + bytes(blob[offset:end])
+        )
+        offset = end
 
-    context = np.array(data["context"], dtype=np.float64)
-    biology = np.array(data["biology"], dtype=np.float64)
-    behavior = np.array(data["behavior"], dtype=np.float64)
+    return TTMTensor(
+        context_vector=vectors[0],
+        biology_vector=vectors[1],
+        behavior_vector=vectors[2],
+    )
 
-    return TTMTensor.from_arrays(context, biology, behavior)
+
+def convert_legacy_blob(blob: bytes, dtype=np.float64) -> bytes:
+    """
+    Rewrite a serialized tensor in the native layout.
+
+    Legacy msgpack values are float64, so they are kept at float64 by
+    default and the conversion is lossless. Native blobs are returned
+    unchanged, so this is safe to run repeatedly.
+    """
+    if bytes(blob[:4]) == _TENSOR_MAGIC:
+        return blob
+    context, biology, behavior = deserialize_tensor(blob).to_arrays()
+    return serialize_tensor(TTMTensor.from_arrays(context, biology, behavior, dtype=dtype))
 
 
 def tensor_to_dict(tensor: TTMTensor) -> Dict[str, Any]:
@@ -5,10 +5,10 @@ import numpy as np
 from scipy.linalg import svd
 from sklearn.decomposition import PCA, NMF
 from typing import Callable, Dict, List, Optional
-import warnings
 import networkx as nx
 
 from schemas import Entity
+from graph import get_graph_metrics_cache
 from metadata.tracking import track_mechanism
 class TensorCompressor:
     """Plugin registry for tensor compression algorithms"""
@@ -152,14 +152,13 @@ def compute_ttm_metrics(entity: Entity, graph: nx.Graph) -> Dict[str, float]:
     if entity.entity_id not in graph:
         return {}
 
-    # Suppress RuntimeWarning for small graphs
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore', category=RuntimeWarning)
-        metrics = {
-            "eigenvector_centrality": nx.eigenvector_centrality(graph).get(entity.entity_id, 0.0),
-            "betweenness": nx.betweenness_centrality(graph).get(entity.entity_id, 0.0),
-            "pagerank": nx.pagerank(graph).get(entity.entity_id, 0.0),
-        }
+    # Whole-graph metrics are computed once per graph version and shared
+    cache = get_graph_metrics_cache()
+    metrics = {
+        "eigenvector_centrality": cache.get(graph, "eigenvector").get(entity.entity_id, 0.0),
+        "betweenness": cache.get(graph, "betweenness").get(entity.entity_id, 0.0),
+        "pagerank": cache.get(graph, "pagerank").get(entity.entity_id, 0.0),
+    }
     return metrics
 
 
@@ -235,7 +234,7 @@ def generate_ttm_tensor(entity: Entity) -> Optional[str]:
         # No personality data, create minimal behavior vector
         behavior_array = np.array([0.5] * 8)  # Neutral personality
 
-    # Create TTMTensor using from_arrays (which msgpack-encodes the arrays)
+    # Create TTMTensor using from_arrays (native float32 layout)
     ttm = TTMTensor.from_arrays(context_array, biology_array, behavior_array)
 
     # Serialize the TTMTensor object to JSON for storage in entity.tensor
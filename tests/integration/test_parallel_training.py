@@ -549,3 +549,82 @@ class TestParallelTrainerProgress:
 
         # Clean up
         await training_task
+
+
+@pytest.mark.integration
+class TestVectorizedTraining:
+    """Tests for the matrix-based batch training path."""
+
+    def test_matrix_rows_converge_independently(self):
+        """Rows stop updating once they reach target maturity."""
+        from training.batch_engine import train_matrix
+
+        matrix = np.random.rand(3, 20)
+        maturity = np.array([0.0, 0.9, 0.99])
+
+        outcome = train_matrix(matrix, maturity, target_maturity=0.95, seed=7)
+
+        assert np.all(outcome.maturity[:2] >= 0.95)
+        assert outcome.cycles[0] > outcome.cycles[1] > 0
+        assert outcome.cycles[2] == 0
+        np.testing.assert_array_equal(outcome.matrix[2], matrix[2])
+        assert np.all((outcome.matrix >= 0) & (outcome.matrix <= 1))
+
+    def test_cycles_match_legacy_schedule(self, tensor_db, sample_tensor_record):
+        """Vectorized cycle counts match the per-tensor loop."""
+        tensor_db.save_tensor(sample_tensor_record)
+        trainer = ParallelTensorTrainer(tensor_db=tensor_db)
+
+        legacy = asyncio.run(trainer._train_tensor(
+            sample_tensor_record.tensor_id, target_maturity=0.8, worker_id="w"
+        ))
+        tensor_db.save_tensor(sample_tensor_record)  # reset maturity to 0.0
+        results = trainer.train_batch_vectorized(
+            [sample_tensor_record.tensor_id], target_maturity=0.8
+        )
+
+        result = results[sample_tensor_record.tensor_id]
+        assert result.cycles_completed == legacy.cycles_completed
+        assert result.final_maturity == pytest.approx(legacy.final_maturity)
+
+    def test_batch_written_back(self, tensor_db, multiple_tensor_records):
+        """All trained tensors are persisted with updated maturity."""
+        tensor_db.save_tensors_batch(multiple_tensor_records[:3])
+        trainer = ParallelTensorTrainer(tensor_db=tensor_db)
+
+        tensor_ids = [r.tensor_id for r in multiple_tensor_records]
+        results = trainer.train_batch_vectorized(tensor_ids, target_maturity=0.5)
+
+        assert sum(r.success for r in results.values()) == 3
+        assert "not found" in results[tensor_ids[4]].error.lower()
+        for tensor_id in tensor_ids[:3]:
+            record = tensor_db.get_tensor(tensor_id)
+            assert record.maturity >= 0.5
+            assert record.training_cycles == results[tensor_id].cycles_completed
+            assert record.version == 2
+
+    def test_duplicate_ids_trained_once(self, tensor_db, multiple_tensor_records):
+        """A repeated tensor ID is trained and saved only once."""
+        tensor_db.save_tensors_batch(multiple_tensor_records[:2])
+        trainer = ParallelTensorTrainer(tensor_db=tensor_db)
+
+        tensor_ids = [r.tensor_id for r in multiple_tensor_records[:2]]
+        results = trainer.train_batch_vectorized(tensor_ids + tensor_ids[:1], target_maturity=0.5)
+
+        assert set(results) == set(tensor_ids)
+        for tensor_id in tensor_ids:
+            assert tensor_db.get_tensor(tensor_id).version == 2
+
+    def test_sharded_training_matches_shapes(self, tensor_db, multiple_tensor_records):
+        """Sharding across processes returns every row in order."""
+        from training.batch_engine import train_matrix_sharded
+
+        matrix = np.random.rand(5, 20)
+        outcome = train_matrix_sharded(
+            matrix, np.zeros(5), target_maturity=0.5, seed=1,
+            shard_size=2, max_processes=2
+        )
+
+        assert outcome.matrix.shape == (5, 20)
+        assert np.all(outcome.maturity >= 0.5)
+        assert len(set(outcome.cycles.tolist())) == 1
@@ -322,10 +322,10 @@ def test_integration_with_storage():
 
     # Deserialize
     tensor_dict = json.loads(entity.tensor)
-    import msgspec
-    context_decoded = msgspec.msgpack.decode(base64.b64decode(tensor_dict["context_vector"]))
-    biology_decoded = msgspec.msgpack.decode(base64.b64decode(tensor_dict["biology_vector"]))
-    behavior_decoded = msgspec.msgpack.decode(base64.b64decode(tensor_dict["behavior_vector"]))
+    from tensor_serialization import decode_vector
+    context_decoded = decode_vector(base64.b64decode(tensor_dict["context_vector"]))
+    biology_decoded = decode_vector(base64.b64decode(tensor_dict["biology_vector"]))
+    behavior_decoded = decode_vector(base64.b64decode(tensor_dict["behavior_vector"]))
 
     print("  ✓ Tensor deserialized from JSON")
     print(f"  ✓ Dimensions preserved: {len(context_decoded)}, {len(biology_decoded)}, {len(behavior_decoded)}")
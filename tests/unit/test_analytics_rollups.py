@@ -0,0 +1,164 @@
+"""
+Tests for the incrementally maintained dashboard analytics rollups.
+"""
+
+import sqlite3
+
+import pytest
+
+from dashboards.api.db import TimepointDB
+from metadata.analytics_rollups import AnalyticsRollups
+from metadata.run_tracker import MetadataManager
+from schemas import TemporalMode
+
+RUNS = [
+    # run_id, template, mode, mechanisms, cost, error
+    ("run_a", "board_meeting", TemporalMode.PEARL, ["M1", "M3", "M3"], 0.5, None),
+    ("run_b", "board_meeting", TemporalMode.BRANCHING, ["M1", "M7"], 1.25, None),
+    ("run_c", "jefferson", TemporalMode.PEARL, ["M3", "M7", "M12"], 0.1, "boom"),
+]
+
+
+def _raw_co_occurrence(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            (m1, m2): n for m1, m2, n in conn.execute("""
+                SELECT m1.mechanism, m2.mechanism, COUNT(DISTINCT m1.run_id)
+                FROM mechanism_usage m1
+                JOIN mechanism_usage m2 ON m1.run_id = m2.run_id
+                WHERE m1.mechanism < m2.mechanism
+                GROUP BY m1.mechanism, m2.mechanism
+            """)
+        }
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = MetadataManager(str(tmp_path / "runs.db"))
+    for run_id, template, mode, mechanisms, cost, error in RUNS:
+        manager.start_run(run_id, template, mode, 5, 3)
+        for mechanism in mechanisms:
+            manager.record_mechanism(run_id, mechanism, "fn")
+        manager.complete_run(run_id, 4, 2, 1, cost, 3, 100, error_message=error)
+    yield manager
+    manager.close()
+
+
+@pytest.mark.unit
+def test_meta_analytics_match_raw_queries(manager):
+    db = TimepointDB(str(manager.db_path))
+    metrics = db.get_meta_analytics()
+
+    assert metrics["total_runs"] == 3
+    assert metrics["total_cost"] == pytest.approx(1.85)
+    assert metrics["avg_cost"] == pytest.approx(1.85 / 3)
+    assert metrics["completed_runs"] == 2
+    assert metrics["failed_runs"] == 1
+    assert metrics["total_entities"] == 12
+    assert {t["template_id"]: t["count"] for t in metrics["top_templates"]} == {
+        "board_meeting": 2, "jefferson": 1
+    }
+    assert {c["causal_mode"]: c["count"] for c in metrics["causal_mode_distribution"]} == {
+        "pearl": 2, "branching": 1
+    }
+    assert sum(d["run_count"] for d in metrics["cost_over_time"]) == 3
+
+    pairs = {(p["mechanism1"], p["mechanism2"]): p["co_occurrence"]
+             for p in metrics["mechanism_co_occurrence"]}
+    assert pairs == _raw_co_occurrence(manager.db_path)
+
+    assert db.get_mechanisms() == {"M1": 2, "M12": 1, "M3": 3, "M7": 2}
+
+
+@pytest.mark.unit
+def test_query_runs_reads_rolled_up_and_live_mechanisms(manager):
+    manager.start_run("run_live", "jefferson", TemporalMode.PEARL, 5, 3)
+    manager.record_mechanism("run_live", "M5", "fn")
+    manager.flush()
+
+    db = TimepointDB(str(manager.db_path))
+    results, total = db.query_runs(limit=10)
+    by_id = {r["run_id"]: r["mechanisms_used"] for r in results}
+
+    assert total == 4
+    assert by_id["run_a"] == {"M1": 1, "M3": 2}
+    assert by_id["run_live"] == {"M5": 1}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("buffered", [True, False])
+def test_global_aggregates_include_unfinished_runs(tmp_path, buffered):
+    manager = MetadataManager(str(tmp_path / "runs.db"), buffered=buffered, flush_interval=60)
+    try:
+        # A run that crashed without complete_run and one still in progress
+        for run_id, mechanisms in (("run_crashed", ["M1", "M3"]), ("run_live", ["M1", "M7"])):
+            manager.start_run(run_id, "jefferson", TemporalMode.PEARL, 5, 3)
+            for mechanism in mechanisms:
+                manager.record_mechanism(run_id, mechanism, "fn")
+        manager.flush()
+
+        db = TimepointDB(str(manager.db_path))
+        assert db.get_mechanisms() == {"M1": 2, "M3": 1, "M7": 1}
+        pairs = {(p["mechanism1"], p["mechanism2"]): p["co_occurrence"]
+                 for p in db.get_meta_analytics()["mechanism_co_occurrence"]}
+        assert pairs == _raw_co_occurrence(manager.db_path)
+    finally:
+        manager.close()
+
+
+@pytest.mark.unit
+def test_refresh_is_idempotent_and_matches_rebuild(manager):
+    rollups = AnalyticsRollups(manager.db_path)
+
+    def snapshot():
+        conn = sqlite3.connect(manager.db_path)
+        try:
+            return {
+                table: sorted(conn.execute(f"SELECT * FROM {table}").fetchall())
+                for table in ("rollup_totals", "rollup_daily_cost", "rollup_templates",
+                              "rollup_causal_modes", "rollup_mechanism_totals",
+                              "rollup_mechanism_pairs", "run_mechanism_counts")
+            }
+        finally:
+            conn.close()
+
+    incremental = snapshot()
+    rollups.refresh_run("run_a")
+    rollups.refresh_run("run_a")
+    assert snapshot() == incremental
+
+    rollups.rebuild()
+    rebuilt = snapshot()
+    assert rebuilt.keys() == incremental.keys()
+    for table in rebuilt:
+        assert len(rebuilt[table]) == len(incremental[table])
+    assert rebuilt["rollup_mechanism_pairs"] == incremental["rollup_mechanism_pairs"]
+
+
+@pytest.mark.unit
+def test_ensure_backfills_existing_database(manager):
+    conn = sqlite3.connect(manager.db_path)
+    with conn:
+        conn.execute("DELETE FROM rollup_run_state")
+        conn.execute("DELETE FROM rollup_mechanism_pairs")
+    conn.close()
+
+    assert AnalyticsRollups(manager.db_path).ensure() is True
+    assert AnalyticsRollups(manager.db_path).ensure() is False
+
+    pairs = {(p["mechanism1"], p["mechanism2"]): p["co_occurrence"]
+             for p in TimepointDB(str(manager.db_path)).get_meta_analytics()["mechanism_co_occurrence"]}
+    assert pairs == _raw_co_occurrence(manager.db_path)
+
+
+@pytest.mark.unit
+def test_get_all_runs_batches_mechanisms(manager):
+    runs = {r.run_id: r for r in manager.get_all_runs()}
+    assert runs["run_c"].mechanisms_used == {"M3", "M7", "M12"}
+    assert runs["run_c"].status == "failed"
+
+    board = manager.get_all_runs(template_id="board_meeting")
+    assert sorted(r.run_id for r in board) == ["run_a", "run_b"]
@@ -0,0 +1,101 @@
+"""
+Unit tests for batched multi-dialog knowledge extraction (M19).
+
+The LLM is a fake that answers batched prompts with per-dialog sections,
+so the tests cover packing, per-section validation and fallbacks only.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from schemas import Entity, Timepoint
+from workflows.knowledge_extraction import (
+    BatchKnowledgeExtractionResponse,
+    DialogExtractionRequest,
+    KnowledgeExtractionResponse,
+    extract_knowledge_from_dialogs,
+    pack_extraction_batches,
+)
+
+
+def _request(index: int, turns: int = 4) -> DialogExtractionRequest:
+    return DialogExtractionRequest(
+        dialog_turns=[{"speaker": "alice", "content": f"turn {t}"} for t in range(turns)],
+        entities=[Entity(entity_id="alice"), Entity(entity_id="bob")],
+        timepoint=Timepoint(timepoint_id=f"tp_{index}", timestamp=datetime(2025, 1, 1 + index),
+                            event_description=f"event {index}", entities_present=["alice", "bob"]),
+        dialog_id=f"dialog_tp_{index}",
+    )
+
+
+def _item(dialog_id: str) -> dict:
+    return {"content": f"Alice shared the plan for {dialog_id}", "speaker": "alice", "category": "plan"}
+
+
+class _FakeLLM:
+    """Answers batched prompts with a section per dialog; `sections` can override them."""
+
+    def __init__(self, sections=None):
+        self.sections = sections
+        self.batch_calls = []
+        self.single_calls = 0
+
+    def generate_structured(self, prompt, response_model, model=None, **kwargs):
+        if response_model is BatchKnowledgeExtractionResponse:
+            ids = [line.split()[-1] for line in prompt.splitlines() if line.startswith("### DIALOG ")]
+            self.batch_calls.append(ids)
+            sections = self.sections(ids) if self.sections else [
+                {"dialog_id": dialog_id, "items": [_item(dialog_id)]} for dialog_id in ids
+            ]
+            return response_model(dialogs=sections)
+        self.single_calls += 1
+        return KnowledgeExtractionResponse(items=[_item("single")])
+
+
+@pytest.mark.unit
+class TestPackExtractionBatches:
+    def test_respects_batch_size(self):
+        batches = pack_extraction_batches([_request(i) for i in range(5)], max_batch_size=2)
+        assert [[r.dialog_id for r in batch] for batch in batches] == [
+            ["dialog_tp_0", "dialog_tp_1"], ["dialog_tp_2", "dialog_tp_3"], ["dialog_tp_4"],
+        ]
+
+    def test_respects_token_budget(self):
+        # A 10-turn dialog needs ~3250 output tokens and two need ~5200
+        batches = pack_extraction_batches(
+            [_request(i, turns=10) for i in range(3)], max_batch_size=4, max_output_tokens=5000
+        )
+        assert [len(batch) for batch in batches] == [1, 1, 1]
+
+
+@pytest.mark.unit
+class TestExtractKnowledgeFromDialogs:
+    def test_one_call_per_batch(self):
+        llm = _FakeLLM()
+        results = extract_knowledge_from_dialogs([_request(i) for i in range(4)], llm, max_batch_size=4)
+
+        assert len(llm.batch_calls) == 1
+        assert llm.single_calls == 0
+        assert [r.dialog_id for r in results] == [f"dialog_tp_{i}" for i in range(4)]
+        assert results[2].items[0].content == "Alice shared the plan for dialog_tp_2"
+        assert results[2].items[0].listeners == ["bob"]
+        assert results[2].timepoint_id == "tp_2"
+
+    def test_malformed_section_falls_back_alone(self):
+        def sections(ids):
+            return [
+                {"dialog_id": ids[0], "items": [_item(ids[0]), {"content": "x"}, "garbage"]},
+                {"dialog_id": ids[1], "items": "not a list"},
+                "not a section",
+                {"dialog_id": "unknown", "items": []},
+            ]
+
+        llm = _FakeLLM(sections)
+        results = extract_knowledge_from_dialogs([_request(i) for i in range(3)], llm, max_batch_size=3)
+
+        # Only the two dialogs without a valid section are re-extracted
+        assert llm.single_calls == 2
+        assert [len(r.items) for r in results] == [1, 1, 1]
+        assert results[0].items[0].content == "Alice shared the plan for dialog_tp_0"
+        assert results[1].items[0].content == "Alice shared the plan for single"
@@ -0,0 +1,90 @@
+"""
+Unit tests for the beam-search frontier shared by PORTAL and BRANCHING.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from generation.config_schema import TemporalConfig
+from schemas import TemporalMode
+from workflows.beam_frontier import BeamFrontier, resolve_beam_width, state_fingerprint
+from workflows.branching_strategy import BranchingState, BranchingStrategy
+
+
+def _state(description, score, year=2025, month=1):
+    return SimpleNamespace(year=year, month=month, description=description,
+                           plausibility_score=score)
+
+
+@pytest.mark.unit
+class TestBeamFrontier:
+    def test_keeps_top_k_best_first(self):
+        frontier = BeamFrontier(3)
+        kept = frontier.extend(_state(f"s{i}", score) for i, score in
+                               enumerate([0.5, 0.9, 0.1, 0.7, 0.3, 0.8]))
+
+        assert [s.description for s in frontier.states()] == ["s1", "s5", "s3"]
+        assert kept == 5  # s2 is rejected outright, s0 and s4 evicted later
+        assert frontier.pruned == 3
+
+    def test_ties_keep_earlier_states(self):
+        frontier = BeamFrontier(2)
+        frontier.extend(_state(f"s{i}", 0.5) for i in range(4))
+        assert [s.description for s in frontier.states()] == ["s0", "s1"]
+
+    def test_near_identical_states_collapse_to_best(self):
+        frontier = BeamFrontier(5)
+        frontier.push(_state("The board  approves the deal.", 0.6))
+        frontier.push(_state("the board approves the deal", 0.8))
+        frontier.push(_state("THE BOARD APPROVES THE DEAL!", 0.7))
+        frontier.push(_state("The board approves the deal.", 0.9, month=2))
+
+        states = frontier.states()
+        assert [(s.month, s.plausibility_score) for s in states] == [(2, 0.9), (1, 0.8)]
+        assert frontier.duplicates == 2
+
+    def test_replacing_duplicate_does_not_leave_stale_entries(self):
+        frontier = BeamFrontier(2)
+        frontier.push(_state("a", 0.1))
+        frontier.push(_state("b", 0.5))
+        frontier.push(_state("a", 0.9))  # replaces the 0.1 entry in place
+        frontier.push(_state("c", 0.6))  # evicts b, not the stale a
+
+        assert [s.description for s in frontier.states()] == ["a", "c"]
+
+    def test_dedupe_disabled(self):
+        frontier = BeamFrontier(5, dedupe=False)
+        frontier.extend([_state("same", 0.5), _state("same", 0.4)])
+        assert len(frontier) == 2
+
+    def test_fingerprint_and_width_defaults(self):
+        assert state_fingerprint(_state("Hello, world", 0)) == state_fingerprint(_state("hello world", 1))
+        assert resolve_beam_width(SimpleNamespace(beam_width=None, path_count=5)) == 10
+        assert resolve_beam_width(SimpleNamespace(beam_width=3, path_count=5)) == 3
+        with pytest.raises(ValueError):
+            BeamFrontier(0)
+
+
+@pytest.mark.unit
+def test_branching_expansions_bounded_by_beam_width(monkeypatch):
+    config = TemporalConfig(
+        mode=TemporalMode.BRANCHING, backward_steps=5, path_count=4,
+        candidate_antecedents_per_step=4, beam_width=3, max_branch_workers=1,
+    )
+    strategy = BranchingStrategy(config, llm_client=None, store=None)
+    expanded_per_step = []
+    original = strategy._expand_frontier
+
+    def counting(states, *args, **kwargs):
+        expanded_per_step.append(len(states))
+        return original(states, *args, **kwargs)
+
+    monkeypatch.setattr(strategy, "_expand_frontier", counting)
+    origin = BranchingState(year=2025, month=1, description="Founders decide on funding",
+                            entities=[], world_state={})
+    paths = strategy._explore_chronological(origin)
+
+    assert expanded_per_step[0] == 1
+    assert max(expanded_per_step) <= 3
+    assert 0 < len(paths) <= 3
@@ -0,0 +1,131 @@
+"""
+Unit tests for parallel frontier expansion in BranchingStrategy.
+
+_generate_consequents is patched with slow fakes so the tests check
+scheduling, ordering, timeouts and seeded reproducibility only.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from generation.config_schema import TemporalConfig
+from schemas import TemporalMode
+from workflows.branching_strategy import BranchingState, BranchingStrategy
+
+
+def _strategy(workers, timeout=120, steps=4):
+    config = TemporalConfig(
+        mode=TemporalMode.BRANCHING,
+        backward_steps=steps,
+        path_count=2,
+        candidate_antecedents_per_step=3,
+        max_branch_workers=workers,
+        branch_expansion_timeout_seconds=timeout,
+    )
+    return BranchingStrategy(config, llm_client=None, store=None)
+
+
+def _origin():
+    return BranchingState(year=2025, month=1, description="Founders decide on funding",
+                          entities=[], world_state={}, branch_id="origin")
+
+
+def _frontier(n):
+    return [
+        BranchingState(year=2025, month=1, description=f"state {i}", entities=[],
+                       world_state={}, branch_id=f"s{i}")
+        for i in range(n)
+    ]
+
+
+@pytest.mark.unit
+class TestExpandFrontier:
+    def test_expands_concurrently_in_frontier_order(self, monkeypatch):
+        strategy = _strategy(workers=4)
+        lock = threading.Lock()
+        active, peak = [0], [0]
+        original = strategy._generate_placeholder_consequents
+
+        def slow(state, year, month, count=3, is_branch_point=False):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            # Later frontier states finish first
+            time.sleep(0.05 * (4 - int(state.branch_id[1:])))
+            with lock:
+                active[0] -= 1
+            return original(state, year, month, count)
+
+        monkeypatch.setattr(strategy, "_generate_consequents", slow)
+        frontier = _frontier(4)
+
+        start = time.perf_counter()
+        expansions = strategy._expand_frontier(frontier, 0, 2025, 7, max_workers=4)
+        elapsed = time.perf_counter() - start
+
+        assert peak[0] > 1
+        assert elapsed < 0.05 * (4 + 3 + 2 + 1)
+        assert [state.branch_id for state, _ in expansions] == ["s0", "s1", "s2", "s3"]
+        assert all(c.parent_state is state for state, cons in expansions for c in cons)
+
+    def test_timed_out_and_failed_states_are_dropped(self, monkeypatch):
+        strategy = _strategy(workers=3)
+        strategy.config.branch_expansion_timeout_seconds = 0.2
+        original = strategy._generate_placeholder_consequents
+
+        def flaky(state, year, month, count=3, is_branch_point=False):
+            if state.branch_id == "s1":
+                time.sleep(1.0)
+            if state.branch_id == "s2":
+                raise RuntimeError("LLM error")
+            return original(state, year, month, count)
+
+        monkeypatch.setattr(strategy, "_generate_consequents", flaky)
+
+        start = time.perf_counter()
+        expansions = strategy._expand_frontier(_frontier(3), 0, 2025, 7, max_workers=3)
+
+        assert time.perf_counter() - start < 1.0
+        assert [state.branch_id for state, _ in expansions] == ["s0"]
+
+    def test_single_worker_is_serial(self, monkeypatch):
+        strategy = _strategy(workers=1)
+        calls = []
+        original = strategy._generate_placeholder_consequents
+
+        def record(state, year, month, count=3, is_branch_point=False):
+            calls.append((state.branch_id, threading.current_thread() is threading.main_thread()))
+            return original(state, year, month, count)
+
+        monkeypatch.setattr(strategy, "_generate_consequents", record)
+        strategy._expand_frontier(_frontier(3), 0, 2025, 7, max_workers=1)
+
+        assert calls == [("s0", True), ("s1", True), ("s2", True)]
+
+
+@pytest.mark.unit
+def test_seeded_runs_reproducible_across_worker_counts(monkeypatch):
+    def explore(workers):
+        strategy = _strategy(workers=workers)
+        original = strategy._generate_placeholder_consequents
+
+        def jittered(state, year, month, count=3, is_branch_point=False):
+            # Randomize completion order between runs
+            time.sleep(np.random.default_rng().uniform(0, 0.02))
+            return original(state, year, month, count)
+
+        monkeypatch.setattr(strategy, "_generate_consequents", jittered)
+        np.random.seed(7)
+        paths = strategy._explore_chronological(_origin())
+        return [
+            [(s.description, round(s.plausibility_score, 12)) for s in path.states]
+            for path in paths
+        ]
+
+    serial = explore(1)
+    assert len(serial) > 1
+    assert explore(4) == serial
+    assert explore(4) == serial
@@ -0,0 +1,129 @@
+"""
+Tests for recursive-CTE causal ancestry queries on GraphStore and temporal_chain.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from schemas import Timepoint, ExposureEvent
+from storage import GraphStore
+from temporal_chain import get_causal_ancestors, has_causal_path, validate_temporal_reference
+
+BASE_TIME = datetime(1789, 4, 30, 12, 0)
+
+
+def _timepoint(index: int, parent: int = None, branch: str = "t") -> Timepoint:
+    return Timepoint(
+        timepoint_id=f"{branch}{index}",
+        timestamp=BASE_TIME + timedelta(days=index),
+        event_description=f"Event {index}",
+        entities_present=["washington"],
+        causal_parent=f"t{parent}" if parent is not None else None,
+    )
+
+
+@pytest.fixture
+def chain_store():
+    """Store with a 50-deep linear chain t0 <- t1 <- ... <- t49 and a branch b5 off t4"""
+    store = GraphStore("sqlite:///:memory:")
+    with store.transaction() as tx:
+        tx.save_timepoint(_timepoint(0))
+        for i in range(1, 50):
+            tx.save_timepoint(_timepoint(i, parent=i - 1))
+        tx.save_timepoint(_timepoint(5, parent=4, branch="b"))
+    return store
+
+
+def _count_queries(store):
+    counter = {"n": 0}
+
+    @event.listens_for(store.engine, "before_cursor_execute")
+    def _count(*args, **kwargs):
+        counter["n"] += 1
+
+    return counter
+
+
+@pytest.mark.unit
+def test_ancestors_oldest_first(chain_store):
+    assert get_causal_ancestors("t3", chain_store) == ["t0", "t1", "t2"]
+    assert get_causal_ancestors("b5", chain_store) == ["t0", "t1", "t2", "t3", "t4"]
+    assert get_causal_ancestors("t0", chain_store) == []
+    assert get_causal_ancestors("missing", chain_store) == []
+
+
+@pytest.mark.unit
+def test_deep_ancestry_is_single_query(chain_store):
+    counter = _count_queries(chain_store)
+
+    ancestors = chain_store.get_causal_ancestor_ids("t49")
+
+    assert ancestors == [f"t{i}" for i in range(49)]
+    assert counter["n"] == 1
+
+    # Cached on repeat
+    assert has_causal_path("t0", "t49", chain_store)
+    assert counter["n"] == 1
+
+
+@pytest.mark.unit
+def test_has_causal_path(chain_store):
+    assert has_causal_path("t2", "t10", chain_store)
+    assert has_causal_path("t4", "b5", chain_store)
+    assert not has_causal_path("t5", "b5", chain_store)
+    assert not has_causal_path("t10", "t2", chain_store)
+    assert has_causal_path("t7", "t7", chain_store)
+
+
+@pytest.mark.unit
+def test_descendants(chain_store):
+    assert chain_store.get_causal_descendant_ids("t46") == ["t47", "t48", "t49"]
+    assert chain_store.get_causal_descendant_ids("t4")[:2] == ["b5", "t5"]
+
+
+@pytest.mark.unit
+def test_cache_invalidated_on_save_timepoint(chain_store):
+    assert chain_store.get_causal_ancestor_ids("x1") == []
+
+    chain_store.save_timepoint(Timepoint(
+        timepoint_id="x1",
+        timestamp=BASE_TIME + timedelta(days=60),
+        event_description="Late branch",
+        entities_present=["washington"],
+        causal_parent="t49",
+    ))
+
+    assert chain_store.get_causal_ancestor_ids("x1")[-1] == "t49"
+
+
+@pytest.mark.unit
+def test_cycle_terminates():
+    store = GraphStore("sqlite:///:memory:")
+    store.save_timepoint(_timepoint(0, parent=1))
+    store.save_timepoint(_timepoint(1, parent=0))
+
+    assert store.get_causal_ancestor_ids("t1") == ["t0"]
+    assert not has_causal_path("t2", "t1", store)
+
+
+@pytest.mark.unit
+def test_validate_temporal_reference_constant_queries(chain_store):
+    chain_store.save_exposure_event(ExposureEvent(
+        entity_id="washington",
+        event_type="learned",
+        information="treaty signed",
+        source="messenger",
+        timestamp=BASE_TIME + timedelta(days=10),
+    ))
+    counter = _count_queries(chain_store)
+
+    result = validate_temporal_reference("washington", "treaty signed", "t49", chain_store)
+
+    assert result["valid"]
+    assert result["learned_at"] == "t10"
+    assert counter["n"] == 2
+
+    early = validate_temporal_reference("washington", "treaty signed", "t3", chain_store)
+    assert not early["valid"]
@@ -0,0 +1,212 @@
+"""
+Unit tests for concurrent dialog synthesis in the E2E runner.
+
+The LLM-bound synthesize_dialog call is patched with a slow fake so the
+tests check scheduling, ordering and emotional-state merging only.
+"""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from schemas import Entity, Timepoint
+from workflows.dialog_synthesis import merge_emotional_state_updates
+from metadata.tracking import get_current_run_id
+
+
+def _entity(entity_id, valence=0.2, arousal=0.4, energy=80.0):
+    return Entity(
+        entity_id=entity_id,
+        entity_metadata={"cognitive_tensor": {
+            "emotional_valence": valence,
+            "emotional_arousal": arousal,
+            "energy_budget": energy,
+        }},
+    )
+
+
+@pytest.mark.unit
+class TestMergeEmotionalStateUpdates:
+    def test_deltas_applied_in_order_with_clamping(self):
+        entity = _entity("a", valence=0.5)
+        baselines = {"a": dict(entity.entity_metadata["cognitive_tensor"])}
+        updates = [
+            {"a": {"emotional_valence": 0.9, "emotional_arousal": 0.5, "energy_budget": 78.0}},
+            {"a": {"emotional_valence": 0.8, "emotional_arousal": 0.3, "energy_budget": 76.0}},
+        ]
+
+        assert merge_emotional_state_updates([entity], baselines, updates) == 1
+
+        cog = entity.entity_metadata["cognitive_tensor"]
+        assert cog["emotional_valence"] == 1.0  # 0.5 + 0.4 -> 0.9, + 0.3 clamps at 1.0
+        assert cog["emotional_arousal"] == pytest.approx(0.4)
+        assert cog["energy_budget"] == pytest.approx(74.0)
+
+    def test_entities_without_updates_untouched(self):
+        a, b = _entity("a"), _entity("b")
+        before = dict(b.entity_metadata["cognitive_tensor"])
+        baselines = {"a": dict(a.entity_metadata["cognitive_tensor"])}
+
+        merge_emotional_state_updates(
+            [a, b], baselines, [{"a": {"emotional_valence": 0.0}}]
+        )
+
+        assert b.entity_metadata["cognitive_tensor"] == before
+        assert a.entity_metadata["cognitive_tensor"]["emotional_valence"] == pytest.approx(0.0)
+
+
+@pytest.fixture
+def runner(tmp_path):
+    from e2e_workflows.e2e_runner import FullE2EWorkflowRunner
+    from metadata.run_tracker import MetadataManager
+
+    runner = FullE2EWorkflowRunner(MetadataManager(str(tmp_path / "runs.db")),
+                                   generate_summary=False, track_usage=False)
+    yield runner
+    runner.metadata_manager.close()
+
+
+def _timepoints(n):
+    return [
+        Timepoint(timepoint_id=f"tp_{i}", timestamp=datetime(2025, 1, 1 + i),
+                  event_description=f"event {i}", entities_present=["a", "b"])
+        for i in range(n)
+    ]
+
+
+@pytest.mark.unit
+class TestConcurrentDialogStage:
+    def _fake_synthesize(self, delay, seen_run_ids, active, peak):
+        lock = threading.Lock()
+
+        def fake(participants, timepoint, timeline, llm, store, run_id=None, persist_entities=True,
+                 extract_knowledge=True):
+            assert persist_entities is False
+            seen_run_ids.append(get_current_run_id())
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(delay)
+            for entity in participants:
+                entity.entity_metadata["cognitive_tensor"]["emotional_valence"] -= 0.1
+            with lock:
+                active[0] -= 1
+            return Mock(timepoint_id=timepoint.timepoint_id)
+
+        return fake
+
+    def test_dialogs_run_concurrently_and_save_in_order(self, runner):
+        entities = [_entity("a", valence=0.5), _entity("b", valence=0.5)]
+        timepoints = _timepoints(6)
+        store = Mock()
+        seen, active, peak = [], [0], [0]
+
+        with patch("e2e_workflows.e2e_runner.synthesize_dialog",
+                   side_effect=self._fake_synthesize(0.2, seen, active, peak)):
+            start = time.perf_counter()
+            runner._synthesize_dialogs(
+                entities, timepoints, {"llm_client": Mock(), "store": store},
+                "run_1", max_workers=6
+            )
+            elapsed = time.perf_counter() - start
+
+        assert peak[0] > 1
+        assert elapsed < 6 * 0.2
+        assert seen == ["run_1"] * 6
+
+        saved = [call.args[0].timepoint_id for call in store.save_dialog.call_args_list]
+        assert saved == [tp.timepoint_id for tp in timepoints]
+
+        # Six dialogs, each lowering valence by 0.1 from the shared baseline
+        for entity in entities:
+            assert entity.entity_metadata["cognitive_tensor"]["emotional_valence"] == pytest.approx(-0.1)
+
+    def test_failed_dialog_is_skipped(self, runner):
+        entities = [_entity("a"), _entity("b")]
+        timepoints = _timepoints(3)
+        store = Mock()
+
+        def flaky(participants, timepoint, *args, **kwargs):
+            if timepoint.timepoint_id == "tp_1":
+                raise RuntimeError("LLM timeout")
+            return Mock(timepoint_id=timepoint.timepoint_id)
+
+        with patch("e2e_workflows.e2e_runner.synthesize_dialog", side_effect=flaky):
+            runner._synthesize_dialogs(
+                entities, timepoints, {"llm_client": Mock(), "store": store},
+                "run_1", max_workers=3
+            )
+
+        saved = [call.args[0].timepoint_id for call in store.save_dialog.call_args_list]
+        assert saved == ["tp_0", "tp_2"]
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_participants_snapshotted_as_of_each_timepoint(self, runner, max_workers):
+        entities = [_entity("a", valence=0.5), _entity("b", valence=0.5)]
+        timepoints = _timepoints(3)
+        store = Mock()
+        snapshots = {}
+
+        def record(participants, timepoint_id, run_id=None):
+            assert run_id == "run_1"
+            snapshots[timepoint_id] = {
+                e.entity_id: e.entity_metadata["cognitive_tensor"]["emotional_valence"]
+                for e in participants
+            }
+            return len(participants)
+
+        def lower_valence(participants, timepoint, *args, **kwargs):
+            for entity in participants:
+                entity.entity_metadata["cognitive_tensor"]["emotional_valence"] -= 0.1
+            return Mock(timepoint_id=timepoint.timepoint_id)
+
+        store.save_entity_snapshots.side_effect = record
+        with patch("e2e_workflows.e2e_runner.synthesize_dialog", side_effect=lower_valence):
+            runner._synthesize_dialogs(
+                entities, timepoints, {"llm_client": Mock(), "store": store},
+                "run_1", max_workers=max_workers
+            )
+
+        # Each timepoint sees only the dialogs up to and including its own
+        assert list(snapshots) == ["tp_0", "tp_1", "tp_2"]
+        for i, tp in enumerate(["tp_0", "tp_1", "tp_2"]):
+            assert snapshots[tp] == {
+                "a": pytest.approx(0.4 - 0.1 * i),
+                "b": pytest.approx(0.4 - 0.1 * i),
+            }
+
+    def test_batched_extraction_replaces_per_dialog_calls(self, runner):
+        import json
+        from schemas import KnowledgeExtractionResult
+
+        entities = [_entity("a"), _entity("b")]
+        timepoints = _timepoints(5)
+        extract_flags = []
+
+        def fake(participants, timepoint, *args, extract_knowledge=True, **kwargs):
+            extract_flags.append(extract_knowledge)
+            return Mock(timepoint_id=timepoint.timepoint_id, turns=json.dumps([{"speaker": "a", "content": "hi"}]))
+
+        def fake_extract(requests, llm, store, max_batch_size):
+            batches.append([r.dialog_id for r in requests])
+            return [
+                KnowledgeExtractionResult(items=[], dialog_id=r.dialog_id, timepoint_id=r.timepoint.timepoint_id,
+                                          extraction_model="m", total_turns_analyzed=1, items_per_turn=0.0,
+                                          extraction_timestamp=datetime(2025, 1, 1))
+                for r in requests
+            ]
+
+        batches = []
+        with patch("e2e_workflows.e2e_runner.synthesize_dialog", side_effect=fake), \
+                patch("e2e_workflows.e2e_runner.extract_knowledge_from_dialogs", side_effect=fake_extract):
+            runner._synthesize_dialogs(
+                entities, timepoints, {"llm_client": Mock(), "store": Mock()},
+                "run_1", max_workers=1, extraction_batch_size=2
+            )
+
+        assert extract_flags == [False] * 5
+        # Serial runs extract in windows of the batch size
+        assert batches == [["dialog_tp_0", "dialog_tp_1"], ["dialog_tp_2", "dialog_tp_3"], ["dialog_tp_4"]]
@@ -0,0 +1,82 @@
+"""
+Tests for the dialog_participant association table and indexed dialog lookups.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from schemas import Dialog
+from storage import GraphStore
+
+
+def _dialog(dialog_id: str, participants: list[str], run_id: str = None) -> Dialog:
+    return Dialog(
+        dialog_id=dialog_id,
+        timepoint_id="tp_1",
+        participants=json.dumps(participants),
+        turns=json.dumps([]),
+        context_used=json.dumps({}),
+        run_id=run_id,
+    )
+
+
+@pytest.fixture
+def store():
+    return GraphStore("sqlite:///:memory:")
+
+
+@pytest.mark.unit
+def test_lookup_by_participant(store):
+    store.save_dialog(_dialog("d1", ["alice", "bob"]))
+    store.save_dialog(_dialog("d2", ["carol", "dave"]))
+    store.save_dialog(_dialog("d3", ["bob", "carol"]))
+
+    assert [d.dialog_id for d in store.get_dialogs_for_entities(["bob"])] == ["d1", "d3"]
+    assert [d.dialog_id for d in store.get_dialogs_for_entities(["alice", "dave"])] == ["d1", "d2"]
+    assert store.get_dialogs_for_entities(["nobody"]) == []
+    assert store.get_dialogs_for_entities([]) == []
+
+
+@pytest.mark.unit
+def test_lookup_scoped_by_run(store):
+    store.save_dialog(_dialog("run_a_d1", ["alice", "bob"], run_id="run_a"))
+    store.save_dialog(_dialog("run_b_d1", ["alice", "bob"], run_id="run_b"))
+
+    scoped = store.get_dialogs_for_entities(["alice"], run_id="run_b")
+
+    assert [d.dialog_id for d in scoped] == ["run_b_d1"]
+    assert len(store.get_dialogs_for_entities(["alice"])) == 2
+
+
+@pytest.mark.unit
+def test_transaction_save_dialog_indexes_participants(store):
+    with store.transaction() as tx:
+        tx.save_dialog(_dialog("tx_d1", ["erin", "frank"]))
+
+    assert [d.dialog_id for d in store.get_dialogs_for_entities(["frank"])] == ["tx_d1"]
+
+
+@pytest.mark.unit
+def test_backfill_existing_dialogs(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    store = GraphStore(db_url)
+
+    # Simulate a database written before dialog_participant existed
+    with Session(store.engine) as session:
+        session.add(_dialog("legacy_d1", ["alice", "bob"], run_id="old_run"))
+        session.commit()
+    assert store.get_dialogs_for_entities(["alice"]) == []
+    store.engine.dispose()
+
+    reopened = GraphStore(db_url)
+    assert [d.dialog_id for d in reopened.get_dialogs_for_entities(["bob"])] == ["legacy_d1"]
+
+    # Second open is a no-op
+    assert reopened._backfill_dialog_participants() == 0
+    with Session(reopened.engine) as session:
+        count = session.exec(text("SELECT COUNT(*) FROM dialog_participant")).one()[0]
+    assert count == 2
+    reopened.engine.dispose()
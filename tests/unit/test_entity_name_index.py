@@ -0,0 +1,126 @@
+"""
+Tests for the in-memory entity name index and its use in QueryInterface.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event
+
+from query_interface import QueryInterface, QueryIntent
+from schemas import Entity
+from storage import EntityNameIndex, GraphStore
+
+
+def _count_queries(store):
+    counter = {"n": 0}
+
+    @event.listens_for(store.engine, "before_cursor_execute")
+    def _count(*args, **kwargs):
+        counter["n"] += 1
+
+    return counter
+
+
+@pytest.fixture
+def store():
+    store = GraphStore("sqlite:///:memory:")
+    store.save_entities_bulk([
+        Entity(entity_id="george_washington"),
+        Entity(entity_id="john_adams", entity_metadata={"aliases": ["The Duke of Braintree"]}),
+        Entity(entity_id="john_jay"),
+        Entity(entity_id="attendee_47"),
+        Entity(entity_id="tj", entity_metadata={"name": "Thomas Jefferson"}),
+    ])
+    return store
+
+
+@pytest.mark.unit
+class TestEntityNameIndex:
+    def test_resolve(self):
+        index = EntityNameIndex()
+        index.load([
+            ("john_adams", {"aliases": ["Duke of Braintree"]}),
+            ("john_jay", {}),
+            ("attendee_47", {}),
+        ])
+
+        assert index.resolve("john_adams") == "john_adams"
+        assert index.resolve("John Adams") == "john_adams"
+        assert index.resolve("duke of braintree") == "john_adams"
+        assert index.resolve("Jay") == "john_jay"
+        assert index.resolve("Adamms") == "john_adams"
+        # Ambiguous tokens and near-miss numbered names stay unresolved
+        assert index.resolve("john") is None
+        assert index.resolve("attendee 41") is None
+
+    def test_updates_replace_aliases(self):
+        index = EntityNameIndex()
+        index.update({"ignored": ("ignored",)})
+        assert len(index) == 0
+
+        index.load([("john_jay", {})])
+        index.update({"john_jay": ("john jay", "chief justice")})
+        assert index.resolve("chief justice") == "john_jay"
+
+        index.update({"john_jay": ("john jay",)})
+        assert index.resolve("chief justice") is None
+
+
+@pytest.mark.unit
+class TestStoreNameIndex:
+    def test_find_mentions_without_database_reads(self, store):
+        index = store.get_entity_name_index()
+        counter = _count_queries(store)
+
+        mentions = index.find_mentions("Did Washington tell John Adams what Thomas Jefferson heard?")
+
+        assert mentions == ["george_washington", "john_adams", "tj"]
+        assert counter["n"] == 0
+
+    def test_save_paths_keep_index_current(self, store):
+        index = store.get_entity_name_index()
+
+        store.save_entity(Entity(entity_id="alexander_hamilton"))
+        with store.transaction() as tx:
+            tx.save_entity(Entity(entity_id="james_madison", entity_metadata={"aliases": ["Father of the Constitution"]}))
+
+        assert index.resolve("Hamilton") == "alexander_hamilton"
+        assert index.resolve("father of the constitution") == "james_madison"
+
+        store.clear_caches()
+        assert store.get_entity_name_index().resolve("madison") == "james_madison"
+
+    def test_rolled_back_transaction_not_indexed(self, store):
+        index = store.get_entity_name_index()
+
+        with pytest.raises(RuntimeError):
+            with store.transaction() as tx:
+                tx.save_entity(Entity(entity_id="aaron_burr"))
+                raise RuntimeError("abort")
+
+        assert "aaron_burr" not in index
+
+
+@pytest.mark.unit
+class TestQueryInterfaceNameResolution:
+    def test_gap_detection_uses_index(self, store):
+        qi = QueryInterface(store, Mock())
+        store.get_entity_name_index()
+        counter = _count_queries(store)
+
+        assert qi.detect_entity_gap("What did attendee #47 see?") is None
+        assert qi.detect_entity_gap("What did attendee #12 see?") == "attendee_12"
+        assert counter["n"] == 0
+
+    def test_simple_parse_and_canonicalization(self, store):
+        qi = QueryInterface(store, Mock())
+
+        intent = qi._parse_query_simple("What did the Duke of Braintree think of Jay?")
+        assert intent.target_entity == "john_adams"
+        assert intent.context_entities == ["john_jay"]
+
+        intent = QueryIntent(target_entity="Thomas Jeffersen", context_entities=["Washington", "nobody"])
+        qi._canonicalize_entity_names(intent)
+        assert intent.target_entity == "tj"
+        assert intent.context_entities == ["george_washington", "nobody"]
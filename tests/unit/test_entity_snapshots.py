@@ -0,0 +1,99 @@
+"""
+Tests for append-only entity snapshots and point-in-time entity reads.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session, select
+
+from schemas import Entity, EntitySnapshot, ResolutionLevel, Timepoint
+from storage import GraphStore
+
+
+def _timepoint(index: int) -> Timepoint:
+    return Timepoint(
+        timepoint_id=f"tp_{index}",
+        timestamp=datetime(1789, 4, index + 1),
+        event_description=f"Event {index}",
+        entities_present=["washington"],
+    )
+
+
+def _washington(knowledge: list[str], **kwargs) -> Entity:
+    return Entity(
+        entity_id="washington",
+        entity_type="historical_person",
+        temporal_span_start=datetime(1789, 4, 1),
+        entity_metadata={"role": "president", "knowledge_state": knowledge},
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def store():
+    return GraphStore("sqlite:///:memory:", snapshot_keyframe_interval=3)
+
+
+def _evolve(store, count: int) -> None:
+    """Snapshot washington at count timepoints, learning one fact per timepoint"""
+    for i in range(count):
+        store.save_timepoint(_timepoint(i))
+        entity = _washington([f"fact {n}" for n in range(i + 1)], query_count=i)
+        store.save_entity(entity)
+        store.save_entity_snapshots([entity], f"tp_{i}")
+
+
+@pytest.mark.unit
+def test_point_in_time_reads_replay_deltas(store):
+    _evolve(store, 7)
+
+    for i in range(7):
+        entity = store.get_entity_at_timepoint("washington", f"tp_{i}")
+        assert entity.entity_metadata["knowledge_state"] == [f"fact {n}" for n in range(i + 1)]
+        assert entity.query_count == i
+        assert entity.temporal_span_start == datetime(1789, 4, 1)
+        assert entity.resolution_level == ResolutionLevel.TENSOR_ONLY
+
+    # Current row still reflects the latest state
+    assert len(store.get_entity("washington").entity_metadata["knowledge_state"]) == 7
+
+
+@pytest.mark.unit
+def test_keyframes_are_periodic_and_deltas_compact(store):
+    _evolve(store, 7)
+
+    with Session(store.engine) as session:
+        rows = session.exec(select(EntitySnapshot).order_by(EntitySnapshot.sequence)).all()
+
+    assert [row.is_keyframe for row in rows] == [True, False, False, True, False, False, True]
+    delta = rows[1].state
+    assert set(delta["set"]) == {"query_count", "entity_metadata.knowledge_state"}
+    assert delta["unset"] == []
+
+
+@pytest.mark.unit
+def test_snapshots_are_append_only(store):
+    store.save_timepoint(_timepoint(0))
+    assert store.save_entity_snapshots([_washington(["original"])], "tp_0") == 1
+    assert store.save_entity_snapshots([_washington(["rewritten"])], "tp_0") == 0
+
+    entity = store.get_entity_snapshot("washington", "tp_0")
+    assert entity.entity_metadata["knowledge_state"] == ["original"]
+
+
+@pytest.mark.unit
+def test_fallbacks_for_unsnapshotted_timepoints(store):
+    for i in range(3):
+        store.save_timepoint(_timepoint(i))
+    store.save_entity(_washington(["current"]))
+
+    # Never snapshotted: current row
+    assert store.get_entity_at_timepoint("washington", "tp_0").entity_metadata["knowledge_state"] == ["current"]
+
+    store.save_entity_snapshots([_washington(["at tp_1"])], "tp_1")
+
+    # Before the first snapshot: did not exist yet; after it: latest earlier snapshot
+    assert store.get_entity_at_timepoint("washington", "tp_0") is None
+    assert store.get_entity_at_timepoint("washington", "tp_2").entity_metadata["knowledge_state"] == ["at tp_1"]
+    assert store.get_entity_snapshot("washington", "tp_2") is None
@@ -0,0 +1,103 @@
+"""
+Unit tests for the shared graph centrality cache.
+"""
+
+import threading
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from graph import GraphMetricsCache, bump_graph_version, compute_centralities, create_test_graph
+from schemas import Entity
+from tensors import compute_ttm_metrics
+
+
+@pytest.mark.unit
+class TestGraphMetricsCache:
+    def test_computes_once_per_graph_version(self):
+        cache = GraphMetricsCache()
+        G = create_test_graph(12)
+
+        with patch("graph.nx.betweenness_centrality", wraps=nx.betweenness_centrality) as spy:
+            for _ in range(5):
+                cache.get(G, "betweenness")
+            assert spy.call_count == 1
+
+            G.add_edge("entity_0", "entity_11")
+            cache.get(G, "betweenness")
+            assert spy.call_count == 2
+
+            bump_graph_version(G)
+            cache.get(G, "betweenness")
+            assert spy.call_count == 3
+
+        assert cache.get_stats()["hits"] == 4
+
+    def test_values_match_networkx(self):
+        cache = GraphMetricsCache()
+        G = create_test_graph(15)
+
+        assert cache.get(G, "betweenness") == pytest.approx(nx.betweenness_centrality(G))
+        assert cache.get(G, "pagerank") == pytest.approx(nx.pagerank(G))
+        assert cache.get(G, "eigenvector") == pytest.approx(
+            nx.eigenvector_centrality(G, max_iter=1000)
+        )
+
+    def test_graphs_are_cached_separately(self):
+        cache = GraphMetricsCache()
+        a, b = nx.path_graph(4), nx.star_graph(3)
+        assert cache.get(a, "degree") == {0: 1, 1: 2, 2: 2, 3: 1}
+        assert cache.get(b, "degree") == {0: 3, 1: 1, 2: 1, 3: 1}
+
+    def test_approximate_betweenness_for_large_graphs(self):
+        G = nx.barabasi_albert_graph(300, 3, seed=1)
+        approx = GraphMetricsCache(betweenness_k=100, approximate_above=200)
+
+        with patch("graph.nx.betweenness_centrality", wraps=nx.betweenness_centrality) as spy:
+            estimate = approx.get(G, "betweenness")
+        assert spy.call_args.kwargs == {"k": 100, "seed": 42}
+
+        exact = nx.betweenness_centrality(G)
+        top_exact = sorted(exact, key=exact.get, reverse=True)[:5]
+        top_estimate = sorted(estimate, key=estimate.get, reverse=True)[:10]
+        assert set(top_exact) <= set(top_estimate)
+
+    def test_concurrent_callers_share_one_computation(self):
+        cache = GraphMetricsCache()
+        G = create_test_graph(20)
+        results = []
+
+        with patch("graph.nx.pagerank", wraps=nx.pagerank) as spy:
+            threads = [threading.Thread(target=lambda: results.append(cache.get(G, "pagerank")))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert spy.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_unknown_metric_and_empty_graph(self):
+        cache = GraphMetricsCache()
+        assert cache.get(nx.Graph(), "eigenvector") == {}
+        with pytest.raises(ValueError):
+            cache.get(nx.Graph(), "closeness")
+
+
+@pytest.mark.unit
+def test_ttm_metrics_and_centralities_share_cache():
+    G = create_test_graph(10)
+
+    with patch("graph.nx.betweenness_centrality", wraps=nx.betweenness_centrality) as spy:
+        metrics = [compute_ttm_metrics(Entity(entity_id=node), G) for node in G.nodes]
+        centralities = compute_centralities(G)
+    assert spy.call_count == 1
+
+    for node, m in zip(G.nodes, metrics):
+        assert m["betweenness"] == centralities["betweenness"][node]
+
+    # Returned dicts are copies; mutating them must not poison the cache
+    centralities["pagerank"].clear()
+    assert compute_centralities(G)["pagerank"]
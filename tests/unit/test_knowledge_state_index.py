@@ -0,0 +1,102 @@
+"""
+Tests for the knowledge_state bitemporal index and knowledge-at-time queries.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from schemas import ExposureEvent, Timepoint
+from storage import GraphStore
+
+
+def _event(entity_id: str, information: str, day: int, run_id: str = None) -> ExposureEvent:
+    return ExposureEvent(
+        entity_id=entity_id,
+        event_type="learned",
+        information=information,
+        source="test",
+        timestamp=datetime(1789, 4, day),
+        run_id=run_id,
+    )
+
+
+@pytest.fixture
+def store():
+    return GraphStore("sqlite:///:memory:")
+
+
+@pytest.mark.unit
+def test_knowledge_as_of_is_range_bounded(store):
+    store.save_exposure_events([
+        _event("washington", "inauguration date", 1),
+        _event("washington", "cabinet nominees", 10),
+        _event("washington", "senate vote", 20),
+        _event("adams", "cabinet nominees", 2),
+    ])
+
+    assert store.get_knowledge_as_of("washington", datetime(1789, 4, 10)) == [
+        "inauguration date", "cabinet nominees",
+    ]
+    assert store.get_knowledge_as_of("washington", datetime(1789, 3, 1)) == []
+    later = store.get_knowledge_states("washington", start=datetime(1789, 4, 10))
+    assert [row.information for row in later] == ["senate vote"]
+
+
+@pytest.mark.unit
+def test_knowledge_as_of_dedupes_and_scopes_by_run(store):
+    store.save_exposure_event(_event("hamilton", "treasury plan", 1, run_id="run_a"))
+    store.save_exposure_event(_event("hamilton", "treasury plan", 5, run_id="run_a"))
+    store.save_exposure_event(_event("hamilton", "bank charter", 3, run_id="run_b"))
+
+    as_of = datetime(1789, 4, 30)
+    assert store.get_knowledge_as_of("hamilton", as_of) == ["treasury plan", "bank charter"]
+    assert store.get_knowledge_as_of("hamilton", as_of, run_id="run_b") == ["bank charter"]
+
+
+@pytest.mark.unit
+def test_knowledge_at_timepoint_and_transaction_path(store):
+    store.save_timepoint(Timepoint(
+        timepoint_id="tp_1",
+        timestamp=datetime(1789, 4, 15),
+        event_description="Cabinet meeting",
+        entities_present=["jefferson"],
+    ))
+    with store.transaction() as tx:
+        tx.save_exposure_events([
+            _event("jefferson", "foreign affairs brief", 12),
+            _event("jefferson", "french revolution news", 25),
+        ])
+
+    assert store.get_entity_knowledge_at_timepoint("jefferson", "tp_1") == ["foreign affairs brief"]
+    assert store.get_entity_knowledge_at_timepoint("jefferson", "missing") == []
+    assert store.get_latest_timepoint_timestamp() == datetime(1789, 4, 15)
+
+
+@pytest.mark.unit
+def test_backfill_existing_exposure_events(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    store = GraphStore(db_url)
+
+    # Simulate a database written before knowledge_state existed
+    with Session(store.engine) as session:
+        session.add(_event("madison", "bill of rights draft", 8))
+        session.exec(text("DROP TABLE knowledge_state"))
+        session.commit()
+    store.engine.dispose()
+
+    reopened = GraphStore(db_url)
+    assert reopened.get_knowledge_as_of("madison", datetime(1789, 5, 1)) == ["bill of rights draft"]
+
+    # Later opens skip the migration; running it again is a no-op anyway
+    with patch.object(GraphStore, "_backfill_knowledge_states") as backfill:
+        GraphStore(db_url).engine.dispose()
+    assert backfill.call_count == 0
+    assert reopened._backfill_knowledge_states() == 0
+    with Session(reopened.engine) as session:
+        count = session.exec(text("SELECT COUNT(*) FROM knowledge_state")).one()[0]
+    assert count == 1
+    reopened.engine.dispose()
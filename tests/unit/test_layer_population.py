@@ -0,0 +1,110 @@
+"""
+Unit tests for concurrent per-layer tensor population in the E2E runner.
+
+populate_tensor_llm_guided and trigger_prospection_for_entity are patched
+with slow fakes so the tests check fan-out and batched persistence only.
+"""
+
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from schemas import Entity, Timepoint, TTMTensor
+from tensor_persistence import TensorDatabase
+
+
+def _entity(entity_id):
+    return Entity(entity_id=entity_id, entity_metadata={"needs_llm_population": True})
+
+
+def _config(workers):
+    return SimpleNamespace(world_id="world", entities=SimpleNamespace(max_population_workers=workers))
+
+
+@pytest.fixture
+def runner(tmp_path):
+    from e2e_workflows.e2e_runner import FullE2EWorkflowRunner
+    from metadata.run_tracker import MetadataManager
+
+    runner = FullE2EWorkflowRunner(MetadataManager(str(tmp_path / "runs.db")),
+                                   generate_summary=False, track_usage=False)
+    runner._tensor_db = TensorDatabase(str(tmp_path / "tensors.db"))
+    yield runner
+    runner._tensor_db.close()
+    runner.metadata_manager.close()
+
+
+@pytest.fixture
+def timepoint():
+    return Timepoint(timepoint_id="tp_0", timestamp=datetime(2025, 1, 1),
+                     event_description="board meeting", entities_present=["a"])
+
+
+@pytest.fixture
+def slow_population():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_populate(entity, timepoint, graph, llm):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.1)
+        with lock:
+            state["active"] -= 1
+        tensor = TTMTensor.from_arrays(np.full(8, 0.5), np.full(4, 0.5), np.full(8, 0.5))
+        return tensor, 0.6
+
+    with patch("tensor_initialization.populate_tensor_llm_guided", side_effect=fake_populate), \
+         patch("prospection_triggers.trigger_prospection_for_entity", return_value=None):
+        yield state
+
+
+@pytest.mark.unit
+def test_layer_population_runs_concurrently(runner, timepoint, slow_population):
+    layer = [_entity(f"e{i}") for i in range(6)]
+
+    start = time.perf_counter()
+    populated, dirty = runner._populate_layer(
+        layer, timepoint, None, Mock(), Mock(), _config(6), "run_1"
+    )
+    elapsed = time.perf_counter() - start
+
+    assert slow_population["peak"] > 1
+    assert elapsed < 6 * 0.1
+    assert [e.entity_id for e in populated] == [e.entity_id for e in layer]
+    assert dirty == populated
+    assert all(e.tensor_maturity == 0.6 for e in layer)
+    assert not any(e.entity_metadata["needs_llm_population"] for e in layer)
+
+
+@pytest.mark.unit
+def test_single_worker_is_serial(runner, timepoint, slow_population):
+    layer = [_entity(f"e{i}") for i in range(3)]
+    runner._populate_layer(layer, timepoint, None, Mock(), Mock(), _config(1), "run_1")
+    assert slow_population["peak"] == 1
+
+
+@pytest.mark.unit
+def test_train_entities_saves_once_per_layer(runner, timepoint, slow_population):
+    layers = [[_entity("a"), _entity("b")], [_entity("c")]]
+    store = Mock()
+    workflow = Mock()
+    workflow.invoke.side_effect = lambda state: {"entities": state["entities"]}
+
+    with patch("e2e_workflows.e2e_runner.create_entity_training_workflow", return_value=workflow), \
+         patch.object(runner._tensor_db, "save_tensors_batch",
+                      wraps=runner._tensor_db.save_tensors_batch) as save_batch:
+        runner._train_entities(
+            {"llm_client": Mock(), "store": store, "graph": Mock(), "config": _config(4)},
+            [timepoint], layers, "run_1"
+        )
+
+    assert store.save_entities_bulk.call_count == 2
+    assert [len(c.args[0]) for c in save_batch.call_args_list] == [2, 1]
+    assert runner._tensor_db.get_tensor("a_world_run_1").maturity == 0.6
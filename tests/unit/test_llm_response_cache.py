@@ -0,0 +1,174 @@
+"""
+Tests for the content-addressed LLM response cache (llm_service.response_cache)
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from llm_service import LLMService, LLMServiceConfig, CacheMissError
+from llm_service.config import ServiceMode, PerformanceConfig
+from llm_service.provider import LLMResponse
+from llm_service.response_cache import ResponseCache, CacheMode, make_cache_key
+
+
+class CountingProvider:
+    """Provider stub that counts calls and echoes the prompt"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, system, user, temperature=0.7, max_tokens=1000, top_p=0.9,
+             model=None, **kwargs):
+        self.calls += 1
+        return LLMResponse(
+            content='{"name": "echo", "value": %d}' % self.calls,
+            model=model or "stub",
+            tokens_used={"prompt": 10, "completion": 5, "total": 15},
+            cost_usd=0.01,
+            latency_ms=5.0,
+            success=True,
+        )
+
+
+class EchoSchema(BaseModel):
+    name: str
+    value: int
+
+
+def _make_service(tmp_path, **perf) -> LLMService:
+    config = LLMServiceConfig(
+        provider="test",
+        mode=ServiceMode.DRY_RUN,
+        performance=PerformanceConfig(**perf),
+    )
+    config.logging.directory = str(tmp_path / "logs")
+    service = LLMService(config)
+    service.provider = CountingProvider()
+    return service
+
+
+@pytest.mark.unit
+def test_cache_key_sensitive_to_inputs():
+    base = dict(model="m", system="s", user="u", temperature=0.7)
+    key = make_cache_key(**base)
+    assert key == make_cache_key(**base)
+    assert key != make_cache_key(**{**base, "temperature": 0.2})
+    assert key != make_cache_key(**{**base, "user": "other"})
+    assert key != make_cache_key(**base, schema=EchoSchema)
+
+
+@pytest.mark.unit
+def test_identical_calls_hit_cache(tmp_path):
+    service = _make_service(tmp_path)
+
+    first = service.call(system="sys", user="hello", temperature=0.0)
+    second = service.call(system="sys", user="hello", temperature=0.0)
+
+    assert service.provider.calls == 1
+    assert second.content == first.content
+    assert second.cost_usd == 0.0
+    assert second.metadata["cache_hit"] is True
+
+    stats = service.get_statistics()["cache_stats"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.unit
+def test_structured_calls_keyed_on_schema(tmp_path):
+    service = _make_service(tmp_path)
+
+    result = service.structured_call(system="sys", user="hello", schema=EchoSchema, temperature=0.0)
+    service.call(system="sys", user="hello", temperature=0.0)
+    again = service.structured_call(system="sys", user="hello", schema=EchoSchema, temperature=0.0)
+
+    assert service.provider.calls == 2
+    assert again.value == result.value
+
+
+@pytest.mark.unit
+def test_sampled_calls_cached_only_when_opted_in(tmp_path):
+    service = _make_service(tmp_path)
+    service.call(system="sys", user="hello", temperature=0.7)
+    service.call(system="sys", user="hello", temperature=0.7)
+    assert service.provider.calls == 2
+
+    opted_in = _make_service(tmp_path, cache_sampled_calls=True)
+    opted_in.call(system="sys", user="hello", temperature=0.7)
+    opted_in.call(system="sys", user="hello", temperature=0.7)
+    assert opted_in.provider.calls == 1
+
+
+@pytest.mark.unit
+def test_unparseable_structured_response_not_cached(tmp_path):
+    service = _make_service(tmp_path)
+    parse = service.response_parser.parse_structured
+    failures = [ValueError("bad JSON")]
+
+    def flaky_parse(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return parse(*args, **kwargs)
+
+    service.response_parser.parse_structured = flaky_parse
+    with pytest.raises(Exception, match="Failed to parse"):
+        service.structured_call(system="sys", user="hello", schema=EchoSchema, temperature=0.0)
+    result = service.structured_call(system="sys", user="hello", schema=EchoSchema, temperature=0.0)
+    again = service.structured_call(system="sys", user="hello", schema=EchoSchema, temperature=0.0)
+
+    assert service.provider.calls == 2
+    assert again.value == result.value == 2
+
+
+@pytest.mark.unit
+def test_caching_disabled_bypasses_cache(tmp_path):
+    service = _make_service(tmp_path, caching_enabled=False)
+
+    service.call(system="sys", user="hello")
+    service.call(system="sys", user="hello")
+
+    assert service.provider.calls == 2
+    assert service.get_statistics()["cache_stats"] == {"enabled": False}
+
+
+@pytest.mark.unit
+def test_memory_tier_lru_eviction():
+    cache = ResponseCache(max_entries=2, ttl_seconds=0)
+    response = CountingProvider().call("s", "u")
+    for key in ("a", "b", "c"):
+        cache.put(key, response)
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.get_statistics()["evictions"] == 1
+
+
+@pytest.mark.unit
+def test_record_then_replay_from_disk(tmp_path):
+    db_path = str(tmp_path / "llm_cache.db")
+
+    recorder = _make_service(tmp_path, cache_path=db_path, cache_mode="record")
+    recorded = recorder.call(system="sys", user="replay me")
+    recorder.response_cache.close()
+
+    replayer = _make_service(tmp_path, cache_path=db_path, cache_mode="replay")
+    replayed = replayer.call(system="sys", user="replay me")
+
+    assert replayer.provider.calls == 0
+    assert replayed.content == recorded.content
+    assert replayer.get_statistics()["cache_stats"]["disk_hits"] == 1
+
+    with pytest.raises(CacheMissError):
+        replayer.call(system="sys", user="never recorded")
+    replayer.response_cache.close()
+
+
+@pytest.mark.unit
+def test_failed_responses_not_cached():
+    cache = ResponseCache(mode=CacheMode.READ_WRITE)
+    failed = LLMResponse(
+        content="", model="m", tokens_used={}, cost_usd=0.0,
+        latency_ms=0.0, success=False, error="boom",
+    )
+    cache.put("k", failed)
+    assert cache.get("k") is None
@@ -285,6 +285,36 @@ class TestPermissionChecks:
 
         assert enforcer.can_fork("user-shared", "tensor-001") is True
 
+    def test_filter_readable_matches_can_read(self, enforcer):
+        """Bulk read check should agree with can_read for every rule."""
+        enforcer.create_default_permission("t-own", "alice")
+        enforcer.create_default_permission("t-private", "bob")
+        enforcer.create_default_permission("t-public", "bob", access_level="public")
+        enforcer.set_permission(TensorPermission(
+            tensor_id="t-user", owner_id="bob",
+            access_level="shared", shared_with=["alice"],
+        ))
+        enforcer.set_permission(TensorPermission(
+            tensor_id="t-group", owner_id="bob",
+            access_level="shared", shared_groups=["team"],
+        ))
+        enforcer.add_user_to_group("alice", "team")
+        ids = ["t-own", "t-private", "t-public", "t-user", "t-group", "t-missing"]
+
+        readable = enforcer.filter_readable("alice", ids)
+
+        assert readable == {t for t in ids if enforcer.can_read("alice", t)}
+        assert readable == {"t-own", "t-public", "t-user", "t-group"}
+        assert enforcer.filter_readable("alice", []) == set()
+
+    def test_filter_readable_chunks_large_id_lists(self, enforcer):
+        """Id lists beyond SQLite's parameter limit are resolved in chunks."""
+        ids = [f"t-{i}" for i in range(1200)]
+        for tensor_id in ids[::100]:
+            enforcer.create_default_permission(tensor_id, "alice")
+
+        assert enforcer.filter_readable("alice", ids + ids[:10]) == set(ids[::100])
+
 
 # ============================================================================
 # Enforce Tests
@@ -648,6 +678,157 @@ class TestListQueries:
         assert "tensor-shared-2" in shared
 
 
+# ============================================================================
+# Share Table & Cache Tests
+# ============================================================================
+
+def _count_selects(enforcer):
+    """Record SELECT statements issued on this thread's connection."""
+    statements = []
+    enforcer.pool.connection().set_trace_callback(
+        lambda sql: statements.append(sql) if sql.lstrip().upper().startswith("SELECT") else None
+    )
+    return statements
+
+
+@pytest.mark.unit
+class TestSharesAndCaching:
+    """Tests for the normalized share table and permission cache."""
+
+    def test_page_of_checks_costs_one_query(self, enforcer):
+        """filter_readable over 100 mixed tensors should issue one SELECT."""
+        enforcer.add_user_to_group("alice", "team")
+        ids = []
+        for i in range(100):
+            kind = ("private", "public", "user", "group")[i % 4]
+            perm = TensorPermission(tensor_id=f"t-{i}", owner_id="bob",
+                                    access_level="private" if kind == "private" else "shared")
+            if kind == "public":
+                perm.access_level = "public"
+            elif kind == "user":
+                perm.shared_with = ["alice"]
+            elif kind == "group":
+                perm.shared_groups = ["team"]
+            enforcer.set_permission(perm)
+            ids.append(perm.tensor_id)
+
+        statements = _count_selects(enforcer)
+        readable = enforcer.filter_readable("alice", ids)
+
+        assert len(statements) == 1
+        assert len(readable) == 75
+        assert "t-0" not in readable
+
+        # Repeating the page is served from the cache
+        assert enforcer.filter_readable("alice", ids) == readable
+        assert all(enforcer.can_read("alice", t) for t in readable)
+        assert len(statements) == 1
+
+    def test_revoke_invalidates_cached_decision(self, enforcer):
+        """Grant and revoke must be visible immediately despite caching."""
+        enforcer.create_default_permission("t-1", "owner")
+        assert enforcer.can_read("user", "t-1") is False
+
+        enforcer.grant_access("owner", "t-1", "user")
+        assert enforcer.can_read("user", "t-1") is True
+
+        enforcer.revoke_access("owner", "t-1", "user")
+        assert enforcer.can_read("user", "t-1") is False
+
+    def test_group_membership_change_invalidates_cache(self, enforcer):
+        """Leaving a group should drop access granted through it."""
+        enforcer.set_permission(TensorPermission(
+            tensor_id="t-1", owner_id="owner",
+            access_level="shared", shared_groups=["team"],
+        ))
+        enforcer.add_user_to_group("user", "team")
+        assert enforcer.can_read("user", "t-1") is True
+        assert enforcer.get_user_groups("user") == {"team"}
+
+        enforcer.remove_user_from_group("user", "team")
+        assert enforcer.can_read("user", "t-1") is False
+        assert enforcer.get_user_groups("user") == set()
+
+    def test_stale_generation_is_not_cached(self, enforcer):
+        """A result computed before a write must not be stored after it."""
+        generation = enforcer.cache.generation
+        enforcer.create_default_permission("t-1", "owner")
+        enforcer.cache.put(("read", "user", "t-1"), True, generation)
+        assert enforcer.can_read("user", "t-1") is False
+
+    def test_cache_ttl_expires(self, tmp_db_path):
+        """Entries expire after the TTL; ttl=0 disables caching."""
+        enforcer = PermissionEnforcer(tmp_db_path, cache_ttl=0.05)
+        enforcer.cache.put("key", "value", enforcer.cache.generation)
+        assert enforcer.cache.get("key") == "value"
+        time.sleep(0.1)
+        assert enforcer.cache.get("key") != "value"
+
+        uncached = PermissionEnforcer(tmp_db_path, cache_ttl=0)
+        uncached.create_default_permission("t-1", "owner")
+        statements = _count_selects(uncached)
+        uncached.can_read("owner", "t-1")
+        uncached.can_read("owner", "t-1")
+        assert len(statements) == 2
+
+    def test_shares_round_trip_through_table(self, enforcer):
+        """Shares persist in tensor_shares, in grant order."""
+        enforcer.set_permission(TensorPermission(
+            tensor_id="t-1", owner_id="owner", access_level="shared",
+            shared_with=["zed", "amy"], shared_groups=["g2", "g1"],
+        ))
+        perm = enforcer.get_permission("t-1")
+        assert perm.shared_with == ["zed", "amy"]
+        assert perm.shared_groups == ["g2", "g1"]
+
+        with enforcer._transaction() as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM tensor_shares").fetchone()[0]
+            legacy = conn.execute(
+                "SELECT shared_with_json FROM tensor_permissions"
+            ).fetchone()[0]
+        assert rows == 4
+        assert legacy is None
+
+        enforcer.delete_permission("t-1")
+        with enforcer._transaction() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM tensor_shares").fetchone()[0] == 0
+
+    def test_legacy_json_shares_are_migrated(self, tmp_db_path):
+        """Existing JSON share arrays move into tensor_shares on startup."""
+        enforcer = PermissionEnforcer(tmp_db_path)
+        with enforcer._transaction() as conn:
+            conn.execute("""
+                INSERT INTO tensor_permissions
+                (tensor_id, owner_id, access_level, shared_with_json,
+                 shared_groups_json, created_at, modified_at)
+                VALUES ('t-old', 'owner', 'shared', '["user"]', '["team"]', ?, ?)
+            """, (datetime.utcnow().isoformat(), datetime.utcnow().isoformat()))
+        enforcer.close()
+
+        migrated = PermissionEnforcer(tmp_db_path)
+        migrated.add_user_to_group("member", "team")
+        perm = migrated.get_permission("t-old")
+        assert perm.shared_with == ["user"]
+        assert perm.shared_groups == ["team"]
+        assert migrated.filter_readable("member", ["t-old"]) == {"t-old"}
+        assert migrated.list_shared_tensors("user") == ["t-old"]
+
+    def test_list_queries_include_group_shares(self, enforcer):
+        """List queries resolve group shares without scanning JSON."""
+        enforcer.set_permission(TensorPermission(
+            tensor_id="t-group", owner_id="bob",
+            access_level="shared", shared_groups=["team"],
+        ))
+        enforcer.create_default_permission("t-public", "bob", access_level="public")
+        enforcer.create_default_permission("t-own", "alice")
+        enforcer.add_user_to_group("alice", "team")
+
+        assert sorted(enforcer.list_accessible_tensors("alice")) == ["t-group", "t-own", "t-public"]
+        assert sorted(enforcer.list_accessible_tensors("alice", include_public=False)) == ["t-group", "t-own"]
+        assert enforcer.list_shared_tensors("alice") == ["t-group"]
+        assert enforcer.list_shared_tensors("bob") == []
+
+
 # ============================================================================
 # AuditLogger Tests
 # ============================================================================
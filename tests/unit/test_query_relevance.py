@@ -0,0 +1,139 @@
+"""
+Unit tests for two-stage knowledge relevance scoring in QueryInterface.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from llm_v2 import LLMClient
+from query_interface import QueryInterface, QueryIntent
+from schemas import RelevanceScores
+from storage import GraphStore
+
+
+class _FakeRAG:
+    """Embeds text as keyword-presence vectors and counts encode calls."""
+
+    VOCAB = ["army", "battle", "troops", "farm", "tobacco", "weather"]
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_embeddings(self, texts):
+        self.calls += 1
+        return np.array(
+            [[float(word in text.lower()) for word in self.VOCAB] for text in texts],
+            dtype=np.float32,
+        )
+
+
+def _llm(scores_for=lambda items: [0.9] * len(items)):
+    llm = Mock(spec=["score_relevance", "score_relevance_batch"])
+    llm.score_relevance_batch.side_effect = lambda query, items: scores_for(items)
+    return llm
+
+
+def _interface(llm, **kwargs):
+    return QueryInterface(GraphStore("sqlite:///:memory:"), llm, **kwargs)
+
+
+@pytest.mark.unit
+class TestFilterRelevantKnowledge:
+    def test_one_batched_call_regardless_of_knowledge_size(self):
+        llm = _llm()
+        qi = _interface(llm, relevance_prefilter_k=8)
+        knowledge = [f"fact {i} about the army" for i in range(40)]
+        intent = QueryIntent(target_entity="washington", information_type="knowledge")
+
+        result = qi._filter_relevant_knowledge(knowledge, intent)
+
+        assert llm.score_relevance_batch.call_count == 1
+        assert llm.score_relevance.call_count == 0
+        assert len(llm.score_relevance_batch.call_args.args[1]) == 8
+        assert len(result) == 5
+
+    def test_embedding_prefilter_keeps_most_similar_items(self):
+        rag = _FakeRAG()
+        llm = _llm()
+        qi = _interface(llm, tensor_rag=rag, relevance_prefilter_k=2)
+        knowledge = [
+            "The farm grew tobacco",
+            "Troops gathered before the battle",
+            "The weather was cold",
+            "The army marched to battle",
+        ]
+        intent = QueryIntent(target_entity="washington", information_type="knowledge")
+        intent._original_query = "What did the army do in battle?"
+
+        qi._filter_relevant_knowledge(knowledge, intent)
+
+        assert rag.calls == 1
+        assert llm.score_relevance_batch.call_args.args[1] == [
+            "Troops gathered before the battle",
+            "The army marched to battle",
+        ]
+
+    def test_ranking_and_thresholds_follow_llm_scores(self):
+        scores = {"a": 0.2, "b": 0.8, "c": 0.5, "d": 0.9}
+        llm = _llm(lambda items: [scores[k] for k in items])
+        qi = _interface(llm)
+
+        specific = QueryIntent(target_entity="x", information_type="knowledge")
+        assert qi._filter_relevant_knowledge(list("abcd"), specific) == ["d", "b", "c"]
+
+        general = QueryIntent(target_entity="x", information_type="general")
+        assert qi._filter_relevant_knowledge(list("abcd"), general) == ["d", "b", "c"]
+        assert qi._filter_relevant_knowledge([], general) == []
+
+    def test_clients_without_batch_api_score_per_item(self):
+        llm = Mock(spec=["score_relevance"])
+        llm.score_relevance.return_value = 0.7
+        qi = _interface(llm, relevance_prefilter_k=3)
+
+        result = qi._filter_relevant_knowledge(
+            ["one", "two", "three", "four"], QueryIntent(information_type="knowledge")
+        )
+
+        assert llm.score_relevance.call_count == 3
+        assert len(result) == 3
+
+
+@pytest.mark.unit
+class TestScoreRelevanceBatch:
+    def _client(self, result):
+        client = LLMClient.__new__(LLMClient)
+        client.use_centralized_service = True
+        client.service = Mock()
+        client.service.structured_call.return_value = result
+        return client
+
+    def test_single_structured_call(self):
+        client = self._client(RelevanceScores(scores=[0.1, 1.4, 0.6]))
+
+        scores = client.score_relevance_batch("army", ["x", "y", "z"])
+
+        assert scores == [0.1, 1.0, 0.6]
+        assert client.service.structured_call.call_count == 1
+        kwargs = client.service.structured_call.call_args.kwargs
+        assert kwargs["schema"] is RelevanceScores
+        assert "exactly 3 numbers" in kwargs["user"]
+
+    def test_missing_scores_fall_back_to_heuristic(self):
+        client = self._client(RelevanceScores(scores=[0.4]))
+
+        scores = client.score_relevance_batch("army battle", ["farm", "army battle"])
+
+        assert scores[0] == 0.4
+        assert scores[1] == client._heuristic_relevance_score("army battle", "army battle")
+        assert client.score_relevance_batch("army", []) == []
+
+    def test_failed_call_falls_back_to_heuristic(self):
+        client = self._client(None)
+        client.service.structured_call.side_effect = ValueError("invalid JSON")
+        items = ["farm", "army battle"]
+
+        scores = client.score_relevance_batch("army battle", items)
+
+        assert scores == [client._heuristic_relevance_score("army battle", item) for item in items]
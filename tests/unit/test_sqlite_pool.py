@@ -0,0 +1,143 @@
+"""
+Tests for the thread-local SQLite connection pool.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from sqlite_pool import SQLiteConnectionPool
+from tensor_persistence import TensorDatabase, TensorRecord
+from training.job_queue import JobQueue
+from access.permissions import PermissionEnforcer, TensorPermission
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "pool.db", synchronous="OFF",
+                                cache_size=-4000, mmap_size=1 << 20)
+    yield pool
+    pool.close()
+
+
+@pytest.mark.unit
+def test_connection_is_reused_per_thread(pool):
+    conn = pool.connection()
+    assert pool.connection() is conn
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not conn
+
+
+@pytest.mark.unit
+def test_pragmas_applied(pool):
+    conn = pool.connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -4000
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+@pytest.mark.unit
+def test_nested_transaction_rolls_back_as_one(pool):
+    with pool.transaction() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+
+    with pytest.raises(RuntimeError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            with pool.transaction() as inner:
+                inner.execute("INSERT INTO t VALUES (2)")
+            raise RuntimeError("abort")
+
+    with pool.transaction() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+@pytest.mark.unit
+def test_exited_thread_connection_released(pool):
+    import gc
+
+    conns = []
+    threads = [threading.Thread(target=lambda: conns.append(pool.connection())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert len(pool._connections) == 0
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+@pytest.mark.unit
+def test_immediate_transaction_joins_outer_block(pool):
+    with pool.transaction() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+
+    with pool.transaction(immediate=True) as conn:
+        assert conn.in_transaction
+        conn.execute("INSERT INTO t VALUES (1)")
+
+    with pytest.raises(RuntimeError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (2)")
+            with pool.transaction(immediate=True) as inner:
+                inner.execute("INSERT INTO t VALUES (3)")
+            raise RuntimeError("abort")
+
+    with pool.transaction() as conn:
+        assert [row[0] for row in conn.execute("SELECT x FROM t")] == [1]
+
+
+@pytest.mark.unit
+def test_close_shuts_down_every_thread(pool):
+    conns = [pool.connection()]
+    thread = threading.Thread(target=lambda: conns.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    pool.close()
+    pool.close()
+
+    assert pool.closed
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError):
+        pool.connection()
+
+
+@pytest.mark.unit
+def test_stores_share_one_pool(tmp_path):
+    db_path = str(tmp_path / "tensors.db")
+    tensor_db = TensorDatabase(db_path)
+    enforcer = PermissionEnforcer(db_path, pool=tensor_db.pool)
+    queue = JobQueue(tensor_db)
+
+    tensor_db.save_tensor(TensorRecord(tensor_id="t1", entity_id="e1", tensor_blob=b"x"))
+    enforcer.set_permission(TensorPermission(tensor_id="t1", owner_id="alice"))
+    job = queue.create_job("t1")
+
+    assert tensor_db.get_tensor("t1").entity_id == "e1"
+    assert enforcer.can_read("alice", "t1")
+    assert queue.acquire_next_pending("w1").job_id == job.job_id
+
+    # Acquiring inside an outer transaction joins it instead of committing it
+    second = queue.create_job("t1")
+    with pytest.raises(RuntimeError):
+        with tensor_db.pool.transaction():
+            assert queue.acquire_next_pending("w2").job_id == second.job_id
+            raise RuntimeError("abort")
+    assert queue.acquire_next_pending("w3").worker_id == "w3"
+    assert len(tensor_db.pool._connections) == 1
+
+    tensor_db.close()
+    assert enforcer.pool.closed
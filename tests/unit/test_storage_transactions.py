@@ -236,3 +236,57 @@ class TestMixedOperations:
         assert retrieved.timepoint == "t2"
         assert retrieved.resolution_level == ResolutionLevel.DIALOG
         assert retrieved.entity_metadata["name"] == "Updated Person"
+
+
+class TestBulkEntityUpsert:
+    """Tests for save_entities_bulk on GraphStore and TransactionContext"""
+
+    def test_bulk_insert_roster(self, store):
+        """Test inserting a full roster in one call"""
+        entities = [
+            Entity(entity_id=f"bulk_{i}", entity_type="human", entity_metadata={"index": i})
+            for i in range(100)
+        ]
+
+        written = store.save_entities_bulk(entities)
+
+        assert written == 100
+        assert len(store.get_all_entities()) == 100
+        assert store.get_entity("bulk_42").entity_metadata == {"index": 42}
+
+    def test_bulk_updates_existing_entities(self, store, sample_entity):
+        """Test that conflicting entity_ids are updated in place"""
+        store.save_entity(sample_entity)
+
+        updated = Entity(
+            entity_id=sample_entity.entity_id,
+            entity_type="human",
+            resolution_level=ResolutionLevel.DIALOG,
+            tensor_maturity=0.8,
+            entity_metadata={"name": "Bulk Updated"}
+        )
+        store.save_entities_bulk([updated, Entity(entity_id="bulk_new")])
+
+        retrieved = store.get_entity(sample_entity.entity_id)
+        assert retrieved.resolution_level == ResolutionLevel.DIALOG
+        assert retrieved.tensor_maturity == 0.8
+        assert retrieved.entity_metadata == {"name": "Bulk Updated"}
+        assert len(store.get_all_entities()) == 2
+
+    def test_duplicate_ids_last_wins(self, store):
+        """Test that the last occurrence of a repeated entity_id is kept"""
+        store.save_entities_bulk([
+            Entity(entity_id="dup", entity_type="human"),
+            Entity(entity_id="dup", entity_type="animal"),
+        ])
+
+        assert store.get_entity("dup").entity_type == "animal"
+
+    def test_bulk_in_transaction_rolls_back(self, store):
+        """Test that a bulk upsert inside a failed transaction is rolled back"""
+        with pytest.raises(ValueError):
+            with store.transaction() as tx:
+                tx.save_entities_bulk([Entity(entity_id=f"tx_bulk_{i}") for i in range(5)])
+                raise ValueError("abort")
+
+        assert store.get_all_entities() == []
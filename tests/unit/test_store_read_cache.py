@@ -0,0 +1,129 @@
+"""
+Tests for GraphStore's read-through timepoint and entity caches.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from schemas import Entity, Timepoint
+from storage import GraphStore
+
+BASE_TIME = datetime(1865, 4, 14, 20, 0)
+
+
+def _timepoint(timepoint_id: str, description: str = "Event") -> Timepoint:
+    return Timepoint(
+        timepoint_id=timepoint_id,
+        timestamp=BASE_TIME,
+        event_description=description,
+        entities_present=["lincoln"],
+    )
+
+
+def _count_queries(store):
+    counter = {"n": 0}
+
+    @event.listens_for(store.engine, "before_cursor_execute")
+    def _count(*args, **kwargs):
+        counter["n"] += 1
+
+    return counter
+
+
+@pytest.fixture
+def store():
+    return GraphStore("sqlite:///:memory:", cache_size=8)
+
+
+@pytest.mark.unit
+def test_timepoint_reads_hit_cache(store):
+    store.save_timepoint(_timepoint("tp_1"))
+    counter = _count_queries(store)
+
+    for _ in range(5):
+        assert store.get_timepoint("tp_1").timepoint_id == "tp_1"
+
+    assert counter["n"] == 1
+    stats = store.get_cache_stats()["timepoints"]
+    assert stats["hits"] == 4
+    assert stats["hit_rate"] == pytest.approx(0.8)
+
+
+@pytest.mark.unit
+def test_save_timepoint_invalidates(store):
+    store.save_timepoint(_timepoint("tp_1", "Before"))
+    assert store.get_timepoint("tp_1").event_description == "Before"
+
+    updated = store.get_timepoint("tp_1")
+    updated.event_description = "After"
+    store.save_timepoint(updated)
+
+    assert store.get_timepoint("tp_1").event_description == "After"
+
+
+@pytest.mark.unit
+def test_transaction_writes_invalidate(store):
+    store.save_entity(Entity(entity_id="lincoln", entity_type="human"))
+    assert store.get_entity("lincoln").entity_type == "human"
+
+    with store.transaction() as tx:
+        tx.save_entity(Entity(entity_id="lincoln", entity_type="abstract"))
+
+    assert store.get_entity("lincoln").entity_type == "abstract"
+
+    store.save_entities_bulk([Entity(entity_id="lincoln", entity_type="animal")])
+    assert store.get_entity("lincoln").entity_type == "animal"
+
+
+@pytest.mark.unit
+def test_returned_rows_are_independent_copies(store):
+    store.save_entity(Entity(entity_id="lincoln", entity_metadata={"knowledge_state": ["a"]}))
+    store.get_entity("lincoln")
+
+    mutated = store.get_entity("lincoln")
+    mutated.entity_metadata["knowledge_state"].append("unsaved")
+
+    assert store.get_entity("lincoln").entity_metadata == {"knowledge_state": ["a"]}
+
+
+@pytest.mark.unit
+def test_entity_timepoint_filter(store):
+    store.save_entity(Entity(entity_id="lincoln", timepoint="tp_1"))
+
+    assert store.get_entity("lincoln", timepoint="tp_1") is not None
+    assert store.get_entity("lincoln", timepoint="tp_2") is None
+
+
+@pytest.mark.unit
+def test_bulk_prefetch_and_bounded_size(store):
+    for i in range(12):
+        store.save_timepoint(_timepoint(f"tp_{i}"))
+
+    counter = _count_queries(store)
+    ids = [f"tp_{i}" for i in range(4)] + ["missing"]
+    assert [tp.timepoint_id for tp in store.get_timepoints(ids)] == ids[:4]
+    assert counter["n"] == 1
+
+    # Cached rows are served without another query
+    store.get_timepoints(ids[:4])
+    assert counter["n"] == 1
+
+    store.get_timepoints([f"tp_{i}" for i in range(12)])
+    stats = store.get_cache_stats()["timepoints"]
+    assert stats["size"] == 8
+    assert stats["evictions"] > 0
+
+
+@pytest.mark.unit
+def test_cache_disabled(tmp_path):
+    store = GraphStore(f"sqlite:///{tmp_path / 'nocache.db'}", cache_size=0)
+    store.save_timepoint(_timepoint("tp_1"))
+    counter = _count_queries(store)
+
+    store.get_timepoint("tp_1")
+    store.get_timepoint("tp_1")
+
+    assert counter["n"] == 2
+    store.engine.dispose()
@@ -0,0 +1,162 @@
+"""
+Tests for the buffered telemetry writer behind MetadataManager.
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from metadata.run_tracker import MetadataManager
+from metadata.telemetry_writer import TelemetryWriter
+from metadata.tracking import (
+    track_mechanism,
+    set_current_run_id,
+    clear_current_run_id,
+    set_metadata_manager,
+)
+from schemas import ResolutionLevel, TemporalMode
+
+
+def _count(db_path, table):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    # Long interval so rows stay queued until an explicit flush
+    manager = MetadataManager(str(tmp_path / "runs.db"), batch_size=1000, flush_interval=60)
+    manager.start_run("run-1", "template", TemporalMode.PEARL, 5, 3)
+    yield manager
+    manager.close()
+
+
+@pytest.mark.unit
+def test_records_are_buffered_until_flush(manager):
+    for i in range(10):
+        manager.record_mechanism("run-1", "M1", f"fn_{i}")
+    manager.record_resolution("run-1", "e1", ResolutionLevel.SCENE, "tp1")
+    manager.record_validation("run-1", "energy", True, violations=["none"])
+
+    assert _count(manager.db_path, "mechanism_usage") == 0
+    assert manager.get_telemetry_stats()["queue_depth"] == 12
+
+    assert manager.flush() == 12
+    assert _count(manager.db_path, "mechanism_usage") == 10
+    assert _count(manager.db_path, "resolution_assignments") == 1
+    assert _count(manager.db_path, "validations") == 1
+
+    stats = manager.get_telemetry_stats()
+    assert stats["queue_depth"] == 0
+    assert stats["rows_written"] == 12
+    assert stats["flushes"] == 1
+
+
+@pytest.mark.unit
+def test_complete_run_drains_queue(manager):
+    manager.record_mechanism("run-1", "M3", "exposure")
+    manager.record_mechanism("run-1", "M7", "causal_chain")
+
+    metadata = manager.complete_run("run-1", 5, 3, 0, 0.0, 0, 0)
+
+    assert metadata.mechanisms_used == {"M3", "M7"}
+    assert manager.get_telemetry_stats()["queue_depth"] == 0
+
+
+@pytest.mark.unit
+def test_batch_size_triggers_background_flush(tmp_path):
+    manager = MetadataManager(str(tmp_path / "runs.db"), batch_size=5, flush_interval=60)
+    try:
+        manager.start_run("run-1", "template", TemporalMode.PEARL, 5, 3)
+        for i in range(5):
+            manager.record_mechanism("run-1", "M1", f"fn_{i}")
+
+        deadline = time.time() + 5
+        while _count(manager.db_path, "mechanism_usage") < 5 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert _count(manager.db_path, "mechanism_usage") == 5
+        assert manager.get_telemetry_stats()["max_queue_depth"] == 5
+    finally:
+        manager.close()
+
+
+@pytest.mark.unit
+def test_unbuffered_manager_writes_immediately(tmp_path):
+    manager = MetadataManager(str(tmp_path / "runs.db"), buffered=False)
+    manager.start_run("run-1", "template", TemporalMode.PEARL, 5, 3)
+    manager.record_mechanism("run-1", "M1", "fn")
+
+    assert _count(manager.db_path, "mechanism_usage") == 1
+    assert manager.get_telemetry_stats() == {"buffered": False}
+
+
+@pytest.mark.unit
+def test_track_mechanism_decorator_enqueues(manager):
+    @track_mechanism("M5", "lazy_resolution")
+    def resolve(x):
+        return x * 2
+
+    set_metadata_manager(manager)
+    set_current_run_id("run-1")
+    try:
+        assert resolve(21) == 42
+    finally:
+        clear_current_run_id()
+        set_metadata_manager(None)
+
+    assert manager.get_telemetry_stats()["rows_enqueued"] == 1
+    assert "M5" in manager.get_run("run-1").mechanisms_used
+
+
+@pytest.mark.unit
+def test_writer_rejects_unknown_table_and_closed_enqueue(tmp_path):
+    writer = TelemetryWriter(tmp_path / "t.db")
+    with pytest.raises(ValueError):
+        writer.enqueue("runs", ("x",))
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.enqueue("validations", ("r", "v", True, "ts", None, "[]"))
+
+
+@pytest.mark.unit
+def test_managers_on_one_database_share_a_writer(tmp_path):
+    db_path = str(tmp_path / "runs.db")
+    first = MetadataManager(db_path, flush_interval=60)
+    second = MetadataManager(db_path, flush_interval=60)
+    writer = first._writer
+    assert second._writer is writer
+
+    second.start_run("run-1", "template", TemporalMode.PEARL, 5, 3)
+    second.record_mechanism("run-1", "M1", "fn")
+    second.close()
+    assert not writer.closed
+    assert _count(db_path, "mechanism_usage") == 1
+
+    first.close()
+    assert writer.closed
+    third = MetadataManager(db_path)
+    assert third._writer is not writer
+    third.close()
+
+
+@pytest.mark.unit
+def test_bad_row_does_not_drop_its_batch(tmp_path):
+    manager = MetadataManager(str(tmp_path / "runs.db"), batch_size=1000, flush_interval=60)
+    try:
+        manager.start_run("run-1", "template", TemporalMode.PEARL, 5, 3)
+        manager.record_mechanism("run-1", "M1", "before")
+        manager._writer.enqueue("mechanism_usage", ("run-1", "M2"))
+        manager.record_mechanism("run-1", "M3", "after")
+
+        assert manager.flush() == 2
+        assert _count(manager.db_path, "mechanism_usage") == 2
+        stats = manager.get_telemetry_stats()
+        assert stats["errors"] == 1
+        assert stats["rows_dropped"] == 1
+    finally:
+        manager.close()
@@ -0,0 +1,137 @@
+"""
+Tests for the native binary TTMTensor layout and legacy msgpack compatibility.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import msgspec
+import numpy as np
+import pytest
+
+from schemas import TTMTensor
+from tensor_serialization import (
+    serialize_tensor,
+    deserialize_tensor,
+    encode_vector,
+    decode_vector,
+    is_native_blob,
+    convert_legacy_blob,
+    tensor_to_numpy,
+)
+from tensor_persistence import TensorDatabase, TensorRecord
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+from migrate_tensor_blobs import migrate_database  # noqa: E402
+
+CONTEXT = np.array([0.5, 0.25, 0.75, 0.125, 0.875, 0.375, 0.625, 0.0625])
+BIOLOGY = np.array([0.35, 0.9, 0.1, 0.8])
+BEHAVIOR = np.array([0.6, 0.7, 0.4, 0.5, 0.8, 0.3, 0.7, 0.5])
+
+
+def _legacy_tensor_blob() -> bytes:
+    return msgspec.msgpack.encode({
+        "context": CONTEXT.tolist(),
+        "biology": BIOLOGY.tolist(),
+        "behavior": BEHAVIOR.tolist(),
+    })
+
+
+@pytest.mark.unit
+def test_vector_is_zero_copy_view():
+    blob = encode_vector(CONTEXT)
+
+    arr = decode_vector(blob)
+
+    assert arr.dtype == np.float32
+    assert not arr.flags.writeable
+    assert len(blob) == 8 + 8 * 4
+    np.testing.assert_allclose(arr, CONTEXT, rtol=1e-6)
+    assert decode_vector(blob, copy=True).flags.writeable
+
+
+@pytest.mark.unit
+def test_float64_roundtrip_is_exact():
+    tensor = TTMTensor.from_arrays(CONTEXT, BIOLOGY, BEHAVIOR, dtype=np.float64)
+
+    recovered = deserialize_tensor(serialize_tensor(tensor))
+
+    np.testing.assert_array_equal(tensor_to_numpy(recovered),
+                                  np.concatenate([CONTEXT, BIOLOGY, BEHAVIOR]))
+    assert recovered.to_arrays()[0].dtype == np.float64
+
+
+@pytest.mark.unit
+def test_serialize_copies_native_payload():
+    tensor = TTMTensor.from_arrays(CONTEXT, BIOLOGY, BEHAVIOR)
+
+    blob = serialize_tensor(tensor)
+
+    assert is_native_blob(blob)
+    assert len(blob) == 16 + 20 * 4
+    assert deserialize_tensor(blob).context_vector == tensor.context_vector
+
+
+@pytest.mark.unit
+def test_legacy_blobs_read_transparently():
+    legacy_vectors = TTMTensor(
+        context_vector=msgspec.msgpack.encode(CONTEXT.tolist()),
+        biology_vector=msgspec.msgpack.encode(BIOLOGY.tolist()),
+        behavior_vector=msgspec.msgpack.encode(BEHAVIOR.tolist()),
+    )
+    np.testing.assert_array_equal(legacy_vectors.to_arrays()[1], BIOLOGY)
+
+    # Legacy float64 values are not narrowed on read or on re-save
+    from_legacy_blob = deserialize_tensor(_legacy_tensor_blob())
+    np.testing.assert_array_equal(tensor_to_numpy(from_legacy_blob),
+                                  tensor_to_numpy(legacy_vectors))
+    np.testing.assert_array_equal(
+        deserialize_tensor(serialize_tensor(from_legacy_blob)).to_arrays()[1], BIOLOGY
+    )
+
+    # Legacy per-vector encodings are converted when serialized
+    resaved = serialize_tensor(legacy_vectors)
+    assert is_native_blob(resaved)
+    np.testing.assert_array_equal(deserialize_tensor(resaved).to_arrays()[1], BIOLOGY)
+
+
+@pytest.mark.unit
+def test_malformed_header_rejected():
+    blob = encode_vector(CONTEXT)
+
+    with pytest.raises(ValueError):
+        decode_vector(blob[:-4])
+    with pytest.raises(ValueError):
+        deserialize_tensor(b"TTMT\x09" + serialize_tensor(
+            TTMTensor.from_arrays(CONTEXT, BIOLOGY, BEHAVIOR))[5:])
+
+
+@pytest.mark.unit
+def test_migration_rewrites_records_and_versions(tmp_path):
+    db_path = str(tmp_path / "tensors.db")
+    db = TensorDatabase(db_path)
+    record = TensorRecord(tensor_id="t1", entity_id="e1", tensor_blob=_legacy_tensor_blob())
+    db.save_tensor(record)
+    db.save_tensor(db.get_tensor("t1"))
+
+    results = migrate_database(db_path)
+
+    assert results["tensor_records"]["converted"] == 1
+    assert results["tensor_versions"]["converted"] == 2
+    with sqlite3.connect(db_path) as conn:
+        blobs = [row[0] for row in conn.execute(
+            "SELECT tensor_blob FROM tensor_records UNION ALL SELECT tensor_blob FROM tensor_versions"
+        )]
+    assert all(is_native_blob(blob) for blob in blobs)
+    assert convert_legacy_blob(blobs[0]) == blobs[0]
+
+    # Legacy float64 values survive the rewrite exactly
+    for blob in blobs:
+        context, biology, behavior = deserialize_tensor(blob).to_arrays()
+        np.testing.assert_array_equal(context, CONTEXT)
+        np.testing.assert_array_equal(biology, BIOLOGY)
+        np.testing.assert_array_equal(behavior, BEHAVIOR)
+
+    # Re-running is a no-op
+    assert migrate_database(db_path)["tensor_records"]["converted"] == 0
@@ -482,6 +482,20 @@ class TestBatchOperations:
         assert len(results) == 3
         assert all(r.tensor_id in ids[:3] for r in results)
 
+    def test_batch_get_chunks_large_id_lists(self, tensor_db, sample_ttm_tensor):
+        """Id lists beyond SQLite's parameter limit are fetched in chunks."""
+        from tensor_serialization import serialize_tensor
+
+        blob = serialize_tensor(sample_ttm_tensor)
+        tensor_db.save_tensors_batch([
+            TensorRecord(tensor_id=f"chunk-{i}", entity_id=f"entity-{i}", tensor_blob=blob)
+            for i in range(0, 1200, 100)
+        ])
+        ids = [f"chunk-{i}" for i in range(1200)]
+
+        results = tensor_db.get_tensors_batch(ids + ids[:10])
+        assert sorted(r.tensor_id for r in results) == sorted(ids[::100])
+
 
 # ============================================================================
 # Optimistic Locking Tests
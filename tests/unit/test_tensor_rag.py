@@ -211,6 +211,98 @@ class TestEmbeddingIndex:
         results = index.search(query, k=5)
         assert all(r[0] != "tensor_1" for r in results)
 
+    def test_growth_and_tombstone_compaction(self):
+        """Storage doubles on add and compacts once half the rows are removed."""
+        index = EmbeddingIndex(embedding_dim=8)
+        embeddings = np.random.randn(300, 8).astype(np.float32)
+        index.add_batch([f"t{i}" for i in range(300)], embeddings)
+
+        assert index.size == 300
+        assert len(index._matrix) == 512
+
+        for i in range(200):
+            index.remove(f"t{i}")
+
+        assert index.size == 100
+        assert index._count < 300  # tombstones compacted away
+        top_id, score = index.search(embeddings[250], k=1)[0]
+        assert top_id == "t250"
+        assert score == pytest.approx(1.0, abs=1e-5)
+
+    def test_update_replaces_embedding(self):
+        """Re-adding an ID replaces its embedding without growing the index."""
+        index = EmbeddingIndex(embedding_dim=4)
+        index.add("a", np.array([1.0, 0.0, 0.0, 0.0]))
+        index.add("b", np.array([0.0, 1.0, 0.0, 0.0]))
+        index.add("a", np.array([0.0, 0.0, 1.0, 0.0]))
+
+        assert index.size == 2
+        results = index.search(np.array([0.0, 0.0, 1.0, 0.0]), k=5)
+        assert [r[0] for r in results] == ["a", "b"]
+
+    def test_ivf_backend_recall(self):
+        """IVF search finds the exact neighbors on clustered data."""
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(50, 32))
+        data = centers[rng.integers(0, 50, 5000)] + 0.2 * rng.normal(size=(5000, 32))
+        ids = [f"t{i}" for i in range(5000)]
+
+        exact = EmbeddingIndex(embedding_dim=32)
+        ivf = EmbeddingIndex(embedding_dim=32, backend="ivf", n_probe=8)
+        exact.add_batch(ids, data)
+        ivf.add_batch(ids, data)
+
+        recalls = []
+        for query in data[rng.integers(0, 5000, 20)]:
+            truth = {tid for tid, _ in exact.search(query, k=10)}
+            found = {tid for tid, _ in ivf.search(query, k=10)}
+            recalls.append(len(truth & found) / 10)
+
+        assert ivf._centroids is not None
+        assert np.mean(recalls) >= 0.9
+
+        # Rows added after training are searchable
+        ivf.add("late", data[0])
+        assert "late" in {tid for tid, _ in ivf.search(data[0], k=2)}
+
+    def test_unknown_backend_rejected(self):
+        """Unsupported backend names fail fast."""
+        with pytest.raises(ValueError):
+            EmbeddingIndex(embedding_dim=4, backend="hnsw")
+
+    def test_search_by_id_excludes_self(self):
+        """Stored vectors query the index directly."""
+        index = EmbeddingIndex(embedding_dim=3)
+        index.add("a", np.array([1.0, 0.0, 0.0]))
+        index.add("b", np.array([0.9, 0.1, 0.0]))
+        index.add("c", np.array([0.0, 1.0, 0.0]))
+
+        results = index.search_by_id("a", k=2)
+        assert [tensor_id for tensor_id, _ in results] == ["b", "c"]
+        assert index.search_by_id("missing") is None
+        assert "a" in index and "missing" not in index
+
+    def test_search_many_matches_search(self):
+        """Batched search returns the same hits as per-query search."""
+        rng = np.random.default_rng(3)
+        index = EmbeddingIndex(embedding_dim=16)
+        index.add_batch([f"t{i}" for i in range(200)], rng.standard_normal((200, 16)))
+        for i in range(0, 200, 3):
+            index.remove(f"t{i}")
+
+        queries = rng.standard_normal((7, 16))
+        batched = index.search_many(queries, k=5)
+
+        assert len(batched) == 7
+        for query, hits in zip(queries, batched):
+            expected = index.search(query, k=5)
+            assert [h[0] for h in hits] == [e[0] for e in expected]
+            assert [h[1] for h in hits] == pytest.approx([e[1] for e in expected], abs=1e-5)
+
+    def test_search_many_empty_index(self):
+        """Every query gets an empty list when nothing is indexed."""
+        assert EmbeddingIndex(embedding_dim=4).search_many(np.ones((2, 4))) == [[], []]
+
 
 # ============================================================================
 # Test TensorComposer
@@ -383,6 +475,36 @@ class TestTensorRAGSearch:
         # Should either return empty or all results
         assert isinstance(results, list)
 
+    def test_search_query_count_is_constant(self, tensor_rag):
+        """Candidates are hydrated in one query regardless of hit count."""
+        statements = []
+        conn = tensor_rag.tensor_db.pool.connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            results = tensor_rag.search("person", n_results=4, min_maturity=0.93)
+        finally:
+            conn.set_trace_callback(None)
+
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+        assert {r.tensor_id for r in results} == {
+            "victorian_detective_001", "modern_ceo_001", "victorian_scientist_001"
+        }
+        assert all(r.tensor_record.category for r in results)
+
+    def test_search_filters_by_permission_in_bulk(self, populated_db):
+        """Only tensors readable by the user are returned."""
+        from access.permissions import PermissionEnforcer
+
+        enforcer = PermissionEnforcer(str(populated_db.db_path), pool=populated_db.pool)
+        enforcer.create_default_permission("victorian_detective_001", "alice")
+        enforcer.create_default_permission("modern_ceo_001", "bob")
+        rag = TensorRAG(tensor_db=populated_db, permission_enforcer=enforcer)
+
+        results = rag.search("person", user_id="alice")
+
+        assert [r.tensor_id for r in results] == ["victorian_detective_001"]
+
 
 class TestTensorRAGComposition:
     """Tests for TensorRAG composition functionality."""
@@ -605,3 +727,170 @@ class TestPipelineIntegration:
             new_results = tensor_rag.search("Victorian detective expert", n_results=5)
             tensor_ids = [r.tensor_id for r in new_results]
             assert tensor_id in tensor_ids
+
+
+# ============================================================================
+# Test Incremental Index Build
+# ============================================================================
+
+class _FakeEmbedder:
+    """Deterministic stand-in for SentenceTransformer that records encode() calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        batch = [texts] if isinstance(texts, str) else list(texts)
+        self.calls.append(len(batch))
+        vectors = np.stack([
+            np.random.default_rng(abs(hash(text)) % (2 ** 32)).standard_normal(384)
+            for text in batch
+        ]).astype(np.float32)
+        return vectors[0] if isinstance(texts, str) else vectors
+
+
+class TestIncrementalIndexBuild:
+    """Tests for snapshot + watermark index builds."""
+
+    @pytest.fixture
+    def embedder(self):
+        from unittest.mock import PropertyMock, patch
+
+        fake = _FakeEmbedder()
+        with patch.object(TensorRAG, "embedder", new_callable=PropertyMock, return_value=fake):
+            yield fake
+
+    def _versions(self, db, tensor_id):
+        return len(db.get_version_history(tensor_id))
+
+    def test_cold_build_batches_and_caches_without_versioning(self, populated_db, embedder):
+        rag = TensorRAG(tensor_db=populated_db, embed_batch_size=64)
+
+        assert rag.index_size == 4
+        assert embedder.calls == [4]  # one batched encode() for all records
+        for record in populated_db.list_tensors():
+            assert record.embedding_blob is not None
+            assert record.version == 1
+            assert self._versions(populated_db, record.tensor_id) == 1
+
+        # Cached blobs are reused on the next cold build
+        TensorRAG(tensor_db=populated_db)
+        assert embedder.calls == [4]
+
+    def test_restart_only_indexes_changed_records(self, populated_db, sample_tensors,
+                                                  embedder, tmp_path):
+        index_path = tmp_path / "rag_index"
+        TensorRAG(tensor_db=populated_db, index_path=index_path)
+        assert (tmp_path / "rag_index.npz").exists()
+
+        # Restart with no changes reads nothing new and embeds nothing
+        reads = []
+        original = populated_db.list_index_entries
+
+        def spy(changed_after=None):
+            rows = original(changed_after=changed_after)
+            reads.append((changed_after, len(rows)))
+            return rows
+
+        populated_db.list_index_entries = spy
+        restarted = TensorRAG(tensor_db=populated_db, index_path=index_path)
+        assert restarted.index_size == 4
+        assert reads[0][0] is not None and reads[0][1] == 0
+        assert embedder.calls == [4]
+
+        # New and deleted records are picked up incrementally
+        sample = sample_tensors[0]
+        populated_db.save_tensor(TensorRecord(
+            tensor_id="new_knight", entity_id="knight", world_id="camelot",
+            tensor_blob=serialize_tensor(sample["tensor"]),
+            description="Medieval knight errant",
+        ))
+        populated_db.delete_tensor("modern_ceo_001")
+
+        synced = TensorRAG(tensor_db=populated_db, index_path=index_path)
+        assert sorted(synced.index.ids) == sorted(
+            ["victorian_detective_001", "renaissance_artist_001",
+             "victorian_scientist_001", "new_knight"]
+        )
+        assert embedder.calls == [4, 1]
+
+        again = TensorRAG(tensor_db=populated_db, index_path=index_path)
+        assert again.index_size == 4
+        assert embedder.calls == [4, 1]
+
+    def test_snapshot_for_other_model_is_ignored(self, populated_db, embedder, tmp_path):
+        index_path = tmp_path / "rag_index"
+        TensorRAG(tensor_db=populated_db, index_path=index_path)
+
+        meta_path = tmp_path / "rag_index.json"
+        meta = meta_path.read_text().replace("all-MiniLM-L6-v2", "other-model")
+        meta_path.write_text(meta)
+
+        rag = TensorRAG(tensor_db=populated_db, index_path=index_path)
+        assert rag.index_size == 4
+        assert "all-MiniLM-L6-v2" in meta_path.read_text()
+
+    def test_sync_index_picks_up_external_writes(self, populated_db, sample_tensors, embedder):
+        rag = TensorRAG(tensor_db=populated_db)
+        sample = sample_tensors[1]
+        populated_db.save_tensor(TensorRecord(
+            tensor_id="external", entity_id="x", tensor_blob=serialize_tensor(sample["tensor"]),
+            description="Written by another process",
+        ))
+
+        rag.sync_index()
+        assert "external" in rag.index.ids
+        assert rag.index_size == 5
+
+    def test_sync_index_picks_up_writes_committed_out_of_order(self, populated_db, sample_tensors,
+                                                              embedder):
+        rag = TensorRAG(tensor_db=populated_db)
+        sample = sample_tensors[1]
+        populated_db.save_tensor(TensorRecord(
+            tensor_id="slow_writer", entity_id="x", tensor_blob=serialize_tensor(sample["tensor"]),
+            description="Timestamped before the index was built, committed after",
+        ))
+        # A writer takes updated_at before its transaction starts
+        with populated_db._transaction() as conn:
+            conn.execute(
+                "UPDATE tensor_records SET updated_at = '2000-01-01T00:00:00' "
+                "WHERE tensor_id = 'slow_writer'"
+            )
+
+        rag.sync_index()
+        assert "slow_writer" in rag.index.ids
+
+    def test_search_by_id_uses_stored_vector(self, populated_db, embedder):
+        rag = TensorRAG(tensor_db=populated_db)
+        calls_after_build = list(embedder.calls)
+
+        results = rag.search_by_id("victorian_detective_001", n_results=2)
+
+        assert embedder.calls == calls_after_build  # no model inference
+        assert len(results) == 2
+        assert "victorian_detective_001" not in [r.tensor_id for r in results]
+        assert rag.search_by_id("missing") == []
+
+    def test_search_by_id_filters_permissions_in_bulk(self, populated_db, embedder):
+        from unittest.mock import Mock
+
+        enforcer = Mock()
+        enforcer.filter_readable.side_effect = lambda user, ids: {
+            i for i in ids if i != "renaissance_artist_001"
+        }
+        rag = TensorRAG(tensor_db=populated_db, permission_enforcer=enforcer)
+
+        results = rag.search_by_id("victorian_detective_001", n_results=5, user_id="alice")
+
+        assert enforcer.filter_readable.call_count == 1
+        assert enforcer.can_read.call_count == 0
+        assert {r.tensor_id for r in results} == {"modern_ceo_001", "victorian_scientist_001"}
+
+    def test_search_many_batches_encoding(self, populated_db, embedder):
+        rag = TensorRAG(tensor_db=populated_db)
+        embedder.calls.clear()
+
+        results = rag.search_many(["detective", "artist", "CEO"], n_results=2)
+
+        assert embedder.calls == [3]
+        assert [len(r) for r in results] == [2, 2, 2]
@@ -174,6 +174,35 @@ class TestWorldManager:
         assert world1.db_path == world2.db_path
         assert Path(world1.db_path).exists()
 
+    def test_delete_shared_world_removes_derived_rows(self, manager):
+        """Deleting a shared-DB world also removes its knowledge, participant and snapshot rows"""
+        import sqlite3
+
+        world = manager.create_world(world_id="shared_a", isolation_mode=IsolationMode.SHARED_DB_PARTITIONED)
+        manager.create_world(world_id="shared_b", isolation_mode=IsolationMode.SHARED_DB_PARTITIONED)
+        tables = ["knowledge_state", "dialog_participant", "entity_snapshot"]
+        with sqlite3.connect(world.db_path) as conn:
+            for world_id in ("shared_a", "shared_b"):
+                conn.execute(
+                    "INSERT INTO knowledge_state (entity_id, information, valid_from, recorded_at, world_id) "
+                    "VALUES ('e', 'fact', '1789-04-30', '2026-01-01', ?)", (world_id,)
+                )
+                conn.execute(
+                    "INSERT INTO dialog_participant (dialog_id, entity_id, world_id) VALUES ('d', 'e', ?)",
+                    (world_id,)
+                )
+                conn.execute(
+                    "INSERT INTO entity_snapshot (entity_id, timepoint_id, sequence, is_keyframe, state, "
+                    "recorded_at, world_id) VALUES ('e', ?, 0, 1, '{}', '2026-01-01', ?)", (world_id, world_id)
+                )
+
+        manager.delete_world("shared_a", confirm=True)
+
+        with sqlite3.connect(world.db_path) as conn:
+            for table in tables:
+                rows = conn.execute(f"SELECT world_id FROM {table}").fetchall()
+                assert rows == [("shared_b",)], table
+
     def test_get_world_engine(self, manager):
         """Test getting SQLAlchemy engine for a world"""
         manager.create_world(world_id="test_engine")
@@ -5,6 +5,7 @@ Phase 2: Parallel Training Infrastructure
 
 This package provides:
 - ParallelTensorTrainer: Asyncio-based parallel tensor training
+- Vectorized batch engine: matrix-based training with optional process sharding
 - JobQueue: SQLite-backed job queue with atomic locking
 - Training utilities for maturity convergence
 - LangGraph integration for workflow-based training
@@ -15,6 +16,9 @@ Usage:
     trainer = ParallelTensorTrainer(tensor_db, max_workers=4)
     results = await trainer.train_batch(tensors, target_maturity=0.95)
 
+    # Vectorized path: one (N, 20) matrix, one batch read and write
+    results = trainer.train_batch_vectorized(tensors, target_maturity=0.95)
+
     # LangGraph workflow integration
     from training import create_parallel_training_node
     training_node = create_parallel_training_node(tensor_db)
@@ -23,6 +27,11 @@ Usage:
 
 from training.job_queue import JobQueue, TrainingJob, JobStatus
 from training.parallel_trainer import ParallelTensorTrainer, TrainingResult
+from training.batch_engine import (
+    MatrixTrainingResult,
+    train_matrix,
+    train_matrix_sharded,
+)
 from training.training_node import (
     create_parallel_training_node,
     extend_workflow_with_training,
@@ -38,6 +47,10 @@ __all__ = [
     # Parallel Trainer
     "ParallelTensorTrainer",
     "TrainingResult",
+    # Vectorized Batch Engine
+    "MatrixTrainingResult",
+    "train_matrix",
+    "train_matrix_sharded",
     # LangGraph Integration
     "create_parallel_training_node",
     "extend_workflow_with_training",
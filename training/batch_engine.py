@@ -0,0 +1,152 @@
+"""
+Vectorized batch training engine for tensor maturity convergence.
+
+Runs the same noise-and-clip training simulation as
+ParallelTensorTrainer._training_step, but over an (N, D) matrix holding
+N flattened tensors. Every maturity cycle is a handful of array
+operations; rows stop updating once they reach the target maturity or
+the cycle limit, tracked through a per-row convergence mask.
+
+Large batches can be sharded across a ProcessPoolExecutor, since the
+work is CPU-bound and asyncio workers give no real parallelism for it.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+# Per-cycle maturity gain factor and noise scale, matching ParallelTensorTrainer
+MATURITY_GAIN = 0.05
+NOISE_SCALE = 0.01
+
+
+@dataclass
+class MatrixTrainingResult:
+    """
+    Result of training a tensor matrix.
+
+    Attributes:
+        matrix: (N, D) trained tensor values, clipped to [0, 1]
+        maturity: (N,) final maturity per row
+        cycles: (N,) training cycles performed per row
+    """
+    matrix: np.ndarray
+    maturity: np.ndarray
+    cycles: np.ndarray
+
+
+def train_matrix(
+    matrix: np.ndarray,
+    maturity: np.ndarray,
+    target_maturity: float = 0.95,
+    max_cycles: int = 1000,
+    noise_scale: float = NOISE_SCALE,
+    seed: Optional[int] = None,
+    progress_callback: Optional[Callable[[np.ndarray, np.ndarray, int], None]] = None,
+) -> MatrixTrainingResult:
+    """
+    Train every row of a tensor matrix to target maturity.
+
+    Args:
+        matrix: (N, D) tensor values, one flattened tensor per row
+        maturity: (N,) starting maturity per row
+        target_maturity: Target maturity level (0.0-1.0)
+        max_cycles: Maximum training cycles per row
+        noise_scale: Standard deviation of the per-cycle perturbation
+        seed: Optional seed for reproducible noise
+        progress_callback: Optional callback(row_indices, maturity, cycle),
+            called every 10 cycles with the rows still training
+
+    Returns:
+        MatrixTrainingResult with updated values, maturity and cycle counts
+    """
+    values = np.array(matrix, dtype=np.float64, copy=True)
+    maturity = np.array(maturity, dtype=np.float64, copy=True)
+    cycles = np.zeros(len(values), dtype=np.int64)
+    rng = np.random.default_rng(seed)
+
+    active = maturity < target_maturity
+    cycle = 0
+    while cycle < max_cycles and active.any():
+        rows = np.flatnonzero(active)
+
+        noise = rng.normal(0.0, noise_scale, (len(rows), values.shape[1]))
+        values[rows] = np.clip(values[rows] + noise, 0.0, 1.0)
+
+        # Maturity increases with diminishing returns
+        maturity[rows] = np.minimum(
+            1.0, maturity[rows] + MATURITY_GAIN * (1.0 - maturity[rows])
+        )
+        cycles[rows] += 1
+        cycle += 1
+
+        if progress_callback and cycle % 10 == 0:
+            progress_callback(rows, maturity[rows], cycle)
+
+        active[rows] = maturity[rows] < target_maturity
+
+    return MatrixTrainingResult(matrix=values, maturity=maturity, cycles=cycles)
+
+
+def _train_shard(args: Tuple[np.ndarray, np.ndarray, float, int, float, int]) -> MatrixTrainingResult:
+    """Process-pool entry point; must stay importable at module level."""
+    matrix, maturity, target_maturity, max_cycles, noise_scale, seed = args
+    return train_matrix(matrix, maturity, target_maturity, max_cycles, noise_scale, seed)
+
+
+def train_matrix_sharded(
+    matrix: np.ndarray,
+    maturity: np.ndarray,
+    target_maturity: float = 0.95,
+    max_cycles: int = 1000,
+    noise_scale: float = NOISE_SCALE,
+    seed: Optional[int] = None,
+    shard_size: int = 10000,
+    max_processes: Optional[int] = None,
+) -> MatrixTrainingResult:
+    """
+    Train a tensor matrix in row shards across a ProcessPoolExecutor.
+
+    Each shard draws noise from an independent child seed, so results
+    are reproducible for a given seed and shard size. Batches that fit
+    in a single shard are trained in-process.
+
+    Args:
+        matrix: (N, D) tensor values, one flattened tensor per row
+        maturity: (N,) starting maturity per row
+        target_maturity: Target maturity level (0.0-1.0)
+        max_cycles: Maximum training cycles per row
+        noise_scale: Standard deviation of the per-cycle perturbation
+        seed: Optional seed for reproducible noise
+        shard_size: Rows per process-pool task
+        max_processes: Process pool size (defaults to CPU count)
+
+    Returns:
+        MatrixTrainingResult covering all rows in their original order
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+
+    bounds = list(range(0, len(matrix), shard_size))
+    seeds = np.random.SeedSequence(seed).generate_state(max(len(bounds), 1))
+
+    if len(bounds) <= 1:
+        return train_matrix(matrix, maturity, target_maturity, max_cycles,
+                            noise_scale, int(seeds[0]))
+
+    tasks = [
+        (matrix[start:start + shard_size], maturity[start:start + shard_size],
+         target_maturity, max_cycles, noise_scale, int(shard_seed))
+        for start, shard_seed in zip(bounds, seeds)
+    ]
+    with ProcessPoolExecutor(max_workers=max_processes) as executor:
+        shards: List[MatrixTrainingResult] = list(executor.map(_train_shard, tasks))
+
+    return MatrixTrainingResult(
+        matrix=np.concatenate([s.matrix for s in shards]),
+        maturity=np.concatenate([s.maturity for s in shards]),
+        cycles=np.concatenate([s.cycles for s in shards]),
+    )
@@ -85,7 +85,7 @@ class JobQueue:
         Initialize job queue.
 
         Args:
-            tensor_db: TensorDatabase instance (provides SQLite connection)
+            tensor_db: TensorDatabase instance (provides the connection pool)
         """
         self.tensor_db = tensor_db
         self._ensure_schema()
@@ -94,8 +94,7 @@ class JobQueue:
         """Ensure training_jobs table exists with correct schema."""
         # TensorDatabase already creates training_jobs table
         # But we add any missing columns or indexes here
-        conn = sqlite3.connect(str(self.tensor_db.db_path))
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
 
             # Check if table exists
@@ -126,8 +125,6 @@ class JobQueue:
                 cursor.execute(
                     "CREATE INDEX IF NOT EXISTS idx_jobs_tensor ON training_jobs(tensor_id)"
                 )
-
-                conn.commit()
             else:
                 # Table exists - check for missing columns and add them
                 cursor.execute("PRAGMA table_info(training_jobs)")
@@ -138,25 +135,20 @@ class JobQueue:
                     cursor.execute(
                         "ALTER TABLE training_jobs ADD COLUMN cycles_completed INTEGER DEFAULT 0"
                     )
-                    conn.commit()
 
                 # Add created_at if missing
                 if "created_at" not in columns:
                     cursor.execute(
                         "ALTER TABLE training_jobs ADD COLUMN created_at TEXT"
                     )
-                    conn.commit()
-        finally:
-            conn.close()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a new SQLite connection."""
-        conn = sqlite3.connect(str(self.tensor_db.db_path))
-        # Enable WAL mode for better concurrency
-        conn.execute("PRAGMA journal_mode=WAL")
-        # Set busy timeout for lock contention
-        conn.execute("PRAGMA busy_timeout=5000")
-        return conn
+        """Get this thread's pooled connection (WAL mode, busy timeout set)."""
+        return self.tensor_db.pool.connection()
+
+    def _transaction(self, immediate: bool = False):
+        """Context manager for atomic transactions on the shared pool."""
+        return self.tensor_db.pool.transaction(immediate=immediate)
 
     def create_job(
         self,
@@ -180,8 +172,7 @@ class JobQueue:
             created_at=datetime.now(),
         )
 
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -203,9 +194,6 @@ class JobQueue:
                     job.created_at.isoformat(),
                 )
             )
-            conn.commit()
-        finally:
-            conn.close()
 
         return job
 
@@ -219,8 +207,7 @@ class JobQueue:
         Returns:
             TrainingJob if found, None otherwise
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -236,8 +223,6 @@ class JobQueue:
             if row:
                 return TrainingJob.from_row(row)
             return None
-        finally:
-            conn.close()
 
     def list_pending_jobs(self) -> List[TrainingJob]:
         """
@@ -246,8 +231,7 @@ class JobQueue:
         Returns:
             List of pending TrainingJob objects
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -261,8 +245,6 @@ class JobQueue:
             )
             rows = cursor.fetchall()
             return [TrainingJob.from_row(row) for row in rows]
-        finally:
-            conn.close()
 
     def acquire_job(self, job_id: str, worker_id: str) -> bool:
         """
@@ -277,8 +259,7 @@ class JobQueue:
         Returns:
             True if acquisition succeeded, False if job was already taken
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
 
             # Atomic update - only updates if status is still 'pending'
@@ -300,12 +281,9 @@ class JobQueue:
                     JobStatus.PENDING.value,
                 )
             )
-            conn.commit()
 
             # Check if we actually updated (rowcount = 1 means success)
             return cursor.rowcount == 1
-        finally:
-            conn.close()
 
     def acquire_next_pending(self, worker_id: str) -> Optional[TrainingJob]:
         """
@@ -317,14 +295,9 @@ class JobQueue:
         Returns:
             Acquired TrainingJob if available, None otherwise
         """
-        conn = self._get_connection()
-        try:
+        # Take the write lock up front so two workers cannot pick the same job
+        with self._transaction(immediate=True) as conn:
             cursor = conn.cursor()
-
-            # First, find and lock a pending job atomically
-            # Using a transaction with immediate locking
-            conn.execute("BEGIN IMMEDIATE")
-
             cursor.execute(
                 """
                 SELECT job_id
@@ -338,7 +311,6 @@ class JobQueue:
             row = cursor.fetchone()
 
             if not row:
-                conn.rollback()
                 return None
 
             job_id = row[0]
@@ -362,14 +334,10 @@ class JobQueue:
                 )
             )
 
-            if cursor.rowcount == 1:
-                conn.commit()
-                return self.get_job(job_id)
-            else:
-                conn.rollback()
+            if cursor.rowcount != 1:
                 return None
-        finally:
-            conn.close()
+
+        return self.get_job(job_id)
 
     def complete_job(self, job_id: str, cycles_completed: int = 0) -> None:
         """
@@ -379,8 +347,7 @@ class JobQueue:
             job_id: Job ID to complete
             cycles_completed: Number of training cycles completed
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -397,9 +364,6 @@ class JobQueue:
                     job_id,
                 )
             )
-            conn.commit()
-        finally:
-            conn.close()
 
     def fail_job(self, job_id: str, error_message: str) -> None:
         """
@@ -409,8 +373,7 @@ class JobQueue:
             job_id: Job ID to mark as failed
             error_message: Error description
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -427,9 +390,6 @@ class JobQueue:
                     job_id,
                 )
             )
-            conn.commit()
-        finally:
-            conn.close()
 
     def release_job(self, job_id: str) -> None:
         """
@@ -440,8 +400,7 @@ class JobQueue:
         Args:
             job_id: Job ID to release
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -453,9 +412,6 @@ class JobQueue:
                 """,
                 (JobStatus.PENDING.value, job_id)
             )
-            conn.commit()
-        finally:
-            conn.close()
 
     def list_running_jobs(self) -> List[TrainingJob]:
         """
@@ -464,8 +420,7 @@ class JobQueue:
         Returns:
             List of running TrainingJob objects
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -479,8 +434,6 @@ class JobQueue:
             )
             rows = cursor.fetchall()
             return [TrainingJob.from_row(row) for row in rows]
-        finally:
-            conn.close()
 
     def get_jobs_for_tensor(self, tensor_id: str) -> List[TrainingJob]:
         """
@@ -492,8 +445,7 @@ class JobQueue:
         Returns:
             List of TrainingJob objects for the tensor
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -507,8 +459,6 @@ class JobQueue:
             )
             rows = cursor.fetchall()
             return [TrainingJob.from_row(row) for row in rows]
-        finally:
-            conn.close()
 
     def cleanup_stale_jobs(self, timeout_seconds: int = 300) -> int:
         """
@@ -520,8 +470,7 @@ class JobQueue:
         Returns:
             Number of jobs released
         """
-        conn = self._get_connection()
-        try:
+        with self._transaction() as conn:
             cursor = conn.cursor()
 
             # Find and release stale running jobs
@@ -538,8 +487,5 @@ class JobQueue:
                 """,
                 (JobStatus.PENDING.value, JobStatus.RUNNING.value, cutoff)
             )
-            conn.commit()
 
             return cursor.rowcount
-        finally:
-            conn.close()
@@ -9,8 +9,9 @@ Phase 2: Parallel Training Infrastructure
 
 import asyncio
 import uuid
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 import numpy as np
@@ -19,6 +20,7 @@ from tensor_persistence import TensorDatabase, TensorRecord
 from tensor_serialization import serialize_tensor, deserialize_tensor
 from schemas import TTMTensor
 from training.job_queue import JobQueue, TrainingJob, JobStatus
+from training.batch_engine import train_matrix, train_matrix_sharded
 
 
 @dataclass
@@ -310,6 +312,124 @@ class ParallelTensorTrainer:
 
         return TTMTensor.from_arrays(context, biology, behavior)
 
+    def train_batch_vectorized(
+        self,
+        tensor_ids: List[str],
+        target_maturity: float = 0.95,
+        max_cycles: int = 1000,
+        seed: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        max_processes: Optional[int] = None
+    ) -> Dict[str, TrainingResult]:
+        """
+        Train a batch of tensors as a single matrix.
+
+        Loads all tensors with one get_tensors_batch call, stacks them into
+        an (N, 20) matrix, runs every maturity cycle as array operations with
+        per-row convergence masks, and writes the results back with one
+        save_tensors_batch call. Tensors are trained directly rather than
+        through the JobQueue, so callers must not train the same tensors
+        concurrently from another trainer.
+
+        Args:
+            tensor_ids: List of tensor IDs to train
+            target_maturity: Target maturity level (0.0-1.0)
+            max_cycles: Maximum training cycles per tensor
+            seed: Optional seed for reproducible noise
+            shard_size: If set, split the matrix into shards of this many rows
+                and train them across a ProcessPoolExecutor
+            max_processes: Process pool size when sharding
+
+        Returns:
+            Dict mapping tensor_id to TrainingResult
+        """
+        start_time = datetime.now()
+        results: Dict[str, TrainingResult] = {}
+        # A repeated ID would otherwise be trained and saved twice
+        tensor_ids = list(dict.fromkeys(tensor_ids))
+        records = {r.tensor_id: r for r in self.tensor_db.get_tensors_batch(tensor_ids)}
+
+        # Group by vector lengths so each group stacks into one matrix
+        groups: Dict[Tuple[int, int, int], List[Tuple[TensorRecord, np.ndarray]]] = defaultdict(list)
+        for tensor_id in tensor_ids:
+            record = records.get(tensor_id)
+            if record is None:
+                results[tensor_id] = TrainingResult(
+                    tensor_id=tensor_id,
+                    success=False,
+                    error="Tensor not found"
+                )
+                continue
+            try:
+                arrays = deserialize_tensor(record.tensor_blob).to_arrays()
+            except Exception as e:
+                results[tensor_id] = TrainingResult(
+                    tensor_id=tensor_id,
+                    success=False,
+                    error=f"Failed to deserialize tensor: {e}"
+                )
+                continue
+            shape = tuple(len(a) for a in arrays)
+            groups[shape].append((record, np.concatenate(arrays)))
+
+        updated: List[TensorRecord] = []
+        trained: List[Tuple[TensorRecord, float, int]] = []
+        for (n_context, n_biology, _), members in groups.items():
+            matrix = np.stack([row for _, row in members])
+            maturity = np.array([record.maturity for record, _ in members])
+
+            if shard_size:
+                outcome = train_matrix_sharded(
+                    matrix, maturity, target_maturity, max_cycles,
+                    seed=seed, shard_size=shard_size, max_processes=max_processes
+                )
+            else:
+                outcome = train_matrix(
+                    matrix, maturity, target_maturity, max_cycles, seed=seed,
+                    progress_callback=self._matrix_progress([r for r, _ in members])
+                )
+
+            split = (n_context, n_context + n_biology)
+            for i, (record, _) in enumerate(members):
+                context, biology, behavior = np.split(outcome.matrix[i], split)
+                cycles = int(outcome.cycles[i])
+                record.tensor_blob = serialize_tensor(
+                    TTMTensor.from_arrays(context, biology, behavior)
+                )
+                record.maturity = float(outcome.maturity[i])
+                record.training_cycles += cycles
+                updated.append(record)
+                trained.append((record, record.maturity, cycles))
+
+        if updated:
+            self.tensor_db.save_tensors_batch(updated)
+
+        duration = (datetime.now() - start_time).total_seconds()
+        for record, maturity, cycles in trained:
+            results[record.tensor_id] = TrainingResult(
+                tensor_id=record.tensor_id,
+                success=True,
+                final_maturity=maturity,
+                cycles_completed=cycles,
+                duration_seconds=duration
+            )
+
+        return results
+
+    def _matrix_progress(
+        self,
+        records: List[TensorRecord]
+    ) -> Optional[Callable[[np.ndarray, np.ndarray, int], None]]:
+        """Adapt progress_callback to the per-row callback used by train_matrix."""
+        if self.progress_callback is None:
+            return None
+
+        def report(rows: np.ndarray, maturity: np.ndarray, cycle: int) -> None:
+            for row, row_maturity in zip(rows, maturity):
+                self.progress_callback(records[row].tensor_id, float(row_maturity), cycle)
+
+        return report
+
     def get_active_jobs(self) -> List[TrainingJob]:
         """
         Get list of currently running training jobs.
@@ -225,15 +225,17 @@ def validate_temporal_causality(entity: Entity, context: Dict) -> Dict:
         return {"valid": True, "message": "Insufficient context for temporal causality validation"}
 
     # Check each knowledge item for temporal validity
-    from temporal_chain import validate_temporal_reference  # Import locally to avoid circular import
+    from temporal_chain import validate_temporal_references  # Import locally to avoid circular import
 
     knowledge_state = entity.entity_metadata.get("knowledge_state", [])
-    invalid_items = []
-
-    for knowledge_item in knowledge_state:
-        validation = validate_temporal_reference(entity.entity_id, knowledge_item, timepoint_id, store)
-        if not validation["valid"]:
-            invalid_items.append(knowledge_item)
+    if not knowledge_state:
+        return {"valid": True, "message": "Temporal causality satisfied"}
+
+    # One causal-chain query and one exposure query for all items
+    validations = validate_temporal_references(entity.entity_id, knowledge_state, timepoint_id, store)
+    invalid_items = [
+        item for item, validation in zip(knowledge_state, validations) if not validation["valid"]
+    ]
 
     if invalid_items:
         return {
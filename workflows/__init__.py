@@ -17,6 +17,7 @@ Submodules:
 - animistic: Animistic entity extension (M16)
 - temporal_agent: Modal temporal causality (M7, M17)
 - portal_strategy: PORTAL mode backward simulation
+- beam_frontier: Beam-search frontier shared by PORTAL and BRANCHING
 """
 
 # Entity Training (M2)
@@ -49,6 +50,7 @@ from workflows.dialog_synthesis import (
     extract_knowledge_references,
     create_exposure_event,
     synthesize_dialog,
+    merge_emotional_state_updates,
 )
 
 # Relationship Analysis (M13)
@@ -94,6 +96,12 @@ from workflows.temporal_agent import (
     TemporalAgent,
 )
 
+# Beam Frontier (shared by PORTAL and BRANCHING)
+from workflows.beam_frontier import (
+    BeamFrontier,
+    state_fingerprint,
+)
+
 # Portal Strategy
 from workflows.portal_strategy import (
     PortalStrategy,
@@ -139,6 +147,7 @@ __all__ = [
     "extract_knowledge_references",
     "create_exposure_event",
     "synthesize_dialog",
+    "merge_emotional_state_updates",
     # Relationship Analysis
     "analyze_relationship_evolution",
     "detect_contradictions",
@@ -167,6 +176,9 @@ __all__ = [
     "generate_animistic_entities_for_scene",
     # Temporal Agent
     "TemporalAgent",
+    # Beam Frontier
+    "BeamFrontier",
+    "state_fingerprint",
     # Portal Strategy
     "PortalStrategy",
     # Branching Strategy
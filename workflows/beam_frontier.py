@@ -0,0 +1,129 @@
+"""
+Beam-search frontier shared by PORTAL and BRANCHING exploration.
+
+Both strategies expand every state in their frontier with an LLM call per
+step. Pushing each step's scored candidates through a BeamFrontier keeps
+only the best beam_width of them (by plausibility_score) before the next
+step is expanded, so LLM calls per step are bounded by the beam width
+rather than by branching factor x frontier size.
+
+Near-identical candidates (same time and same description after
+normalizing case, punctuation and whitespace) are collapsed to the
+highest-scoring one.
+"""
+
+import hashlib
+import heapq
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def state_fingerprint(state: Any) -> str:
+    """
+    Cheap content hash of a PortalState/BranchingState.
+
+    Args:
+        state: Object with year, month and description attributes
+
+    Returns:
+        Hex digest identifying near-identical states
+    """
+    text = _NON_WORD.sub(" ", (state.description or "").lower()).strip()
+    key = f"{state.year}-{state.month}|{text}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def resolve_beam_width(config: Any) -> int:
+    """Beam width from config, defaulting to the old prune target (path_count * 2)."""
+    beam_width = getattr(config, "beam_width", None)
+    if beam_width is None:
+        beam_width = getattr(config, "path_count", 4) * 2
+    return max(1, int(beam_width))
+
+
+class BeamFrontier:
+    """
+    Bounded priority queue of candidate states keyed by plausibility_score.
+
+    A min-heap holds the current beam, so each push is O(log beam_width) and a
+    candidate scoring below the weakest kept state is rejected without being
+    stored. Ties keep the earlier-pushed state, so results are deterministic
+    for a deterministic push order.
+
+    Args:
+        beam_width: Maximum number of states kept
+        dedupe: Collapse states with the same state_fingerprint
+    """
+
+    def __init__(self, beam_width: int, dedupe: bool = True):
+        if beam_width < 1:
+            raise ValueError(f"beam_width must be >= 1, got {beam_width}")
+        self.beam_width = beam_width
+        self.dedupe = dedupe
+        self.pruned = 0
+        self.duplicates = 0
+        self._seq = 0
+        # (score, -seq, key) min-heap; entries whose key no longer maps to
+        # the same seq in _entries are stale and skipped
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Tuple[float, int, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, state: Any) -> bool:
+        """
+        Offer a candidate to the beam.
+
+        Returns:
+            True if the state was kept (it may still be evicted later)
+        """
+        score = float(state.plausibility_score)
+        seq = self._seq
+        self._seq += 1
+        key = state_fingerprint(state) if self.dedupe else str(seq)
+
+        existing = self._entries.get(key)
+        if existing is not None:
+            self.duplicates += 1
+            if score <= existing[0]:
+                return False
+        elif len(self._entries) >= self.beam_width and score <= self._min_score():
+            self.pruned += 1
+            return False
+
+        self._entries[key] = (score, seq, state)
+        heapq.heappush(self._heap, (score, -seq, key))
+
+        while len(self._entries) > self.beam_width:
+            self._pop_min()
+            self.pruned += 1
+        return True
+
+    def extend(self, states: Iterable[Any]) -> int:
+        """Push several candidates; returns how many were kept."""
+        return sum(self.push(state) for state in states)
+
+    def states(self) -> List[Any]:
+        """Kept states, best first (ties in push order)."""
+        ranked = sorted(self._entries.values(), key=lambda e: (-e[0], e[1]))
+        return [state for _, _, state in ranked]
+
+    def _discard_stale(self):
+        while self._heap:
+            score, neg_seq, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == -neg_seq:
+                return
+            heapq.heappop(self._heap)
+
+    def _min_score(self) -> float:
+        self._discard_stale()
+        return self._heap[0][0]
+
+    def _pop_min(self):
+        self._discard_stale()
+        _, _, key = heapq.heappop(self._heap)
+        del self._entries[key]
@@ -20,12 +20,13 @@ from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 import numpy as np
 import uuid
 
 from schemas import Entity, Timepoint, TemporalMode, ResolutionLevel
 from generation.config_schema import TemporalConfig
+from workflows.beam_frontier import BeamFrontier, resolve_beam_width
 from llm_service.model_selector import ActionType, get_token_estimator
 import re
 import json
@@ -243,6 +244,7 @@ class BranchingStrategy:
         self.forward_steps = getattr(config, 'backward_steps', 15)  # Reuse backward_steps for forward
         self.branch_count = getattr(config, 'path_count', 4)  # Number of branches at decision points
         self.candidates_per_step = getattr(config, 'candidate_antecedents_per_step', 3)
+        self.beam_width = resolve_beam_width(config)  # Max states expanded per step
 
     def run(self) -> List[BranchingPath]:
         """Execute forward simulation with branching."""
@@ -465,36 +467,20 @@ class BranchingStrategy:
             temp_state = BranchingState(year=target_year, month=target_month, description="", entities=[], world_state={})
             print(f"  Forward step {step+1}/{self.forward_steps}: {temp_state.to_year_month_str()}")
 
-            for state in current_states:
-                # Check if this is a decision/branch point
-                is_branch_point = self._is_branch_point(state, step)
+            max_branch_workers = getattr(self.config, 'max_branch_workers', 3)
+            expansions = self._expand_frontier(
+                current_states, step, target_year, target_month, max_branch_workers
+            )
 
-                if is_branch_point:
-                    # Generate multiple divergent futures
-                    consequents = self._generate_consequents(
-                        state, target_year, target_month,
-                        count=self.candidates_per_step,
-                        is_branch_point=True
-                    )
-                    state.is_branch_point = True
-                else:
-                    # Generate single continuation
-                    consequents = self._generate_consequents(
-                        state, target_year, target_month,
-                        count=1,
-                        is_branch_point=False
-                    )
-
-                # Score consequents
+            # Score on this thread in frontier order so the random draws in
+            # _score_consequents (and seeded runs) don't depend on which
+            # expansion finished first
+            for state, consequents in expansions:
                 scored = self._score_consequents(consequents, state)
                 next_states.extend(scored[:self.candidates_per_step])
 
-            current_states = next_states
-
-            # Prune if too many paths
-            if len(current_states) > self.branch_count * 3:
-                current_states = self._prune_low_scoring_paths(current_states)
-                print(f"    Pruned to {len(current_states)} states")
+            # Keep only the beam for the next step so discarded states are never expanded
+            current_states = self._select_beam(next_states)
 
         # Convert final states to complete paths
         for final_state in current_states:
@@ -503,6 +489,73 @@ class BranchingStrategy:
 
         return paths
 
+    def _expand_frontier(
+        self,
+        states: List[BranchingState],
+        step: int,
+        target_year: int,
+        target_month: int,
+        max_workers: int
+    ) -> List[Tuple[BranchingState, List[BranchingState]]]:
+        """
+        Generate consequents for every frontier state.
+
+        Runs states concurrently when there is more than one state and more
+        than one worker. Results are returned in frontier order regardless of
+        completion order; a state that fails or exceeds
+        branch_expansion_timeout_seconds is dropped from the frontier.
+        """
+        if len(states) <= 1 or max_workers <= 1:
+            return [
+                (state, self._expand_state(state, step, target_year, target_month))
+                for state in states
+            ]
+
+        timeout = getattr(self.config, 'branch_expansion_timeout_seconds', 120)
+        print(f"    Expanding {len(states)} states in parallel ({max_workers} workers)...")
+
+        expansions = []
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(self._expand_state, state, step, target_year, target_month)
+                for state in states
+            ]
+            for state, future in zip(states, futures):
+                try:
+                    expansions.append((state, future.result(timeout=timeout)))
+                except FuturesTimeoutError:
+                    print(f"    ⚠️  State expansion timed out after {timeout}s: {state.branch_id}")
+                except Exception as e:
+                    print(f"    ⚠️  State expansion failed: {e}")
+        finally:
+            # Don't block the step on expansions that already timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return expansions
+
+    def _expand_state(
+        self,
+        state: BranchingState,
+        step: int,
+        target_year: int,
+        target_month: int
+    ) -> List[BranchingState]:
+        """Generate divergent futures at branch points, a single continuation otherwise."""
+        if self._is_branch_point(state, step):
+            state.is_branch_point = True
+            return self._generate_consequents(
+                state, target_year, target_month,
+                count=self.candidates_per_step,
+                is_branch_point=True
+            )
+
+        return self._generate_consequents(
+            state, target_year, target_month,
+            count=1,
+            is_branch_point=False
+        )
+
     def _is_branch_point(self, state: BranchingState, step: int) -> bool:
         """
         Detect if this state is a decision/branch point.
@@ -771,10 +824,14 @@ Return ONLY valid JSON matching this exact structure. All strings must be quoted
 
         return sorted(consequents, key=lambda s: s.plausibility_score, reverse=True)
 
-    def _prune_low_scoring_paths(self, states: List[BranchingState]) -> List[BranchingState]:
-        """Prune low-scoring states to manage path explosion."""
-        sorted_states = sorted(states, key=lambda s: s.plausibility_score, reverse=True)
-        return sorted_states[:self.branch_count * 2]
+    def _select_beam(self, states: List[BranchingState]) -> List[BranchingState]:
+        """Keep the top beam_width distinct states to manage path explosion."""
+        frontier = BeamFrontier(self.beam_width, dedupe=getattr(self.config, 'beam_dedupe', True))
+        frontier.extend(states)
+        if frontier.pruned or frontier.duplicates:
+            print(f"    Beam kept {len(frontier)} states "
+                  f"(pruned {frontier.pruned}, merged {frontier.duplicates} duplicates)")
+        return frontier.states()
 
     def _reconstruct_path(self, leaf_state: BranchingState) -> BranchingPath:
         """Reconstruct complete path from leaf state to origin."""
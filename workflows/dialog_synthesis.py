@@ -268,6 +268,74 @@ def _persist_emotional_state_updates(
     return updates_made
 
 
+# Cognitive fields written by _persist_emotional_state_updates, with their
+# clamping ranges (None = unbounded)
+_EMOTIONAL_FIELD_RANGES = {
+    "emotional_valence": (-1.0, 1.0),
+    "emotional_arousal": (0.0, 1.0),
+    "energy_budget": (0.0, None),
+}
+
+
+def merge_emotional_state_updates(
+    entities: List[Entity],
+    baselines: Dict[str, Dict],
+    updates: List[Dict[str, Dict]],
+    store: Optional['GraphStore'] = None
+) -> int:
+    """
+    Fold emotional updates from dialogs synthesized in isolation back into entities.
+
+    Each dialog ran on copies of its participants taken from the same starting
+    state, so each copy's change relative to `baselines` is applied to the
+    real entity in list order (timepoint order), clamping after every step
+    the way serial synthesis would.
+
+    Args:
+        entities: Entities to update in place
+        baselines: entity_id -> cognitive_tensor dict the copies started from
+        updates: Ordered list of {entity_id: cognitive_tensor dict after one dialog}
+        store: Optional GraphStore; each updated entity is synced to its
+            TTMTensor and saved once
+
+    Returns:
+        Number of entities updated
+    """
+    from schemas import CognitiveTensor
+
+    updated = 0
+    for entity in entities:
+        entity_id = entity.entity_id
+        per_dialog = [u[entity_id] for u in updates if entity_id in u]
+        if not per_dialog:
+            continue
+
+        base = baselines.get(entity_id, {})
+        merged = dict(entity.entity_metadata.get("cognitive_tensor", {}))
+        for after in per_dialog:
+            for field, (low, high) in _EMOTIONAL_FIELD_RANGES.items():
+                if field not in after:
+                    continue
+                if field in base and field in merged:
+                    value = merged[field] + (after[field] - base[field])
+                else:
+                    value = after[field]
+                if low is not None:
+                    value = max(low, value)
+                if high is not None:
+                    value = min(high, value)
+                merged[field] = value
+
+        entity.entity_metadata["cognitive_tensor"] = merged
+        try:
+            _sync_cognitive_to_ttm(entity, CognitiveTensor(**merged), store=store)
+        except Exception as e:
+            logger.warning(f"[SYNC] Failed backprop for {entity_id}: {e}")
+        updated += 1
+
+    return updated
+
+
 def _sync_ttm_to_cognitive(entity: Entity) -> Optional['CognitiveTensor']:
     """
     Sync TTMTensor context values → CognitiveTensor (pretraining equivalent).
@@ -292,8 +360,7 @@ def _sync_ttm_to_cognitive(entity: Entity) -> Optional['CognitiveTensor']:
     """
     import json
     import base64
-    import msgspec
-    import numpy as np
+    from tensor_serialization import decode_vector
     from schemas import CognitiveTensor
 
     # Check if entity has a trained tensor
@@ -304,7 +371,7 @@ def _sync_ttm_to_cognitive(entity: Entity) -> Optional['CognitiveTensor']:
     try:
         # Decode TTMTensor
         tensor_dict = json.loads(entity.tensor)
-        context = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["context_vector"])))
+        context = decode_vector(base64.b64decode(tensor_dict["context_vector"]), copy=True)
 
         # Extract values from context_vector
         # [0]=knowledge, [1]=valence, [2]=arousal, [3]=energy, [4]=confidence, [5]=patience, [6]=risk, [7]=social
@@ -393,8 +460,7 @@ def _sync_cognitive_to_ttm(
     """
     import json
     import base64
-    import msgspec
-    import numpy as np
+    from tensor_serialization import decode_vector, encode_vector
 
     # Check if entity has a tensor to update
     if not entity.tensor:
@@ -404,7 +470,7 @@ def _sync_cognitive_to_ttm(
     try:
         # Decode TTMTensor
         tensor_dict = json.loads(entity.tensor)
-        context = np.array(msgspec.msgpack.decode(base64.b64decode(tensor_dict["context_vector"])))
+        context = decode_vector(base64.b64decode(tensor_dict["context_vector"]), copy=True)
 
         # Scale conversions (reverse)
         ttm_valence = (cognitive.emotional_valence + 1) / 2  # -1 to 1 → 0-1
@@ -436,7 +502,7 @@ def _sync_cognitive_to_ttm(
 
         # Re-encode tensor
         updated_tensor = {
-            "context_vector": base64.b64encode(msgspec.msgpack.encode(context.tolist())).decode('utf-8'),
+            "context_vector": base64.b64encode(encode_vector(context)).decode('utf-8'),
             "biology_vector": tensor_dict["biology_vector"],  # Preserve unchanged
             "behavior_vector": tensor_dict["behavior_vector"]  # Preserve unchanged
         }
@@ -716,9 +782,20 @@ def synthesize_dialog(
     timeline: List[Dict],
     llm: 'LLMClient',
     store: Optional['GraphStore'] = None,
-    run_id: Optional[str] = None  # January 2026: Added for dialog persistence/convergence
+    run_id: Optional[str] = None,  # January 2026: Added for dialog persistence/convergence
+    persist_entities: bool = True,
+    extract_knowledge: bool = True
 ) -> Dialog:
-    """Generate conversation with full physical/emotional/temporal context"""
+    """
+    Generate conversation with full physical/emotional/temporal context
+
+    persist_entities=False leaves the participants' updated tensors unsaved;
+    concurrent callers working on entity copies merge them afterwards with
+    merge_emotional_state_updates().
+
+    extract_knowledge=False skips the per-dialog M19 extraction call; callers
+    batch it afterwards with knowledge_extraction.extract_knowledge_from_dialogs().
+    """
 
     # Sanitize timeline to ensure all datetime objects are converted to strings
     sanitized_timeline = []
@@ -980,7 +1057,7 @@ Generate 8-12 dialog turns showing realistic interaction given these constraints
 
     # Create ExposureEvents using M19 Knowledge Extraction Agent (LLM-based)
     exposure_events_created = 0
-    if store:
+    if store and extract_knowledge:
         print(f"    [M11→M19] Extracting knowledge from {len(dialog_data.turns)} dialog turns using LLM agent")
 
         # Import M19 knowledge extraction
@@ -1052,7 +1129,8 @@ Generate 8-12 dialog turns showing realistic interaction given these constraints
             if updated_cog_data:
                 try:
                     updated_cognitive = CognitiveTensor(**updated_cog_data)
-                    if _sync_cognitive_to_ttm(entity, updated_cognitive, store=store):
+                    if _sync_cognitive_to_ttm(entity, updated_cognitive,
+                                              store=store if persist_entities else None):
                         backprop_count += 1
                 except Exception as e:
                     logger.warning(f"[SYNC] Failed backprop for {entity.entity_id}: {e}")
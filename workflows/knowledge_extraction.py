@@ -22,13 +22,17 @@ This is mechanism M19 in the MECHANICS.md documentation.
 """
 
 from typing import List, Dict, Optional, Any
+from dataclasses import dataclass
 from datetime import datetime
 from pydantic import BaseModel, Field
 import json
 import logging
 
 from schemas import KnowledgeItem, KnowledgeExtractionResult, DialogTurn, Entity
-from llm_service.model_selector import ActionType, select_model_for_action, get_fallback_models
+from llm_service.model_selector import (
+    ActionType, select_model_for_action, get_fallback_models,
+    TokenBudgetEstimator, get_token_estimator
+)
 from metadata.tracking import track_mechanism
 
 logger = logging.getLogger(__name__)
@@ -132,6 +136,40 @@ def extract_json_from_response(text: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+def validate_extracted_items(raw_items: Any) -> List[ExtractedKnowledge]:
+    """
+    Validate raw item dicts one by one, dropping the malformed ones.
+
+    Args:
+        raw_items: The "items" value from a parsed LLM response
+
+    Returns:
+        Valid ExtractedKnowledge items with meaningful content
+    """
+    items = []
+    if not isinstance(raw_items, list):
+        return items
+    for raw_item in raw_items:
+        if isinstance(raw_item, dict):
+            try:
+                # Validate and normalize the item
+                item = ExtractedKnowledge(
+                    content=raw_item.get("content", ""),
+                    speaker=raw_item.get("speaker", "unknown"),
+                    category=raw_item.get("category", "fact"),
+                    confidence=float(raw_item.get("confidence", 0.9)),
+                    causal_relevance=float(raw_item.get("causal_relevance", 0.5)),
+                    context=raw_item.get("context"),
+                    source_turn_index=raw_item.get("source_turn_index")
+                )
+                # Only keep items with meaningful content
+                if item.content and len(item.content) > 10:
+                    items.append(item)
+            except Exception as e:
+                logger.debug(f"[M19] Skipping invalid item: {e}")
+    return items
+
+
 def parse_extraction_response_manual(text: str, entity_ids: List[str]) -> KnowledgeExtractionResponse:
     """
     Manually parse extraction response with fallbacks.
@@ -149,31 +187,8 @@ def parse_extraction_response_manual(text: str, entity_ids: List[str]) -> Knowle
         logger.warning("[M19] Could not extract JSON from response")
         return KnowledgeExtractionResponse(items=[], reasoning="JSON parsing failed")
 
-    # Handle items array
-    items = []
-    raw_items = data.get("items", [])
-    if isinstance(raw_items, list):
-        for raw_item in raw_items:
-            if isinstance(raw_item, dict):
-                try:
-                    # Validate and normalize the item
-                    item = ExtractedKnowledge(
-                        content=raw_item.get("content", ""),
-                        speaker=raw_item.get("speaker", "unknown"),
-                        category=raw_item.get("category", "fact"),
-                        confidence=float(raw_item.get("confidence", 0.9)),
-                        causal_relevance=float(raw_item.get("causal_relevance", 0.5)),
-                        context=raw_item.get("context"),
-                        source_turn_index=raw_item.get("source_turn_index")
-                    )
-                    # Only keep items with meaningful content
-                    if item.content and len(item.content) > 10:
-                        items.append(item)
-                except Exception as e:
-                    logger.debug(f"[M19] Skipping invalid item: {e}")
-
     return KnowledgeExtractionResponse(
-        items=items,
+        items=validate_extracted_items(data.get("items", [])),
         reasoning=data.get("reasoning", ""),
         skipped_content=data.get("skipped_content")
     )
@@ -234,6 +249,41 @@ def build_causal_context(
     return "\n\n".join(context_parts)
 
 
+# Shared by the single-dialog and batched extraction prompts
+_EXTRACTION_RULES = """You are a Knowledge Extraction Agent. Your task is to extract MEANINGFUL knowledge items from dialog.
+
+## CRITICAL RULES - READ CAREFULLY
+
+1. **EXTRACT COMPLETE SEMANTIC UNITS** - Not single words!
+   - BAD: "thanks", "what", "Michael", "we'll"
+   - GOOD: "Michael believes the project deadline is unrealistic"
+   - GOOD: "The board approved the $2M budget increase"
+
+2. **ONLY extract information that was TRANSFERRED**
+   - Someone learned something new
+   - A decision was communicated
+   - An opinion was expressed and received
+   - A plan was shared
+
+3. **DO NOT extract:**
+   - Greetings, pleasantries, filler words
+   - Sentence fragments without meaning
+   - Single names without context
+   - Contractions or common words (I'll, we're, that's)
+   - Questions without answers (unless the question itself reveals information)
+
+4. **Categories explained:**
+   - **fact**: Verifiable information shared (e.g., "The meeting is at 3pm")
+   - **decision**: A choice that was made and communicated
+   - **opinion**: A subjective view expressed by someone
+   - **plan**: Intended future action shared
+   - **revelation**: New information that changes understanding
+   - **question**: Only if the question itself reveals important information
+   - **agreement**: Consensus reached between parties
+
+"""
+
+
 def build_extraction_prompt(
     dialog_turns: List[Dict[str, Any]],
     entities: List[Entity],
@@ -273,38 +323,7 @@ def build_extraction_prompt(
     # Determine listeners (all entities except speaker for each turn)
     entity_ids = [e.entity_id for e in entities]
 
-    prompt = f"""You are a Knowledge Extraction Agent. Your task is to extract MEANINGFUL knowledge items from dialog.
-
-## CRITICAL RULES - READ CAREFULLY
-
-1. **EXTRACT COMPLETE SEMANTIC UNITS** - Not single words!
-   - BAD: "thanks", "what", "Michael", "we'll"
-   - GOOD: "Michael believes the project deadline is unrealistic"
-   - GOOD: "The board approved the $2M budget increase"
-
-2. **ONLY extract information that was TRANSFERRED**
-   - Someone learned something new
-   - A decision was communicated
-   - An opinion was expressed and received
-   - A plan was shared
-
-3. **DO NOT extract:**
-   - Greetings, pleasantries, filler words
-   - Sentence fragments without meaning
-   - Single names without context
-   - Contractions or common words (I'll, we're, that's)
-   - Questions without answers (unless the question itself reveals information)
-
-4. **Categories explained:**
-   - **fact**: Verifiable information shared (e.g., "The meeting is at 3pm")
-   - **decision**: A choice that was made and communicated
-   - **opinion**: A subjective view expressed by someone
-   - **plan**: Intended future action shared
-   - **revelation**: New information that changes understanding
-   - **question**: Only if the question itself reveals important information
-   - **agreement**: Consensus reached between parties
-
-## SCENE CONTEXT
+    prompt = f"""{_EXTRACTION_RULES}## SCENE CONTEXT
 {timepoint_description}
 
 ## PARTICIPANTS
@@ -556,6 +575,297 @@ def extract_knowledge_from_dialog(
         )
 
 
+# ============================================================================
+# Batched extraction (several dialogs per LLM call)
+# ============================================================================
+
+@dataclass
+class DialogExtractionRequest:
+    """One dialog queued for batched knowledge extraction."""
+    dialog_turns: List[Dict[str, Any]]
+    entities: List[Entity]
+    timepoint: 'Timepoint'
+    dialog_id: str
+
+
+class BatchKnowledgeExtractionResponse(BaseModel):
+    """
+    LLM response for batched extraction.
+
+    Sections are typed loosely so one malformed section cannot fail the
+    whole response; parse_batch_extraction_sections validates each one.
+    """
+    dialogs: List[Any] = Field(
+        default_factory=list,
+        description="One section per dialog: {dialog_id, items, reasoning}"
+    )
+
+
+def estimate_extraction_tokens(
+    requests: List[DialogExtractionRequest],
+    estimator: Optional[TokenBudgetEstimator] = None,
+    model_id: Optional[str] = None
+) -> int:
+    """Recommended max_tokens for extracting knowledge from these dialogs in one call."""
+    estimator = estimator or get_token_estimator()
+    turn_count = sum(len(request.dialog_turns) for request in requests)
+    return estimator.estimate(
+        ActionType.KNOWLEDGE_EXTRACTION,
+        context={"turn_count": turn_count},
+        model_id=model_id
+    ).recommended_tokens
+
+
+def pack_extraction_batches(
+    requests: List[DialogExtractionRequest],
+    max_batch_size: int = 4,
+    max_output_tokens: int = 12000,
+    estimator: Optional[TokenBudgetEstimator] = None
+) -> List[List[DialogExtractionRequest]]:
+    """
+    Greedily pack dialogs into extraction batches, in order.
+
+    A batch closes when adding the next dialog would exceed max_batch_size
+    or push the estimated output budget past max_output_tokens. A dialog
+    that is over budget on its own still gets a batch of one.
+
+    Args:
+        requests: Dialogs to extract from
+        max_batch_size: Max dialogs per LLM call
+        max_output_tokens: Output token budget per call
+        estimator: Token estimator (defaults to the shared instance)
+
+    Returns:
+        Batches preserving request order
+    """
+    estimator = estimator or get_token_estimator()
+    batches: List[List[DialogExtractionRequest]] = []
+    current: List[DialogExtractionRequest] = []
+    for request in requests:
+        candidate = current + [request]
+        if current and (
+            len(candidate) > max_batch_size
+            or estimate_extraction_tokens(candidate, estimator) > max_output_tokens
+        ):
+            batches.append(current)
+            candidate = [request]
+        current = candidate
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_batch_extraction_prompt(
+    requests: List[DialogExtractionRequest],
+    causal_context: str
+) -> str:
+    """
+    Build one prompt covering several dialogs.
+
+    The rules, participant roster and prior knowledge are written once;
+    each dialog gets its own section keyed by dialog_id.
+
+    Args:
+        requests: Dialogs in the batch
+        causal_context: Prior knowledge for every participant in the batch
+
+    Returns:
+        Complete prompt string for the LLM
+    """
+    roster = {}
+    for request in requests:
+        for entity in request.entities:
+            roster.setdefault(entity.entity_id, entity)
+
+    entity_info = []
+    for entity in roster.values():
+        traits = entity.entity_metadata.get("personality_traits", [])
+        goals = entity.entity_metadata.get("current_goals", [])
+        entity_info.append(f"- {entity.entity_id}: traits={traits[:3]}, goals={goals[:2]}")
+    entity_context = "\n".join(entity_info) if entity_info else "No entity metadata available."
+
+    sections = []
+    for request in requests:
+        dialog_text = []
+        for i, turn in enumerate(request.dialog_turns):
+            speaker = turn.get("speaker", "Unknown")
+            content = turn.get("content", turn.get("text", ""))
+            dialog_text.append(f"[Turn {i}] {speaker}: {content}")
+        sections.append(
+            f"### DIALOG {request.dialog_id}\n"
+            f"Scene: {getattr(request.timepoint, 'event_description', 'Unknown event')}\n"
+            f"Participants: {[e.entity_id for e in request.entities]}\n"
+            + "\n".join(dialog_text)
+        )
+    dialogs_formatted = "\n\n".join(sections)
+    dialog_ids = [request.dialog_id for request in requests]
+
+    return f"""{_EXTRACTION_RULES}## PARTICIPANTS (all dialogs)
+{entity_context}
+
+## PRIOR KNOWLEDGE (avoid redundant extraction)
+{causal_context}
+
+## DIALOGS TO ANALYZE
+Each dialog is independent; only attribute knowledge to that dialog's participants.
+
+{dialogs_formatted}
+
+## YOUR TASK
+For EACH dialog, extract 0-5 knowledge items per dialog turn. It's okay to extract NOTHING for a dialog with no meaningful knowledge transfer.
+
+For each item, provide:
+- content: The complete semantic knowledge (a full thought/statement)
+- speaker: Who communicated this
+- category: One of fact, decision, opinion, plan, revelation, question, agreement
+- confidence: 0.0-1.0 (how confident you are this is real knowledge transfer)
+- causal_relevance: 0.0-1.0 (how important for understanding the causal chain of events)
+- context: Brief note on why this matters (optional)
+- source_turn_index: Which turn number (within its dialog) this came from
+
+Return a JSON object with:
+- dialogs: array with exactly one section per dialog, in this order: {dialog_ids}
+  Each section has:
+  - dialog_id: the dialog's ID exactly as given
+  - items: array of extracted knowledge items (can be empty)
+  - reasoning: Brief explanation of what you extracted and why
+"""
+
+
+def _to_knowledge_items(items: List[ExtractedKnowledge], entity_ids: List[str]) -> List[KnowledgeItem]:
+    """Attach listeners (every participant except the speaker) to extracted items."""
+    return [
+        KnowledgeItem(
+            content=item.content,
+            speaker=item.speaker,
+            listeners=[eid for eid in entity_ids if eid != item.speaker],
+            category=item.category,
+            confidence=item.confidence,
+            context=item.context,
+            source_turn_index=item.source_turn_index,
+            causal_relevance=item.causal_relevance
+        )
+        for item in items
+    ]
+
+
+def parse_batch_extraction_sections(
+    sections: Any,
+    requests: List[DialogExtractionRequest]
+) -> Dict[str, List[ExtractedKnowledge]]:
+    """
+    Validate each dialog section of a batched response independently.
+
+    Sections that are not dicts, name an unknown or duplicate dialog_id, or
+    have a non-list items field are dropped; so are individual malformed
+    items. Dialogs without a valid section are absent from the result.
+
+    Returns:
+        dialog_id -> validated items
+    """
+    expected = {request.dialog_id for request in requests}
+    parsed: Dict[str, List[ExtractedKnowledge]] = {}
+    if not isinstance(sections, list):
+        return parsed
+    for section in sections:
+        if not isinstance(section, dict):
+            logger.debug(f"[M19] Skipping non-object batch section: {section!r:.80}")
+            continue
+        dialog_id = section.get("dialog_id")
+        if dialog_id not in expected or dialog_id in parsed:
+            logger.debug(f"[M19] Skipping batch section for unexpected dialog_id {dialog_id!r}")
+            continue
+        if not isinstance(section.get("items", []), list):
+            logger.debug(f"[M19] Skipping batch section {dialog_id}: items is not a list")
+            continue
+        parsed[dialog_id] = validate_extracted_items(section.get("items", []))
+    return parsed
+
+
+@track_mechanism("M19", "knowledge_extraction_batch")
+def extract_knowledge_from_dialogs(
+    requests: List[DialogExtractionRequest],
+    llm: 'LLMClient',
+    store: Optional['GraphStore'] = None,
+    max_batch_size: int = 4,
+    max_output_tokens: int = 12000
+) -> List[KnowledgeExtractionResult]:
+    """
+    Extract knowledge from several dialogs with one LLM call per packed batch.
+
+    Dialogs are packed with pack_extraction_batches. Each batch shares one
+    prompt (rules, roster and prior knowledge written once) and the response
+    is validated section by section; any dialog whose section is missing or
+    malformed, or whose whole batch call failed, is re-extracted on its own
+    with extract_knowledge_from_dialog.
+
+    Args:
+        requests: Dialogs to extract from
+        llm: LLM client for making extraction calls
+        store: GraphStore for causal context retrieval
+        max_batch_size: Max dialogs per LLM call (1 = one call per dialog)
+        max_output_tokens: Output token budget per call, used for packing
+
+    Returns:
+        KnowledgeExtractionResult per request, in request order
+    """
+    model_fallback_chain = get_fallback_models(ActionType.KNOWLEDGE_EXTRACTION, chain_length=3)
+    if not model_fallback_chain:
+        model_fallback_chain = ["meta-llama/llama-3.1-70b-instruct"]
+
+    results: List[KnowledgeExtractionResult] = []
+    for batch in pack_extraction_batches(requests, max_batch_size, max_output_tokens):
+        extracted: Dict[str, List[ExtractedKnowledge]] = {}
+        model = model_fallback_chain[0]
+        if len(batch) > 1:
+            roster = list({e.entity_id: e for request in batch for e in request.entities}.values())
+            prompt = build_batch_extraction_prompt(batch, build_causal_context(roster, store))
+            logger.info(f"[M19] Extracting knowledge from {len(batch)} dialogs in one call")
+
+            for model in model_fallback_chain:
+                try:
+                    response = llm.generate_structured(
+                        prompt=prompt,
+                        response_model=BatchKnowledgeExtractionResponse,
+                        model=model,
+                        temperature=0.3,
+                        max_tokens=estimate_extraction_tokens(batch, model_id=model)
+                    )
+                    extracted = parse_batch_extraction_sections(response.dialogs, batch)
+                    break
+                except Exception as e:
+                    logger.warning(f"[M19] Batched extraction failed with model '{model}': {e}")
+
+        for request in batch:
+            if request.dialog_id not in extracted:
+                if len(batch) > 1:
+                    logger.info(f"[M19] No valid batch section for {request.dialog_id}, extracting it alone")
+                results.append(extract_knowledge_from_dialog(
+                    dialog_turns=request.dialog_turns,
+                    entities=request.entities,
+                    timepoint=request.timepoint,
+                    llm=llm,
+                    store=store,
+                    dialog_id=request.dialog_id
+                ))
+                continue
+
+            knowledge_items = _to_knowledge_items(
+                extracted[request.dialog_id], [e.entity_id for e in request.entities]
+            )
+            results.append(KnowledgeExtractionResult(
+                items=knowledge_items,
+                dialog_id=request.dialog_id,
+                timepoint_id=request.timepoint.timepoint_id,
+                extraction_model=model,
+                total_turns_analyzed=len(request.dialog_turns),
+                items_per_turn=len(knowledge_items) / max(1, len(request.dialog_turns)),
+                extraction_timestamp=datetime.now()
+            ))
+
+    return results
+
+
 def create_exposure_events_from_knowledge(
     extraction_result: KnowledgeExtractionResult,
     timepoint: 'Timepoint',
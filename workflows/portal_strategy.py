@@ -28,6 +28,7 @@ import uuid
 
 from schemas import Entity, Timepoint, TemporalMode, ResolutionLevel
 from generation.config_schema import TemporalConfig
+from workflows.beam_frontier import BeamFrontier, resolve_beam_width
 from llm_service.model_selector import (
     ActionType,
     TokenBudgetEstimator,
@@ -260,6 +261,7 @@ class PortalStrategy:
         self.store = store
         self.paths: List[PortalPath] = []  # Top-ranked paths (backward compatible)
         self.all_paths: List[PortalPath] = []  # ALL generated paths for exploration
+        self.beam_width = resolve_beam_width(config)  # Max states expanded per step
 
         # Validate configuration
         if not config.portal_description:
@@ -611,12 +613,8 @@ Include 3-10 relevant entities."""
 
                     next_states.extend(top_antecedents)
 
-            current_states = next_states
-
-            # Prune if too many paths
-            if len(current_states) > self.config.path_count * 3:
-                current_states = self._prune_low_scoring_paths(current_states)
-                print(f"    Pruned to {len(current_states)} states")
+            # Keep only the beam for the next step so discarded states are never expanded
+            current_states = self._select_beam(next_states)
 
         # Convert to complete paths
         for final_state in current_states:
@@ -1653,10 +1651,14 @@ Rate contextual plausibility from 0.0 (anachronistic/impossible for the era) to
             print(f"    ⚠️  Dynamic context scoring failed: {e}")
             return 0.7
 
-    def _prune_low_scoring_paths(self, states: List[PortalState]) -> List[PortalState]:
-        """Prune states below threshold to manage path explosion"""
-        sorted_states = sorted(states, key=lambda s: s.plausibility_score, reverse=True)
-        return sorted_states[:self.config.path_count * 2]
+    def _select_beam(self, states: List[PortalState]) -> List[PortalState]:
+        """Keep the top beam_width distinct states to manage path explosion"""
+        frontier = BeamFrontier(self.beam_width, dedupe=self.config.beam_dedupe)
+        frontier.extend(states)
+        if frontier.pruned or frontier.duplicates:
+            print(f"    Beam kept {len(frontier)} states "
+                  f"(pruned {frontier.pruned}, merged {frontier.duplicates} duplicates)")
+        return frontier.states()
 
     def _reconstruct_path(self, leaf_state: PortalState) -> PortalPath:
         """Reconstruct complete path from leaf state to portal"""